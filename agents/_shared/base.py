@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
+from agents._shared import cache
 
 
 # ---------------------------------------------------------------------------
@@ -70,16 +70,21 @@ class AgentConfig:
 
     def load_system_prompt(self) -> str:
         """Carga el CLAUDE.md del agente."""
-        return self.system_prompt_path.read_text(encoding="utf-8")
+        text = cache.read_text(self.system_prompt_path)
+        if text is None:
+            raise FileNotFoundError(self.system_prompt_path)
+        return text
 
     def load_skills_for_milestone(self, milestone: int) -> list[SkillContent]:
         """Carga los skills asignados a este agente para un milestone."""
-        if not self.skills_map_path.exists():
+        key = ("skills", str(Path(self.agent_dir).resolve()), milestone)
+        return list(cache.memoize(key, lambda: self._build_skills_for_milestone(milestone)))
+
+    def _build_skills_for_milestone(self, milestone: int) -> list[SkillContent]:
+        skills_config = cache.load_yaml(self.skills_map_path)
+        if skills_config is None:
             return []
 
-        skills_config = yaml.safe_load(
-            self.skills_map_path.read_text(encoding="utf-8")
-        )
         relevant: list[SkillContent] = []
 
         for skill in skills_config.get("skills", []):
@@ -108,12 +113,12 @@ class AgentConfig:
 
         if load_level == 2:
             # Body completo + references preloaded
-            body = skill_path.read_text(encoding="utf-8") if skill_path.exists() else ""
+            body = cache.read_text(skill_path) or ""
             refs: list[str] = []
             for ref_rel in skill.get("references_to_preload", []):
-                full_ref = skill_path.parent / ref_rel
-                if full_ref.exists():
-                    refs.append(full_ref.read_text(encoding="utf-8"))
+                ref_text = cache.read_text(skill_path.parent / ref_rel)
+                if ref_text is not None:
+                    refs.append(ref_text)
             return SkillContent(
                 name=skill["name"],
                 path=skill["path"],
@@ -138,7 +143,7 @@ class AgentConfig:
         refs: dict[str, str] = {}
         if self.references_dir.exists():
             for ref_file in self.references_dir.glob("*.md"):
-                refs[ref_file.stem] = ref_file.read_text(encoding="utf-8")
+                refs[ref_file.stem] = cache.read_text(ref_file) or ""
         return refs
 
 
@@ -155,7 +160,6 @@ class Agent:
 
     def __init__(self, config: AgentConfig) -> None:
         self.config = config
-        self._system_prompt: str | None = None
 
     @property
     def name(self) -> str:
@@ -166,11 +170,16 @@ class Agent:
         return self.config.model
 
     def get_system_prompt(self, milestone: int | None = None) -> str:
-        """Ensambla el system prompt con skills del milestone actual."""
-        if self._system_prompt is None:
-            self._system_prompt = self.config.load_system_prompt()
+        """Ensambla el system prompt con skills del milestone actual.
+
+        El resultado se cachea por agente y milestone hasta que cambie
+        alguno de los archivos leídos (CLAUDE.md, skills.yaml, skills).
+        """
+        key = ("system_prompt", str(Path(self.config.agent_dir).resolve()), milestone)
+        return cache.memoize(key, lambda: self._assemble_system_prompt(milestone))
 
-        prompt = self._system_prompt
+    def _assemble_system_prompt(self, milestone: int | None) -> str:
+        prompt = self.config.load_system_prompt()
 
         if milestone is not None:
             skills = self.config.load_skills_for_milestone(milestone)
@@ -201,10 +210,10 @@ class Agent:
 
 def _extract_front_matter(path: Path) -> str:
     """Extrae el YAML front matter de un archivo Markdown."""
-    if not path.exists():
+    text = cache.read_text(path)
+    if text is None:
         return ""
 
-    text = path.read_text(encoding="utf-8")
     if not text.startswith("---"):
         return ""
 
@@ -0,0 +1,125 @@
+# agents/_shared/cache.py
+"""Cache de proceso para skills y system prompts, invalidada por mtime.
+
+Cada lectura de archivo pasa por ``read_text``/``load_yaml``, que guardan
+el contenido junto al ``(mtime_ns, size)`` del archivo y solo vuelven a
+leer (y parsear) cuando cambia. ``memoize`` guarda resultados ensamblados
+(prompt completo, lista de skills) y registra qué archivos se leyeron al
+construirlos: el resultado se descarta en cuanto uno de ellos cambia,
+aparece o desaparece.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import yaml
+
+_Stamp = tuple[int, int] | None
+
+_lock = threading.RLock()
+_files: dict[tuple[str, str], tuple[_Stamp, Any]] = {}
+_assembled: dict[tuple, tuple[tuple[tuple[str, _Stamp], ...], Any]] = {}
+_tracking = threading.local()
+_stats = {"file_hits": 0, "file_misses": 0, "hits": 0, "misses": 0}
+
+
+def _stamp(path: str) -> _Stamp:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _record(path: str, stamp: _Stamp) -> None:
+    deps = getattr(_tracking, "deps", None)
+    if deps is not None:
+        deps.setdefault(path, stamp)
+
+
+def _cached_file(path: str | Path, kind: str, parse: Callable[[str], Any]) -> Any:
+    key_path = str(Path(path).resolve())
+    stamp = _stamp(key_path)
+    _record(key_path, stamp)
+    if stamp is None:
+        return None
+    with _lock:
+        entry = _files.get((key_path, kind))
+        if entry is not None and entry[0] == stamp:
+            _stats["file_hits"] += 1
+            return entry[1]
+        _stats["file_misses"] += 1
+    value = parse(Path(key_path).read_text(encoding="utf-8"))
+    with _lock:
+        _files[(key_path, kind)] = (stamp, value)
+    return value
+
+
+def read_text(path: str | Path) -> str | None:
+    """Contenido del archivo (None si no existe)."""
+    return _cached_file(path, "text", lambda text: text)
+
+
+def load_yaml(path: str | Path) -> Any:
+    """YAML parseado del archivo (None si no existe).
+
+    El objeto devuelto es compartido: no modificarlo.
+    """
+    return _cached_file(path, "yaml", yaml.safe_load)
+
+
+@contextmanager
+def _track() -> Iterator[dict[str, _Stamp]]:
+    previous = getattr(_tracking, "deps", None)
+    _tracking.deps = {}
+    try:
+        yield _tracking.deps
+    finally:
+        deps = _tracking.deps
+        _tracking.deps = previous
+        if previous is not None:
+            for path, stamp in deps.items():
+                previous.setdefault(path, stamp)
+
+
+def memoize(key: tuple, build: Callable[[], Any]) -> Any:
+    """Resultado de ``build()`` cacheado bajo ``key``.
+
+    Se reconstruye cuando cambia cualquier archivo leído vía este módulo
+    durante la construcción anterior. Las excepciones no se cachean.
+    """
+    with _lock:
+        entry = _assembled.get(key)
+    if entry is not None and all(_stamp(path) == stamp for path, stamp in entry[0]):
+        # Los archivos de un resultado cacheado cuentan como leídos por el llamador
+        for path, stamp in entry[0]:
+            _record(path, stamp)
+        with _lock:
+            _stats["hits"] += 1
+        return entry[1]
+
+    with _track() as deps:
+        value = build()
+    with _lock:
+        _stats["misses"] += 1
+        _assembled[key] = (tuple(deps.items()), value)
+    return value
+
+
+def clear() -> None:
+    """Vacía la cache y reinicia los contadores."""
+    with _lock:
+        _files.clear()
+        _assembled.clear()
+        for k in _stats:
+            _stats[k] = 0
+
+
+def stats() -> dict[str, int]:
+    with _lock:
+        return {**_stats, "files": len(_files), "assembled": len(_assembled)}
@@ -10,8 +10,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from agents._shared import cache
 from agents._shared.base import Agent, AgentConfig, SkillContent
 
 
@@ -92,13 +91,10 @@ def load_skills_for_agent(
     agent_dir = AGENTS_ROOT / agent_name
     skills_path = agent_dir / "skills.yaml"
 
-    if not skills_path.exists():
+    skills_config = cache.load_yaml(skills_path)
+    if skills_config is None:
         return []
 
-    skills_config = yaml.safe_load(
-        skills_path.read_text(encoding="utf-8")
-    )
-
     results: list[SkillContent] = []
 
     for skill in skills_config.get("skills", []):
@@ -143,13 +139,10 @@ def get_agent_skills_summary(agent_name: str) -> dict[str, Any]:
     agent_dir = AGENTS_ROOT / agent_name
     skills_path = agent_dir / "skills.yaml"
 
-    if not skills_path.exists():
+    skills_config = cache.load_yaml(skills_path)
+    if skills_config is None:
         return {"agent": agent_name, "total_skills": 0}
 
-    skills_config = yaml.safe_load(
-        skills_path.read_text(encoding="utf-8")
-    )
-
     skills_list = skills_config.get("skills", [])
     mandatory = [s for s in skills_list if s.get("mandatory", False)]
     optional = [s for s in skills_list if not s.get("mandatory", False)]
@@ -166,3 +159,36 @@ def get_agent_skills_summary(agent_name: str) -> dict[str, Any]:
         "milestones": milestones,
         "skills_list": [s["name"] for s in skills_list],
     }
+
+
+def warm_up(agent_names: list[str] | None = None) -> dict[str, int]:
+    """Precarga en la cache los system prompts de cada agente y milestone.
+
+    Pensado para el arranque de la API: las sesiones posteriores ensamblan
+    el prompt sin leer ni parsear archivos. Los agentes cuya carpeta o
+    config no se pueden cargar se omiten.
+
+    Returns:
+        Número de prompts ensamblados por agente.
+    """
+    warmed: dict[str, int] = {}
+    for agent_name in agent_names or list_all_agents():
+        try:
+            agent = load_agent(agent_name)
+        except (FileNotFoundError, AttributeError):
+            continue
+        skills_config = cache.load_yaml(agent.config.skills_map_path) or {}
+        milestones: list[int | None] = [None]
+        milestones.extend(sorted(
+            {s.get("milestone") for s in skills_config.get("skills", [])} - {None, "all"},
+            key=str,
+        ))
+        count = 0
+        for milestone in milestones:
+            try:
+                agent.get_system_prompt(milestone)
+            except FileNotFoundError:
+                break
+            count += 1
+        warmed[agent_name] = count
+    return warmed
@@ -3,6 +3,7 @@
 Each agent wraps the Anthropic Messages API in an agentic tool-use loop:
 1. Send message with system prompt + tools
 2. If response has tool_use blocks, execute them via the tool registry
+   (concurrently, up to AgentConfig.max_tool_concurrency at a time)
 3. Feed tool results back and loop until the model produces a final text response
 """
 
@@ -11,6 +12,7 @@ from __future__ import annotations
 import json
 import pathlib
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -19,7 +21,8 @@ import anthropic
 from anthropic import Anthropic
 from anthropic.types import Message, ToolUseBlock, TextBlock
 
-from agents.tool_wrappers.registry import call_tool
+from agents._shared import cache
+from agents.tool_wrappers.registry import TOOL_REGISTRY, call_tool
 from agents.tool_wrappers.server import get_tools_for_agent
 try:
     from core.skills.loader import (
@@ -62,10 +65,20 @@ class AgentConfig:
     include_shared_skills: bool = True
     api_timeout_seconds: float = 300.0
     api_max_retries: int = 2
+    # Tool calls of one model response run in parallel; 1 = sequential
+    max_tool_concurrency: int = 8
 
     def load_system_prompt(self) -> str:
+        """Assemble the system prompt, cached until a prompt or skill file changes."""
+        key = ("definition_prompt", self.agent_type, self.system_prompt_file,
+               self.use_skills, self.include_shared_skills)
+        return cache.memoize(key, self._assemble_system_prompt)
+
+    def _assemble_system_prompt(self) -> str:
         path = PROMPTS_DIR / self.system_prompt_file
-        base_prompt = path.read_text(encoding="utf-8")
+        base_prompt = cache.read_text(path)
+        if base_prompt is None:
+            raise FileNotFoundError(path)
 
         if not self.use_skills:
             return base_prompt
@@ -89,15 +102,16 @@ class AgentConfig:
 
     def get_tools_schema(self) -> list[dict]:
         """Return Anthropic-compatible tool definitions for this agent."""
-        raw = get_tools_for_agent(self.agent_type)
-        return [
+        # The registry only grows at import time; its size keys out stale entries
+        key = ("tools_schema", self.agent_type, len(TOOL_REGISTRY))
+        return list(cache.memoize(key, lambda: [
             {
                 "name": t["name"],
                 "description": t["description"],
                 "input_schema": t["input_schema"],
             }
-            for t in raw
-        ]
+            for t in get_tools_for_agent(self.agent_type)
+        ]))
 
 
 @dataclass
@@ -168,8 +182,7 @@ class Agent:
             messages.append({"role": "assistant", "content": response.content})
 
             tool_results_content = []
-            for tool_use in tool_uses:
-                result_str = call_tool(tool_use.name, tool_use.input)
+            for tool_use, result_str in zip(tool_uses, self._execute_tools(tool_uses)):
                 tool_results_content.append({
                     "type": "tool_result",
                     "tool_use_id": tool_use.id,
@@ -186,6 +199,18 @@ class Agent:
 
         return "\n".join(text_parts) if text_parts else "[Agent reached max turns without final response]"
 
+    def _execute_tools(self, tool_uses: list[ToolUseBlock]) -> list[str]:
+        """Run the tool calls of one response; results are in tool_uses order.
+
+        Tool wrappers are stateless calls into the deterministic engines, so
+        independent calls from the same turn can overlap.
+        """
+        workers = min(self.config.max_tool_concurrency, len(tool_uses))
+        if workers <= 1:
+            return [call_tool(t.name, t.input) for t in tool_uses]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{self.config.agent_type}-tool") as pool:
+            return list(pool.map(lambda t: call_tool(t.name, t.input), tool_uses))
+
     def _call_api(self, messages: list[dict]) -> Message:
         """API call to Anthropic Messages with timeout retry."""
         kwargs: dict[str, Any] = {
@@ -2,16 +2,316 @@
 
 Saves and loads SessionState snapshots after each milestone approval,
 enabling workflow resumption from the last approved milestone.
+
+Each session has one append-only log (``<session_id>.ckpt.jsonl.gz``) of
+gzip members, one JSON record per checkpoint, and an index
+(``<session_id>.index.json``) with the offset of every record and the
+latest record per approved milestone. A record stores only what changed
+since the previous one: scalar fields whose value changed and, per entity
+list, its new length plus the items that were added or modified. Every
+``FULL_SNAPSHOT_EVERY`` records (and on the first write of a process) a
+full record is written, so loading replays a bounded number of deltas.
+
+Autosaves taken mid-milestone are written on a background thread; the
+caller only pays for JSON-encoding the state, which freezes it: the writer
+never reads objects the workflow may still be mutating, and every digest
+is computed from the same bytes the record stores. A session's log and
+its writer thread are released with ``close_checkpoint_log`` when the
+workflow ends.
+
+Sessions saved by earlier versions as ``<session_id>_m<N>.json`` files
+are still loaded.
 """
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import fields
+from datetime import datetime
 from pathlib import Path
 
 from agents.orchestration.session_state import SessionState
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_CHECKPOINT_DIR = Path("sessions/checkpoints")
 
+# A full record is written after this many deltas to bound replay on load
+FULL_SNAPSHOT_EVERY = 20
+
+_LIST_FIELDS = frozenset(f.name for f in fields(SessionState) if f.default_factory is list)
+
+_logs: dict[Path, CheckpointLog] = {}
+_logs_lock = threading.Lock()
+
+
+def _encode(value) -> str:
+    return json.dumps(value, default=str)
+
+
+def _digest(encoded: str) -> bytes:
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).digest()
+
+
+def _snapshot(session: SessionState) -> dict:
+    """JSON text of each session field; entity lists are encoded item by item."""
+    snapshot = {}
+    for f in fields(session):
+        value = getattr(session, f.name)
+        if f.name in _LIST_FIELDS:
+            snapshot[f.name] = [_encode(item) for item in value]
+        else:
+            snapshot[f.name] = _encode(value)
+    return snapshot
+
+
+def _json_object(members: dict[str, str]) -> str:
+    """A JSON object from already encoded member values."""
+    return "{" + ",".join(f"{json.dumps(key)}:{value}" for key, value in members.items()) + "}"
+
+
+def _apply_record(state: dict, record: dict) -> None:
+    state.update(record["fields"])
+    for name, delta in record["lists"].items():
+        items = state.setdefault(name, [])
+        del items[delta["len"]:]
+        for i, item in delta["set"].items():
+            i = int(i)
+            if i < len(items):
+                items[i] = item
+            else:
+                items.append(item)
+
+
+class CheckpointLog:
+    """Append-only, delta-compressed checkpoint log of one session."""
+
+    def __init__(
+        self,
+        session_id: str,
+        checkpoint_dir: Path = DEFAULT_CHECKPOINT_DIR,
+        full_every: int = FULL_SNAPSHOT_EVERY,
+    ):
+        self.session_id = session_id
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.log_path = self.checkpoint_dir / f"{session_id}.ckpt.jsonl.gz"
+        self.index_path = self.checkpoint_dir / f"{session_id}.index.json"
+        self.full_every = full_every
+        self._lock = threading.Lock()
+        self._index: dict | None = None
+        # Digests of the state written by the last record (None: next one is full)
+        self._digests: dict | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._queued: tuple[dict, int] | None = None
+        self._queue_lock = threading.Lock()
+
+    # ── Index ───────────────────────────────────────────────────────
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            if self.index_path.exists():
+                self._index = json.loads(self.index_path.read_text(encoding="utf-8"))
+            else:
+                self._index = {"session_id": self.session_id, "records": [], "milestones": {}}
+        return self._index
+
+    def _write_index(self, index: dict) -> None:
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    def records(self) -> list[dict]:
+        """Index entries of every record, oldest first."""
+        with self._lock:
+            return list(self._load_index()["records"])
+
+    def latest(self) -> dict | None:
+        """Index entry of the most recent record (approved or autosave)."""
+        with self._lock:
+            records = self._load_index()["records"]
+            return records[-1] if records else None
+
+    def milestone_seq(self, milestone_number: int) -> int | None:
+        """Sequence number of the latest approved checkpoint of a milestone."""
+        with self._lock:
+            return self._load_index()["milestones"].get(str(milestone_number))
+
+    def latest_milestone(self) -> int | None:
+        """Highest approved milestone in the log."""
+        with self._lock:
+            milestones = self._load_index()["milestones"]
+            return max(map(int, milestones)) if milestones else None
+
+    # ── Writing ─────────────────────────────────────────────────────
+
+    def append(self, session: SessionState, milestone_number: int) -> dict:
+        """Write an approved-milestone checkpoint and return its index entry.
+
+        A queued autosave that has not started yet is dropped: this record
+        already holds a newer state.
+        """
+        snapshot = _snapshot(session)
+        with self._queue_lock:
+            self._queued = None
+        with self._lock:
+            return self._write(snapshot, milestone_number, "milestone")
+
+    def autosave(self, session: SessionState, milestone_number: int) -> Future:
+        """Queue a mid-milestone checkpoint written on a background thread.
+
+        Autosaves queued while another is being written are coalesced, so
+        only the newest state is written.
+        """
+        snapshot = _snapshot(session)
+        with self._queue_lock:
+            pending = self._queued is not None
+            self._queued = (snapshot, milestone_number)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+            if pending:
+                future: Future = Future()
+                future.set_result(None)
+                return future
+            return self._executor.submit(self._drain)
+
+    def _drain(self) -> dict | None:
+        with self._queue_lock:
+            queued, self._queued = self._queued, None
+        if queued is None:
+            return None
+        try:
+            with self._lock:
+                return self._write(*queued, "autosave")
+        except Exception:
+            logger.exception("Autosave of session %s failed", self.session_id)
+            raise
+
+    def flush(self) -> None:
+        """Wait for queued autosaves to be written."""
+        if self._executor is not None:
+            self._executor.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Flush queued autosaves and stop the background writer."""
+        if self._executor is not None:
+            self.flush()
+            self._executor.shutdown()
+            self._executor = None
+
+    def _write(self, snapshot: dict, milestone_number: int, kind: str) -> dict:
+        index = self._load_index()
+        records = index["records"]
+        seq = len(records) + 1
+        full = self._digests is None or seq - records[-1]["base"] >= self.full_every
+        previous = {} if full else self._digests
+
+        # Values are JSON text from _snapshot, spliced into the record as is
+        changed_fields: dict[str, str] = {}
+        changed_lists: dict[str, str] = {}
+        digests: dict = {}
+        for name, value in snapshot.items():
+            if name in _LIST_FIELDS:
+                item_digests = [_digest(item) for item in value]
+                before = previous.get(name, [])
+                changed = {
+                    str(i): value[i] for i, d in enumerate(item_digests)
+                    if i >= len(before) or before[i] != d
+                }
+                if full or changed or len(before) != len(value):
+                    changed_lists[name] = _json_object({"len": str(len(value)), "set": _json_object(changed)})
+                digests[name] = item_digests
+            else:
+                digest = _digest(value)
+                if full or previous.get(name) != digest:
+                    changed_fields[name] = value
+                digests[name] = digest
+
+        saved_at = datetime.now().isoformat()
+        record = _json_object({
+            "seq": str(seq),
+            "milestone": json.dumps(milestone_number),
+            "kind": json.dumps(kind),
+            "full": json.dumps(full),
+            "saved_at": json.dumps(saved_at),
+            "fields": _json_object(changed_fields),
+            "lists": _json_object(changed_lists),
+        })
+        payload = gzip.compress((record + "\n").encode("utf-8"))
+
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as f:
+            offset = f.tell()
+            f.write(payload)
+
+        entry = {
+            "seq": seq,
+            "milestone": milestone_number,
+            "kind": kind,
+            "base": seq if full else records[-1]["base"],
+            "offset": offset,
+            "length": len(payload),
+            "saved_at": saved_at,
+        }
+        records.append(entry)
+        if kind == "milestone":
+            index["milestones"][str(milestone_number)] = seq
+        self._write_index(index)
+        self._digests = digests
+        return entry
+
+    # ── Reading ─────────────────────────────────────────────────────
+
+    def load(self, seq: int | None = None) -> SessionState | None:
+        """Rebuild the session as of record `seq` (default: the latest)."""
+        with self._lock:
+            records = self._load_index()["records"]
+            if not records:
+                return None
+            target = records[-1] if seq is None else records[seq - 1]
+            entries = records[target["base"] - 1:target["seq"]]
+
+        state: dict = {}
+        with open(self.log_path, "rb") as f:
+            for entry in entries:
+                f.seek(entry["offset"])
+                _apply_record(state, json.loads(gzip.decompress(f.read(entry["length"]))))
+        return SessionState(**state)
+
+
+def get_checkpoint_log(
+    session_id: str,
+    checkpoint_dir: Path = DEFAULT_CHECKPOINT_DIR,
+) -> CheckpointLog:
+    """Shared log for a session, so consecutive checkpoints are written as deltas."""
+    path = (Path(checkpoint_dir) / session_id).resolve()
+    with _logs_lock:
+        log = _logs.get(path)
+        if log is None:
+            log = _logs[path] = CheckpointLog(session_id, checkpoint_dir)
+        return log
+
+
+def close_checkpoint_log(
+    session_id: str,
+    checkpoint_dir: Path = DEFAULT_CHECKPOINT_DIR,
+) -> None:
+    """Write pending autosaves, stop the session's writer thread and forget its log.
+
+    A later get_checkpoint_log reopens the log from its index; its first
+    record is then a full one.
+    """
+    path = (Path(checkpoint_dir) / session_id).resolve()
+    with _logs_lock:
+        log = _logs.pop(path, None)
+    if log is not None:
+        log.close()
+
 
 def save_checkpoint(
     session: SessionState,
@@ -20,12 +320,24 @@ def save_checkpoint(
 ) -> Path:
     """Save session state after milestone approval.
 
-    Returns the path to the written checkpoint file.
+    Returns the path to the session's checkpoint log.
     """
-    checkpoint_dir.mkdir(parents=True, exist_ok=True)
-    path = checkpoint_dir / f"{session.session_id}_m{milestone_number}.json"
-    path.write_text(session.to_json(), encoding="utf-8")
-    return path
+    log = get_checkpoint_log(session.session_id, checkpoint_dir)
+    log.append(session, milestone_number)
+    return log.log_path
+
+
+def autosave_checkpoint(
+    session: SessionState,
+    milestone_number: int,
+    checkpoint_dir: Path = DEFAULT_CHECKPOINT_DIR,
+) -> Future:
+    """Save an in-progress milestone without blocking the caller."""
+    return get_checkpoint_log(session.session_id, checkpoint_dir).autosave(session, milestone_number)
+
+
+def _legacy_path(session_id: str, milestone_number: int, checkpoint_dir: Path) -> Path:
+    return Path(checkpoint_dir) / f"{session_id}_m{milestone_number}.json"
 
 
 def load_checkpoint(
@@ -33,8 +345,12 @@ def load_checkpoint(
     milestone_number: int,
     checkpoint_dir: Path = DEFAULT_CHECKPOINT_DIR,
 ) -> SessionState | None:
-    """Load a checkpoint. Returns None if not found."""
-    path = checkpoint_dir / f"{session_id}_m{milestone_number}.json"
+    """Load the approved checkpoint of a milestone. Returns None if not found."""
+    log = get_checkpoint_log(session_id, checkpoint_dir)
+    seq = log.milestone_seq(milestone_number)
+    if seq is not None:
+        return log.load(seq)
+    path = _legacy_path(session_id, milestone_number, checkpoint_dir)
     if not path.exists():
         return None
     return SessionState.from_json(path.read_text(encoding="utf-8"))
@@ -48,8 +364,12 @@ def find_latest_checkpoint(
 
     Returns (milestone_num, session) or None if no checkpoints exist.
     """
+    log = get_checkpoint_log(session_id, checkpoint_dir)
+    milestone = log.latest_milestone()
+    if milestone is not None:
+        return (milestone, log.load(log.milestone_seq(milestone)))
     for m in range(4, 0, -1):
-        session = load_checkpoint(session_id, m, checkpoint_dir)
-        if session is not None:
-            return (m, session)
+        path = _legacy_path(session_id, m, checkpoint_dir)
+        if path.exists():
+            return (m, SessionState.from_json(path.read_text(encoding="utf-8")))
     return None
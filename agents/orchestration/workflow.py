@@ -135,11 +135,17 @@ class StrategyWorkflow:
         self.session.equipment_tag = equipment_description
         self.session.plant_code = plant_code
 
-        for gate in self.milestones:
-            self._execute_milestone(gate)
-
-            if gate.status == MilestoneStatus.REJECTED:
-                break
+        try:
+            for gate in self.milestones:
+                self._execute_milestone(gate)
+
+                if gate.status == MilestoneStatus.REJECTED:
+                    break
+        finally:
+            if self.checkpoint_dir:
+                from agents.orchestration.checkpoint import close_checkpoint_log
+                from pathlib import Path
+                close_checkpoint_log(self.session.session_id, Path(self.checkpoint_dir))
 
         return self.session
 
@@ -164,6 +170,11 @@ class StrategyWorkflow:
                 instruction=instruction,
                 response_summary=response[:500],
             )
+            # Written in the background while validation and the human gate run
+            if self.checkpoint_dir:
+                from agents.orchestration.checkpoint import autosave_checkpoint
+                from pathlib import Path
+                autosave_checkpoint(self.session, gate.number, Path(self.checkpoint_dir))
 
             validation = _run_validation(self.session)
             gate.present(validation)
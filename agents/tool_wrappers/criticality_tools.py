@@ -22,6 +22,7 @@ def assess_criticality(input_json: str) -> str:
     "calculate_criticality_score",
     "Calculate raw criticality score from criteria scores and probability. Returns float score.",
     {"type": "object", "properties": {"criteria_scores": {"type": "string"}, "probability": {"type": "integer"}}, "required": ["criteria_scores", "probability"]},
+    cacheable=True,
 )
 def calculate_criticality_score(criteria_scores: str, probability: int) -> str:
     scores = [CriteriaScore(**s) for s in json.loads(criteria_scores)]
@@ -33,6 +34,7 @@ def calculate_criticality_score(criteria_scores: str, probability: int) -> str:
     "determine_risk_class",
     "Determine risk class (I/II/III/IV) from an overall criticality score.",
     {"type": "object", "properties": {"overall_score": {"type": "number"}}, "required": ["overall_score"]},
+    cacheable=True,
 )
 def determine_risk_class(overall_score: float) -> str:
     risk_class = CriticalityEngine.determine_risk_class(overall_score)
@@ -43,6 +45,7 @@ def determine_risk_class(overall_score: float) -> str:
     "validate_criticality_matrix",
     "Validate that all 11 criteria categories are covered. Returns list of validation errors.",
     {"type": "object", "properties": {"criteria_scores": {"type": "string"}}, "required": ["criteria_scores"]},
+    cacheable=True,
 )
 def validate_criticality_matrix(criteria_scores: str) -> str:
     scores = [CriteriaScore(**s) for s in json.loads(criteria_scores)]
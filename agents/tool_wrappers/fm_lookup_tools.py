@@ -9,6 +9,7 @@ from tools.models.schemas import Mechanism, Cause, VALID_FM_COMBINATIONS
     "validate_fm_combination",
     "Validate a Mechanism+Cause combination against the authoritative 72-combo table (SRC-09). MANDATORY before creating any FailureMode.",
     {"type": "object", "properties": {"mechanism": {"type": "string"}, "cause": {"type": "string"}}, "required": ["mechanism", "cause"]},
+    cacheable=True,
 )
 def validate_fm_combination(mechanism: str, cause: str) -> str:
     try:
@@ -32,6 +33,7 @@ def validate_fm_combination(mechanism: str, cause: str) -> str:
     "get_valid_fm_combinations",
     "Get all valid Cause values for a given Mechanism from the 72-combo table. Use this BEFORE creating failure modes.",
     {"type": "object", "properties": {"mechanism": {"type": "string"}}, "required": ["mechanism"]},
+    cacheable=True,
 )
 def get_valid_causes_for_mechanism(mechanism: str) -> str:
     try:
@@ -47,6 +49,7 @@ def get_valid_causes_for_mechanism(mechanism: str) -> str:
     "list_all_mechanisms",
     "List all 18 valid Mechanism values.",
     {"type": "object", "properties": {}},
+    cacheable=True,
 )
 def list_all_mechanisms() -> str:
     return json.dumps({"mechanisms": [m.value for m in Mechanism], "count": len(Mechanism)})
@@ -56,6 +59,7 @@ def list_all_mechanisms() -> str:
     "list_all_causes",
     "List all 44 valid Cause values.",
     {"type": "object", "properties": {}},
+    cacheable=True,
 )
 def list_all_causes() -> str:
     return json.dumps({"causes": [c.value for c in Cause], "count": len(Cause)})
@@ -9,6 +9,7 @@ from tools.engines.priority_engine import PriorityEngine, PriorityInput
     "calculate_priority",
     "Calculate maintenance task priority based on risk class, failure pattern, and consequence. Returns priority level and score.",
     {"type": "object", "properties": {"input_json": {"type": "string"}}, "required": ["input_json"]},
+    cacheable=True,
 )
 def calculate_priority(input_json: str) -> str:
     data = json.loads(input_json)
@@ -22,6 +23,7 @@ def calculate_priority(input_json: str) -> str:
     "validate_priority_override",
     "Validate a human priority override against AI-calculated priority. Returns comparison and warnings.",
     {"type": "object", "properties": {"ai_priority": {"type": "string"}, "human_priority": {"type": "string"}}, "required": ["ai_priority", "human_priority"]},
+    cacheable=True,
 )
 def validate_priority_override(ai_priority: str, human_priority: str) -> str:
     result = PriorityEngine.validate_priority_override(ai_priority, human_priority)
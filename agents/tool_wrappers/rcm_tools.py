@@ -9,6 +9,7 @@ from tools.engines.rcm_decision_engine import RCMDecisionEngine, RCMDecisionInpu
     "rcm_decide",
     "Run the RCM decision tree to determine maintenance strategy (CBM/FT/FFI/RTF/REDESIGN). Input: JSON with hidden, safety, environmental, operational, cause fields.",
     {"type": "object", "properties": {"input_json": {"type": "string"}}, "required": ["input_json"]},
+    cacheable=True,
 )
 def rcm_decide(input_json: str) -> str:
     data = json.loads(input_json)
@@ -22,6 +23,7 @@ def rcm_decide(input_json: str) -> str:
     "validate_frequency_unit",
     "Validate that a frequency unit is appropriate for a given cause type. Returns list of warnings.",
     {"type": "object", "properties": {"cause": {"type": "string"}, "frequency_unit": {"type": "string"}}, "required": ["cause", "frequency_unit"]},
+    cacheable=True,
 )
 def validate_frequency_unit(cause: str, frequency_unit: str) -> str:
     from tools.models.schemas import Cause, FrequencyUnit
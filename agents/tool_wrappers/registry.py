@@ -6,30 +6,125 @@ to expose tools to agents.
 """
 
 import json
+import threading
+import time
+from collections import OrderedDict
 from typing import Callable
 
-# Global tool registry: name -> {function, description, input_schema}
+# Global tool registry: name -> {function, description, input_schema, cacheable}
 TOOL_REGISTRY: dict[str, dict] = {}
 
+DEFAULT_CACHE_SIZE = 2048
+DEFAULT_CACHE_TTL_SECONDS = 3600.0
 
-def tool(name: str, description: str, input_schema: dict | None = None):
+
+class ToolResultCache:
+    """Thread-safe LRU cache of serialized tool results with a time-to-live.
+
+    Keys are (tool name, canonical JSON of the arguments), so argument order
+    and dict key order do not matter.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    @staticmethod
+    def make_key(name: str, arguments: dict) -> tuple[str, str] | None:
+        try:
+            return name, json.dumps(arguments, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None  # not JSON-serializable: never cached
+
+    def get(self, key: tuple[str, str]) -> str | None:
+        name = key[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self._hits[name] = self._hits.get(name, 0) + 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._misses[name] = self._misses.get(name, 0) + 1
+            return None
+
+    def put(self, key: tuple[str, str], result: str) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits.clear()
+            self._misses.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                "per_tool": {
+                    name: {"hits": self._hits.get(name, 0), "misses": self._misses.get(name, 0)}
+                    for name in sorted(set(self._hits) | set(self._misses))
+                },
+            }
+
+
+_result_cache = ToolResultCache()
+
+
+def tool(name: str, description: str, input_schema: dict | None = None, cacheable: bool = False):
     """Register a function as an MCP tool.
 
     Args:
         name: Unique tool name (snake_case).
         description: What the tool does (shown to agents).
         input_schema: JSON Schema for tool parameters.
+        cacheable: The result is a pure function of the arguments (no DB,
+            clock or randomness) and may be served from the result cache.
     """
     def decorator(func: Callable) -> Callable:
         TOOL_REGISTRY[name] = {
             "function": func,
             "description": description,
             "input_schema": input_schema or {"type": "object", "properties": {}},
+            "cacheable": cacheable,
         }
         return func
     return decorator
 
 
+def _invoke(name: str, arguments: dict) -> str:
+    """Run a registered tool, serving cacheable tools from the result cache."""
+    info = TOOL_REGISTRY[name]
+    key = ToolResultCache.make_key(name, arguments) if info.get("cacheable") else None
+    if key is not None:
+        cached = _result_cache.get(key)
+        if cached is not None:
+            return cached
+    result = info["function"](**arguments)
+    result = result if isinstance(result, str) else json.dumps(result, default=str)
+    if key is not None:
+        _result_cache.put(key, result)
+    return result
+
+
 def call_tool(name: str, arguments: dict) -> str:
     """Invoke a registered tool by name.
 
@@ -38,8 +133,7 @@ def call_tool(name: str, arguments: dict) -> str:
     if name not in TOOL_REGISTRY:
         return json.dumps({"error": f"Unknown tool: {name}"})
     try:
-        result = TOOL_REGISTRY[name]["function"](**arguments)
-        return result if isinstance(result, str) else json.dumps(result, default=str)
+        return _invoke(name, arguments)
     except Exception as e:
         return json.dumps({"error": str(e), "tool": name})
 
@@ -47,11 +141,33 @@ def call_tool(name: str, arguments: dict) -> str:
 def list_tools() -> list[dict]:
     """Return all registered tools with metadata."""
     return [
-        {"name": name, "description": info["description"], "input_schema": info["input_schema"]}
+        {
+            "name": name, "description": info["description"], "input_schema": info["input_schema"],
+            "cacheable": info.get("cacheable", False),
+        }
         for name, info in TOOL_REGISTRY.items()
     ]
 
 
+def cache_stats() -> dict:
+    """Hit/miss counters and occupancy of the tool result cache."""
+    return _result_cache.stats()
+
+
+def clear_cache() -> None:
+    """Drop cached results and reset counters."""
+    _result_cache.clear()
+
+
+def configure_cache(maxsize: int | None = None, ttl_seconds: float | None = None) -> None:
+    """Resize the result cache or change its TTL (maxsize 0 disables caching)."""
+    if maxsize is not None:
+        _result_cache.maxsize = maxsize
+    if ttl_seconds is not None:
+        _result_cache.ttl_seconds = ttl_seconds
+    _result_cache.clear()
+
+
 class ToolExecutionError(Exception):
     """Raised by call_tool_strict when a tool fails."""
 
@@ -65,8 +181,7 @@ def call_tool_strict(name: str, arguments: dict) -> str:
     if name not in TOOL_REGISTRY:
         raise ToolExecutionError(name, f"Unknown tool: {name}")
     try:
-        result = TOOL_REGISTRY[name]["function"](**arguments)
-        return result if isinstance(result, str) else json.dumps(result, default=str)
+        return _invoke(name, arguments)
     except Exception as e:
         raise ToolExecutionError(name, str(e)) from e
 
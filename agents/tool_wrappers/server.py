@@ -81,7 +81,7 @@ AGENT_TOOL_MAP = {
         "validate_fm_what",
         "calculate_priority", "validate_priority_override",
         "calculate_health_score", "determine_health_trend",
-        "fit_weibull", "predict_failure", "weibull_reliability",
+        "fit_weibull", "fit_weibull_mle", "predict_failure", "weibull_reliability",
         "detect_variance", "detect_multi_metric_variance", "rank_plants",
         "calculate_mtbf", "calculate_mttr", "calculate_availability",
         "calculate_oee", "calculate_kpis_from_records",
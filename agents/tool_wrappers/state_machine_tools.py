@@ -9,6 +9,7 @@ from tools.engines.state_machine import StateMachine
     "validate_state_transition",
     "Check if a state transition is valid for an entity type. Returns boolean.",
     {"type": "object", "properties": {"entity_type": {"type": "string"}, "current_state": {"type": "string"}, "target_state": {"type": "string"}}, "required": ["entity_type", "current_state", "target_state"]},
+    cacheable=True,
 )
 def validate_state_transition(entity_type: str, current_state: str, target_state: str) -> str:
     valid = StateMachine.validate_transition(entity_type, current_state, target_state)
@@ -19,6 +20,7 @@ def validate_state_transition(entity_type: str, current_state: str, target_state
     "get_valid_transitions",
     "Get all valid next states for an entity in a given state.",
     {"type": "object", "properties": {"entity_type": {"type": "string"}, "current_state": {"type": "string"}}, "required": ["entity_type", "current_state"]},
+    cacheable=True,
 )
 def get_valid_transitions(entity_type: str, current_state: str) -> str:
     transitions = StateMachine.get_valid_transitions(entity_type, current_state)
@@ -29,6 +31,7 @@ def get_valid_transitions(entity_type: str, current_state: str) -> str:
     "get_all_entity_states",
     "Get all possible states for an entity type.",
     {"type": "object", "properties": {"entity_type": {"type": "string"}}, "required": ["entity_type"]},
+    cacheable=True,
 )
 def get_all_entity_states(entity_type: str) -> str:
     states = StateMachine.get_all_states(entity_type)
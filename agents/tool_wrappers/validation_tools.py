@@ -2,7 +2,7 @@
 
 import json
 from agents.tool_wrappers.registry import tool
-from tools.validators.quality_validator import QualityValidator
+from tools.validators.quality_validator import QualityValidator, ValidationCache
 from tools.validators.confidence_validator import ConfidenceValidator
 from tools.validators.naming_validator import NamingValidator
 from tools.models.schemas import (
@@ -11,6 +11,11 @@ from tools.models.schemas import (
 )
 
 
+# Shared across calls so repeated gate validations of a session only
+# re-check the entities that changed since the previous run
+_full_validation_cache = ValidationCache()
+
+
 def _parse_list(json_str: str, cls):
     return [cls(**item) for item in json.loads(json_str)]
 
@@ -122,7 +127,7 @@ def run_full_validation(input_json: str) -> str:
         kwargs["tasks"] = [MaintenanceTask(**t) for t in data["tasks"]]
     if "work_packages" in data:
         kwargs["work_packages"] = [WorkPackage(**wp) for wp in data["work_packages"]]
-    results = QualityValidator.run_full_validation(**kwargs)
+    results = QualityValidator.run_full_validation(**kwargs, cache=_full_validation_cache)
     return _serialize_results(results)
 
 
@@ -10,6 +10,7 @@ from tools.models.schemas import WeibullParameters
     "fit_weibull",
     "Fit 2-parameter Weibull distribution to failure interval data. Returns beta (shape), eta (scale), and R-squared.",
     {"type": "object", "properties": {"failure_intervals": {"type": "string"}}, "required": ["failure_intervals"]},
+    cacheable=True,
 )
 def fit_weibull(failure_intervals: str) -> str:
     intervals = json.loads(failure_intervals)
@@ -17,6 +18,28 @@ def fit_weibull(failure_intervals: str) -> str:
     return json.dumps(result.model_dump(), default=str)
 
 
+@tool(
+    "fit_weibull_mle",
+    "Fit Weibull distribution by maximum likelihood, including suspensions (units still running) and optional 3-parameter location. Returns beta, eta, gamma, and Fisher-matrix confidence bounds.",
+    {"type": "object", "properties": {"input_json": {"type": "string"}}, "required": ["input_json"]},
+    cacheable=True,
+)
+def fit_weibull_mle(input_json: str) -> str:
+    data = json.loads(input_json)
+    result = WeibullEngine.fit_mle_batch(
+        [data["failure_intervals"]],
+        [data.get("suspensions", [])],
+        three_parameter=data.get("three_parameter", False),
+        confidence_level=data.get("confidence_level", 0.9),
+    )
+    return json.dumps({
+        **result.params(0).model_dump(),
+        "failures": int(result.failures[0]),
+        "converged": bool(result.converged[0]),
+        "bounds": result.bounds(0) if result.converged[0] else None,
+    }, default=str)
+
+
 @tool(
     "predict_failure",
     "Generate a full failure prediction with risk score, recommended strategy, and reliability curve. Output is always DRAFT status (safety-first).",
@@ -38,6 +61,7 @@ def predict_failure(input_json: str) -> str:
     "weibull_reliability",
     "Calculate reliability R(t) at time t given Weibull parameters.",
     {"type": "object", "properties": {"t": {"type": "number"}, "beta": {"type": "number"}, "eta": {"type": "number"}, "gamma": {"type": "number"}}, "required": ["t", "beta", "eta"]},
+    cacheable=True,
 )
 def weibull_reliability(t: float, beta: float, eta: float, gamma: float = 0.0) -> str:
     params = WeibullParameters(beta=beta, eta=eta, gamma=gamma, r_squared=0.0)
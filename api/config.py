@@ -18,6 +18,27 @@ class Settings:
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
     CORS_ORIGINS: str = os.getenv("CORS_ORIGINS", "http://localhost:8501,http://localhost")
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    # Connection pool (QueuePool — PostgreSQL and file-backed SQLite)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # SQLite pragmas
+    SQLITE_WAL: bool = os.getenv("SQLITE_WAL", "true").lower() == "true"
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE_KB: int = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+    # Audit log: "batched" (write at commit), "sync" (flush per entry) or "async" (background writer)
+    AUDIT_MODE: str = os.getenv("AUDIT_MODE", "batched").lower()
+    AUDIT_QUEUE_SIZE: int = int(os.getenv("AUDIT_QUEUE_SIZE", "1000"))
+    AUDIT_QUEUE_BLOCK: bool = os.getenv("AUDIT_QUEUE_BLOCK", "true").lower() == "true"
+    # Batch capture sync: worker threads per batch and maximum captures per request
+    CAPTURE_BATCH_WORKERS: int = int(os.getenv("CAPTURE_BATCH_WORKERS", "8"))
+    CAPTURE_BATCH_MAX: int = int(os.getenv("CAPTURE_BATCH_MAX", "1000"))
+    # Preload agent prompts/skills into the process cache at startup
+    AGENT_PROMPT_WARMUP: bool = os.getenv("AGENT_PROMPT_WARMUP", "true").lower() == "true"
 
 
 settings = Settings()
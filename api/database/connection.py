@@ -1,31 +1,152 @@
 """SQLAlchemy database engine and session management."""
 
+import threading
+import time
+
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
+from sqlalchemy.pool import QueuePool
 
 from api.config import settings
 
 
-# SQLite needs special handling for foreign keys
-_is_sqlite = settings.DATABASE_URL.startswith("sqlite")
-
-_engine_kwargs = {
-    "connect_args": {"check_same_thread": False} if _is_sqlite else {},
-    "echo": settings.DEBUG,
-}
-if not _is_sqlite:
-    _engine_kwargs["pool_size"] = 5
-    _engine_kwargs["max_overflow"] = 10
-
-engine = create_engine(settings.DATABASE_URL, **_engine_kwargs)
-
-# Enable foreign key enforcement for SQLite
-if _is_sqlite:
-    @event.listens_for(engine, "connect")
-    def _set_sqlite_pragma(dbapi_conn, connection_record):
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+class PoolMetrics:
+    """Thread-safe counters for connection checkouts and the time spent waiting for them."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait_ms = 0.0
+            self.max_wait_ms = 0.0
+
+    def record_wait(self, wait_ms: float):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait to obtain a connection."""
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "TimedQueuePool":
+        # Keep counters across engine.dispose()
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            conn = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_wait((time.perf_counter() - start) * 1000)
+        return conn
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
+def _sqlite_pragmas(url: str) -> list[str]:
+    pragmas = [
+        "PRAGMA foreign_keys=ON",
+        # Lets LIKE 'prefix%' on hierarchy_nodes.path use the index
+        "PRAGMA case_sensitive_like=ON",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}",
+    ]
+    if not _is_sqlite_memory(url):
+        # WAL lets readers proceed while a writer holds the lock; NORMAL is
+        # durable across application crashes in WAL mode
+        if settings.SQLITE_WAL:
+            pragmas.append("PRAGMA journal_mode=WAL")
+        pragmas.append(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        pragmas.append(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    return pragmas
+
+
+def build_engine(url: str) -> Engine:
+    """Create an engine with the pool and SQLite settings from `Settings`."""
+    is_sqlite = url.startswith("sqlite")
+    kwargs = {
+        "connect_args": {"check_same_thread": False} if is_sqlite else {},
+        "echo": settings.DEBUG,
+    }
+    if not (is_sqlite and _is_sqlite_memory(url)):
+        kwargs["poolclass"] = TimedQueuePool
+        kwargs["pool_size"] = settings.DB_POOL_SIZE
+        kwargs["max_overflow"] = settings.DB_MAX_OVERFLOW
+        kwargs["pool_timeout"] = settings.DB_POOL_TIMEOUT
+    if not is_sqlite:
+        kwargs["pool_recycle"] = settings.DB_POOL_RECYCLE
+        kwargs["pool_pre_ping"] = settings.DB_POOL_PRE_PING
+
+    new_engine = create_engine(url, **kwargs)
+
+    if is_sqlite:
+        pragmas = _sqlite_pragmas(url)
+
+        @event.listens_for(new_engine, "connect")
+        def _set_sqlite_pragma(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    return new_engine
+
+
+def pool_metrics(target: Engine | None = None) -> dict:
+    """Pool occupancy and checkout wait times for an engine (default: the app engine)."""
+    pool = (target or engine).pool
+    result = {
+        "pool_class": type(pool).__name__,
+        "dialect": (target or engine).dialect.name,
+    }
+    if isinstance(pool, QueuePool):
+        result.update({
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "timeout_s": pool.timeout(),
+        })
+    if isinstance(pool, TimedQueuePool):
+        result.update(pool.metrics.snapshot())
+    return result
+
+
+engine = build_engine(settings.DATABASE_URL)
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
@@ -44,8 +165,11 @@ def get_db():
 
 
 def create_all_tables():
-    """Create all tables in the database."""
+    """Create all tables in the database, upgrading existing ones in place."""
+    from api.database.upgrade import upgrade_schema
+
     Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
 
 
 def drop_all_tables():
@@ -9,9 +9,9 @@ from datetime import datetime, date
 
 from sqlalchemy import (
     String, Integer, Float, Boolean, Text, DateTime, Date,
-    ForeignKey, JSON, Index,
+    ForeignKey, JSON, Index, event,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from api.database.connection import Base
 
@@ -56,6 +56,9 @@ class HierarchyNodeModel(Base):
     sap_equipment_nr: Mapped[str | None] = mapped_column(String(100), nullable=True)
     order: Mapped[int] = mapped_column(Integer, default=1)
     metadata_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # NodeMetadata
+    # Materialized ancestor path "/<root_id>/.../<node_id>/" — set on insert,
+    # rewritten by hierarchy_service.move_node; subtree = path prefix match
+    path: Mapped[str | None] = mapped_column(String(600), nullable=True)
 
     plant: Mapped["PlantModel | None"] = relationship(back_populates="nodes")
     children: Mapped[list["HierarchyNodeModel"]] = relationship(back_populates="parent", foreign_keys=[parent_node_id])
@@ -64,9 +67,48 @@ class HierarchyNodeModel(Base):
     __table_args__ = (
         Index("ix_hierarchy_nodes_parent", "parent_node_id"),
         Index("ix_hierarchy_nodes_level_type", "level", "node_type"),
+        Index("ix_hierarchy_nodes_path", "path", postgresql_ops={"path": "varchar_pattern_ops"}),
+        Index("ix_hierarchy_nodes_plant_type", "plant_id", "node_type"),
     )
 
 
+@event.listens_for(Session, "before_flush")
+def _assign_hierarchy_paths(session, flush_context, instances):
+    """Fill HierarchyNodeModel.path for new nodes, whichever code path adds them.
+
+    Parents are looked up among the other pending nodes first (vendor builds
+    and seeding add a whole tree before flushing), then in the database.
+    """
+    pending = {}
+    for obj in session.new:
+        if isinstance(obj, HierarchyNodeModel):
+            if obj.node_id is None:
+                obj.node_id = _uuid()
+            pending[obj.node_id] = obj
+    if not pending:
+        return
+
+    def resolve(node: HierarchyNodeModel, visiting: set[str]) -> str:
+        if node.path:
+            return node.path
+        parent_path = "/"
+        parent_id = node.parent_node_id
+        if parent_id:
+            parent = pending.get(parent_id)
+            if parent is not None and parent_id not in visiting:
+                parent_path = resolve(parent, visiting | {node.node_id})
+            elif parent is None:
+                with session.no_autoflush:
+                    parent_path = session.query(HierarchyNodeModel.path).filter(
+                        HierarchyNodeModel.node_id == parent_id
+                    ).scalar() or "/"
+        node.path = f"{parent_path}{node.node_id}/"
+        return node.path
+
+    for node in pending.values():
+        resolve(node, set())
+
+
 # ── Criticality Assessment ─────────────────────────────────────────────
 
 class CriticalityAssessmentModel(Base):
@@ -273,6 +315,18 @@ class KPIMetricsModel(Base):
     corrective_wo_count: Mapped[int] = mapped_column(Integer, default=0)
     preventive_wo_count: Mapped[int] = mapped_column(Integer, default=0)
     reactive_ratio_pct: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Daily rollups (grain="DAY", one row per equipment and day) keep the
+    # additive inputs of the KPIs so any period can be summed from them
+    grain: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    pm_completed_count: Mapped[int] = mapped_column(Integer, default=0)
+    repair_count: Mapped[int] = mapped_column(Integer, default=0)
+    repair_hours: Mapped[float] = mapped_column(Float, default=0.0)
+    downtime_hours: Mapped[float] = mapped_column(Float, default=0.0)
+
+    __table_args__ = (
+        Index("ix_kpi_metrics_rollup", "grain", "plant_id", "period_start"),
+        Index("ix_kpi_metrics_rollup_equipment", "grain", "equipment_id", "period_start"),
+    )
 
 
 # ── Failure Prediction ────────────────────────────────────────────────
@@ -455,12 +509,15 @@ class BacklogItemModel(Base):
     materials_ready: Mapped[bool] = mapped_column(Boolean, default=False)
     shutdown_required: Mapped[bool] = mapped_column(Boolean, default=False)
     age_days: Mapped[int] = mapped_column(Integer, default=0)
+    plant_id: Mapped[str | None] = mapped_column(String(50), nullable=True)  # NULL = equipment not resolved to a plant
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
 
     __table_args__ = (
         Index("ix_backlog_items_priority", "priority"),
         Index("ix_backlog_items_status", "status"),
         Index("ix_backlog_items_equipment_tag", "equipment_tag"),
+        Index("ix_backlog_items_plant_updated", "plant_id", "updated_at"),
     )
 
 
@@ -545,6 +602,8 @@ class WeeklyProgramModel(Base):
     total_hours: Mapped[float] = mapped_column(Float, default=0.0)
     resource_slots: Mapped[list | None] = mapped_column(JSON, nullable=True)
     conflicts: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    # ConflictResolution dicts from capacity leveling (packages that did not fit)
+    leveling_conflicts: Mapped[list | None] = mapped_column(JSON, nullable=True)
     support_tasks: Mapped[list | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     finalized_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -764,3 +823,15 @@ class FMECAWorksheetModel(Base):
     analyst: Mapped[str] = mapped_column(String(100), default="")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+# ── Cache Versions ──────────────────────────────────────────────────
+# Change counter per (cache scope, plant), bumped by writers so every worker
+# process can tell whether its in-process caches are current
+
+class CacheVersionModel(Base):
+    __tablename__ = "cache_versions"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    plant_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0)
@@ -0,0 +1,82 @@
+"""Schema upgrade for databases created by an earlier version.
+
+The repo has no migration tool and ``create_all`` never alters a table that
+already exists, so columns added to a model would be missing from existing
+databases. ``upgrade_schema`` adds them with ALTER TABLE (nullable: SQLite
+cannot add a NOT NULL column without a default), creates missing indexes
+and backfills the columns that need data. It is idempotent and runs at
+every startup from ``create_all_tables``.
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from api.database import models  # noqa: F401 — registers the tables on Base.metadata
+from api.database.connection import Base
+
+
+def _rebuild_hierarchy_paths(bind: Engine):
+    from api.services import hierarchy_service
+    with Session(bind) as db:
+        hierarchy_service.rebuild_paths(db)
+
+
+def _build_kpi_rollups(bind: Engine):
+    from api.services import kpi_rollup_service
+    with Session(bind) as db:
+        kpi_rollup_service.refresh_rollups(db)
+
+
+def _sql(statement: str):
+    def backfill(bind: Engine):
+        with bind.begin() as conn:
+            conn.execute(text(statement))
+    return backfill
+
+
+# Data backfills for added columns, keyed by "table.column"
+_BACKFILLS = {
+    "hierarchy_nodes.path": _rebuild_hierarchy_paths,
+    # Daily rollups of the work orders already in the database
+    "kpi_metrics.grain": _build_kpi_rollups,
+    # Plant of the equipment node, as backlog_service.add_to_backlog resolves it
+    "backlog_items.plant_id": _sql(
+        "UPDATE backlog_items SET plant_id = (SELECT plant_id FROM hierarchy_nodes "
+        "WHERE hierarchy_nodes.node_id = backlog_items.equipment_id) WHERE plant_id IS NULL"
+    ),
+    "backlog_items.updated_at": _sql(
+        "UPDATE backlog_items SET updated_at = created_at WHERE updated_at IS NULL"
+    ),
+}
+
+
+def upgrade_schema(bind: Engine) -> list[str]:
+    """Add missing columns and indexes to existing tables.
+
+    Returns the added columns as "table.column".
+    """
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    preparer = bind.dialect.identifier_preparer
+    added = []
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            present = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in present:
+                    continue
+                conn.execute(text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(dialect=bind.dialect)}"
+                ))
+                added.append(f"{table.name}.{column.name}")
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+    for name in added:
+        if name in _BACKFILLS:
+            _BACKFILLS[name](bind)
+    return added
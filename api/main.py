@@ -48,7 +48,15 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     create_all_tables()
+    if settings.AGENT_PROMPT_WARMUP:
+        from api.services.agent_service import warm_up_prompts
+        warm_up_prompts()
+    if settings.AUDIT_MODE == "async":
+        from api.services.audit_service import start_audit_writer
+        start_audit_writer()
     yield
+    from api.services.audit_service import stop_audit_writer
+    stop_audit_writer()
 
 
 def create_app() -> FastAPI:
@@ -66,6 +74,7 @@ def create_app() -> FastAPI:
         allow_credentials=False,
         allow_methods=["GET", "POST", "PUT", "DELETE"],
         allow_headers=["Content-Type", "Authorization", "X-Requested-With", "X-API-Key"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     # API key middleware — only active when API_KEY env var is set
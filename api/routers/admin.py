@@ -5,10 +5,10 @@ import os
 from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.orm import Session
 
-from api.database.connection import get_db
+from api.database.connection import get_db, pool_metrics
 from api.database.models import AuditLogModel, UserFeedbackModel
 from api.schemas import FeedbackCreate
-from api.services import hierarchy_service, agent_service
+from api.services import hierarchy_service, agent_service, equipment_registry
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -28,6 +28,12 @@ def seed_database(db: Session = Depends(get_db)):
     return result
 
 
+@router.post("/rebuild-hierarchy-paths", dependencies=[Depends(_require_admin)])
+def rebuild_hierarchy_paths(plant_id: str | None = None, db: Session = Depends(get_db)):
+    """Backfill materialized hierarchy paths (e.g. after upgrading an existing database)."""
+    return {"nodes_updated": hierarchy_service.rebuild_paths(db, plant_id)}
+
+
 @router.get("/audit-log")
 def get_audit_log(entity_type: str | None = None, limit: int = 100, db: Session = Depends(get_db)):
     q = db.query(AuditLogModel)
@@ -42,6 +48,12 @@ def get_audit_log(entity_type: str | None = None, limit: int = 100, db: Session
     ]
 
 
+@router.get("/pool-metrics")
+def get_pool_metrics():
+    """Connection pool occupancy (checked-out/overflow) and checkout wait times."""
+    return pool_metrics()
+
+
 @router.get("/stats")
 def get_stats(db: Session = Depends(get_db)):
     node_counts = hierarchy_service.count_nodes_by_type(db)
@@ -77,6 +89,7 @@ def reset_database(db: Session = Depends(get_db)):
         CriticalityAssessmentModel, WorkOrderModel, HierarchyNodeModel, PlantModel,
     ]:
         db.query(model).delete()
+    equipment_registry.invalidate(db)
     db.commit()
     return {"status": "Database reset complete"}
 
@@ -1,14 +1,17 @@
 """Analytics router — KPIs, health scores, Weibull, variance."""
 
-from fastapi import APIRouter, Depends
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from api.database.connection import get_db
 from api.schemas import (
-    HealthScoreRequest, KPIRequest, WeibullFitRequest,
+    HealthScoreRequest, KPIRequest, KPIRollupRefreshRequest, WeibullFitRequest,
     WeibullPredictRequest, VarianceDetectRequest,
 )
-from api.services import analytics_service
+from api.services import analytics_service, kpi_rollup_service
+from api.services.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -43,6 +46,24 @@ def calculate_kpis(data: KPIRequest, db: Session = Depends(get_db)):
     )
 
 
+@router.get("/kpis/{plant_id}")
+def get_period_kpis(
+    plant_id: str,
+    period_start: date,
+    period_end: date,
+    equipment_id: str | None = None,
+    db: Session = Depends(get_db),
+):
+    if period_end < period_start:
+        raise HTTPException(status_code=400, detail="period_end is before period_start")
+    return kpi_rollup_service.get_period_kpis(db, plant_id, period_start, period_end, equipment_id)
+
+
+@router.post("/kpis/rollups/refresh")
+def refresh_kpi_rollups(data: KPIRollupRefreshRequest, db: Session = Depends(get_db)):
+    return kpi_rollup_service.refresh_rollups(db, since=data.since, until=data.until)
+
+
 @router.post("/weibull-fit")
 def fit_weibull(data: WeibullFitRequest):
     return analytics_service.fit_weibull(data.failure_intervals)
@@ -66,10 +87,20 @@ def detect_variance(data: VarianceDetectRequest):
 
 
 @router.get("/variance-alerts")
-def get_variance_alerts(db: Session = Depends(get_db)):
-    alerts = analytics_service.get_variance_alerts(db)
+def get_variance_alerts(
+    response: Response,
+    limit: int | None = None,
+    cursor: str | None = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        page = analytics_service.get_variance_alerts(db, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
     return [
         {"alert_id": a.alert_id, "plant_id": a.plant_id, "metric_name": a.metric_name,
          "z_score": a.z_score, "variance_level": a.variance_level}
-        for a in alerts
+        for a in page
     ]
@@ -32,7 +32,7 @@ def add_to_backlog(work_request_id: str, db: Session = Depends(get_db)):
 
 @router.post("/optimize")
 def optimize_backlog(data: BacklogOptimizeRequest, db: Session = Depends(get_db)):
-    return backlog_service.optimize_backlog(db, data.plant_id, data.period_days)
+    return backlog_service.optimize_backlog(db, data.plant_id, data.period_days, data.incremental)
 
 
 @router.get("/optimizations/{optimization_id}")
@@ -1,11 +1,12 @@
 """Capture router — field capture submission and retrieval."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from api.database.connection import get_db
-from api.schemas import CaptureCreate
+from api.schemas import CaptureBatchCreate, CaptureCreate
 from api.services import capture_service
+from api.services.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/capture", tags=["capture"])
 
@@ -16,23 +17,36 @@ def submit_capture(data: CaptureCreate, db: Session = Depends(get_db)):
     return result
 
 
-@router.get("/")
-def list_captures(db: Session = Depends(get_db)):
-    from api.database.models import WorkRequestModel
+@router.post("/batch")
+def submit_capture_batch(data: CaptureBatchCreate, db: Session = Depends(get_db)):
+    """Process many captures at once (offline sync); failures are reported per item."""
+    return capture_service.process_captures_batch(db, [c.model_dump() for c in data.captures])
+
 
-    captures = capture_service.list_captures(db)
+@router.get("/")
+def list_captures(
+    response: Response,
+    limit: int | None = None,
+    cursor: str | None = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        captures = capture_service.list_captures(db, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if captures.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = captures.next_cursor
+    work_requests = capture_service.work_requests_for_captures(db, [c.capture_id for c in captures])
     result = []
     for c in captures:
-        wr = db.query(WorkRequestModel).filter(
-            WorkRequestModel.source_capture_id == c.capture_id
-        ).first()
+        wr = work_requests.get(c.capture_id)
         result.append({
             "capture_id": c.capture_id,
             "technician_id": c.technician_id,
             "capture_type": c.capture_type,
             "language": c.language,
             "equipment_tag_manual": c.equipment_tag_manual,
-            "raw_text_preview": (c.raw_text or "")[:100],
+            "raw_text_preview": c.raw_text_preview or "",
             "location_hint": c.location_hint,
             "work_request_id": wr.request_id if wr else None,
             "work_request_status": wr.status if wr else None,
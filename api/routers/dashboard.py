@@ -1,10 +1,11 @@
 """Dashboard router — executive dashboard data aggregation."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from api.database.connection import get_db
-from api.services import reporting_service
+from api.services import dashboard_service
+from api.services.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -12,35 +13,28 @@ router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 @router.get("/executive/{plant_id}")
 def get_executive_dashboard(plant_id: str, db: Session = Depends(get_db)):
     """Get consolidated executive dashboard data for a plant."""
-    reports = reporting_service.list_reports(db, plant_id)
-    notifications = reporting_service.list_notifications(db, plant_id)
-    critical_alerts = [n for n in notifications if n.get("level") == "CRITICAL"]
-    return {
-        "plant_id": plant_id,
-        "total_reports": len(reports),
-        "recent_reports": reports[:5],
-        "total_notifications": len(notifications),
-        "critical_alerts": len(critical_alerts),
-        "recent_notifications": notifications[:10],
-    }
+    return dashboard_service.get_executive_summary(db, plant_id)
 
 
 @router.get("/kpi-summary/{plant_id}")
 def get_kpi_summary(plant_id: str, db: Session = Depends(get_db)):
     """Get KPI summary with traffic lights for a plant."""
-    reports = reporting_service.list_reports(db, plant_id, "MONTHLY_KPI")
-    if reports:
-        latest = reporting_service.get_report(db, reports[0]["report_id"])
-        return {"plant_id": plant_id, "has_data": True, "report": latest}
-    return {"plant_id": plant_id, "has_data": False, "report": None}
+    return dashboard_service.get_kpi_summary(db, plant_id)
 
 
 @router.get("/alerts/{plant_id}")
-def get_dashboard_alerts(plant_id: str, db: Session = Depends(get_db)):
+def get_dashboard_alerts(
+    plant_id: str,
+    response: Response,
+    limit: int | None = None,
+    cursor: str | None = None,
+    db: Session = Depends(get_db),
+):
     """Get active (unacknowledged) alerts for dashboard display."""
-    notifications = reporting_service.list_notifications(db, plant_id, acknowledged=False)
-    return {
-        "plant_id": plant_id,
-        "total_active": len(notifications),
-        "alerts": notifications,
-    }
+    try:
+        result, page = dashboard_service.get_alerts(db, plant_id, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return result
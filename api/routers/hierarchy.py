@@ -1,10 +1,11 @@
 """Hierarchy router — plant hierarchy CRUD endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from api.database.connection import get_db
-from api.schemas import PlantCreate, NodeCreate, VendorBuildRequest
+from api.schemas import PlantCreate, NodeCreate, NodeMove, VendorBuildRequest
 from api.services import hierarchy_service
 from api.services.hierarchy_builder_service import build_hierarchy_from_vendor
 
@@ -51,6 +52,39 @@ def get_subtree(node_id: str, db: Session = Depends(get_db)):
     return [_node_to_dict(n) for n in nodes]
 
 
+@router.get("/nodes/{node_id}/ancestors")
+def get_ancestors(node_id: str, db: Session = Depends(get_db)):
+    if not hierarchy_service.get_node(db, node_id):
+        raise HTTPException(status_code=404, detail="Node not found")
+    return [_node_to_dict(n) for n in hierarchy_service.get_ancestors(db, node_id)]
+
+
+@router.put("/nodes/{node_id}/move")
+def move_node(node_id: str, data: NodeMove, db: Session = Depends(get_db)):
+    try:
+        node = hierarchy_service.move_node(db, node_id, data.parent_node_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not node:
+        raise HTTPException(status_code=404, detail="Node not found")
+    return _node_to_dict(node)
+
+
+@router.delete("/nodes/{node_id}")
+def delete_node(node_id: str, db: Session = Depends(get_db)):
+    try:
+        deleted = hierarchy_service.delete_node(db, node_id)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="Node or its subtree is still referenced (e.g. criticality assessments, health scores)",
+        )
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Node not found")
+    return {"node_id": node_id, "deleted": deleted}
+
+
 @router.post("/build-from-vendor")
 def build_from_vendor(data: VendorBuildRequest, db: Session = Depends(get_db)):
     """Build complete equipment hierarchy from vendor/OEM data."""
@@ -61,8 +95,8 @@ def build_from_vendor(data: VendorBuildRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/stats")
-def node_stats(plant_id: str | None = None, db: Session = Depends(get_db)):
-    return hierarchy_service.count_nodes_by_type(db, plant_id=plant_id)
+def node_stats(plant_id: str | None = None, node_id: str | None = None, db: Session = Depends(get_db)):
+    return hierarchy_service.count_nodes_by_type(db, plant_id=plant_id, node_id=node_id)
 
 
 def _node_to_dict(n) -> dict:
@@ -74,6 +108,7 @@ def _node_to_dict(n) -> dict:
         "code": n.code,
         "parent_node_id": n.parent_node_id,
         "level": n.level,
+        "path": n.path,
         "plant_id": n.plant_id,
         "tag": n.tag,
         "criticality": n.criticality,
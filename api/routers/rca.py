@@ -1,11 +1,12 @@
 """RCA & Defect Elimination router — root cause analysis, planning KPIs, DE KPIs."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from api.database.connection import get_db
 from api.schemas import RCACreate, FiveW2HRequest, RCAAdvance, PlanningKPIRequest, DEKPIRequest
 from api.services import rca_service
+from api.services.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/rca", tags=["rca"])
 
@@ -27,11 +28,20 @@ def create_rca(data: RCACreate, db: Session = Depends(get_db)):
 
 @router.get("/analyses")
 def list_rcas(
+    response: Response,
     plant_id: str | None = None,
     status: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
-    return rca_service.list_rcas(db, plant_id, status)
+    try:
+        page = rca_service.list_rcas(db, plant_id, status, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page
 
 
 @router.get("/analyses/summary")
@@ -104,8 +104,8 @@ def advance_moc(moc_id: str, data: MOCAdvance, db: Session = Depends(get_db)):
 # ── OCR ──────────────────────────────────────────────────────────────
 
 @router.post("/ocr/analyze")
-def calculate_ocr(data: OCRRequest, db: Session = Depends(get_db)):
-    return reliability_service.calculate_ocr(db, data.model_dump())
+def calculate_ocr(data: OCRRequest, include_cost_curve: bool = False, db: Session = Depends(get_db)):
+    return reliability_service.calculate_ocr(db, data.model_dump(), include_cost_curve)
 
 
 # ── Jack-Knife ───────────────────────────────────────────────────────
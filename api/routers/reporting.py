@@ -1,6 +1,10 @@
 """Reporting router — reports, DE KPIs, notifications, import/export, cross-module analytics."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from typing import Iterator
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from api.database.connection import get_db
@@ -9,7 +13,10 @@ from api.schemas import (
     ReportingDEKPIRequest, NotificationRequest, ImportValidateRequest,
     ExportRequest, CrossModuleRequest,
 )
-from api.services import reporting_service
+from api.services import export_service, reporting_service, import_service
+from api.services.pagination import NEXT_CURSOR_HEADER
+from tools.engines.data_export_engine import STREAM_FORMATS
+from tools.models.schemas import ImportSource
 
 router = APIRouter(prefix="/reporting", tags=["reporting"])
 
@@ -36,11 +43,20 @@ def generate_quarterly_report(data: QuarterlyReportRequest, db: Session = Depend
 
 @router.get("/reports")
 def list_reports(
+    response: Response,
     plant_id: str | None = None,
     report_type: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
-    return reporting_service.list_reports(db, plant_id, report_type)
+    try:
+        page = reporting_service.list_reports(db, plant_id, report_type, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page
 
 
 @router.get("/reports/{report_id}")
@@ -74,11 +90,20 @@ def generate_notifications(data: NotificationRequest, db: Session = Depends(get_
 
 @router.get("/notifications")
 def list_notifications(
+    response: Response,
     plant_id: str | None = None,
     level: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
-    return reporting_service.list_notifications(db, plant_id, level)
+    try:
+        page = reporting_service.list_notifications(db, plant_id, level, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page
 
 
 @router.put("/notifications/{notification_id}/ack")
@@ -96,6 +121,33 @@ def validate_import(data: ImportValidateRequest, db: Session = Depends(get_db)):
     return reporting_service.validate_import(db, data.source, data.rows)
 
 
+@router.post("/import/upload")
+def upload_import(
+    source: str = Query("EQUIPMENT_HIERARCHY"),
+    plant_id: str | None = None,
+    chunk_size: int = Query(5000, ge=100, le=50000),
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+):
+    """Stream a CSV/XLSX extract into the database in chunks."""
+    if source not in ImportSource.__members__:
+        raise HTTPException(status_code=422, detail=f"Unknown import source: {source}")
+    try:
+        result = import_service.import_file(
+            db, source, file.file, filename=file.filename, plant_id=plant_id, chunk_size=chunk_size,
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except import_service.ImportAborted as e:
+        # Earlier chunks stay committed: report them with the error
+        raise HTTPException(status_code=400, detail={
+            "message": str(e), "result": e.result.model_dump(mode="json"),
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return result.model_dump(mode="json")
+
+
 # ── Export ──────────────────────────────────────────────────────────
 
 @router.post("/export")
@@ -105,6 +157,77 @@ def export_data(data: ExportRequest, db: Session = Depends(get_db)):
     return reporting_service.export_data(db, export_type, d)
 
 
+def _check_format(fmt: str):
+    if fmt not in STREAM_FORMATS:
+        raise HTTPException(status_code=422, detail=f"Unknown export format: {fmt}")
+
+
+def _streaming(chunks: Iterator[bytes], fmt: str, basename: str) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        media_type=export_service.media_type(fmt),
+        headers={"Content-Disposition": f'attachment; filename="{export_service.filename(basename, fmt)}"'},
+    )
+
+
+@router.get("/export/columnar/{dataset}")
+def stream_columnar_export(
+    dataset: str,
+    format: str = Query("parquet"),
+    plant_id: str | None = None,
+    equipment_id: str | None = None,
+    db: Session = Depends(get_db),
+):
+    """Stream an analytics dataset as Parquet or an Arrow IPC stream."""
+    if dataset not in export_service.DATASETS:
+        raise HTTPException(status_code=404, detail=f"Unknown dataset: {dataset}")
+    if format not in export_service.COLUMNAR_FORMATS:
+        raise HTTPException(status_code=422, detail=f"Unknown columnar format: {format}")
+    try:
+        chunks = export_service.stream_dataset(db, dataset, format, plant_id, equipment_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return StreamingResponse(
+        chunks,
+        media_type=export_service.columnar_media_type(format),
+        headers={"Content-Disposition": f'attachment; filename="{export_service.columnar_filename(dataset, format)}"'},
+    )
+
+
+@router.post("/export/stream")
+def stream_export(data: ExportRequest, format: str = Query("csv"), db: Session = Depends(get_db)):
+    """Stream a payload export as CSV, NDJSON or XLSX."""
+    _check_format(format)
+    d = data.model_dump()
+    export_type = d.pop("export_type", "report")
+    return _streaming(export_service.stream_prepared(db, export_type, d, format), format, export_type)
+
+
+@router.get("/export/equipment")
+def stream_equipment_export(
+    plant_id: str | None = None,
+    format: str = Query("csv"),
+    db: Session = Depends(get_db),
+):
+    """Stream every EQUIPMENT node (optionally of one plant) from the database."""
+    _check_format(format)
+    return _streaming(export_service.stream_equipment(db, format, plant_id), format, "equipment")
+
+
+@router.get("/export/work-orders")
+def stream_work_order_export(
+    equipment_id: str | None = None,
+    since: date | None = None,
+    until: date | None = None,
+    format: str = Query("csv"),
+    db: Session = Depends(get_db),
+):
+    """Stream the work order history from the database."""
+    _check_format(format)
+    chunks = export_service.stream_work_orders(db, format, equipment_id, since, until)
+    return _streaming(chunks, format, "work_orders")
+
+
 # ── Cross-Module ────────────────────────────────────────────────────
 
 @router.post("/cross-module/analyze")
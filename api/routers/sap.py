@@ -1,11 +1,12 @@
 """SAP router — upload generation, approval, mock data access."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from api.database.connection import get_db
 from api.schemas import SAPUploadRequest, SAPTransitionRequest
 from api.services import sap_service
+from api.services.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/sap", tags=["sap"])
 
@@ -37,9 +38,20 @@ def get_upload(package_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/uploads")
-def list_uploads(plant_code: str | None = None, db: Session = Depends(get_db)):
-    uploads = sap_service.list_uploads(db, plant_code=plant_code)
-    return [{"package_id": u.package_id, "plant_code": u.plant_code, "status": u.status} for u in uploads]
+def list_uploads(
+    response: Response,
+    plant_code: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        page = sap_service.list_uploads(db, plant_code=plant_code, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return [{"package_id": u.package_id, "plant_code": u.plant_code, "status": u.status} for u in page]
 
 
 @router.put("/uploads/{package_id}/approve")
@@ -1,12 +1,13 @@
 """Scheduling router — weekly program management and Gantt export."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from api.database.connection import get_db
 from api.schemas import ProgramCreate
 from api.services import scheduling_service
+from api.services.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/scheduling", tags=["scheduling"])
 
@@ -18,11 +19,20 @@ def create_program(data: ProgramCreate, db: Session = Depends(get_db)):
 
 @router.get("/programs")
 def list_programs(
+    response: Response,
     plant_id: str | None = None,
     status: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
-    return scheduling_service.list_programs(db, plant_id, status)
+    try:
+        page = scheduling_service.list_programs(db, plant_id, status, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page
 
 
 @router.get("/programs/{program_id}")
@@ -40,6 +50,7 @@ def get_program(program_id: str, db: Session = Depends(get_db)):
         "work_packages": model.work_packages,
         "resource_slots": model.resource_slots,
         "conflicts": model.conflicts,
+        "leveling_conflicts": model.leveling_conflicts,
         "support_tasks": model.support_tasks,
         "created_at": model.created_at.isoformat() if model.created_at else None,
         "finalized_at": model.finalized_at.isoformat() if model.finalized_at else None,
@@ -80,11 +91,11 @@ def get_gantt(program_id: str, db: Session = Depends(get_db)):
 
 @router.get("/programs/{program_id}/gantt/export")
 def export_gantt_excel(program_id: str, db: Session = Depends(get_db)):
-    filepath = scheduling_service.export_gantt_excel(db, program_id)
-    if not filepath:
+    chunks = scheduling_service.stream_gantt_excel(db, program_id)
+    if chunks is None:
         raise HTTPException(status_code=404, detail="Program not found")
-    return FileResponse(
-        filepath,
+    return StreamingResponse(
+        chunks,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        filename=f"gantt_{program_id}.xlsx",
+        headers={"Content-Disposition": f'attachment; filename="gantt_{program_id}.xlsx"'},
     )
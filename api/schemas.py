@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from datetime import date
+
 from pydantic import BaseModel, ConfigDict, Field
 from typing import Any
 
+from api.config import settings
+
 
 # ── Admin ────────────────────────────────────────────────────────────
 
@@ -38,6 +42,11 @@ class KPIRequest(BaseModel):
     total_downtime_hours: float | None = None
 
 
+class KPIRollupRefreshRequest(BaseModel):
+    since: date | None = None
+    until: date | None = None
+
+
 class WeibullFitRequest(BaseModel):
     failure_intervals: list[float]
 
@@ -59,6 +68,7 @@ class VarianceDetectRequest(BaseModel):
 class BacklogOptimizeRequest(BaseModel):
     plant_id: str = "BRY"
     period_days: int = 30
+    incremental: bool = False  # reuse the previous run's grouping, reload only changed items
 
 
 # ── Capture ──────────────────────────────────────────────────────────
@@ -72,6 +82,11 @@ class CaptureCreate(BaseModel):
     raw_text_input: str | None = None
     equipment_tag_manual: str | None = None
     location_hint: str | None = None
+    plant_id: str | None = None  # Restricts equipment resolution to one plant
+
+
+class CaptureBatchCreate(BaseModel):
+    captures: list[CaptureCreate] = Field(..., max_length=settings.CAPTURE_BATCH_MAX)
 
 
 # ── Criticality ──────────────────────────────────────────────────────
@@ -147,6 +162,10 @@ class NodeCreate(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+class NodeMove(BaseModel):
+    parent_node_id: str | None = None
+
+
 class VendorBuildRequest(BaseModel):
     plant_id: str
     area_code: str
@@ -323,6 +323,7 @@ def _seed_m13_data(db: Session, nodes: list[dict]) -> dict:
                 materials_ready=random.choice([True, True, False]),
                 shutdown_required=random.choice([True, False, False]),
                 age_days=random.randint(1, 45),
+                plant_id="OCP-JFC1",
                 created_at=datetime.now() - timedelta(days=random.randint(1, 30)),
             ))
             bl_count += 1
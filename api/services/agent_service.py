@@ -1,7 +1,11 @@
 """Agent service — optional wrapper for AI agent workflows (requires API key)."""
 
+import logging
+
 from api.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 def is_api_available() -> bool:
     return bool(settings.ANTHROPIC_API_KEY)
@@ -13,3 +17,26 @@ def get_status() -> dict:
         "agents_available": ["orchestrator", "reliability", "planning", "spare_parts"] if is_api_available() else [],
         "message": "Agent workflows require ANTHROPIC_API_KEY in .env" if not is_api_available() else "Ready",
     }
+
+
+def warm_up_prompts() -> dict:
+    """Preload agent system prompts, skill maps and tool schemas into the process cache."""
+    from agents._shared import cache
+    from agents._shared.loader import warm_up
+    from agents.definitions.orchestrator import ORCHESTRATOR_CONFIG
+    from agents.definitions.planning import PLANNING_CONFIG
+    from agents.definitions.reliability import RELIABILITY_CONFIG
+    from agents.definitions.spare_parts import SPARE_PARTS_CONFIG
+
+    warmed = warm_up()
+    for config in (ORCHESTRATOR_CONFIG, RELIABILITY_CONFIG, PLANNING_CONFIG, SPARE_PARTS_CONFIG):
+        config.get_tools_schema()
+        try:
+            config.load_system_prompt()
+        except FileNotFoundError as e:
+            logger.warning("Prompt warm-up skipped for %s: %s", config.agent_type, e)
+            continue
+        warmed[config.agent_type] = warmed.get(config.agent_type, 0) + 1
+    stats = cache.stats()
+    logger.info("Agent prompt cache warmed: %s (%d files)", warmed, stats["files"])
+    return {"prompts": warmed, **stats}
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from api.database.models import HealthScoreModel, KPIMetricsModel, FailurePredictionModel, VarianceAlertModel
 from api.services.audit_service import log_action
+from api.services.pagination import Page, paginate
 from tools.engines.health_score_engine import HealthScoreEngine
 from tools.engines.kpi_engine import KPIEngine
 from tools.engines.weibull_engine import WeibullEngine
@@ -91,5 +92,9 @@ def detect_variance(snapshots: list[dict]) -> list[dict]:
     return [a.model_dump(mode="json") for a in alerts]
 
 
-def get_variance_alerts(db: Session) -> list[VarianceAlertModel]:
-    return db.query(VarianceAlertModel).order_by(VarianceAlertModel.detected_at.desc()).all()
+def get_variance_alerts(db: Session, limit: int | None = None, cursor: str | None = None) -> Page:
+    q = db.query(
+        VarianceAlertModel.alert_id, VarianceAlertModel.plant_id, VarianceAlertModel.metric_name,
+        VarianceAlertModel.z_score, VarianceAlertModel.variance_level, VarianceAlertModel.detected_at,
+    )
+    return paginate(q, VarianceAlertModel.detected_at, VarianceAlertModel.alert_id, limit, cursor)
@@ -1,19 +1,216 @@
-"""Audit log service — records every mutation for traceability."""
+"""Audit log service — records every mutation for traceability.
 
+Entries are buffered on the session and written with a single executemany
+when the session commits, so they stay in the same transaction as the
+change they describe without a flush per call. ``AUDIT_MODE`` selects the
+guarantee:
+
+- ``batched`` (default): buffered, written inside the committing transaction.
+- ``sync``: flushed immediately on every call (legacy behaviour).
+- ``async``: handed to a background writer after commit (fire-and-forget;
+  entries can be lost if the process dies before the queue drains). Falls
+  back to ``batched`` when the writer is not running.
+"""
+
+import logging
+import queue
+import threading
 from datetime import datetime
+
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
+from api.config import settings
 from api.database.models import AuditLogModel
 
+logger = logging.getLogger(__name__)
+
+_BUFFER_KEY = "audit_buffer"
+
 
 def log_action(db: Session, entity_type: str, entity_id: str, action: str, payload: dict | None = None, user: str = "system"):
-    entry = AuditLogModel(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        payload=payload,
-        user=user,
-        timestamp=datetime.now(),
-    )
-    db.add(entry)
-    db.flush()
+    row = {
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "action": action,
+        "payload": payload,
+        "user": user,
+        "timestamp": datetime.now(),
+    }
+    if settings.AUDIT_MODE == "sync":
+        db.add(AuditLogModel(**row))
+        db.flush()
+        return
+    db.info.setdefault(_BUFFER_KEY, []).append(row)
+
+
+def pending_entries(db: Session) -> int:
+    """Number of audit entries buffered on the session and not yet written."""
+    return len(db.info.get(_BUFFER_KEY, ()))
+
+
+def flush_audit(db: Session) -> int:
+    """Write buffered entries now (still inside the session's transaction)."""
+    rows = db.info.pop(_BUFFER_KEY, None)
+    if not rows:
+        return 0
+    db.execute(insert(AuditLogModel.__table__), rows)
+    return len(rows)
+
+
+class AuditWriter:
+    """Background thread that writes audit entries from a bounded queue.
+
+    Args:
+        maxsize: Queue capacity in batches (one batch per committed session).
+        block: When the queue is full, wait for space (True) or drop the batch (False).
+        batch_size: Maximum rows coalesced into one write transaction.
+    """
+
+    _STOP = object()
+
+    def __init__(self, maxsize: int = 1000, block: bool = True, batch_size: int = 1000):
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._block = block
+        self._batch_size = batch_size
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 10.0):
+        """Write everything still queued, then stop the thread."""
+        if not self.running:
+            return
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, bind: Engine, rows: list[dict]) -> bool:
+        try:
+            self._queue.put((bind, rows), block=self._block)
+        except queue.Full:
+            with self._lock:
+                self.dropped += len(rows)
+            logger.warning("Audit queue full — dropped %d entries", len(rows))
+            return False
+        return True
+
+    def drain(self):
+        """Block until every submitted batch has been written."""
+        self._queue.join()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "running": self.running,
+                "queued_batches": self._queue.qsize(),
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+            }
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                self._queue.task_done()
+                return
+            batches = [item]
+            stop = False
+            pending = len(item[1])
+            while pending < self._batch_size:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is self._STOP:
+                    stop = True
+                    break
+                batches.append(nxt)
+                pending += len(nxt[1])
+            self._write(batches)
+            for _ in batches:
+                self._queue.task_done()
+            if stop:
+                self._queue.task_done()
+                return
+
+    def _write(self, batches: list[tuple[Engine, list[dict]]]):
+        by_bind: dict[Engine, list[dict]] = {}
+        for bind, rows in batches:
+            by_bind.setdefault(bind, []).extend(rows)
+        for bind, rows in by_bind.items():
+            try:
+                with bind.begin() as conn:
+                    conn.execute(insert(AuditLogModel.__table__), rows)
+            except Exception:
+                logger.exception("Audit writer failed to write %d entries", len(rows))
+                with self._lock:
+                    self.failed += len(rows)
+            else:
+                with self._lock:
+                    self.written += len(rows)
+
+
+_writer: AuditWriter | None = None
+
+
+def start_audit_writer() -> AuditWriter:
+    """Start the background writer used by ``AUDIT_MODE=async``."""
+    global _writer
+    if _writer is None:
+        _writer = AuditWriter(
+            maxsize=settings.AUDIT_QUEUE_SIZE,
+            block=settings.AUDIT_QUEUE_BLOCK,
+        )
+    _writer.start()
+    return _writer
+
+
+def stop_audit_writer():
+    global _writer
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
+
+
+def get_audit_writer() -> AuditWriter | None:
+    return _writer
+
+
+def _async_enabled() -> bool:
+    return settings.AUDIT_MODE == "async" and _writer is not None and _writer.running
+
+
+@event.listens_for(Session, "before_commit")
+def _flush_on_commit(session: Session):
+    if not _async_enabled():
+        flush_audit(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_after_commit(session: Session):
+    if _async_enabled():
+        rows = session.info.pop(_BUFFER_KEY, None)
+        if rows:
+            _writer.submit(session.get_bind(), rows)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_on_rollback(session: Session, transaction):
+    # Rolled back or closed without commit: the audited changes are gone too
+    if transaction.parent is None:
+        session.info.pop(_BUFFER_KEY, None)
@@ -1,17 +1,36 @@
 """Backlog service — manages backlog items and optimisation."""
 
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, date
+from typing import Callable
+
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from api.database.models import (
     BacklogItemModel, WorkRequestModel, OptimizedBacklogModel,
-    WorkforceModel, ShutdownCalendarModel,
+    WorkforceModel, ShutdownCalendarModel, HierarchyNodeModel,
 )
 from api.services.audit_service import log_action
-from tools.processors.backlog_optimizer import BacklogOptimizer
+from tools.engines.backlog_grouper import BacklogGrouper, GroupingCache, WorkPackageGroup
+from tools.processors.backlog_optimizer import BacklogOptimizer, _to_backlog_entries
 from tools.models.schemas import BacklogItem, Priority, BacklogWOType, BacklogStatus
 
 
+@dataclass
+class _PlantBacklogCache:
+    """Converted backlog items of one plant and the grouping state built on them."""
+    cursor: datetime | None = None  # newest updated_at seen
+    items: dict[str, BacklogItem] = field(default_factory=dict)  # ordered by backlog_id
+    groupings: dict[str, GroupingCache] = field(default_factory=dict)
+    dirty: dict[str, set[str]] = field(default_factory=dict)  # grouping -> ids changed since it ran
+
+
+_plant_caches: dict[str, _PlantBacklogCache] = {}
+_cache_lock = threading.Lock()
+
+
 def add_to_backlog(db: Session, work_request_id: str) -> dict | None:
     """Create a backlog item from a validated work request."""
     wr = db.query(WorkRequestModel).filter(
@@ -24,8 +43,13 @@ def add_to_backlog(db: Session, work_request_id: str) -> dict | None:
     priority = ai.get("priority_suggested", "3_NORMAL")
     wo_type = _map_wo_type(ai.get("work_order_type", "PM01_INSPECTION"))
 
+    plant_id = db.query(HierarchyNodeModel.plant_id).filter(
+        HierarchyNodeModel.node_id == wr.equipment_id
+    ).scalar()
+
     item = BacklogItemModel(
         work_request_id=work_request_id,
+        plant_id=plant_id,
         equipment_id=wr.equipment_id,
         equipment_tag=wr.equipment_tag,
         priority=priority,
@@ -65,13 +89,15 @@ def list_backlog(
     return [_item_to_dict(i) for i in items]
 
 
-def optimize_backlog(db: Session, plant_id: str, period_days: int = 30) -> dict:
-    """Run backlog optimisation for a plant."""
-    # Load all backlog items
-    db_items = db.query(BacklogItemModel).all()
+def optimize_backlog(
+    db: Session, plant_id: str, period_days: int = 30, incremental: bool = False,
+) -> dict:
+    """Run backlog optimisation for a plant.
 
-    # Convert to schema objects
-    items = [_to_schema_item(i) for i in db_items]
+    With incremental=True only backlog rows changed since the previous run for
+    the plant are reloaded, and only their areas are regrouped.
+    """
+    items, groups = load_plant_backlog(db, plant_id, incremental=incremental)
 
     # Load workforce and shutdowns
     workforce = [
@@ -88,7 +114,7 @@ def optimize_backlog(db: Session, plant_id: str, period_days: int = 30) -> dict:
     ]
 
     # Optimise
-    result = BacklogOptimizer.optimize(items, workforce, shutdowns, period_days)
+    result = BacklogOptimizer.optimize(items, workforce, shutdowns, period_days, groups=groups)
 
     # Persist
     opt_model = OptimizedBacklogModel(
@@ -162,6 +188,96 @@ def get_schedule(db: Session) -> dict | None:
     }
 
 
+def load_plant_backlog(
+    db: Session,
+    plant_id: str,
+    incremental: bool = False,
+    grouping: str = "all",
+    include: Callable[[BacklogItem], bool] | None = None,
+) -> tuple[list[BacklogItem], list[WorkPackageGroup]]:
+    """Load a plant's backlog and its work package groups.
+
+    Items without a resolved plant (plant_id NULL) belong to every plant's
+    backlog. A full load refreshes the per-plant cache; an incremental load
+    only fetches rows whose updated_at is at or after the cache cursor, plus
+    a COUNT to detect deleted rows.
+
+    Args:
+        grouping: Name of the grouping kept in the cache for this caller.
+        include: Filter selecting the items that take part in this grouping.
+
+    Returns:
+        (all plant items ordered by backlog_id, groups for the included items)
+    """
+    scope = or_(BacklogItemModel.plant_id == plant_id, BacklogItemModel.plant_id.is_(None))
+    with _cache_lock:
+        cache = _plant_caches.get(plant_id)
+        if not incremental or cache is None:
+            rows = db.query(BacklogItemModel).filter(scope).order_by(BacklogItemModel.backlog_id).all()
+            cache = _PlantBacklogCache(
+                cursor=max((r.updated_at for r in rows if r.updated_at), default=None),
+                items={r.backlog_id: _to_schema_item(r) for r in rows},
+            )
+            _plant_caches[plant_id] = cache
+        else:
+            _refresh_plant_cache(db, cache, scope)
+
+        items = list(cache.items.values())
+        selected = [i for i in items if include(i)] if include else items
+        grouping_cache = cache.groupings.get(grouping)
+        if grouping_cache is None:
+            grouping_cache = cache.groupings[grouping] = GroupingCache()
+            upserts, removed = selected, set()
+        else:
+            dirty = cache.dirty[grouping]
+            upserts = [i for i in selected if i.backlog_id in dirty]
+            removed = dirty - {i.backlog_id for i in upserts}
+        cache.dirty[grouping] = set()
+        groups = BacklogGrouper.update_groups(grouping_cache, _to_backlog_entries(upserts), removed)
+    return items, groups
+
+
+def invalidate_backlog_cache(plant_id: str | None = None) -> None:
+    """Drop cached backlog state for one plant, or for all plants."""
+    with _cache_lock:
+        if plant_id is None:
+            _plant_caches.clear()
+        else:
+            _plant_caches.pop(plant_id, None)
+
+
+def _refresh_plant_cache(db: Session, cache: _PlantBacklogCache, scope) -> None:
+    """Apply rows changed since the cache cursor, then drop deleted rows."""
+    q = db.query(BacklogItemModel).filter(scope)
+    if cache.cursor is not None:
+        q = q.filter(BacklogItemModel.updated_at >= cache.cursor)
+
+    changed: set[str] = set()
+    inserted = False
+    for row in q.all():
+        if row.updated_at and (cache.cursor is None or row.updated_at > cache.cursor):
+            cache.cursor = row.updated_at
+        item = _to_schema_item(row)
+        old = cache.items.get(row.backlog_id)
+        if old == item:
+            continue
+        inserted = inserted or old is None
+        cache.items[row.backlog_id] = item
+        changed.add(row.backlog_id)
+
+    total = db.query(func.count()).select_from(BacklogItemModel).filter(scope).scalar()
+    if total != len(cache.items):
+        live = {backlog_id for (backlog_id,) in db.query(BacklogItemModel.backlog_id).filter(scope)}
+        for backlog_id in set(cache.items) - live:
+            del cache.items[backlog_id]
+            changed.add(backlog_id)
+    if inserted:
+        cache.items = dict(sorted(cache.items.items()))
+
+    for dirty in cache.dirty.values():
+        dirty |= changed
+
+
 def _map_wo_type(wo_type: str) -> str:
     mapping = {"PM01_INSPECTION": "PM01", "PM02_PREVENTIVE": "PM02", "PM03_CORRECTIVE": "PM03"}
     return mapping.get(wo_type, "PM01")
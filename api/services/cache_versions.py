@@ -0,0 +1,68 @@
+"""Cross-process versions for the in-process caches.
+
+The dashboard counters and the equipment registry are kept per worker
+process and patched from that process's commits only; commits made by
+another worker (gunicorn runs several) never reach them through the
+session hooks. Writers therefore also bump a ``cache_versions`` row per
+(scope, plant) inside their own transaction, and a cached entry is only
+served while the versions it was built at are still the current ones, which
+costs one primary-key query.
+
+A token maps plant_id to version for the rows an entry depends on: its
+plant and ``ALL_PLANTS`` (bumped when every plant is invalidated), or every
+row of the scope for an all-plants entry. Missing rows count as version 0.
+"""
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from api.database.models import CacheVersionModel
+
+ALL_PLANTS = "*"
+
+_table = CacheVersionModel.__table__
+
+# advance() outcomes for a cached entry after a local commit
+APPLY = "apply"  # built before the commit: apply its changes
+SKIP = "skip"    # built after the commit or not affected: leave as is
+DROP = "drop"    # another process committed too: rebuild on next use
+
+
+def read(db: Session, scope: str, plant_id: str | None) -> dict[str, int]:
+    """Current token of a plant's entry (plant_id None: the all-plants entry)."""
+    q = select(_table.c.plant_id, _table.c.version).where(_table.c.scope == scope)
+    if plant_id is not None:
+        q = q.where(_table.c.plant_id.in_([plant_id, ALL_PLANTS]))
+    return dict(db.execute(q).all())
+
+
+def bump(db: Session, scope: str, plant_id: str | None, bumps: dict[str, list[int]]):
+    """Increment the version of a plant (None: ALL_PLANTS) in ``db``'s transaction.
+
+    ``bumps`` collects {plant_id: [version before the transaction, current]}
+    for ``advance`` once the transaction commits. The row stays locked until
+    then, so the versions of one transaction are consecutive.
+    """
+    key = plant_id or ALL_PLANTS
+    where = (_table.c.scope == scope) & (_table.c.plant_id == key)
+    conn = db.connection()
+    if not conn.execute(update(_table).where(where).values(version=_table.c.version + 1)).rowcount:
+        conn.execute(insert(_table).values(scope=scope, plant_id=key, version=1))
+    version = conn.execute(select(_table.c.version).where(where)).scalar_one()
+    bumps.setdefault(key, [version - 1, version])[1] = version
+
+
+def advance(token: dict[str, int], plant_id: str | None, bumps: dict[str, list[int]]) -> str:
+    """Classify a cached entry after a commit that made ``bumps``; updates ``token`` on APPLY."""
+    relevant = {k: v for k, v in bumps.items() if plant_id is None or k in (plant_id, ALL_PLANTS)}
+    if not relevant:
+        return SKIP
+    states = set()
+    for key, (before, after) in relevant.items():
+        current = token.get(key, 0)
+        states.add(APPLY if current == before else SKIP if current == after else DROP)
+    if len(states) > 1 or DROP in states:
+        return DROP
+    if APPLY in states:
+        token.update({key: after for key, (_before, after) in relevant.items()})
+    return states.pop()
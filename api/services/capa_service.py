@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from api.database.models import CAPAItemModel
 from api.services.audit_service import log_action
+from api.services.pagination import Page, paginate
 from tools.engines.capa_engine import CAPAEngine
 from tools.models.schemas import CAPAType, CAPAItem
 
@@ -43,17 +44,28 @@ def get_capa(db: Session, capa_id: str) -> CAPAItemModel | None:
     return db.query(CAPAItemModel).filter(CAPAItemModel.capa_id == capa_id).first()
 
 
-def list_capas(db: Session, plant_id: str | None = None, status: str | None = None) -> list[CAPAItemModel]:
+def list_capas(
+    db: Session, plant_id: str | None = None, status: str | None = None,
+    limit: int | None = None, cursor: str | None = None,
+) -> Page:
     q = db.query(CAPAItemModel)
     if plant_id:
         q = q.filter(CAPAItemModel.plant_id == plant_id)
     if status:
         q = q.filter(CAPAItemModel.status == status)
-    return q.order_by(CAPAItemModel.created_at.desc()).all()
+    return paginate(q, CAPAItemModel.created_at, CAPAItemModel.capa_id, limit, cursor)
 
 
 def get_summary(db: Session, plant_id: str | None = None) -> dict:
-    capas = list_capas(db, plant_id=plant_id)
+    # Only the columns CAPAItem needs — skips the action lists and free-text fields
+    q = db.query(
+        CAPAItemModel.capa_id, CAPAItemModel.capa_type, CAPAItemModel.title,
+        CAPAItemModel.description, CAPAItemModel.plant_id, CAPAItemModel.source,
+        CAPAItemModel.current_phase, CAPAItemModel.status, CAPAItemModel.created_at,
+    )
+    if plant_id:
+        q = q.filter(CAPAItemModel.plant_id == plant_id)
+    capas = paginate(q, CAPAItemModel.created_at, CAPAItemModel.capa_id)
     capa_objects = []
     for c in capas:
         capa_objects.append(CAPAItem(
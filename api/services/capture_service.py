@@ -1,18 +1,26 @@
 """Capture service — processes field captures into structured work requests."""
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
+from api.config import settings
 from api.database.models import FieldCaptureModel, WorkRequestModel
+from api.services import equipment_registry
 from api.services.audit_service import log_action
-from tools.processors.pii_redactor import redact
+from api.services.pagination import Page, paginate
 from tools.processors.field_capture_processor import FieldCaptureProcessor
-from tools.models.schemas import FieldCaptureInput, CaptureType, Language
+from tools.processors.pii_redactor import redact
+from tools.models.schemas import FieldCaptureInput, CaptureType, Language, StructuredWorkRequest
 
+logger = logging.getLogger(__name__)
 
-def process_capture(db: Session, data: dict) -> dict:
-    """Process a field capture: persist raw capture, run processor, persist work request."""
-    capture_input = FieldCaptureInput(
+
+def _capture_input(data: dict) -> FieldCaptureInput:
+    return FieldCaptureInput(
         timestamp=datetime.now(),
         technician_id=data.get("technician_id", "UNKNOWN"),
         technician_name=data.get("technician_name", "Unknown"),
@@ -25,62 +33,41 @@ def process_capture(db: Session, data: dict) -> dict:
         location_hint=data.get("location_hint"),
     )
 
-    # Persist raw capture
-    capture_model = FieldCaptureModel(
-        capture_id=capture_input.capture_id,
-        technician_id=capture_input.technician_id,
-        capture_type=capture_input.capture_type.value,
-        language=capture_input.language_detected.value,
-        raw_text=capture_input.raw_text_input,
-        raw_voice_text=capture_input.raw_voice_text,
-        images=None,
-        equipment_tag_manual=capture_input.equipment_tag_manual,
-        location_hint=capture_input.location_hint,
-        created_at=datetime.now(),
-    )
-    db.add(capture_model)
-    log_action(db, "field_capture", capture_model.capture_id, "CREATE")
 
-    # Build equipment registry from hierarchy nodes
-    from api.database.models import HierarchyNodeModel
-    nodes = db.query(HierarchyNodeModel).filter(
-        HierarchyNodeModel.node_type == "EQUIPMENT"
-    ).all()
-    equipment_registry = [
-        {
-            "equipment_id": n.node_id,
-            "tag": n.tag or n.code,
-            "description": n.name,
-            "description_fr": n.name_fr or "",
-            "aliases": [],
-        }
-        for n in nodes
-    ]
-
-    # Process
-    processor = FieldCaptureProcessor(equipment_registry)
-    wr = processor.process(capture_input)
+def _capture_row(capture_input: FieldCaptureInput) -> dict:
+    return {
+        "capture_id": capture_input.capture_id,
+        "technician_id": capture_input.technician_id,
+        "capture_type": capture_input.capture_type.value,
+        "language": capture_input.language_detected.value,
+        "raw_text": capture_input.raw_text_input,
+        "raw_voice_text": capture_input.raw_voice_text,
+        "images": None,
+        "equipment_tag_manual": capture_input.equipment_tag_manual,
+        "location_hint": capture_input.location_hint,
+        "created_at": datetime.now(),
+    }
 
-    # Persist work request
-    wr_model = WorkRequestModel(
-        request_id=wr.request_id,
-        source_capture_id=capture_input.capture_id,
-        status=wr.status.value,
-        equipment_id=wr.equipment_identification.equipment_id,
-        equipment_tag=wr.equipment_identification.equipment_tag,
-        equipment_confidence=wr.equipment_identification.confidence_score,
-        resolution_method=wr.equipment_identification.resolution_method.value,
-        problem_description=wr.problem_description.model_dump(mode="json"),
-        ai_classification=wr.ai_classification.model_dump(mode="json"),
-        spare_parts=[sp.model_dump(mode="json") for sp in wr.spare_parts_suggested],
-        image_analysis=wr.image_analysis.model_dump(mode="json") if wr.image_analysis else None,
-        validation=wr.validation.model_dump(mode="json"),
-        created_at=datetime.now(),
-    )
-    db.add(wr_model)
-    log_action(db, "work_request", wr_model.request_id, "CREATE")
-    db.commit()
 
+def _work_request_row(capture_input: FieldCaptureInput, wr: StructuredWorkRequest) -> dict:
+    return {
+        "request_id": wr.request_id,
+        "source_capture_id": capture_input.capture_id,
+        "status": wr.status.value,
+        "equipment_id": wr.equipment_identification.equipment_id,
+        "equipment_tag": wr.equipment_identification.equipment_tag,
+        "equipment_confidence": wr.equipment_identification.confidence_score,
+        "resolution_method": wr.equipment_identification.resolution_method.value,
+        "problem_description": wr.problem_description.model_dump(mode="json"),
+        "ai_classification": wr.ai_classification.model_dump(mode="json"),
+        "spare_parts": [sp.model_dump(mode="json") for sp in wr.spare_parts_suggested],
+        "image_analysis": wr.image_analysis.model_dump(mode="json") if wr.image_analysis else None,
+        "validation": wr.validation.model_dump(mode="json"),
+        "created_at": datetime.now(),
+    }
+
+
+def _summary(capture_input: FieldCaptureInput, wr: StructuredWorkRequest) -> dict:
     return {
         "capture_id": capture_input.capture_id,
         "work_request_id": wr.request_id,
@@ -93,11 +80,124 @@ def process_capture(db: Session, data: dict) -> dict:
     }
 
 
+def process_capture(db: Session, data: dict) -> dict:
+    """Process a field capture: persist raw capture, run processor, persist work request."""
+    capture_input = _capture_input(data)
+
+    # Persist raw capture
+    capture_model = FieldCaptureModel(**_capture_row(capture_input))
+    db.add(capture_model)
+    log_action(db, "field_capture", capture_model.capture_id, "CREATE")
+
+    # Process against the plant's cached equipment registry
+    processor = equipment_registry.get_processor(db, data.get("plant_id"))
+    wr = processor.process(capture_input)
+
+    # Persist work request
+    wr_model = WorkRequestModel(**_work_request_row(capture_input, wr))
+    db.add(wr_model)
+    log_action(db, "work_request", wr_model.request_id, "CREATE")
+    db.commit()
+
+    return _summary(capture_input, wr)
+
+
+def process_captures_batch(db: Session, items: list[dict], max_workers: int | None = None) -> dict:
+    """Process a batch of captures (e.g. an offline sync) in one transaction.
+
+    Captures are processed on a thread pool sharing each plant's cached
+    processor. Successful captures and their work requests are written with
+    two executemany inserts and a single commit. An item that fails
+    validation or processing is reported in ``results`` with its error and
+    does not affect the rest of the batch.
+    """
+    results: list[dict] = [{}] * len(items)
+    jobs: list[tuple[int, FieldCaptureInput, FieldCaptureProcessor]] = []
+    processors: dict[str | None, FieldCaptureProcessor] = {}
+    for i, data in enumerate(items):
+        try:
+            capture_input = _capture_input(data)
+        except ValueError as e:
+            results[i] = {"index": i, "ok": False, "error": str(e)}
+            continue
+        plant_id = data.get("plant_id")
+        if plant_id not in processors:
+            processors[plant_id] = equipment_registry.get_processor(db, plant_id)
+        jobs.append((i, capture_input, processors[plant_id]))
+
+    def _run(job):
+        i, capture_input, processor = job
+        try:
+            return i, capture_input, processor.process(capture_input), None
+        except Exception as e:  # reported per item
+            logger.warning("Capture %d of batch failed: %s", i, e)
+            return i, capture_input, None, e
+
+    workers = max(1, min(max_workers or settings.CAPTURE_BATCH_WORKERS, len(jobs) or 1))
+    if workers == 1:
+        outcomes = [_run(job) for job in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="capture") as pool:
+            outcomes = list(pool.map(_run, jobs))
+
+    capture_rows, wr_rows = [], []
+    for i, capture_input, wr, error in outcomes:
+        if error is not None:
+            results[i] = {"index": i, "ok": False, "error": str(error)}
+            continue
+        capture_rows.append(_capture_row(capture_input))
+        wr_rows.append(_work_request_row(capture_input, wr))
+        log_action(db, "field_capture", capture_input.capture_id, "CREATE")
+        log_action(db, "work_request", wr.request_id, "CREATE")
+        results[i] = {"index": i, "ok": True, **_summary(capture_input, wr)}
+
+    if capture_rows:
+        db.execute(insert(FieldCaptureModel.__table__), capture_rows)
+        db.execute(insert(WorkRequestModel.__table__), wr_rows)
+    db.commit()
+
+    return {
+        "processed": len(capture_rows),
+        "failed": len(items) - len(capture_rows),
+        "results": results,
+    }
+
+
 def get_capture(db: Session, capture_id: str) -> FieldCaptureModel | None:
     return db.query(FieldCaptureModel).filter(
         FieldCaptureModel.capture_id == capture_id
     ).first()
 
 
-def list_captures(db: Session) -> list[FieldCaptureModel]:
-    return db.query(FieldCaptureModel).order_by(FieldCaptureModel.created_at.desc()).all()
+def list_captures(db: Session, limit: int | None = None, cursor: str | None = None) -> Page:
+    """List view rows (newest first) — full texts and image payloads are not loaded."""
+    q = db.query(
+        FieldCaptureModel.capture_id,
+        FieldCaptureModel.technician_id,
+        FieldCaptureModel.capture_type,
+        FieldCaptureModel.language,
+        FieldCaptureModel.equipment_tag_manual,
+        func.substr(FieldCaptureModel.raw_text, 1, 100).label("raw_text_preview"),
+        FieldCaptureModel.location_hint,
+        FieldCaptureModel.created_at,
+    )
+    return paginate(q, FieldCaptureModel.created_at, FieldCaptureModel.capture_id, limit, cursor)
+
+
+def work_requests_for_captures(db: Session, capture_ids: list[str]) -> dict:
+    """First work request generated from each capture, in one query."""
+    if not capture_ids:
+        return {}
+    rows = db.query(
+        WorkRequestModel.source_capture_id,
+        WorkRequestModel.request_id,
+        WorkRequestModel.status,
+        WorkRequestModel.equipment_tag,
+        WorkRequestModel.ai_classification,
+    ).filter(
+        WorkRequestModel.source_capture_id.in_(capture_ids)
+    ).order_by(WorkRequestModel.created_at, WorkRequestModel.request_id).all()
+    result = {}
+    for r in rows:
+        result.setdefault(r.source_capture_id, r)
+    return result
@@ -0,0 +1,252 @@
+"""Dashboard service — executive summaries from per-plant counters.
+
+Report and notification totals are served from counters kept per
+(database, plant): loaded once with COUNT/GROUP BY queries and then kept
+current by the writers' sessions, so a dashboard request costs the same
+whatever the size of the history. Recent items come from LIMIT queries.
+
+Counter updates are recorded at flush, applied when the writing session
+commits and dropped on rollback, like the equipment registry:
+
+- ORM inserts and deletes of reports/notifications adjust the counts.
+- ORM updates move a row between buckets (e.g. acknowledging an alert);
+  if the previous value was not loaded the counters are reloaded instead.
+- Bulk statements bypass the unit of work, so their callers call
+  ``invalidate`` explicitly.
+
+Every change also bumps the plant's row in ``cache_versions`` within the
+writer's transaction, so counters cached by another worker process are
+reloaded instead of served stale.
+"""
+
+import threading
+import weakref
+from collections import Counter
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from api.database.models import NotificationModel, ReportModel
+from api.services import cache_versions, reporting_service
+from api.services.pagination import Page
+
+RECENT_REPORTS = 5
+RECENT_NOTIFICATIONS = 10
+
+_SCOPE = "dashboard_counters"
+_PENDING_KEY = "dashboard_counters_pending"
+_BUMPS_KEY = "dashboard_counters_bumps"
+_ALL_PLANTS = object()  # invalidate() target for every plant of a database
+
+# Bucket attributes per model; the bucket key is the tuple of their values
+_TRACKED = {
+    ReportModel: ("reports", ("report_type",)),
+    NotificationModel: ("notifications", ("level", "acknowledged")),
+}
+
+_lock = threading.Lock()
+# engine -> plant_id -> (version token, {"reports": Counter, "notifications": Counter})
+_counters: "weakref.WeakKeyDictionary[Engine, dict[str, tuple[dict, dict[str, Counter]]]]" = weakref.WeakKeyDictionary()
+# Bumped on every change so a load that raced with a commit is not stored
+_generation = 0
+
+
+def _load_counters(db: Session, plant_id: str) -> dict[str, Counter]:
+    reports = db.query(ReportModel.report_type, func.count()).filter(
+        ReportModel.plant_id == plant_id,
+    ).group_by(ReportModel.report_type)
+    notifications = db.query(
+        NotificationModel.level, NotificationModel.acknowledged, func.count(),
+    ).filter(
+        NotificationModel.plant_id == plant_id,
+    ).group_by(NotificationModel.level, NotificationModel.acknowledged)
+    return {
+        "reports": Counter({(report_type,): n for report_type, n in reports}),
+        "notifications": Counter({(level, bool(ack)): n for level, ack, n in notifications}),
+    }
+
+
+def get_counters(db: Session, plant_id: str) -> dict[str, Counter]:
+    """Report counts by (type,) and notification counts by (level, acknowledged)."""
+    bind = db.get_bind()
+    token = cache_versions.read(db, _SCOPE, plant_id)
+    with _lock:
+        cached = _counters.get(bind, {}).get(plant_id)
+        if cached is not None and cached[0] == token:
+            return {kind: Counter(c) for kind, c in cached[1].items()}
+        generation = _generation
+
+    counters = _load_counters(db, plant_id)
+    # Not stored if a commit landed during the load, or if db holds
+    # uncommitted changes of its own
+    if not db.info.get(_BUMPS_KEY) and cache_versions.read(db, _SCOPE, plant_id) == token:
+        with _lock:
+            if generation == _generation:
+                _counters.setdefault(bind, {})[plant_id] = (token, counters)
+    return {kind: Counter(c) for kind, c in counters.items()}
+
+
+def invalidate(db: Session, plant_id: str | None = None):
+    """Drop the cached counters of a plant (default: every plant) once ``db`` commits."""
+    cache_versions.bump(db, _SCOPE, plant_id, db.info.setdefault(_BUMPS_KEY, {}))
+    db.info.setdefault(_PENDING_KEY, []).append(("invalidate", plant_id or _ALL_PLANTS, None, None, 0))
+
+
+def clear():
+    """Drop every cached counter."""
+    global _generation
+    with _lock:
+        _counters.clear()
+        _generation += 1
+
+
+# ── Summaries ───────────────────────────────────────────────────────
+
+def get_executive_summary(db: Session, plant_id: str) -> dict:
+    counters = get_counters(db, plant_id)
+    reports, notifications = counters["reports"], counters["notifications"]
+    by_level: Counter = Counter()
+    for (level, _acknowledged), n in notifications.items():
+        by_level[level] += n
+    return {
+        "plant_id": plant_id,
+        "total_reports": sum(reports.values()),
+        "reports_by_type": {report_type: n for (report_type,), n in reports.items()},
+        "recent_reports": reporting_service.list_reports(db, plant_id, limit=RECENT_REPORTS),
+        "total_notifications": sum(notifications.values()),
+        "notifications_by_level": dict(by_level),
+        "critical_alerts": by_level["CRITICAL"],
+        "active_alerts": sum(n for (_level, ack), n in notifications.items() if not ack),
+        "recent_notifications": reporting_service.list_notifications(
+            db, plant_id, limit=RECENT_NOTIFICATIONS,
+        ),
+    }
+
+
+def get_kpi_summary(db: Session, plant_id: str) -> dict:
+    latest = reporting_service.list_reports(db, plant_id, "MONTHLY_KPI", limit=1)
+    if latest:
+        report = reporting_service.get_report(db, latest[0]["report_id"])
+        return {"plant_id": plant_id, "has_data": True, "report": report}
+    return {"plant_id": plant_id, "has_data": False, "report": None}
+
+
+def get_alerts(
+    db: Session, plant_id: str, limit: int | None = None, cursor: str | None = None,
+) -> tuple[dict, Page]:
+    """Active (unacknowledged) alerts: the summary and the page of alerts it holds."""
+    notifications = get_counters(db, plant_id)["notifications"]
+    page = reporting_service.list_notifications(
+        db, plant_id, acknowledged=False, limit=limit, cursor=cursor,
+    )
+    return {
+        "plant_id": plant_id,
+        "total_active": sum(n for (_level, ack), n in notifications.items() if not ack),
+        "alerts": page,
+    }, page
+
+
+# ── Writer hooks ────────────────────────────────────────────────────
+
+def _bucket(obj, values: list) -> tuple:
+    if isinstance(obj, NotificationModel):
+        level, ack = values
+        return (level or "INFO", bool(ack))
+    return tuple(values)
+
+
+def _previous(obj, attr: str):
+    """Value before this flush; raises LookupError if it was never loaded."""
+    state = inspect(obj)
+    if attr in state.unloaded:
+        raise LookupError(attr)
+    history = state.attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    if history.added:
+        raise LookupError(attr)
+    return getattr(obj, attr)
+
+
+def _apply(bind: Engine, changes: list[tuple], bumps: dict[str, list[int]]):
+    global _generation
+    with _lock:
+        _generation += 1
+        cached = _counters.get(bind)
+        if not cached:
+            return
+        for op, plant_id, _kind, _key, _delta in changes:
+            if op == "invalidate":
+                if plant_id is _ALL_PLANTS:
+                    cached.clear()
+                else:
+                    cached.pop(plant_id, None)
+        # Only counters built before this commit take its deltas
+        current = set()
+        for plant_id, (token, _counts) in list(cached.items()):
+            outcome = cache_versions.advance(token, plant_id, bumps)
+            if outcome == cache_versions.DROP:
+                del cached[plant_id]
+            elif outcome == cache_versions.APPLY:
+                current.add(plant_id)
+        for op, plant_id, kind, key, delta in changes:
+            if op == "invalidate" or plant_id not in current:
+                continue
+            counter = cached[plant_id][1][kind]
+            counter[key] += delta
+            if counter[key] <= 0:
+                del counter[key]
+
+
+@event.listens_for(Session, "after_flush")
+def _record_changes(session: Session, flush_context):
+    changes = []
+    for obj in session.new:
+        tracked = _TRACKED.get(type(obj))
+        if tracked:
+            kind, attrs = tracked
+            changes.append(("count", obj.plant_id, kind, _bucket(obj, [getattr(obj, a) for a in attrs]), 1))
+    for obj in (*session.dirty, *session.deleted):
+        tracked = _TRACKED.get(type(obj))
+        if not tracked:
+            continue
+        deleted = obj in session.deleted
+        if not deleted and not session.is_modified(obj):
+            continue
+        kind, attrs = tracked
+        try:
+            old_plant = _previous(obj, "plant_id")
+            old = _bucket(obj, [_previous(obj, a) for a in attrs])
+        except LookupError:
+            changes.append(("invalidate", _ALL_PLANTS, None, None, 0))
+            continue
+        if deleted:
+            changes.append(("count", old_plant, kind, old, -1))
+            continue
+        new = _bucket(obj, [getattr(obj, a) for a in attrs])
+        if (old_plant, old) != (obj.plant_id, new):
+            changes.append(("count", old_plant, kind, old, -1))
+            changes.append(("count", obj.plant_id, kind, new, 1))
+    if changes:
+        bumps = session.info.setdefault(_BUMPS_KEY, {})
+        for plant_id in {c[1] for c in changes}:
+            cache_versions.bump(session, _SCOPE, None if plant_id is _ALL_PLANTS else plant_id, bumps)
+        session.info.setdefault(_PENDING_KEY, []).extend(changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_after_commit(session: Session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    bumps = session.info.pop(_BUMPS_KEY, None)
+    if changes:
+        _apply(session.get_bind(), changes, bumps or {})
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_on_rollback(session: Session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+        session.info.pop(_BUMPS_KEY, None)
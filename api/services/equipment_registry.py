@@ -0,0 +1,175 @@
+"""Equipment registry cache — prebuilt field-capture processors per plant.
+
+Building the registry and the resolver's fuzzy-match indexes is
+proportional to plant size, so one ``FieldCaptureProcessor`` is kept per
+(database, plant) and reused by every capture. ``plant_id=None`` covers
+the equipment of all plants.
+
+Changes are picked up when the writing session commits and dropped on
+rollback, like the audit buffer:
+
+- ORM inserts of EQUIPMENT nodes (``hierarchy_service.create_node``, the
+  vendor hierarchy builder, seeding) are patched into the cached indexes.
+- ORM updates/deletes of nodes invalidate the plant's processors.
+- Bulk statements bypass the unit of work, so their callers (move, subtree
+  delete, imports, reset) call ``invalidate`` explicitly.
+
+Each change also bumps the plant's ``cache_versions`` row in the writer's
+transaction, so processors cached by another worker process are rebuilt
+instead of resolving against a stale registry.
+"""
+
+import threading
+import weakref
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from api.database.models import HierarchyNodeModel
+from api.services import cache_versions
+from tools.processors.field_capture_processor import FieldCaptureProcessor
+
+_SCOPE = "equipment_registry"
+_PENDING_KEY = "equipment_registry_pending"
+_BUMPS_KEY = "equipment_registry_bumps"
+_ALL_PLANTS = object()  # invalidate() target for every plant of a database
+
+_lock = threading.Lock()
+# engine -> plant_id -> (version token, processor); weak so per-test engines are not kept alive
+_processors: "weakref.WeakKeyDictionary[Engine, dict[str | None, tuple[dict, FieldCaptureProcessor]]]" = weakref.WeakKeyDictionary()
+# Bumped on every change so a build that raced with a commit is not stored
+_generation = 0
+_stats = {"hits": 0, "builds": 0, "patched": 0, "invalidated": 0}
+
+
+def registry_entry(node) -> dict:
+    """Resolver registry entry for an EQUIPMENT hierarchy node."""
+    return {
+        "equipment_id": node.node_id,
+        "tag": node.tag or node.code,
+        "description": node.name,
+        "description_fr": node.name_fr or "",
+        "aliases": [],
+    }
+
+
+def load_registry(db: Session, plant_id: str | None = None) -> list[dict]:
+    q = db.query(
+        HierarchyNodeModel.node_id,
+        HierarchyNodeModel.tag,
+        HierarchyNodeModel.code,
+        HierarchyNodeModel.name,
+        HierarchyNodeModel.name_fr,
+    ).filter(HierarchyNodeModel.node_type == "EQUIPMENT")
+    if plant_id:
+        q = q.filter(HierarchyNodeModel.plant_id == plant_id)
+    return [registry_entry(n) for n in q.all()]
+
+
+def get_processor(db: Session, plant_id: str | None = None) -> FieldCaptureProcessor:
+    """Cached processor for the plant, built on first use."""
+    bind = db.get_bind()
+    token = cache_versions.read(db, _SCOPE, plant_id)
+    with _lock:
+        cached = _processors.get(bind, {}).get(plant_id)
+        if cached is not None and cached[0] == token:
+            _stats["hits"] += 1
+            return cached[1]
+        generation = _generation
+
+    processor = FieldCaptureProcessor(load_registry(db, plant_id))
+    # Not stored if a commit landed during the build, or if db holds
+    # uncommitted changes of its own
+    stored = not db.info.get(_BUMPS_KEY) and cache_versions.read(db, _SCOPE, plant_id) == token
+    with _lock:
+        _stats["builds"] += 1
+        if stored and generation == _generation:
+            _processors.setdefault(bind, {})[plant_id] = (token, processor)
+    return processor
+
+
+def invalidate(db: Session, plant_id: str | None = None):
+    """Drop the cached processors of a plant (default: every plant) once ``db`` commits."""
+    cache_versions.bump(db, _SCOPE, plant_id, db.info.setdefault(_BUMPS_KEY, {}))
+    db.info.setdefault(_PENDING_KEY, []).append(("invalidate", plant_id or _ALL_PLANTS, None))
+
+
+def clear():
+    """Drop every cached processor and reset the counters."""
+    global _generation
+    with _lock:
+        _processors.clear()
+        _generation += 1
+        for k in _stats:
+            _stats[k] = 0
+
+
+def stats() -> dict:
+    with _lock:
+        return {**_stats, "cached": sum(len(p) for p in _processors.values())}
+
+
+def _apply(bind: Engine, changes: list[tuple], bumps: dict[str, list[int]]):
+    global _generation
+    with _lock:
+        _generation += 1
+        cached = _processors.get(bind)
+        if not cached:
+            return
+        for op, plant_id, _entry in changes:
+            if op != "invalidate":
+                continue
+            if plant_id is _ALL_PLANTS:
+                _stats["invalidated"] += len(cached)
+                cached.clear()
+                continue
+            for key in (plant_id, None):
+                if cached.pop(key, None) is not None:
+                    _stats["invalidated"] += 1
+        # Only processors built before this commit are patched with it
+        current = set()
+        for key, (token, _processor) in list(cached.items()):
+            outcome = cache_versions.advance(token, key, bumps)
+            if outcome == cache_versions.DROP:
+                del cached[key]
+                _stats["invalidated"] += 1
+            elif outcome == cache_versions.APPLY:
+                current.add(key)
+        for op, plant_id, entry in changes:
+            if op == "invalidate":
+                continue
+            for key in {plant_id, None} & current:
+                cached[key][1].resolver.add_equipment(entry)
+                _stats["patched"] += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _record_node_changes(session: Session, flush_context):
+    changes = []
+    for node in session.new:
+        if isinstance(node, HierarchyNodeModel) and node.node_type == "EQUIPMENT":
+            changes.append(("create", node.plant_id, registry_entry(node)))
+    for node in (*session.dirty, *session.deleted):
+        if isinstance(node, HierarchyNodeModel):
+            changes.append(("invalidate", node.plant_id or _ALL_PLANTS, None))
+    if changes:
+        bumps = session.info.setdefault(_BUMPS_KEY, {})
+        for plant_id in {c[1] for c in changes}:
+            cache_versions.bump(session, _SCOPE, None if plant_id is _ALL_PLANTS else plant_id, bumps)
+        session.info.setdefault(_PENDING_KEY, []).extend(changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_after_commit(session: Session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    bumps = session.info.pop(_BUMPS_KEY, None)
+    if changes:
+        _apply(session.get_bind(), changes, bumps or {})
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_on_rollback(session: Session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+        session.info.pop(_BUMPS_KEY, None)
@@ -0,0 +1,223 @@
+"""Export service — streams large exports as CSV, NDJSON or XLSX, and
+analytics datasets as Parquet or Arrow IPC.
+
+Equipment and work-order exports are read from the database with
+``yield_per`` batches and passed row by row to DataExportEngine's streaming
+writers, so memory stays flat regardless of the export size (e.g. a
+500k-row work order history). Exports built from a request payload are
+prepared as usual and streamed through the same writers.
+
+Columnar datasets (work orders, hierarchy nodes, KPI snapshots, Weibull
+predictions) use Arrow schemas derived from their Pydantic models, built
+in record batches by ColumnarEngine.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Iterator
+
+import pyarrow as pa
+from pydantic import BaseModel
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, aliased
+
+from api.database.models import (
+    FailurePredictionModel, HealthScoreModel, HierarchyNodeModel, KPIMetricsModel, WorkOrderModel,
+)
+from api.services import reporting_service
+from tools.engines.columnar_engine import (
+    ARROW_STREAM_MEDIA_TYPE, PARQUET_MEDIA_TYPE, ColumnarEngine, arrow_schema,
+)
+from tools.engines.data_export_engine import STREAM_FORMATS, DataExportEngine
+from tools.models.schemas import FailurePrediction, KPIMetrics, PlantHierarchyNode, WorkOrderHistory
+
+# Rows fetched per database round trip
+YIELD_PER = 1000
+
+
+def media_type(fmt: str) -> str:
+    return STREAM_FORMATS[fmt][0]
+
+
+def filename(basename: str, fmt: str) -> str:
+    return f"{basename}.{STREAM_FORMATS[fmt][1]}"
+
+
+def _equipment_rows(db: Session, plant_id: str | None) -> Iterator[dict]:
+    node = HierarchyNodeModel
+    parent = aliased(HierarchyNodeModel)
+    latest = db.query(
+        HealthScoreModel.node_id, func.max(HealthScoreModel.calculated_at).label("calculated_at"),
+    ).group_by(HealthScoreModel.node_id).subquery()
+    q = db.query(
+        node.node_id, node.code, node.tag, node.name, node.equipment_lib_ref, node.criticality,
+        parent.code, HealthScoreModel.composite_score, HealthScoreModel.health_class,
+    ).outerjoin(
+        parent, parent.node_id == node.parent_node_id,
+    ).outerjoin(
+        latest, latest.c.node_id == node.node_id,
+    ).outerjoin(
+        HealthScoreModel, and_(
+            HealthScoreModel.node_id == latest.c.node_id,
+            HealthScoreModel.calculated_at == latest.c.calculated_at,
+        ),
+    ).filter(node.node_type == "EQUIPMENT")
+    if plant_id:
+        q = q.filter(node.plant_id == plant_id)
+
+    # Several scores stamped at the same instant would repeat a node
+    last_node_id = None
+    for node_id, code, tag, name, lib_ref, criticality, parent_code, score, health_class in (
+        q.order_by(node.node_id).yield_per(YIELD_PER)
+    ):
+        if node_id == last_node_id:
+            continue
+        last_node_id = node_id
+        yield {
+            "equipment_id": tag or code,
+            "description": name,
+            "equipment_type": lib_ref or "",
+            "parent_id": parent_code or "",
+            "criticality_class": criticality or "",
+            "risk_score": "",
+            "health_score": score if score is not None else "",
+            "health_class": health_class or "",
+        }
+
+
+def _work_order_rows(
+    db: Session, equipment_id: str | None, since: date | None, until: date | None,
+) -> Iterator[dict]:
+    wo = WorkOrderModel
+    q = db.query(
+        wo.work_order_id, wo.order_type, wo.equipment_id, wo.equipment_tag, wo.priority,
+        wo.status, wo.created_date, wo.actual_duration_hours, wo.description,
+    )
+    if equipment_id:
+        q = q.filter(wo.equipment_id == equipment_id)
+    if since:
+        q = q.filter(wo.created_date >= since)
+    if until:
+        q = q.filter(wo.created_date <= until)
+    for row in q.order_by(wo.created_date, wo.work_order_id).yield_per(YIELD_PER):
+        yield row._asdict()
+
+
+def stream_equipment(db: Session, fmt: str, plant_id: str | None = None) -> Iterator[bytes]:
+    """EQUIPMENT nodes with parent code, criticality and latest health score."""
+    return DataExportEngine.stream([DataExportEngine.equipment_sheet(_equipment_rows(db, plant_id))], fmt)
+
+
+def stream_work_orders(
+    db: Session, fmt: str, equipment_id: str | None = None,
+    since: date | None = None, until: date | None = None,
+) -> Iterator[bytes]:
+    """Work order history, oldest first."""
+    rows = _work_order_rows(db, equipment_id, since, until)
+    return DataExportEngine.stream([DataExportEngine.work_order_sheet(rows)], fmt)
+
+
+def stream_prepared(db: Session, export_type: str, data: dict, fmt: str) -> Iterator[bytes]:
+    """The sheets of a payload export (see reporting_service.export_data)."""
+    result = reporting_service.prepare_export(export_type, data)
+    return DataExportEngine.stream(DataExportEngine.to_streams(result), fmt)
+
+
+# ── Columnar datasets ───────────────────────────────────────────────
+
+# Columnar format → (media type, file extension)
+COLUMNAR_FORMATS = {
+    "parquet": (PARQUET_MEDIA_TYPE, "parquet"),
+    "arrow": (ARROW_STREAM_MEDIA_TYPE, "arrows"),
+}
+
+
+@dataclass(frozen=True)
+class _Dataset:
+    """A table exported with the Arrow schema of its Pydantic model."""
+    table: type
+    model: type[BaseModel]
+    # Model fields stored as columns of the same name (default: all)
+    fields: tuple[str, ...] | None = None
+    # Table-only columns
+    extra: dict[str, pa.DataType] = field(default_factory=dict)
+    order_by: str = ""
+
+    @property
+    def schema(self) -> pa.Schema:
+        return arrow_schema(self.model, self.fields, self.extra)
+
+
+DATASETS = {
+    "work_orders": _Dataset(
+        WorkOrderModel, WorkOrderHistory,
+        fields=(
+            "work_order_id", "order_type", "equipment_id", "equipment_tag", "description",
+            "priority", "status", "created_date", "actual_duration_hours",
+        ),
+        order_by="created_date",
+    ),
+    "hierarchy_nodes": _Dataset(
+        HierarchyNodeModel, PlantHierarchyNode,
+        fields=(
+            "node_id", "node_type", "name", "name_fr", "code", "parent_node_id", "level",
+            "equipment_lib_ref", "component_lib_ref", "sap_func_loc", "sap_equipment_nr",
+            "tag", "status", "order",
+        ),
+        extra={"plant_id": pa.string(), "criticality": pa.string()},
+        order_by="level",
+    ),
+    "kpi_snapshots": _Dataset(
+        KPIMetricsModel, KPIMetrics,
+        extra={"grain": pa.string()},
+        order_by="period_start",
+    ),
+    "weibull_predictions": _Dataset(
+        FailurePredictionModel, FailurePrediction,
+        order_by="predicted_at",
+    ),
+}
+
+
+def columnar_media_type(fmt: str) -> str:
+    return COLUMNAR_FORMATS[fmt][0]
+
+
+def columnar_filename(dataset: str, fmt: str) -> str:
+    return f"{dataset}.{COLUMNAR_FORMATS[fmt][1]}"
+
+
+def _dataset_query(db: Session, dataset: _Dataset, filters: dict):
+    table = dataset.table
+    q = db.query(*[getattr(table, name) for name in dataset.schema.names])
+    for column, value in filters.items():
+        if value is None:
+            continue
+        if not hasattr(table, column):
+            raise ValueError(f"Dataset cannot be filtered by {column}")
+        q = q.filter(getattr(table, column) == value)
+    primary_key = [getattr(table, c.key) for c in table.__table__.primary_key]
+    return q.order_by(getattr(table, dataset.order_by), *primary_key)
+
+
+def _dataset_rows(q, names: list[str]) -> Iterator[dict]:
+    for row in q.yield_per(YIELD_PER):
+        yield dict(zip(names, row))
+
+
+def stream_dataset(
+    db: Session, name: str, fmt: str,
+    plant_id: str | None = None, equipment_id: str | None = None,
+) -> Iterator[bytes]:
+    """A dataset as Parquet or an Arrow IPC stream, optionally filtered."""
+    if name not in DATASETS:
+        raise ValueError(f"Unknown dataset: {name}")
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format: {fmt}")
+    dataset = DATASETS[name]
+    schema = dataset.schema
+    q = _dataset_query(db, dataset, {"plant_id": plant_id, "equipment_id": equipment_id})
+    batches = ColumnarEngine.record_batches(_dataset_rows(q, schema.names), schema)
+    if fmt == "parquet":
+        return ColumnarEngine.stream_parquet(batches, schema)
+    return ColumnarEngine.stream_ipc(batches, schema)
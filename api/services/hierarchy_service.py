@@ -1,8 +1,12 @@
 """Hierarchy service — CRUD for plant hierarchy nodes."""
 
+from collections import deque
+
+from sqlalchemy import delete, func, literal, update
 from sqlalchemy.orm import Session
 
 from api.database.models import PlantModel, HierarchyNodeModel
+from api.services import equipment_registry, kpi_rollup_service
 from api.services.audit_service import log_action
 
 
@@ -48,39 +52,184 @@ def list_nodes(db: Session, plant_id: str | None = None, node_type: str | None =
 
 
 def get_subtree(db: Session, node_id: str) -> list[HierarchyNodeModel]:
-    """Get node and all descendants (BFS) — single query, in-memory traversal."""
+    """Get node and all descendants — one indexed prefix query on the materialized path."""
     root = get_node(db, node_id)
     if not root:
         return []
+    _ensure_path(db, root)
 
-    # Load all nodes for this plant in one query, build parent→children map
-    all_nodes = db.query(HierarchyNodeModel).filter(
-        HierarchyNodeModel.plant_id == root.plant_id
-    ).all()
-    children_map: dict[str | None, list[HierarchyNodeModel]] = {}
-    for n in all_nodes:
-        children_map.setdefault(n.parent_node_id, []).append(n)
-
-    # BFS in memory
-    result = []
-    queue = [node_id]
-    while queue:
-        current_id = queue.pop(0)
-        for n in all_nodes:
-            if n.node_id == current_id:
-                result.append(n)
-                break
-        for child in children_map.get(current_id, []):
-            queue.append(child.node_id)
-    return result
+    return db.query(HierarchyNodeModel).filter(
+        _in_subtree(root.path)
+    ).order_by(HierarchyNodeModel.level, HierarchyNodeModel.order).all()
 
 
-def count_nodes_by_type(db: Session, plant_id: str | None = None) -> dict[str, int]:
-    q = db.query(HierarchyNodeModel)
+def get_ancestors(db: Session, node_id: str) -> list[HierarchyNodeModel]:
+    """Get all ancestors of a node, root first — ids come from the path, one IN query."""
+    node = get_node(db, node_id)
+    if not node:
+        return []
+    _ensure_path(db, node)
+
+    ancestor_ids = node.path.strip("/").split("/")[:-1]
+    if not ancestor_ids:
+        return []
+    rows = db.query(HierarchyNodeModel).filter(HierarchyNodeModel.node_id.in_(ancestor_ids)).all()
+    by_id = {n.node_id: n for n in rows}
+    return [by_id[i] for i in ancestor_ids if i in by_id]
+
+
+def get_depth(db: Session, node_id: str) -> int | None:
+    """Distance from the root of the node's tree (root = 0)."""
+    node = get_node(db, node_id)
+    if not node:
+        return None
+    _ensure_path(db, node)
+    return node.path.count("/") - 2
+
+
+def count_nodes_by_type(db: Session, plant_id: str | None = None, node_id: str | None = None) -> dict[str, int]:
+    """Node counts per type for a plant or for the subtree under ``node_id``."""
+    q = db.query(HierarchyNodeModel.node_type, func.count(HierarchyNodeModel.node_id))
+    if plant_id:
+        q = q.filter(HierarchyNodeModel.plant_id == plant_id)
+    if node_id:
+        root = get_node(db, node_id)
+        if not root:
+            return {}
+        _ensure_path(db, root)
+        q = q.filter(_in_subtree(root.path))
+    return dict(q.group_by(HierarchyNodeModel.node_type).all())
+
+
+def move_node(db: Session, node_id: str, new_parent_id: str | None) -> HierarchyNodeModel | None:
+    """Re-parent a node; its whole subtree's paths and levels move in one UPDATE.
+
+    Raises:
+        ValueError: if the new parent does not exist or lies inside the moved subtree.
+    """
+    node = get_node(db, node_id)
+    if not node:
+        return None
+    _ensure_path(db, node)
+
+    if new_parent_id:
+        parent = get_node(db, new_parent_id)
+        if not parent:
+            raise ValueError(f"Parent node '{new_parent_id}' not found")
+        _ensure_path(db, parent)
+        if parent.path.startswith(node.path):
+            raise ValueError("Cannot move a node under itself or one of its descendants")
+        new_path = f"{parent.path}{node_id}/"
+        new_level = parent.level + 1
+        plant_id = parent.plant_id
+    else:
+        new_path = f"/{node_id}/"
+        new_level = node.level
+        plant_id = node.plant_id
+
+    old_path = node.path
+    level_delta = new_level - node.level
+    db.execute(
+        update(HierarchyNodeModel)
+        .where(_in_subtree(old_path))
+        .values(
+            path=literal(new_path) + func.substr(HierarchyNodeModel.path, len(old_path) + 1),
+            level=HierarchyNodeModel.level + level_delta,
+            plant_id=plant_id,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        update(HierarchyNodeModel)
+        .where(HierarchyNodeModel.node_id == node_id)
+        .values(parent_node_id=new_parent_id)
+        .execution_options(synchronize_session=False)
+    )
+    log_action(db, "hierarchy_node", node_id, "MOVE", {"from": node.parent_node_id, "to": new_parent_id})
+    equipment_registry.invalidate(db, node.plant_id)
+    if plant_id != node.plant_id:
+        equipment_registry.invalidate(db, plant_id)
+        # Work orders of the moved equipment now roll up to the new plant
+        moved = db.query(HierarchyNodeModel.code, HierarchyNodeModel.tag).filter(
+            _in_subtree(new_path), HierarchyNodeModel.node_type == "EQUIPMENT",
+        )
+        kpi_rollup_service.mark_dirty(db, {i for row in moved for i in row})
+    db.commit()
+    db.refresh(node)
+    return node
+
+
+def delete_node(db: Session, node_id: str) -> int:
+    """Delete a node and its whole subtree in one statement. Returns rows deleted.
+
+    Raises:
+        IntegrityError: if rows of other tables (assessments, health scores,
+            ...) still reference a node of the subtree; nothing is deleted.
+    """
+    node = get_node(db, node_id)
+    if not node:
+        return 0
+    _ensure_path(db, node)
+
+    deleted = db.execute(
+        delete(HierarchyNodeModel)
+        .where(_in_subtree(node.path))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    log_action(db, "hierarchy_node", node_id, "DELETE", {"subtree_nodes": deleted})
+    equipment_registry.invalidate(db, node.plant_id)
+    db.commit()
+    return deleted
+
+
+def _in_subtree(path: str):
+    """``path LIKE '<escaped path>%'`` as a bound literal pattern, so the index is used."""
+    escaped = path.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return HierarchyNodeModel.path.like(f"{escaped}%", escape="\\")
+
+
+def _ensure_path(db: Session, node: HierarchyNodeModel) -> str:
+    """Backfill paths on the fly for rows created before the column existed."""
+    if node.path is None:
+        rebuild_paths(db, node.plant_id)
+        db.refresh(node)
+    return node.path
+
+
+def rebuild_paths(db: Session, plant_id: str | None = None) -> int:
+    """Recompute materialized paths from parent links (backfill for pre-existing rows).
+
+    Loads only (node_id, parent_node_id) pairs and writes the paths back
+    with one executemany UPDATE. Returns the number of nodes updated.
+    """
+    q = db.query(HierarchyNodeModel.node_id, HierarchyNodeModel.parent_node_id)
     if plant_id:
         q = q.filter(HierarchyNodeModel.plant_id == plant_id)
-    nodes = q.all()
-    counts: dict[str, int] = {}
-    for n in nodes:
-        counts[n.node_type] = counts.get(n.node_type, 0) + 1
-    return counts
+    rows = q.all()
+
+    children: dict[str | None, list[str]] = {}
+    ids = set()
+    for nid, parent_id in rows:
+        children.setdefault(parent_id, []).append(nid)
+        ids.add(nid)
+
+    # Roots: no parent, or parent outside the loaded set (other plant)
+    paths: dict[str, str] = {}
+    queue = deque(
+        (nid, "/") for parent_id, kids in children.items() if parent_id not in ids for nid in kids
+    )
+    while queue:
+        nid, parent_path = queue.popleft()
+        path = f"{parent_path}{nid}/"
+        paths[nid] = path
+        for child in children.get(nid, []):
+            queue.append((child, path))
+
+    if paths:
+        # ORM bulk UPDATE by primary key — a single executemany
+        db.execute(
+            update(HierarchyNodeModel),
+            [{"node_id": nid, "path": path} for nid, path in paths.items()],
+        )
+        db.commit()
+    return len(paths)
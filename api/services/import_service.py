@@ -0,0 +1,398 @@
+"""Import service — streams SAP extracts (CSV/XLSX) into the database.
+
+Rows are read and validated one chunk at a time by DataImportEngine and
+written with SQLAlchemy Core executemany inserts, committing per chunk, so
+memory stays flat regardless of file size (e.g. a 2M-row work order
+history).
+"""
+
+import logging
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import IO, Callable
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from api.database.models import (
+    PlantModel, HierarchyNodeModel, WorkOrderModel, MaintenanceTaskModel,
+)
+from api.services import equipment_registry, kpi_rollup_service
+from api.services.audit_service import log_action
+from api.services.hierarchy_service import rebuild_paths
+from tools.engines.data_import_engine import DataImportEngine, DEFAULT_CHUNK_SIZE
+from tools.models.schemas import (
+    BulkImportResult, ImportProgress, ImportSource, ImportValidationError,
+    NodeType, TaskType, TaskConstraint, FrequencyUnit,
+)
+
+logger = logging.getLogger(__name__)
+
+# Keep the result bounded on very dirty files
+MAX_REPORTED_ERRORS = 1000
+
+_NODE_LEVELS = {
+    NodeType.PLANT.value: 1, NodeType.AREA.value: 2, NodeType.SYSTEM.value: 3,
+    NodeType.EQUIPMENT.value: 4, NodeType.SUB_ASSEMBLY.value: 5,
+    NodeType.MAINTAINABLE_ITEM.value: 6,
+}
+
+_FREQUENCY_UNITS = {
+    "H": "HOURS", "HR": "HOURS", "HRS": "HOURS", "HOUR": "HOURS", "HOURS": "HOURS",
+    "D": "DAYS", "DAY": "DAYS", "DAYS": "DAYS",
+    "W": "WEEKS", "WK": "WEEKS", "WEEK": "WEEKS", "WEEKS": "WEEKS",
+    "M": "MONTHS", "MON": "MONTHS", "MONTH": "MONTHS", "MONTHS": "MONTHS",
+    "Y": "YEARS", "YR": "YEARS", "YEAR": "YEARS", "YEARS": "YEARS",
+}
+_FREQUENCY_WORDS = {
+    "DAILY": (1.0, "DAYS"), "WEEKLY": (1.0, "WEEKS"), "MONTHLY": (1.0, "MONTHS"),
+    "QUARTERLY": (3.0, "MONTHS"), "YEARLY": (1.0, "YEARS"), "ANNUAL": (1.0, "YEARS"),
+}
+_FREQUENCY_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([A-Za-z_]*)\s*$")
+
+
+class ImportAborted(ValueError):
+    """Raised when an import stops after some chunks were already committed."""
+
+    def __init__(self, message: str, result: BulkImportResult):
+        super().__init__(message)
+        self.result = result
+
+
+@dataclass
+class _Chunk:
+    """Validated rows of one chunk with their 1-based file row numbers."""
+    rows: list[dict]
+    row_numbers: list[int]
+    errors: list[ImportValidationError] = field(default_factory=list)
+
+    def reject(self, i: int, column: str, message: str, severity: str = "ERROR") -> None:
+        self.errors.append(ImportValidationError(
+            row=self.row_numbers[i], column=column, message=message, severity=severity,
+        ))
+
+
+def import_file(
+    db: Session,
+    source: str,
+    file: str | IO[bytes],
+    filename: str | None = None,
+    plant_id: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    column_mapping: dict[str, str] | None = None,
+    progress: Callable[[ImportProgress], None] | None = None,
+) -> BulkImportResult:
+    """Stream a CSV/XLSX extract into the table for its import source.
+
+    EQUIPMENT_HIERARCHY -> hierarchy_nodes, FAILURE_HISTORY -> work_orders,
+    MAINTENANCE_PLAN -> maintenance_tasks. Rows failing validation or whose
+    key already exists are reported and skipped; the rest of the chunk is
+    inserted and committed.
+
+    Raises:
+        LookupError: plant_id given but the plant does not exist.
+        ImportAborted: a later chunk is unreadable; carries the result of
+            the chunks already committed.
+        ValueError: unsupported file type or unreadable file content.
+    """
+    src = ImportSource(source)
+    if plant_id and db.get(PlantModel, plant_id) is None:
+        raise LookupError(f"Plant {plant_id} not found")
+
+    writer = _HierarchyWriter(plant_id) if src == ImportSource.EQUIPMENT_HIERARCHY else (
+        _write_work_orders if src == ImportSource.FAILURE_HISTORY else _write_maintenance_tasks
+    )
+    result = BulkImportResult(source=src)
+    started = time.perf_counter()
+
+    chunks = DataImportEngine.read_chunks(file, filename, chunk_size)
+    try:
+        for mapping, validated in DataImportEngine.stream_validate(chunks, src, column_mapping):
+            result.mapping = mapping
+            first_row = result.rows_read + 1
+            rejected = {e.row for e in validated.errors}
+            numbers = [n for n in range(first_row, first_row + validated.total_rows) if n not in rejected]
+            chunk = _Chunk(validated.validated_data, numbers)
+
+            inserted = writer(db, chunk)
+            db.commit()
+
+            result.chunks += 1
+            result.rows_read += validated.total_rows
+            result.rows_inserted += inserted
+            result.rows_rejected += validated.total_rows - inserted
+            _add_errors(result, validated.errors + chunk.errors)
+            result.elapsed_seconds = round(time.perf_counter() - started, 3)
+            logger.info(
+                "import %s: chunk %d, %d rows read, %d inserted",
+                src.value, result.chunks, result.rows_read, result.rows_inserted,
+            )
+            if progress:
+                progress(ImportProgress(**result.model_dump(include=set(ImportProgress.model_fields))))
+        error = None
+    except ValueError as e:
+        db.rollback()
+        if not result.chunks:
+            raise
+        # Earlier chunks are committed: finish and report them with the error
+        logger.warning("import %s aborted after chunk %d: %s", src.value, result.chunks, e)
+        error = e
+
+    if isinstance(writer, _HierarchyWriter):
+        _add_errors(result, writer.finish(db))
+
+    log_action(db, "data_import", src.value, "BULK_IMPORT", {
+        "filename": filename, "plant_id": plant_id,
+        "rows_read": result.rows_read, "rows_inserted": result.rows_inserted,
+        **({"error": str(error)} if error else {}),
+    })
+    db.commit()
+    result.elapsed_seconds = round(time.perf_counter() - started, 3)
+    if error:
+        raise ImportAborted(str(error), result) from error
+    return result
+
+
+def _add_errors(result: BulkImportResult, errors: list[ImportValidationError]) -> None:
+    room = MAX_REPORTED_ERRORS - len(result.errors)
+    if len(errors) > room:
+        result.errors_truncated = True
+    result.errors.extend(errors[:max(room, 0)])
+
+
+def _existing_keys(db: Session, column, keys: list[str]) -> set[str]:
+    if not keys:
+        return set()
+    return set(db.execute(select(column).where(column.in_(keys))).scalars())
+
+
+def _text(value) -> str:
+    return "" if value is None else str(value).strip()
+
+
+class _HierarchyWriter:
+    """Inserts hierarchy nodes, parents before children within a chunk.
+
+    Core inserts bypass the ORM before_flush hook, so paths are set here.
+    A parent that only appears in a later chunk cannot be referenced yet
+    (foreign key); such links are inserted as roots, remembered, and patched
+    in finish() followed by a path rebuild for the plant.
+    """
+
+    def __init__(self, plant_id: str | None):
+        self.plant_id = plant_id
+        self.deferred: dict[str, tuple[str, int]] = {}  # child -> (parent, file row)
+        self.stale_paths = False
+
+    def __call__(self, db: Session, chunk: _Chunk) -> int:
+        by_id: dict[str, int] = {}
+        for i, row in enumerate(chunk.rows):
+            node_id = _text(row["equipment_id"])
+            if node_id in by_id:
+                chunk.reject(i, "equipment_id", f"Duplicate equipment_id '{node_id}' in file")
+            else:
+                by_id[node_id] = i
+        for node_id in _existing_keys(db, HierarchyNodeModel.node_id, list(by_id)):
+            chunk.reject(by_id.pop(node_id), "equipment_id", f"Node '{node_id}' already exists")
+
+        parents = {
+            node_id: _text(chunk.rows[i].get("parent_id")) for node_id, i in by_id.items()
+        }
+        external = {p for p in parents.values() if p and p not in by_id}
+        paths: dict[str, str] = dict(db.execute(
+            select(HierarchyNodeModel.node_id, HierarchyNodeModel.path)
+            .where(HierarchyNodeModel.node_id.in_(external))
+        ).all()) if external else {}
+
+        # Depth-first so that every parent in this chunk is inserted first
+        ordered: list[dict] = []
+        state: dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(node_id: str) -> None:
+            if state.get(node_id):
+                return
+            state[node_id] = 1
+            parent = parents[node_id]
+            parent_id, parent_path = None, "/"
+            if parent in by_id and state.get(parent) == 1:
+                chunk.reject(by_id[node_id], "parent_id", f"Parent cycle at '{parent}'; '{node_id}' imported as a root node", "WARNING")
+            else:
+                if parent in by_id:
+                    visit(parent)
+                if parent in paths:
+                    parent_id, parent_path = parent, paths[parent]
+                    if not parent_path:
+                        parent_path, self.stale_paths = f"/{parent}/", True
+                elif parent:
+                    self.deferred[node_id] = (parent, chunk.row_numbers[by_id[node_id]])
+            paths[node_id] = f"{parent_path}{node_id}/"
+            ordered.append(self._row(chunk.rows[by_id[node_id]], node_id, parent_id, paths[node_id]))
+            state[node_id] = 2
+
+        for node_id in by_id:
+            visit(node_id)
+        if ordered:
+            db.execute(insert(HierarchyNodeModel.__table__), ordered)
+            equipment_registry.invalidate(db, self.plant_id)
+            kpi_rollup_service.mark_dirty(db, [r["code"] for r in ordered if r["node_type"] == "EQUIPMENT"])
+        return len(ordered)
+
+    def _row(self, row: dict, node_id: str, parent_id: str | None, path: str) -> dict:
+        # SAP extracts often carry the hierarchy level in the type column
+        node_type = _text(row.get("node_type") or row["equipment_type"]).upper()
+        if node_type not in _NODE_LEVELS:
+            node_type = NodeType.EQUIPMENT.value
+        return {
+            "node_id": node_id,
+            "node_type": node_type,
+            "name": _text(row["description"])[:200],
+            "name_fr": "",
+            "code": node_id,
+            "tag": node_id,
+            "parent_node_id": parent_id,
+            "level": _NODE_LEVELS[node_type],
+            "plant_id": self.plant_id,
+            "criticality": _text(row.get("criticality")) or None,
+            "status": "ACTIVE",
+            "order": 1,
+            "metadata_json": {"equipment_type": _text(row["equipment_type"])},
+            "path": path,
+        }
+
+    def finish(self, db: Session) -> list[ImportValidationError]:
+        """Link children to parents that arrived in later chunks, then fix paths."""
+        found = _existing_keys(db, HierarchyNodeModel.node_id, list({p for p, _ in self.deferred.values()}))
+        links = [
+            {"node_id": child, "parent_node_id": parent}
+            for child, (parent, _) in self.deferred.items() if parent in found
+        ]
+        if links:
+            db.execute(update(HierarchyNodeModel), links)
+        if links or self.stale_paths:
+            rebuild_paths(db, self.plant_id)
+        return [
+            ImportValidationError(
+                row=row, column="parent_id", severity="WARNING",
+                message=f"Parent '{parent}' not found; '{child}' imported as a root node",
+            )
+            for child, (parent, row) in self.deferred.items() if parent not in found
+        ]
+
+
+def _write_work_orders(db: Session, chunk: _Chunk) -> int:
+    rows: list[dict] = []
+    ids: dict[str, int] = {}
+    for i, row in enumerate(chunk.rows):
+        wo_id = _text(row.get("work_order_id")) or f"WO-IMP-{uuid.uuid4().hex[:16]}"
+        if wo_id in ids:
+            chunk.reject(i, "work_order_id", f"Duplicate work order '{wo_id}' in file")
+            continue
+        try:
+            created = _to_date(row["failure_date"])
+        except (TypeError, ValueError) as e:
+            chunk.reject(i, "failure_date", str(e))
+            continue
+        try:
+            hours = float(row["downtime_hours"]) if _text(row.get("downtime_hours")) else None
+        except (TypeError, ValueError) as e:
+            chunk.reject(i, "downtime_hours", str(e))
+            continue
+        ids[wo_id] = i
+        failure_mode = _text(row["failure_mode"])
+        description = _text(row.get("description"))
+        rows.append({
+            "work_order_id": wo_id,
+            "order_type": _text(row.get("order_type")) or "PM03",
+            "equipment_id": _text(row["equipment_id"]),
+            "equipment_tag": _text(row["equipment_id"]),
+            "priority": _text(row.get("priority")) or "3",
+            "status": "COMPLETED",
+            "created_date": created,
+            "actual_duration_hours": hours,
+            "description": f"{failure_mode}: {description}" if description else failure_mode,
+        })
+
+    existing = _existing_keys(db, WorkOrderModel.work_order_id, list(ids))
+    if existing:
+        for wo_id in existing:
+            chunk.reject(ids[wo_id], "work_order_id", f"Work order '{wo_id}' already exists")
+        rows = [r for r in rows if r["work_order_id"] not in existing]
+    if rows:
+        db.execute(insert(WorkOrderModel.__table__), rows)
+        days: dict[str, set] = {}
+        for r in rows:
+            days.setdefault(r["equipment_id"], set()).add(r["created_date"])
+        for equipment_id, equipment_days in days.items():
+            kpi_rollup_service.mark_dirty(db, [equipment_id], equipment_days)
+    return len(rows)
+
+
+def _write_maintenance_tasks(db: Session, chunk: _Chunk) -> int:
+    rows: list[dict] = []
+    ids: dict[str, int] = {}
+    for i, row in enumerate(chunk.rows):
+        task_id = _text(row.get("task_id")) or str(uuid.uuid4())
+        if task_id in ids:
+            chunk.reject(i, "task_id", f"Duplicate task '{task_id}' in file")
+            continue
+        frequency = _parse_frequency(row["frequency"])
+        if frequency is None:
+            chunk.reject(i, "frequency", f"Unrecognised frequency: '{row['frequency']}'")
+            continue
+        ids[task_id] = i
+        task_type = _text(row.get("task_type")).upper()
+        constraint = _text(row.get("constraint")).upper()
+        rows.append({
+            "task_id": task_id,
+            "name": _text(row["task_description"])[:72],
+            "name_fr": "",
+            "task_type": task_type if task_type in TaskType.__members__ else TaskType.INSPECT.value,
+            "constraint": constraint if constraint in TaskConstraint.__members__ else TaskConstraint.ONLINE.value,
+            "frequency_value": frequency[0],
+            "frequency_unit": frequency[1],
+            "origin": f"SAP import: {_text(row['equipment_id'])}"[:200],
+            "status": "DRAFT",
+        })
+
+    existing = _existing_keys(db, MaintenanceTaskModel.task_id, list(ids))
+    if existing:
+        for task_id in existing:
+            chunk.reject(ids[task_id], "task_id", f"Task '{task_id}' already exists")
+        rows = [r for r in rows if r["task_id"] not in existing]
+    if rows:
+        db.execute(insert(MaintenanceTaskModel.__table__), rows)
+    return len(rows)
+
+
+def _to_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(_text(value)[:10])
+    except ValueError:
+        raise ValueError(f"Invalid failure_date: '{value}'") from None
+
+
+def _parse_frequency(value) -> tuple[float, str] | None:
+    """'30', '30 D', '2 weeks', 'monthly' -> (value, FrequencyUnit)."""
+    if isinstance(value, (int, float)):
+        return (float(value), FrequencyUnit.DAYS.value) if value > 0 else None
+    text = _text(value).upper()
+    if text in _FREQUENCY_WORDS:
+        return _FREQUENCY_WORDS[text]
+    match = _FREQUENCY_RE.match(text)
+    if not match or float(match.group(1)) <= 0:
+        return None
+    unit = match.group(2)
+    if not unit:
+        return float(match.group(1)), FrequencyUnit.DAYS.value
+    if unit in FrequencyUnit.__members__:
+        return float(match.group(1)), unit
+    if unit in _FREQUENCY_UNITS:
+        return float(match.group(1)), _FREQUENCY_UNITS[unit]
+    return None
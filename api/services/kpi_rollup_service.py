@@ -0,0 +1,329 @@
+"""KPI rollup service — reliability KPIs from daily work-order rollups.
+
+Work orders are aggregated with SQL GROUP BY into one ``KPIMetricsModel``
+row per equipment and day (``grain="DAY"``) holding additive inputs:
+order counts by type, completed PM orders, repair hours/count and
+downtime. KPIs for any plant/equipment/period are then a single SUM over
+the rollups instead of a rescan of the order history:
+
+- MTBF: failures are corrective (PM03) orders; the mean interval between
+  consecutive failure dates telescopes to (last - first) / (n - 1).
+- MTTR: repair hours / repairs with a positive duration.
+- Availability/OEE: period hours minus downtime of the failures.
+- PM compliance: completed / planned PM02 orders.
+- Reactive ratio: corrective / total orders.
+
+Schedule compliance needs planned dates, which work orders do not carry,
+so it is left empty.
+
+Rollups are kept current by the writers: ORM changes to work orders and
+EQUIPMENT nodes mark (equipment, day) scopes at flush, and those scopes
+are recomputed in the same transaction just before it commits. Bulk
+statements bypass the unit of work, so their callers call ``mark_dirty``.
+Orders are attributed to the plant of the EQUIPMENT node whose code (or
+tag) equals their ``equipment_id``, or to plant "" when there is none.
+"""
+
+import uuid
+from datetime import date, datetime
+from typing import Iterable
+
+from sqlalchemy import and_, case, delete, event, func, insert, inspect, or_, select
+from sqlalchemy.orm import Session
+
+from api.database.models import HierarchyNodeModel, KPIMetricsModel, WorkOrderModel
+from tools.engines.kpi_engine import KPIEngine
+from tools.models.schemas import KPIMetrics
+
+DAY = "DAY"
+CORRECTIVE_ORDER_TYPE = "PM03"
+PREVENTIVE_ORDER_TYPE = "PM02"
+COMPLETED_STATUSES = ("COMPLETED", "CLOSED", "TECO")
+
+_PENDING_KEY = "kpi_rollups_pending"
+_ALL_DAYS = None  # scope value: every day of the equipment
+_CHUNK = 500
+# Node attributes that decide which plant an equipment's orders roll up to
+_NODE_ATTRS = ("code", "tag", "plant_id", "node_type")
+
+
+# ── Aggregation ─────────────────────────────────────────────────────
+
+def _aggregate(db: Session, *filters) -> list:
+    wo = WorkOrderModel
+    is_failure = wo.order_type == CORRECTIVE_ORDER_TYPE
+    is_pm = wo.order_type == PREVENTIVE_ORDER_TYPE
+    repaired = and_(is_failure, wo.actual_duration_hours > 0)
+    return db.query(
+        wo.equipment_id,
+        wo.created_date,
+        func.count(),
+        func.sum(case((is_failure, 1), else_=0)),
+        func.sum(case((is_pm, 1), else_=0)),
+        func.sum(case((and_(is_pm, wo.status.in_(COMPLETED_STATUSES)), 1), else_=0)),
+        func.sum(case((repaired, 1), else_=0)),
+        func.sum(case((repaired, wo.actual_duration_hours), else_=0.0)),
+        func.sum(case((and_(is_failure, wo.actual_duration_hours.isnot(None)), wo.actual_duration_hours), else_=0.0)),
+    ).filter(*filters).group_by(wo.equipment_id, wo.created_date).all()
+
+
+def _plant_map(db: Session, equipment_ids: Iterable[str] | None = None) -> dict[str, str]:
+    """equipment_id → plant_id of the EQUIPMENT node with that code (or else tag)."""
+    q = db.query(HierarchyNodeModel.code, HierarchyNodeModel.tag, HierarchyNodeModel.plant_id).filter(
+        HierarchyNodeModel.node_type == "EQUIPMENT",
+    )
+    if equipment_ids is not None:
+        ids = list(equipment_ids)
+        q = q.filter(or_(HierarchyNodeModel.code.in_(ids), HierarchyNodeModel.tag.in_(ids)))
+    by_tag: dict[str, str] = {}
+    by_code: dict[str, str] = {}
+    for code, tag, plant_id in q:
+        if tag:
+            by_tag.setdefault(tag, plant_id)
+        if code:
+            by_code.setdefault(code, plant_id)
+    return {**by_tag, **by_code}
+
+
+def _insert_rollups(db: Session, rows: list, plants: dict[str, str]) -> int:
+    now = datetime.now()
+    values = [
+        {
+            "metrics_id": str(uuid.uuid4()),
+            "grain": DAY,
+            "plant_id": plants.get(equipment_id, ""),
+            "equipment_id": equipment_id,
+            "period_start": day,
+            "period_end": day,
+            "calculated_at": now,
+            "total_work_orders": total,
+            "corrective_wo_count": corrective,
+            "preventive_wo_count": preventive,
+            "pm_completed_count": pm_completed,
+            "repair_count": repairs,
+            "repair_hours": repair_hours,
+            "downtime_hours": downtime,
+            "backlog_hours": 0.0,
+        }
+        for equipment_id, day, total, corrective, preventive, pm_completed, repairs, repair_hours, downtime in rows
+    ]
+    if values:
+        db.execute(insert(KPIMetricsModel.__table__), values)
+    return len(values)
+
+
+def _chunks(items: list, size: int = _CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _refresh_scope(db: Session, scope: dict[str, set[date] | None]) -> int:
+    """Recompute the rollups of each equipment for the given days (None: all days)."""
+    rollup, wo = KPIMetricsModel, WorkOrderModel
+    written = 0
+    all_days = [e for e, days in scope.items() if days is _ALL_DAYS]
+    by_day = {e: days for e, days in scope.items() if days is not _ALL_DAYS}
+
+    batches: list[tuple[list[str], list[date] | None]] = [(chunk, None) for chunk in _chunks(all_days)]
+    for chunk in _chunks(list(by_day)):
+        days = sorted(set().union(*(by_day[e] for e in chunk)))
+        batches.extend((chunk, day_chunk) for day_chunk in _chunks(days))
+
+    for equipment_ids, days in batches:
+        # Delete and recompute the same equipment × days scope
+        rollup_filter = [rollup.grain == DAY, rollup.equipment_id.in_(equipment_ids)]
+        order_filter = [wo.equipment_id.in_(equipment_ids)]
+        if days is not None:
+            rollup_filter.append(rollup.period_start.in_(days))
+            order_filter.append(wo.created_date.in_(days))
+        db.execute(delete(rollup).where(*rollup_filter).execution_options(synchronize_session=False))
+        written += _insert_rollups(db, _aggregate(db, *order_filter), _plant_map(db, equipment_ids))
+    return written
+
+
+def refresh_rollups(db: Session, since: date | None = None, until: date | None = None) -> dict:
+    """Rebuild the daily rollups of every equipment between two dates (inclusive)."""
+    rollup, wo = KPIMetricsModel, WorkOrderModel
+    rollup_filter, order_filter = [rollup.grain == DAY], []
+    if since:
+        rollup_filter.append(rollup.period_start >= since)
+        order_filter.append(wo.created_date >= since)
+    if until:
+        rollup_filter.append(rollup.period_start <= until)
+        order_filter.append(wo.created_date <= until)
+    db.execute(delete(rollup).where(*rollup_filter).execution_options(synchronize_session=False))
+    written = _insert_rollups(db, _aggregate(db, *order_filter), _plant_map(db))
+    db.commit()
+    return {"rollups": written, "since": since, "until": until}
+
+
+def mark_dirty(db: Session, equipment_ids: Iterable[str], days: Iterable[date] | None = None):
+    """Recompute the rollups of these equipment (on `days`, default every day) when ``db`` commits."""
+    scope = db.info.setdefault(_PENDING_KEY, {})
+    day_set = None if days is None else set(days)
+    for equipment_id in equipment_ids:
+        if not equipment_id:
+            continue
+        if day_set is None or (equipment_id in scope and scope[equipment_id] is _ALL_DAYS):
+            scope[equipment_id] = _ALL_DAYS
+        else:
+            scope.setdefault(equipment_id, set()).update(day_set)
+
+
+# ── KPIs ────────────────────────────────────────────────────────────
+
+def calculate_period_kpis(
+    db: Session,
+    plant_id: str,
+    period_start: date,
+    period_end: date,
+    equipment_id: str | None = None,
+    total_period_hours: float | None = None,
+) -> KPIMetrics:
+    """Reliability KPIs of a plant (or one of its equipment) from the daily rollups."""
+    rollup = KPIMetricsModel
+    failed = rollup.corrective_wo_count > 0
+    q = db.query(
+        func.coalesce(func.sum(rollup.total_work_orders), 0),
+        func.coalesce(func.sum(rollup.corrective_wo_count), 0),
+        func.coalesce(func.sum(rollup.preventive_wo_count), 0),
+        func.coalesce(func.sum(rollup.pm_completed_count), 0),
+        func.coalesce(func.sum(rollup.repair_count), 0),
+        func.coalesce(func.sum(rollup.repair_hours), 0.0),
+        func.coalesce(func.sum(rollup.downtime_hours), 0.0),
+        func.min(case((failed, rollup.period_start))),
+        func.max(case((failed, rollup.period_start))),
+    ).filter(
+        rollup.grain == DAY,
+        rollup.plant_id == plant_id,
+        rollup.period_start >= period_start,
+        rollup.period_start <= period_end,
+    )
+    if equipment_id:
+        q = q.filter(rollup.equipment_id == equipment_id)
+    total, corrective, preventive, pm_completed, repairs, repair_hours, downtime, first, last = q.one()
+
+    mtbf = None
+    if corrective >= 2:
+        first, last = (d if isinstance(d, date) else date.fromisoformat(d) for d in (first, last))
+        mtbf = round((last - first).days / (corrective - 1), 1)
+    mttr = round(repair_hours / repairs, 1) if repairs else None
+    if total_period_hours is None:
+        # Both period_start and period_end are included
+        total_period_hours = ((period_end - period_start).days + 1) * 24.0
+    availability = KPIEngine.calculate_availability(total_period_hours, downtime)
+
+    return KPIMetrics(
+        plant_id=plant_id,
+        equipment_id=equipment_id,
+        period_start=period_start,
+        period_end=period_end,
+        mtbf_days=mtbf,
+        mttr_hours=mttr,
+        availability_pct=availability,
+        oee_pct=KPIEngine.calculate_oee(availability) if availability is not None else None,
+        schedule_compliance_pct=None,
+        pm_compliance_pct=KPIEngine.calculate_pm_compliance(preventive, pm_completed),
+        total_work_orders=total,
+        corrective_wo_count=corrective,
+        preventive_wo_count=preventive,
+        reactive_ratio_pct=KPIEngine.calculate_reactive_ratio(corrective, total),
+    )
+
+
+def get_period_kpis(db: Session, plant_id: str, period_start: date, period_end: date,
+                    equipment_id: str | None = None) -> dict:
+    return calculate_period_kpis(db, plant_id, period_start, period_end, equipment_id).model_dump(mode="json")
+
+
+def reliability_summary(db: Session, plant_id: str, period_start: date, period_end: date) -> dict | None:
+    """Flat reliability metrics of a reporting period (both days included) for
+    report sections; None when the plant has no work orders in it."""
+    kpis = calculate_period_kpis(db, plant_id, period_start, period_end)
+    if not kpis.total_work_orders:
+        return None
+    return kpis.model_dump(
+        mode="json",
+        exclude={"metrics_id", "plant_id", "equipment_id", "period_start", "period_end", "calculated_at"},
+    )
+
+
+# ── Writer hooks ────────────────────────────────────────────────────
+
+def _values(obj, attr: str) -> list:
+    """Current value and, if it changed in this flush, the previous one."""
+    history = inspect(obj).attrs[attr].history
+    return [getattr(obj, attr), *history.deleted]
+
+
+def _old_value_unknown(obj, attrs: tuple[str, ...]) -> bool:
+    """An attribute was set without its previous value ever being loaded."""
+    state = inspect(obj)
+    for attr in attrs:
+        history = state.attrs[attr].history
+        if history.added and not history.deleted and not history.unchanged:
+            return True
+    return False
+
+
+@event.listens_for(Session, "before_flush")
+def _record_changes(session: Session, flush_context, instances):
+    work_orders: dict[str, set[date]] = {}
+    equipment: set[str] = set()
+    # Persistent rows whose previous equipment/day (or code/tag) must be read back
+    reload: list[str] = []
+    reload_nodes: list[str] = []
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, (WorkOrderModel, HierarchyNodeModel)):
+            continue
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        if isinstance(obj, WorkOrderModel):
+            for equipment_id in _values(obj, "equipment_id"):
+                work_orders.setdefault(equipment_id, set()).update(_values(obj, "created_date"))
+            if obj in session.dirty and _old_value_unknown(obj, ("equipment_id", "created_date")):
+                reload.append(obj.work_order_id)
+        elif obj.node_type == "EQUIPMENT":
+            if obj in session.dirty and not any(
+                inspect(obj).attrs[attr].history.has_changes() for attr in _NODE_ATTRS
+            ):
+                continue
+            equipment.update(_values(obj, "code"))
+            equipment.update(_values(obj, "tag"))
+            if obj in session.dirty and _old_value_unknown(obj, ("code", "tag")):
+                reload_nodes.append(obj.node_id)
+    for ids in _chunks(reload):
+        # Not flushed yet, so the table still holds the previous values
+        with session.no_autoflush:
+            rows = session.execute(
+                select(WorkOrderModel.equipment_id, WorkOrderModel.created_date)
+                .where(WorkOrderModel.work_order_id.in_(ids))
+            )
+            for equipment_id, day in rows:
+                work_orders.setdefault(equipment_id, set()).add(day)
+    for ids in _chunks(reload_nodes):
+        with session.no_autoflush:
+            rows = session.execute(
+                select(HierarchyNodeModel.code, HierarchyNodeModel.tag)
+                .where(HierarchyNodeModel.node_id.in_(ids))
+            )
+            equipment.update(value for row in rows for value in row)
+    for equipment_id, days in work_orders.items():
+        mark_dirty(session, [equipment_id], days)
+    if equipment:
+        mark_dirty(session, equipment)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_before_commit(session: Session):
+    # Flush first so changes still pending in the session are marked too
+    session.flush()
+    scope = session.info.pop(_PENDING_KEY, None)
+    if scope:
+        _refresh_scope(session, scope)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_on_rollback(session: Session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
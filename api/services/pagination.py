@@ -0,0 +1,84 @@
+"""Keyset pagination for list endpoints.
+
+Lists are ordered newest first on a timestamp column with the primary key
+as tie-breaker. A cursor encodes the (timestamp, id) of the last row
+returned; the next page continues strictly after it, so pages stay stable
+while new rows are inserted and deep pages cost the same as the first one
+(no OFFSET scan).
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+MAX_PAGE_SIZE = 1000
+# Response header carrying the cursor of the next page on list endpoints
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Page(list):
+    """A list of rows plus the cursor of the following page (None on the last page)."""
+
+    def __init__(self, rows=(), next_cursor: str | None = None):
+        super().__init__(rows)
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(timestamp: datetime | None, key: str) -> str:
+    raw = json.dumps([timestamp.isoformat() if timestamp else None, key])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime | None, str]:
+    """Inverse of encode_cursor. Raises ValueError on a malformed cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(ts) if ts else None), str(key)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def paginate(
+    query: Query,
+    timestamp_col,
+    key_col,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> Page:
+    """Apply keyset ordering/filtering to `query` and fetch one page.
+
+    Args:
+        query: Filtered query over full entities or projected columns; it
+            must select `timestamp_col` and `key_col`.
+        timestamp_col: Column ordered descending (e.g. ``created_at``).
+        key_col: Unique tie-breaker (primary key).
+        limit: Page size, capped at MAX_PAGE_SIZE. None returns every row.
+        cursor: Value of ``next_cursor`` from the previous page.
+    """
+    if cursor:
+        ts, key = decode_cursor(cursor)
+        if ts is None:
+            query = query.filter(timestamp_col.is_(None), key_col < key)
+        else:
+            query = query.filter(or_(
+                timestamp_col < ts,
+                and_(timestamp_col == ts, key_col < key),
+                timestamp_col.is_(None),
+            ))
+    query = query.order_by(timestamp_col.desc().nulls_last(), key_col.desc())
+    if limit is None:
+        return Page(query.all())
+
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return Page(rows)
+    rows = rows[:limit]
+    last = rows[-1]
+    return Page(rows, encode_cursor(
+        getattr(last, timestamp_col.key), getattr(last, key_col.key),
+    ))
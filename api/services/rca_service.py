@@ -8,6 +8,7 @@ from api.database.models import (
     RCAAnalysisModel, PlanningKPISnapshotModel, DEKPISnapshotModel,
 )
 from api.services.audit_service import log_action
+from api.services.pagination import Page, paginate
 from tools.engines.rca_engine import RCAEngine
 from tools.engines.planning_kpi_engine import PlanningKPIEngine
 from tools.engines.de_kpi_engine import DEKPIEngine
@@ -69,13 +70,20 @@ def get_rca(db: Session, analysis_id: str) -> dict | None:
 
 def list_rcas(
     db: Session, plant_id: str | None = None, status: str | None = None,
-) -> list[dict]:
-    q = db.query(RCAAnalysisModel)
+    limit: int | None = None, cursor: str | None = None,
+) -> Page:
+    # The 5W2H, cause-effect, evidence and solutions blobs are only needed by get_rca
+    q = db.query(
+        RCAAnalysisModel.analysis_id, RCAAnalysisModel.event_description,
+        RCAAnalysisModel.level, RCAAnalysisModel.status,
+        RCAAnalysisModel.plant_id, RCAAnalysisModel.created_at,
+    )
     if plant_id:
-        q = q.filter_by(plant_id=plant_id)
+        q = q.filter(RCAAnalysisModel.plant_id == plant_id)
     if status:
-        q = q.filter_by(status=status)
-    return [
+        q = q.filter(RCAAnalysisModel.status == status)
+    page = paginate(q, RCAAnalysisModel.created_at, RCAAnalysisModel.analysis_id, limit, cursor)
+    return Page([
         {
             "analysis_id": r.analysis_id,
             "event_description": r.event_description[:80],
@@ -84,8 +92,8 @@ def list_rcas(
             "plant_id": r.plant_id,
             "created_at": r.created_at.isoformat() if r.created_at else None,
         }
-        for r in q.order_by(RCAAnalysisModel.created_at.desc()).all()
-    ]
+        for r in page
+    ], page.next_cursor)
 
 
 def run_5w2h(db: Session, analysis_id: str, data: dict) -> dict | None:
@@ -223,10 +223,14 @@ def advance_moc(db: Session, moc_id: str, action: str, **kwargs) -> dict | None:
 
 # ── OCR ──────────────────────────────────────────────────────────────
 
-def calculate_ocr(db: Session, data: dict) -> dict:
+def calculate_ocr(db: Session, data: dict, include_cost_curve: bool = False) -> dict:
     inp = OCRAnalysisInput(**data)
-    result = OCREngine.calculate_optimal_interval(inp)
-    return result.model_dump(mode="json")
+    result = OCREngine.calculate_optimal_interval(inp).model_dump(mode="json")
+    if include_cost_curve:
+        result["cost_curve"] = {
+            str(interval): round(cost, 2) for interval, cost in OCREngine.cost_curve(inp).items()
+        }
+    return result
 
 
 # ── Jack-Knife ───────────────────────────────────────────────────────
@@ -1,22 +1,35 @@
 """Reporting service — reports, DE KPIs, notifications, import/export, cross-module analytics."""
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 from sqlalchemy.orm import Session
 
 from api.database.models import ReportModel, NotificationModel
+from api.services import kpi_rollup_service
 from api.services.audit_service import log_action
+from api.services.pagination import Page, paginate
 from tools.engines.reporting_engine import ReportingEngine
 from tools.engines.de_kpi_engine import DEKPIEngine
 from tools.engines.notification_engine import NotificationEngine
 from tools.engines.data_import_engine import DataImportEngine
 from tools.engines.data_export_engine import DataExportEngine
 from tools.engines.cross_module_engine import CrossModuleEngine
-from tools.models.schemas import DEKPIInput, ImportSource, ExportFormat
+from tools.models.schemas import DEKPIInput, ImportSource, ExportFormat, ExportResult
 
 
 # ── Reports ─────────────────────────────────────────────────────────
 
+def _month_bounds(year: int, month: int) -> tuple[date, date]:
+    start = date(year, month, 1)
+    next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, next_month - timedelta(days=1)
+
+
+def _reliability_kpis(db: Session, plant_id: str, month: int, year: int) -> dict | None:
+    """Reliability KPIs of a month from the work-order rollups."""
+    return kpi_rollup_service.reliability_summary(db, plant_id, *_month_bounds(year, month))
+
+
 def generate_weekly_report(db: Session, plant_id: str, week: int, year: int, data: dict) -> dict:
     result = ReportingEngine.generate_weekly_report(
         plant_id, week, year,
@@ -47,7 +60,7 @@ def generate_monthly_report(db: Session, plant_id: str, month: int, year: int, d
         plant_id, month, year,
         planning_kpis=data.get("planning_kpis"),
         de_kpis=data.get("de_kpis"),
-        reliability_kpis=data.get("reliability_kpis"),
+        reliability_kpis=data.get("reliability_kpis") or _reliability_kpis(db, plant_id, month, year),
         health_summary=data.get("health_summary"),
         previous_month_kpis=data.get("previous_month_kpis"),
     )
@@ -67,9 +80,16 @@ def generate_monthly_report(db: Session, plant_id: str, month: int, year: int, d
 
 
 def generate_quarterly_report(db: Session, plant_id: str, quarter: int, year: int, data: dict) -> dict:
+    monthly_reports = data.get("monthly_reports")
+    if not monthly_reports:
+        monthly_reports = []
+        for month in range((quarter - 1) * 3 + 1, quarter * 3 + 1):
+            kpis = _reliability_kpis(db, plant_id, month, year)
+            if kpis is not None:
+                monthly_reports.append({"month": month, "year": year, "reliability_kpis": kpis})
     result = ReportingEngine.generate_quarterly_review(
         plant_id, quarter, year,
-        monthly_reports=data.get("monthly_reports"),
+        monthly_reports=monthly_reports,
         management_review=data.get("management_review"),
         rbi_summary=data.get("rbi_summary"),
         bad_actors=data.get("bad_actors"),
@@ -90,13 +110,21 @@ def generate_quarterly_report(db: Session, plant_id: str, quarter: int, year: in
     return report_dict
 
 
-def list_reports(db: Session, plant_id: str | None = None, report_type: str | None = None) -> list[dict]:
-    q = db.query(ReportModel)
+def list_reports(
+    db: Session, plant_id: str | None = None, report_type: str | None = None,
+    limit: int | None = None, cursor: str | None = None,
+) -> Page:
+    # Report content is only loaded by get_report
+    q = db.query(
+        ReportModel.report_id, ReportModel.report_type, ReportModel.plant_id,
+        ReportModel.period_start, ReportModel.period_end, ReportModel.generated_at,
+    )
     if plant_id:
-        q = q.filter_by(plant_id=plant_id)
+        q = q.filter(ReportModel.plant_id == plant_id)
     if report_type:
-        q = q.filter_by(report_type=report_type)
-    return [
+        q = q.filter(ReportModel.report_type == report_type)
+    page = paginate(q, ReportModel.generated_at, ReportModel.report_id, limit, cursor)
+    return Page([
         {
             "report_id": r.report_id, "report_type": r.report_type,
             "plant_id": r.plant_id,
@@ -104,8 +132,8 @@ def list_reports(db: Session, plant_id: str | None = None, report_type: str | No
             "period_end": r.period_end.isoformat() if r.period_end else None,
             "generated_at": r.generated_at.isoformat() if r.generated_at else None,
         }
-        for r in q.order_by(ReportModel.generated_at.desc()).all()
-    ]
+        for r in page
+    ], page.next_cursor)
 
 
 def get_report(db: Session, report_id: str) -> dict | None:
@@ -163,7 +191,8 @@ def generate_notifications(db: Session, plant_id: str, data: dict) -> dict:
 def list_notifications(
     db: Session, plant_id: str | None = None,
     level: str | None = None, acknowledged: bool | None = None,
-) -> list[dict]:
+    limit: int | None = None, cursor: str | None = None,
+) -> Page:
     q = db.query(NotificationModel)
     if plant_id:
         q = q.filter_by(plant_id=plant_id)
@@ -171,7 +200,8 @@ def list_notifications(
         q = q.filter_by(level=level)
     if acknowledged is not None:
         q = q.filter_by(acknowledged=acknowledged)
-    return [
+    page = paginate(q, NotificationModel.created_at, NotificationModel.notification_id, limit, cursor)
+    return Page([
         {
             "notification_id": n.notification_id, "notification_type": n.notification_type,
             "level": n.level, "title": n.title, "message": n.message,
@@ -179,8 +209,8 @@ def list_notifications(
             "acknowledged": n.acknowledged,
             "created_at": n.created_at.isoformat() if n.created_at else None,
         }
-        for n in q.order_by(NotificationModel.created_at.desc()).all()
-    ]
+        for n in page
+    ], page.next_cursor)
 
 
 def acknowledge_notification(db: Session, notification_id: str) -> dict | None:
@@ -208,7 +238,7 @@ def validate_import(db: Session, source: str, rows: list[dict]) -> dict:
 
 # ── Export ──────────────────────────────────────────────────────────
 
-def export_data(db: Session, export_type: str, data: dict) -> dict:
+def prepare_export(export_type: str, data: dict) -> ExportResult:
     if export_type == "equipment":
         result = DataExportEngine.prepare_equipment_export(
             data.get("hierarchy_data", []),
@@ -231,7 +261,11 @@ def export_data(db: Session, export_type: str, data: dict) -> dict:
             data.get("report", {}),
             format=ExportFormat(data.get("format", "EXCEL")),
         )
-    return result.model_dump(mode="json")
+    return result
+
+
+def export_data(db: Session, export_type: str, data: dict) -> dict:
+    return prepare_export(export_type, data).model_dump(mode="json")
 
 
 # ── Cross-Module ────────────────────────────────────────────────────
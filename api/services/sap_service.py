@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from api.config import settings
 from api.database.models import SAPUploadPackageModel
 from api.services.audit_service import log_action
+from api.services.pagination import Page, paginate
 from tools.engines.state_machine import StateMachine, TransitionError
 
 
@@ -31,11 +32,18 @@ def get_upload(db: Session, package_id: str) -> SAPUploadPackageModel | None:
     return db.query(SAPUploadPackageModel).filter(SAPUploadPackageModel.package_id == package_id).first()
 
 
-def list_uploads(db: Session, plant_code: str | None = None) -> list[SAPUploadPackageModel]:
-    q = db.query(SAPUploadPackageModel)
+def list_uploads(
+    db: Session, plant_code: str | None = None,
+    limit: int | None = None, cursor: str | None = None,
+) -> Page:
+    """Upload headers only — plan, items and task lists are loaded by get_upload."""
+    q = db.query(
+        SAPUploadPackageModel.package_id, SAPUploadPackageModel.plant_code,
+        SAPUploadPackageModel.status, SAPUploadPackageModel.generated_at,
+    )
     if plant_code:
         q = q.filter(SAPUploadPackageModel.plant_code == plant_code)
-    return q.order_by(SAPUploadPackageModel.generated_at.desc()).all()
+    return paginate(q, SAPUploadPackageModel.generated_at, SAPUploadPackageModel.package_id, limit, cursor)
 
 
 def approve_upload(db: Session, package_id: str) -> dict:
@@ -1,24 +1,25 @@
 """Scheduling service — manages weekly programs and Gantt exports."""
 
 import os
-import tempfile
+from collections import defaultdict
 from datetime import datetime
+from typing import Iterator
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from api.database.models import (
-    BacklogItemModel, WeeklyProgramModel,
+    WeeklyProgramModel,
     WorkforceModel, ShutdownCalendarModel,
 )
 from api.services.audit_service import log_action
-from tools.engines.scheduling_engine import SchedulingEngine
+from api.services.backlog_service import load_plant_backlog
+from api.services.pagination import Page, paginate
+from tools.engines.scheduling_engine import SchedulingEngine, SHIFT_HOURS
 from tools.processors.gantt_generator import GanttGenerator
-from tools.processors.backlog_optimizer import BacklogOptimizer, _to_backlog_entries
-from tools.engines.backlog_grouper import BacklogGrouper
 from tools.models.schemas import (
-    BacklogItem, Priority, BacklogWOType, BacklogStatus,
     BacklogWorkPackage, ShiftType, MaterialsReadyStatus,
-    WeeklyProgram, WeeklyProgramStatus,
+    WeeklyProgram, WeeklyProgramStatus, TradeCapacity,
 )
 
 
@@ -29,14 +30,13 @@ def create_program(
     year: int,
 ) -> dict:
     """Create a DRAFT weekly program from current backlog."""
-    db_items = db.query(BacklogItemModel).all()
-    items = [_to_schema_item(i) for i in db_items]
+    items, groups = load_plant_backlog(
+        db, plant_id, grouping="schedulable",
+        include=lambda i: i.materials_ready and not i.shutdown_required,
+    )
 
     schedulable = [i for i in items if i.materials_ready and not i.shutdown_required]
 
-    entries = _to_backlog_entries(schedulable)
-    groups = BacklogGrouper.find_all_groups(entries)
-
     from datetime import date, timedelta
     period_start = date.today()
     work_packages = []
@@ -72,27 +72,47 @@ def create_program(
 
     program = SchedulingEngine.create_weekly_program(plant_id, week_number, year, work_packages)
 
-    # Load workforce and level resources
-    workforce = [
-        {"worker_id": w.worker_id, "specialty": w.specialty, "shift": w.shift, "available": w.available}
-        for w in db.query(WorkforceModel).filter(WorkforceModel.plant_id == plant_id).all()
-    ]
-    program = SchedulingEngine.level_resources(program, workforce)
-
-    # Assign support tasks
+    # A package is as urgent as its most urgent item ("1_EMERGENCY" sorts first)
+    item_priority = {i.backlog_id: i.priority.value for i in schedulable}
     pkg_attrs = [
         {
             "package_id": p.get("package_id", ""),
             "shutdown_required": False,
             "specialties": p.get("assigned_team", []),
             "total_hours": p.get("total_duration_hours", 0.0),
+            "priority": min(
+                (item_priority[b] for b in p.get("grouped_items", []) if b in item_priority),
+                default="9",
+            ),
         }
         for p in program.work_packages
     ]
+
+    # Place packages on the Thu-Sun window against available trade capacity
+    headcount: dict[tuple[str, str], int] = defaultdict(int)
+    for w in db.query(WorkforceModel).filter(WorkforceModel.plant_id == plant_id).all():
+        if w.available:
+            headcount[(w.shift or "MORNING", w.specialty or "GENERAL")] += 1
+    capacities = [
+        TradeCapacity(specialty=spec, shift=shift, headcount=n, total_hours=n * SHIFT_HOURS)
+        for (shift, spec), n in sorted(headcount.items())
+    ]
+    leveling = SchedulingEngine.level_schedule(program, capacities, pkg_attrs)
+
+    # Packages that did not fit keep no date, so they stay out of the
+    # interference checks and the Gantt; leveling_conflicts explains why
+    unscheduled = set(leveling.unscheduled_packages)
+    for pkg in program.work_packages:
+        if pkg.get("package_id", "") in unscheduled:
+            pkg["scheduled_date"] = None
+            pkg["unscheduled"] = True
+
+    # Assign support tasks
     program = SchedulingEngine.assign_support_tasks(program, pkg_attrs)
 
     # Detect conflicts
-    SchedulingEngine.detect_conflicts(program)
+    placed = [p for p in program.work_packages if not p.get("unscheduled")]
+    conflicts = SchedulingEngine.detect_conflicts(program.model_copy(update={"work_packages": placed}))
 
     # Persist
     model = WeeklyProgramModel(
@@ -104,7 +124,8 @@ def create_program(
         work_packages=[p for p in program.work_packages],
         total_hours=program.total_hours,
         resource_slots=[s.model_dump(mode="json") for s in program.resource_slots],
-        conflicts=[c.model_dump(mode="json") for c in program.conflicts],
+        conflicts=[c.model_dump(mode="json") for c in conflicts],
+        leveling_conflicts=[c.model_dump(mode="json") for c in leveling.conflicts],
         support_tasks=[t.model_dump(mode="json") for t in program.support_tasks],
         created_at=datetime.now(),
     )
@@ -126,13 +147,44 @@ def list_programs(
     db: Session,
     plant_id: str | None = None,
     status: str | None = None,
-) -> list[dict]:
-    q = db.query(WeeklyProgramModel)
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> Page:
+    # Counts come from SQL so the package, slot and conflict JSON is never loaded
+    q = db.query(
+        WeeklyProgramModel.program_id,
+        WeeklyProgramModel.plant_id,
+        WeeklyProgramModel.week_number,
+        WeeklyProgramModel.year,
+        WeeklyProgramModel.status,
+        WeeklyProgramModel.total_hours,
+        func.coalesce(func.json_array_length(WeeklyProgramModel.work_packages), 0).label("work_packages_count"),
+        func.coalesce(func.json_array_length(WeeklyProgramModel.conflicts), 0).label("conflicts_count"),
+        func.coalesce(func.json_array_length(WeeklyProgramModel.support_tasks), 0).label("support_tasks_count"),
+        WeeklyProgramModel.created_at,
+        WeeklyProgramModel.finalized_at,
+    )
     if plant_id:
         q = q.filter(WeeklyProgramModel.plant_id == plant_id)
     if status:
         q = q.filter(WeeklyProgramModel.status == status)
-    return [_program_to_dict(p) for p in q.order_by(WeeklyProgramModel.created_at.desc()).all()]
+    page = paginate(q, WeeklyProgramModel.created_at, WeeklyProgramModel.program_id, limit, cursor)
+    return Page([
+        {
+            "program_id": p.program_id,
+            "plant_id": p.plant_id,
+            "week_number": p.week_number,
+            "year": p.year,
+            "status": p.status,
+            "total_hours": p.total_hours,
+            "work_packages_count": p.work_packages_count,
+            "conflicts_count": p.conflicts_count,
+            "support_tasks_count": p.support_tasks_count,
+            "created_at": p.created_at.isoformat() if p.created_at else None,
+            "finalized_at": p.finalized_at.isoformat() if p.finalized_at else None,
+        }
+        for p in page
+    ], page.next_cursor)
 
 
 def finalize_program(db: Session, program_id: str) -> dict | None:
@@ -197,18 +249,14 @@ def get_gantt(db: Session, program_id: str) -> list[dict] | None:
     return [r.model_dump(mode="json") for r in rows]
 
 
-def export_gantt_excel(db: Session, program_id: str) -> str | None:
+def stream_gantt_excel(db: Session, program_id: str) -> Iterator[bytes] | None:
     model = get_program(db, program_id)
     if not model:
         return None
 
     program = _model_to_schema(model)
     rows = GanttGenerator.generate_gantt_data(program)
-
-    tmp = tempfile.NamedTemporaryFile(suffix=".xlsx", prefix="gantt_", delete=False)
-    tmp.close()
-    GanttGenerator.export_gantt_excel(rows, tmp.name)
-    return tmp.name
+    return GanttGenerator.stream_gantt_excel(rows)
 
 
 def _model_to_schema(model: WeeklyProgramModel) -> WeeklyProgram:
@@ -228,26 +276,6 @@ def _model_to_schema(model: WeeklyProgramModel) -> WeeklyProgram:
     )
 
 
-def _to_schema_item(item: BacklogItemModel) -> BacklogItem:
-    from datetime import date
-    return BacklogItem(
-        backlog_id=item.backlog_id,
-        work_request_id=item.work_request_id or "",
-        equipment_id=item.equipment_id,
-        equipment_tag=item.equipment_tag,
-        priority=Priority(item.priority) if item.priority in [e.value for e in Priority] else Priority.NORMAL,
-        work_order_type=BacklogWOType(item.wo_type) if item.wo_type in [e.value for e in BacklogWOType] else BacklogWOType.PM01,
-        created_date=item.created_at.date() if item.created_at else date.today(),
-        age_days=item.age_days,
-        status=BacklogStatus(item.status) if item.status in [e.value for e in BacklogStatus] else BacklogStatus.AWAITING_APPROVAL,
-        blocking_reason=item.blocking_reason,
-        estimated_duration_hours=item.estimated_hours,
-        required_specialties=item.specialties or ["MECHANICAL"],
-        materials_ready=item.materials_ready,
-        shutdown_required=item.shutdown_required,
-    )
-
-
 def _program_to_dict(model: WeeklyProgramModel) -> dict:
     return {
         "program_id": model.program_id,
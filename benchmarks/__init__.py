@@ -0,0 +1 @@
+"""Performance benchmarks for the deterministic engines (see engine_benchmarks)."""
@@ -0,0 +1,475 @@
+"""
+Engine Benchmarks — timings of the hot engines on synthetic fleets.
+
+Each case builds its input from SyntheticDataGenerator at a given scale
+(untimed), then times the engine call alone. The scale counts what the
+engine iterates over:
+
+    weibull_fit          equipment failure series   WeibullEngine.fit_batch
+    ocr                  equipment items            OCREngine.batch_analyze
+    backlog_optimizer    backlog items              BacklogOptimizer.optimize
+    schedule_leveling    work packages              SchedulingEngine.level_schedule
+    quality_validation   hierarchy nodes            QualityValidator.run_full_validation
+                         (with their functions, criticality, FMs, tasks and WPs)
+    equipment_resolver   registry equipment         EquipmentResolver.resolve_many (fixed lookups)
+    hierarchy_subtree    hierarchy nodes (SQLite)   hierarchy_service.get_subtree per plant
+
+Results are written as JSON so runs can be compared; ``--compare`` reports
+cases whose best time grew by more than ``--threshold`` against a previous
+file and exits with status 1.
+
+Usage:
+    python -m benchmarks.engine_benchmarks
+    python -m benchmarks.engine_benchmarks --scales 1000 10000 --engines ocr weibull_fit
+    python -m benchmarks.engine_benchmarks --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable
+
+from tools.generators.synthetic_data import SPECIALTIES, SyntheticDataGenerator
+
+DEFAULT_SCALES = (1_000, 10_000, 100_000)
+DEFAULT_REPEAT = 3
+# Relative slowdown of the best time reported as a regression
+DEFAULT_THRESHOLD = 0.25
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Lookups timed against the registry in the equipment_resolver case
+RESOLVER_LOOKUPS = 500
+HISTORY_YEARS = 5
+
+# Nodes per equipment of a full-depth fleet (equipment, sub-assemblies, items)
+_NODES_PER_EQUIPMENT = 15
+
+
+@dataclass
+class BenchmarkResult:
+    engine: str
+    scale: int
+    unit: str
+    setup_s: float
+    best_s: float
+    median_s: float
+    repeat: int
+    per_item_us: float
+
+
+class Fixtures:
+    """Synthetic inputs shared by the cases of one run, built once per size."""
+
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+        self._fleets: dict[tuple[int, bool], list[dict]] = {}
+
+    def generator(self) -> SyntheticDataGenerator:
+        return SyntheticDataGenerator(seed=self.seed)
+
+    def fleet(self, equipment: int, include_components: bool = False) -> list[dict]:
+        """Nodes of a fleet with about ``equipment`` equipment."""
+        key = (equipment, include_components)
+        if key not in self._fleets:
+            num_plants = max(1, math.ceil(equipment / 5_000))
+            areas_per_plant = 8
+            per_system = max(1, math.ceil(equipment / (num_plants * areas_per_plant)))
+            self._fleets[key] = self.generator().generate_fleet(
+                num_plants, areas_per_plant, per_system, include_components,
+            )
+        return self._fleets[key]
+
+    def equipment(self, count: int) -> list[dict]:
+        nodes = [n for n in self.fleet(count) if n["node_type"] == "EQUIPMENT"]
+        return nodes[:count]
+
+    def hierarchy(self, count: int) -> list[dict]:
+        """Full-depth nodes, cut at ``count`` so parents always come first."""
+        nodes = self.fleet(max(1, math.ceil(count / _NODES_PER_EQUIPMENT)), include_components=True)
+        return nodes[:count]
+
+
+# ── Cases ───────────────────────────────────────────────────────────
+# A case prepares its input for a scale and returns the callable to time.
+
+
+def _weibull_fit(fx: Fixtures, scale: int) -> Callable[[], object]:
+    from tools.engines.weibull_engine import WeibullEngine
+
+    intervals = fx.generator().generate_failure_intervals(fx.equipment(scale), years=HISTORY_YEARS)
+    series = list(intervals.values())
+    return lambda: WeibullEngine.fit_batch(series)
+
+
+def _ocr(fx: Fixtures, scale: int) -> Callable[[], object]:
+    from tools.engines.ocr_engine import OCREngine
+    from tools.models.schemas import OCRAnalysisInput
+
+    equipment = fx.equipment(scale)
+    intervals = fx.generator().generate_failure_intervals(equipment, years=HISTORY_YEARS)
+    cost = {"AA": 250_000.0, "A+": 120_000.0, "A": 60_000.0, "B": 15_000.0}
+    inputs = [
+        OCRAnalysisInput(
+            equipment_id=eq["code"],
+            failure_rate=len(intervals[eq["code"]]) / HISTORY_YEARS,
+            cost_per_failure=cost.get(eq["criticality"], 10_000.0),
+            cost_per_pm=cost.get(eq["criticality"], 10_000.0) / 20,
+        )
+        for eq in equipment
+    ]
+    return lambda: OCREngine.batch_analyze(inputs)
+
+
+def _backlog_optimizer(fx: Fixtures, scale: int) -> Callable[[], object]:
+    from tools.models.schemas import BacklogItem
+    from tools.processors.backlog_optimizer import BacklogOptimizer
+
+    equipment = fx.equipment(max(1, scale // 10))
+    items = [BacklogItem(**item) for item in fx.generator().generate_backlog(equipment, scale)]
+    workforce = [
+        {"worker_id": f"W-{i:03d}", "specialty": SPECIALTIES[i % len(SPECIALTIES)],
+         "shift": "MORNING" if i % 2 else "AFTERNOON", "available": True}
+        for i in range(40)
+    ]
+    today = date.today().isoformat()
+    shutdowns = [{"shutdown_id": "SD-1", "start_date": today, "end_date": today, "type": "MINOR", "areas": []}]
+    return lambda: BacklogOptimizer.optimize(items, workforce, shutdowns)
+
+
+def _schedule_leveling(fx: Fixtures, scale: int) -> Callable[[], object]:
+    from tools.engines.scheduling_engine import SchedulingEngine
+    from tools.models.schemas import TradeCapacity, WeeklyProgram
+
+    rng = fx.generator().rng
+    packages = [
+        {"package_id": f"WP-{i:07d}", "scheduled_shift": "MORNING",
+         "assigned_team": rng.sample(SPECIALTIES, rng.randint(1, 2)),
+         "total_duration_hours": rng.choice([2.0, 4.0, 8.0, 12.0, 16.0])}
+        for i in range(scale)
+    ]
+    total_hours = sum(p["total_duration_hours"] for p in packages)
+    # Enough capacity for about 90% of the demand over 4 days x 2 shifts
+    per_slot = total_hours * 0.9 / (4 * 2 * len(SPECIALTIES))
+    headcount = max(1, math.ceil(per_slot / 8.0))
+    capacities = [
+        TradeCapacity(specialty=spec, shift=shift, headcount=headcount, total_hours=headcount * 8.0)
+        for spec in SPECIALTIES for shift in ("MORNING", "AFTERNOON")
+    ]
+    attributes = [
+        {"package_id": p["package_id"], "priority": rng.choice(["1_EMERGENCY", "2_URGENT", "3_NORMAL", "4_PLANNED"])}
+        for p in packages
+    ]
+
+    def run():
+        # level_schedule rewrites the packages, so each repetition gets a fresh program
+        program = WeeklyProgram(
+            plant_id="OCP-P01", week_number=10, year=2025,
+            work_packages=[dict(p) for p in packages], total_hours=total_hours,
+        )
+        return SchedulingEngine.level_schedule(program, capacities, attributes)
+
+    return run
+
+
+def _quality_validation(fx: Fixtures, scale: int) -> Callable[[], object]:
+    from tools.models.schemas import (
+        AllocatedTask, CriteriaScore, CriticalityAssessment, CriticalityCategory, CriticalityMethod,
+        FailureEffect, FailureMode, FailureType, FrequencyUnit, Function, FunctionalFailure,
+        FunctionType, LabourResource, LabourSpecialty, LabourSummary, MaintenanceTask,
+        PlantHierarchyNode, RiskClass, TaskConstraint, TaskType, VALID_FM_COMBINATIONS, WorkPackage,
+        WPConstraint, WPType,
+    )
+    from tools.validators.quality_validator import QualityValidator
+
+    raw = fx.hierarchy(scale)
+    fields = set(PlantHierarchyNode.model_fields)
+    nodes = [PlantHierarchyNode(**{k: v for k, v in n.items() if k in fields}) for n in raw]
+    by_id = {n.node_id: n for n in nodes}
+
+    # One function and total failure per system and maintainable item
+    functions, failures, failure_of = [], [], {}
+    for n in nodes:
+        if n.node_type.value not in ("SYSTEM", "MAINTAINABLE_ITEM"):
+            continue
+        fn = Function(
+            node_id=n.node_id, function_type=FunctionType.PRIMARY,
+            description=f"To operate {n.name}", description_fr=f"Faire fonctionner {n.name}",
+        )
+        ff = FunctionalFailure(
+            function_id=fn.function_id, failure_type=FailureType.TOTAL,
+            description=f"{n.name} fails to operate", description_fr=f"{n.name} ne fonctionne pas",
+        )
+        functions.append(fn)
+        failures.append(ff)
+        failure_of[n.node_id] = ff.failure_id
+
+    assessments = [
+        CriticalityAssessment(
+            node_id=n.node_id, assessed_at=datetime(2025, 1, 1), assessed_by="BENCH",
+            method=CriticalityMethod.FULL_MATRIX,
+            criteria_scores=[CriteriaScore(category=c, consequence_level=3) for c in CriticalityCategory],
+            probability=3, risk_class=RiskClass.III_HIGH,
+        )
+        for n in nodes if n.node_type.value == "EQUIPMENT"
+    ]
+
+    # Failure modes per the generator's templates (its mechanism/cause names
+    # predate the SRC-09 vocabulary, so valid combinations are cycled instead),
+    # one inspection task each and one work package per equipment
+    combinations = sorted(VALID_FM_COMBINATIONS, key=lambda mc: (mc[0].value, mc[1].value))
+    failure_modes, tasks, tasks_of = [], [], {}
+    for i, fm in enumerate(fx.generator().generate_failure_modes(raw)):
+        mechanism, cause = combinations[i % len(combinations)]
+        mode = FailureMode(
+            functional_failure_id=failure_of[fm["node_id"]], what=fm["what"],
+            mechanism=mechanism, cause=cause, failure_pattern=fm["failure_pattern"],
+            failure_consequence=fm["failure_consequence"], is_hidden=fm["is_hidden"],
+            failure_effect=FailureEffect(evidence=f"{fm['what']} {mechanism.value.lower()}"),
+            strategy_type=fm["strategy_type"],
+        )
+        task = MaintenanceTask(
+            name=f"Inspect {fm['mi_name']} {fm['what']}"[:72], name_fr="Inspecter",
+            task_type=TaskType.INSPECT, consequences="Unplanned stoppage",
+            constraint=TaskConstraint.ONLINE, access_time_hours=0,
+            frequency_value=4, frequency_unit=FrequencyUnit.WEEKS,
+            labour_resources=[LabourResource(specialty=LabourSpecialty.FITTER, quantity=1, hours_per_person=0.5)],
+        )
+        failure_modes.append(mode)
+        tasks.append(task)
+        equipment = by_id[fm["node_id"]]
+        while equipment.node_type.value != "EQUIPMENT" and equipment.parent_node_id in by_id:
+            equipment = by_id[equipment.parent_node_id]
+        tasks_of.setdefault(equipment.node_id, []).append(task)
+    work_packages = [
+        WorkPackage(
+            name=f"4W {by_id[node_id].code} INSP ON"[:40], code=f"WP-{i:06d}", node_id=node_id,
+            frequency_value=4, frequency_unit=FrequencyUnit.WEEKS, constraint=WPConstraint.ONLINE,
+            access_time_hours=0, work_package_type=WPType.STANDALONE,
+            allocated_tasks=[
+                AllocatedTask(task_id=t.task_id, order=k + 1, operation_number=10 * (k + 1))
+                for k, t in enumerate(equipment_tasks)
+            ],
+            labour_summary=LabourSummary(total_hours=0.5 * len(equipment_tasks)),
+        )
+        for i, (node_id, equipment_tasks) in enumerate(tasks_of.items())
+    ]
+
+    return lambda: QualityValidator.run_full_validation(
+        nodes=nodes, functions=functions, functional_failures=failures,
+        criticality_assessments=assessments, failure_modes=failure_modes,
+        tasks=tasks, work_packages=work_packages,
+    )
+
+
+def _equipment_resolver(fx: Fixtures, scale: int) -> Callable[[], object]:
+    from tools.engines.equipment_resolver import EquipmentResolver
+
+    equipment = fx.equipment(scale)
+    resolver = EquipmentResolver([
+        {"equipment_id": eq["node_id"], "tag": eq["tag"], "description": eq["name"],
+         "description_fr": eq["name_fr"], "aliases": []}
+        for eq in equipment
+    ])
+    rng = fx.generator().rng
+    lookups = []
+    for i in range(RESOLVER_LOOKUPS):
+        eq = rng.choice(equipment)
+        kind = i % 4
+        if kind == 0:
+            lookups.append(eq["tag"])
+        elif kind == 1:
+            lookups.append(eq["tag"].lower().replace("-", " "))
+        elif kind == 2:
+            lookups.append(eq["tag"][:-1])
+        else:
+            lookups.append(f"the {eq['name'].lower()} is leaking")
+    return lambda: resolver.resolve_many(lookups)
+
+
+def _hierarchy_subtree(fx: Fixtures, scale: int) -> Callable[[], object]:
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+
+    from api.database.connection import Base
+    from api.database.models import HierarchyNodeModel, PlantModel
+    from api.services import hierarchy_service
+
+    nodes = fx.hierarchy(scale)
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+
+    paths: dict[str, str] = {}
+    rows = []
+    for n in nodes:
+        path = f"{paths.get(n['parent_node_id'], '/')}{n['node_id']}/"
+        paths[n["node_id"]] = path
+        rows.append({
+            "node_id": n["node_id"], "node_type": n["node_type"], "name": n["name"],
+            "name_fr": n["name_fr"], "code": n["code"], "parent_node_id": n["parent_node_id"],
+            "level": n["level"], "plant_id": n["plant_code"], "tag": n.get("tag"),
+            "criticality": n.get("criticality"), "status": "ACTIVE", "order": 1, "path": path,
+        })
+    plants = [n for n in nodes if n["node_type"] == "PLANT"]
+    db.execute(insert(PlantModel), [
+        {"plant_id": p["code"], "name": p["name"], "name_fr": p["name_fr"]} for p in plants
+    ])
+    db.execute(insert(HierarchyNodeModel), rows)
+    db.commit()
+
+    def run():
+        try:
+            return sum(len(hierarchy_service.get_subtree(db, p["node_id"])) for p in plants)
+        finally:
+            # Time loading from the database, not hits in the identity map
+            db.expunge_all()
+
+    return run
+
+
+CASES: dict[str, tuple[str, Callable[[Fixtures, int], Callable[[], object]]]] = {
+    "weibull_fit": ("equipment", _weibull_fit),
+    "ocr": ("equipment", _ocr),
+    "backlog_optimizer": ("backlog items", _backlog_optimizer),
+    "schedule_leveling": ("work packages", _schedule_leveling),
+    "quality_validation": ("nodes", _quality_validation),
+    "equipment_resolver": ("registry equipment", _equipment_resolver),
+    "hierarchy_subtree": ("nodes", _hierarchy_subtree),
+}
+
+
+# ── Running and comparing ───────────────────────────────────────────
+
+
+def run_case(
+    name: str, scale: int, fixtures: Fixtures | None = None, repeat: int = DEFAULT_REPEAT,
+) -> BenchmarkResult:
+    """Prepare one case at ``scale`` and time ``repeat`` calls of it."""
+    if name not in CASES:
+        raise ValueError(f"Unknown benchmark: {name}")
+    unit, prepare = CASES[name]
+    fixtures = fixtures or Fixtures()
+
+    started = time.perf_counter()
+    call = prepare(fixtures, scale)
+    setup = time.perf_counter() - started
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    return BenchmarkResult(
+        engine=name, scale=scale, unit=unit,
+        setup_s=round(setup, 6), best_s=round(best, 6),
+        median_s=round(statistics.median(timings), 6), repeat=repeat,
+        per_item_us=round(best / scale * 1e6, 3),
+    )
+
+
+def run_benchmarks(
+    engines: list[str] | None = None,
+    scales: tuple[int, ...] = DEFAULT_SCALES,
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = 42,
+    progress: Callable[[BenchmarkResult], None] | None = None,
+) -> dict:
+    """Run the cases at every scale and return the JSON-ready report."""
+    engines = list(engines or CASES)
+    unknown = [e for e in engines if e not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    fixtures = Fixtures(seed)
+    results = []
+    for scale in scales:
+        for name in engines:
+            result = run_case(name, scale, fixtures, repeat)
+            results.append(asdict(result))
+            if progress:
+                progress(result)
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """Cases present in both reports whose best time grew by more than ``threshold``."""
+    previous = {(r["engine"], r["scale"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in current.get("results", []):
+        before = previous.get((r["engine"], r["scale"]))
+        if not before or before["best_s"] <= 0:
+            continue
+        change = r["best_s"] / before["best_s"] - 1
+        if change > threshold:
+            regressions.append({
+                "engine": r["engine"], "scale": r["scale"],
+                "baseline_s": before["best_s"], "current_s": r["best_s"],
+                "change_pct": round(change * 100, 1),
+            })
+    return regressions
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent,
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--engines", nargs="+", choices=sorted(CASES), help="Cases to run (default: all)")
+    parser.add_argument("--scales", nargs="+", type=int, default=list(DEFAULT_SCALES))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/engines-<timestamp>.json)")
+    parser.add_argument("--compare", type=Path, help="Previous result file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    def progress(r: BenchmarkResult):
+        print(f"{r.engine:<20} {r.scale:>8,} {r.unit:<20} best {r.best_s:>9.4f}s  "
+              f"median {r.median_s:>9.4f}s  setup {r.setup_s:>8.2f}s", flush=True)
+
+    report = run_benchmarks(args.engines, tuple(args.scales), args.repeat, args.seed, progress)
+
+    output = args.output or RESULTS_DIR / f"engines-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+    if args.compare:
+        regressions = compare(json.loads(args.compare.read_text()), report, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['engine']} @ {r['scale']:,}: "
+                  f"{r['baseline_s']:.4f}s -> {r['current_s']:.4f}s (+{r['change_pct']}%)")
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -86,7 +86,8 @@ with tab_resources:
             col_m1.metric(t("scheduling.total_hours"), f"{details.get('total_hours', 0):.0f}h")
             col_m2.metric(t("backlog.work_packages"), len(details.get("work_packages") or []))
             conflicts = details.get("conflicts") or []
-            col_m3.metric(t("scheduling.conflicts"), len(conflicts))
+            leveling_conflicts = details.get("leveling_conflicts") or []
+            col_m3.metric(t("scheduling.conflicts"), len(conflicts) + len(leveling_conflicts))
 
             slots = details.get("resource_slots") or []
             if slots:
@@ -94,10 +95,12 @@ with tab_resources:
                     [{"date": s.get("slot_date", ""), "utilization_percent": s.get("utilization_pct", 0)} for s in slots]
                 ), width="stretch")
 
-            if conflicts:
+            if conflicts or leveling_conflicts:
                 st.subheader(t("scheduling.conflicts"))
                 for c in conflicts:
                     st.warning(f"**{c.get('shift', '')}** — {c.get('description', '')}")
+                for c in leveling_conflicts:
+                    st.warning(f"**{c.get('resolution_type', '')}** — {c.get('conflict_description', '')}")
     else:
         st.info(t("scheduling.create_first_resources"))
 
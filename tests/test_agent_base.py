@@ -6,6 +6,8 @@ All tests are offline (no API key needed).
 """
 
 import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import anthropic
@@ -242,6 +244,63 @@ class TestAgentLoop:
         assert any("error" in str(item) for item in tool_result_msg["content"])
 
 
+class TestConcurrentToolExecution:
+    """Tool calls from one response run on a bounded pool, results keep order."""
+
+    @staticmethod
+    def _run_multi(agent, mock_client, n, fake_call):
+        mock_client.messages.create.side_effect = [
+            make_multi_tool_message([("test_tool", {"i": i}, f"toolu_{i:03d}") for i in range(n)]),
+            make_text_message("done"),
+        ]
+        with patch("agents.definitions.base.call_tool", side_effect=fake_call):
+            agent.run("Run many tools")
+        return mock_client.messages.create.call_args_list[1].kwargs["messages"][-1]["content"]
+
+    def test_results_preserve_tool_use_order(self, mock_agent):
+        agent, mock_client = mock_agent
+
+        def fake_call(name, args):
+            time.sleep(0.01 * (5 - args["i"]))  # later calls finish first
+            return json.dumps({"i": args["i"]})
+
+        content = self._run_multi(agent, mock_client, 6, fake_call)
+        assert [c["tool_use_id"] for c in content] == [f"toolu_{i:03d}" for i in range(6)]
+        assert [json.loads(c["content"])["i"] for c in content] == list(range(6))
+        assert [r["tool_use_id"] for r in agent.history[0].tool_results] == [c["tool_use_id"] for c in content]
+
+    def test_calls_overlap_up_to_limit(self, mock_agent):
+        agent, mock_client = mock_agent
+        agent.config.max_tool_concurrency = 3
+        lock = threading.Lock()
+        active = peak = 0
+
+        def fake_call(name, args):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return "{}"
+
+        self._run_multi(agent, mock_client, 9, fake_call)
+        assert peak == 3
+
+    def test_concurrency_one_is_sequential(self, mock_agent):
+        agent, mock_client = mock_agent
+        agent.config.max_tool_concurrency = 1
+        threads = set()
+
+        def fake_call(name, args):
+            threads.add(threading.get_ident())
+            return "{}"
+
+        self._run_multi(agent, mock_client, 4, fake_call)
+        assert threads == {threading.get_ident()}
+
+
 class TestAgentConfigTimeout:
     """Tests for REC-002: API timeout and retry configuration."""
 
@@ -89,6 +89,6 @@ class TestAgentToolCompleteness:
     def test_tool_count_per_agent(self):
         """Verify expected tool counts per agent type."""
         assert len(AGENT_TOOL_MAP["orchestrator"]) == 13
-        assert len(AGENT_TOOL_MAP["reliability"]) == 48
+        assert len(AGENT_TOOL_MAP["reliability"]) == 49
         assert len(AGENT_TOOL_MAP["planning"]) == 58
         assert len(AGENT_TOOL_MAP["spare_parts"]) == 3
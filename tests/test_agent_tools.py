@@ -15,8 +15,8 @@ from agents.tool_wrappers.registry import call_tool, TOOL_REGISTRY
 class TestToolRegistry:
 
     def test_all_tools_loaded(self):
-        """All 126 tools should be registered (62 original + 13 Phase 4A + 6 Phase 4B + 16 Phase 5 + 16 Phase 6 + 10 Phase 7 + 3 Phase 9B)."""
-        assert get_tool_count() == 126
+        """All 127 tools should be registered (62 original + 13 Phase 4A + 6 Phase 4B + 16 Phase 5 + 16 Phase 6 + 10 Phase 7 + 3 Phase 9B + Weibull MLE)."""
+        assert get_tool_count() == 127
 
     def test_all_tools_have_metadata(self):
         tools = get_all_tools()
@@ -265,6 +265,16 @@ class TestAnalyticsTools:
         }))
         assert "reliability" in result
 
+    def test_fit_weibull_mle(self):
+        result = json.loads(call_tool("fit_weibull_mle", {
+            "input_json": json.dumps({
+                "failure_intervals": [120, 150, 130, 140, 135],
+                "suspensions": [160, 170],
+            }),
+        }))
+        assert result["converged"] is True
+        assert result["bounds"]["beta_lower"] < result["beta"]
+
     def test_determine_health_trend(self):
         result = json.loads(call_tool("determine_health_trend", {
             "current_score": 72.0,
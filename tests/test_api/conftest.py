@@ -9,6 +9,7 @@ from fastapi.testclient import TestClient
 from api.database.connection import Base, get_db
 import api.database.models  # noqa: F401 — register all ORM models with Base.metadata
 from api.main import app
+from api.services import dashboard_service, equipment_registry
 
 # In-memory SQLite for tests — StaticPool ensures all connections share one DB
 TEST_DATABASE_URL = "sqlite:///:memory:"
@@ -33,6 +34,8 @@ TestSessionLocal = sessionmaker(bind=test_engine, autocommit=False, autoflush=Fa
 def test_db():
     """Create tables before each test, drop after."""
     Base.metadata.create_all(bind=test_engine)
+    equipment_registry.clear()
+    dashboard_service.clear()
     yield
     Base.metadata.drop_all(bind=test_engine)
 
@@ -48,3 +48,10 @@ class TestAdminEndpoints:
         # Verify empty
         r2 = client.get("/api/v1/hierarchy/plants")
         assert r2.json() == []
+
+    def test_pool_metrics(self, client):
+        r = client.get("/api/v1/admin/pool-metrics")
+        assert r.status_code == 200
+        data = r.json()
+        assert "pool_class" in data
+        assert data["dialect"] == "sqlite"
@@ -0,0 +1,118 @@
+"""Tests for the audit log sink — batched, sync and background-writer modes."""
+
+from unittest.mock import patch
+
+import pytest
+
+from api.config import settings
+from api.database.models import AuditLogModel
+from api.services import audit_service
+from api.services.audit_service import AuditWriter, flush_audit, log_action, pending_entries
+
+
+@pytest.fixture
+def audit_mode(monkeypatch):
+    def _set(mode):
+        monkeypatch.setattr(settings, "AUDIT_MODE", mode)
+    return _set
+
+
+class TestBatchedAudit:
+
+    def test_entries_buffered_until_commit(self, db_session):
+        for i in range(3):
+            log_action(db_session, "node", f"N-{i}", "CREATE", {"i": i})
+        assert pending_entries(db_session) == 3
+        assert db_session.query(AuditLogModel).count() == 0
+        db_session.commit()
+        assert pending_entries(db_session) == 0
+        rows = db_session.query(AuditLogModel).order_by(AuditLogModel.id).all()
+        assert [r.entity_id for r in rows] == ["N-0", "N-1", "N-2"]
+        assert rows[2].payload == {"i": 2}
+
+    def test_single_executemany_per_commit(self, db_session):
+        for i in range(50):
+            log_action(db_session, "node", f"N-{i}", "CREATE")
+        with patch.object(db_session, "execute", wraps=db_session.execute) as execute:
+            db_session.commit()
+        assert execute.call_count == 1
+        assert db_session.query(AuditLogModel).count() == 50
+
+    def test_rollback_discards_buffer(self, db_session):
+        db_session.query(AuditLogModel).count()  # begin a transaction
+        log_action(db_session, "node", "N-1", "CREATE")
+        db_session.rollback()
+        assert pending_entries(db_session) == 0
+        db_session.commit()
+        assert db_session.query(AuditLogModel).count() == 0
+
+    def test_flush_audit_writes_inside_transaction(self, db_session):
+        log_action(db_session, "node", "N-1", "CREATE")
+        assert flush_audit(db_session) == 1
+        assert db_session.query(AuditLogModel).count() == 1
+        db_session.rollback()
+        assert db_session.query(AuditLogModel).count() == 0
+
+    def test_api_mutation_is_audited(self, client):
+        client.post("/api/v1/hierarchy/plants", json={"plant_id": "P-AUD", "name": "Audit"})
+        entries = client.get("/api/v1/admin/audit-log").json()
+        assert any(e["entity_id"] == "P-AUD" for e in entries)
+
+
+class TestSyncAudit:
+
+    def test_flushes_immediately(self, db_session, audit_mode):
+        audit_mode("sync")
+        log_action(db_session, "node", "N-1", "CREATE")
+        assert pending_entries(db_session) == 0
+        assert db_session.query(AuditLogModel).count() == 1
+
+
+class TestAsyncAudit:
+
+    @pytest.fixture
+    def writer(self, audit_mode):
+        audit_mode("async")
+        writer = audit_service.start_audit_writer()
+        yield writer
+        audit_service.stop_audit_writer()
+
+    def test_written_by_background_thread(self, db_session, writer):
+        log_action(db_session, "node", "N-1", "CREATE")
+        log_action(db_session, "node", "N-2", "UPDATE")
+        db_session.commit()
+        writer.drain()
+        assert db_session.query(AuditLogModel).count() == 2
+        assert writer.stats()["written"] == 2
+
+    def test_rolled_back_entries_not_submitted(self, db_session, writer):
+        db_session.query(AuditLogModel).count()
+        log_action(db_session, "node", "N-1", "CREATE")
+        db_session.rollback()
+        writer.drain()
+        assert writer.stats()["written"] == 0
+
+    def test_falls_back_to_batched_without_writer(self, db_session, audit_mode):
+        audit_mode("async")
+        log_action(db_session, "node", "N-1", "CREATE")
+        db_session.commit()
+        assert db_session.query(AuditLogModel).count() == 1
+
+    def test_full_queue_drops_when_non_blocking(self, db_session):
+        writer = AuditWriter(maxsize=1, block=False)  # not started: nothing consumes the queue
+        bind = db_session.get_bind()
+        row = {"entity_type": "node", "entity_id": "N", "action": "CREATE",
+               "payload": None, "user": "system", "timestamp": None}
+        assert writer.submit(bind, [row])
+        assert not writer.submit(bind, [row, row])
+        assert writer.stats()["dropped"] == 2
+
+    def test_stop_drains_queue(self, db_session, audit_mode):
+        audit_mode("async")
+        writer = audit_service.start_audit_writer()
+        for i in range(20):
+            log_action(db_session, "node", f"N-{i}", "CREATE")
+            db_session.commit()
+        audit_service.stop_audit_writer()
+        assert not writer.running
+        assert db_session.query(AuditLogModel).count() == 20
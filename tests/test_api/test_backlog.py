@@ -56,6 +56,50 @@ class TestBacklogEndpoints:
         assert data["total_items"] >= 1
         assert "optimization_id" in data
 
+    def _seed_items(self, db_session):
+        from api.database.models import BacklogItemModel
+        plants = ["TEST-PLANT", "TEST-PLANT", "TEST-PLANT", "OTHER-PLANT", None]
+        for i, plant in enumerate(plants):
+            db_session.add(BacklogItemModel(
+                backlog_id=f"BL-OPT-{i:03d}",
+                equipment_id=f"EQ-{i}",
+                equipment_tag=f"BRY-SAG-ML-{i % 2:03d}",
+                priority="3_NORMAL",
+                wo_type="PM02",
+                estimated_hours=4.0,
+                specialties=["MECHANICAL"],
+                materials_ready=True,
+                shutdown_required=False,
+                plant_id=plant,
+            ))
+        db_session.commit()
+
+    def test_optimize_scoped_to_plant(self, client, db_session):
+        self._seed_items(db_session)
+        r = client.post("/api/v1/backlog/optimize", json={"plant_id": "TEST-PLANT"})
+        # Three plant items plus the one not yet resolved to a plant
+        assert r.json()["total_items"] == 4
+        r = client.post("/api/v1/backlog/optimize", json={"plant_id": "OTHER-PLANT"})
+        assert r.json()["total_items"] == 2
+
+    def test_optimize_incremental_matches_full(self, client, db_session):
+        from api.database.models import BacklogItemModel
+        self._seed_items(db_session)
+        client.post("/api/v1/backlog/optimize", json={"plant_id": "TEST-PLANT"})
+
+        item = db_session.get(BacklogItemModel, "BL-OPT-001")
+        item.materials_ready = False
+        db_session.delete(db_session.get(BacklogItemModel, "BL-OPT-002"))
+        db_session.commit()
+
+        incremental = client.post(
+            "/api/v1/backlog/optimize", json={"plant_id": "TEST-PLANT", "incremental": True},
+        ).json()
+        full = client.post("/api/v1/backlog/optimize", json={"plant_id": "TEST-PLANT"}).json()
+        for key in ("total_items", "schedulable_now", "blocked", "work_packages", "stratification"):
+            assert incremental[key] == full[key]
+        assert incremental["blocked"] == 1
+
     def test_get_optimization_not_found(self, client):
         r = client.get("/api/v1/backlog/optimizations/nonexistent")
         assert r.status_code == 404
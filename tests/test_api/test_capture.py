@@ -50,3 +50,68 @@ class TestCaptureEndpoints:
     def test_get_capture_not_found(self, client):
         r = client.get("/api/v1/capture/nonexistent")
         assert r.status_code == 404
+
+
+class TestCaptureBatch:
+
+    def test_batch_persists_all_captures(self, seeded_client):
+        captures = [
+            {"technician_id": f"TECH-{i}", "raw_text_input": f"Bearing noise on BRY-SAG-ML-001 ({i})"}
+            for i in range(20)
+        ]
+        r = seeded_client.post("/api/v1/capture/batch", json={"captures": captures})
+        assert r.status_code == 200
+        data = r.json()
+        assert data["processed"] == 20
+        assert data["failed"] == 0
+        assert [item["index"] for item in data["results"]] == list(range(20))
+        assert all(item["equipment_tag"] == "BRY-SAG-ML-001" for item in data["results"])
+
+        listed = seeded_client.get("/api/v1/capture/").json()
+        assert len(listed) == 20
+        assert all(c["work_request_id"] for c in listed)
+
+    def test_invalid_item_reported_without_failing_batch(self, client):
+        r = client.post("/api/v1/capture/batch", json={"captures": [
+            {"raw_text_input": "Motor overheating"},
+            {"raw_text_input": "Bad type", "capture_type": "FAX"},
+            {"raw_text_input": "Pump leaking", "language": "xx"},
+        ]})
+        assert r.status_code == 200
+        data = r.json()
+        assert data["processed"] == 1
+        assert data["failed"] == 2
+        assert [item["ok"] for item in data["results"]] == [True, False, False]
+        assert "FAX" in data["results"][1]["error"]
+        assert len(client.get("/api/v1/capture/").json()) == 1
+
+    def test_batch_audited(self, client, db_session):
+        from api.database.models import AuditLogModel
+        client.post("/api/v1/capture/batch", json={"captures": [
+            {"raw_text_input": "Motor overheating"}, {"raw_text_input": "Pump leaking"},
+        ]})
+        actions = db_session.query(AuditLogModel.entity_type).all()
+        assert sorted(a for (a,) in actions) == ["field_capture"] * 2 + ["work_request"] * 2
+
+    def test_batch_size_limit(self, client):
+        from api.config import settings
+        captures = [{"raw_text_input": "x"}] * (settings.CAPTURE_BATCH_MAX + 1)
+        r = client.post("/api/v1/capture/batch", json={"captures": captures})
+        assert r.status_code == 422
+
+    def test_processing_error_isolated(self, client, monkeypatch):
+        from tools.processors.field_capture_processor import FieldCaptureProcessor
+        original = FieldCaptureProcessor.process
+
+        def flaky(self, capture):
+            if capture.raw_text_input == "boom":
+                raise RuntimeError("processor crashed")
+            return original(self, capture)
+
+        monkeypatch.setattr(FieldCaptureProcessor, "process", flaky)
+        r = client.post("/api/v1/capture/batch", json={"captures": [
+            {"raw_text_input": "Motor overheating"}, {"raw_text_input": "boom"},
+        ]})
+        data = r.json()
+        assert data["processed"] == 1
+        assert data["results"][1] == {"index": 1, "ok": False, "error": "processor crashed"}
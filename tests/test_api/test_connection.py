@@ -0,0 +1,67 @@
+"""Tests for engine construction — SQLite pragmas and pool metrics."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from api.config import settings
+from api.database.connection import TimedQueuePool, build_engine, pool_metrics
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    eng = build_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    yield eng
+    eng.dispose()
+
+
+class TestSqlitePragmas:
+
+    def test_file_database_uses_wal(self, file_engine):
+        with file_engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -settings.SQLITE_CACHE_SIZE_KB
+
+    def test_memory_database_keeps_default_pool(self):
+        eng = build_engine("sqlite:///:memory:")
+        assert not isinstance(eng.pool, TimedQueuePool)
+        with eng.connect() as conn:
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        assert "checked_out" not in pool_metrics(eng)
+
+
+class TestPoolMetrics:
+
+    def test_checkout_counters(self, file_engine):
+        assert isinstance(file_engine.pool, TimedQueuePool)
+        with file_engine.connect():
+            with file_engine.connect():
+                snap = pool_metrics(file_engine)
+                assert snap["checked_out"] == 2
+        snap = pool_metrics(file_engine)
+        assert snap["checked_out"] == 0
+        assert snap["checkouts"] == 2
+        assert snap["pool_size"] == settings.DB_POOL_SIZE
+        assert snap["max_wait_ms"] >= snap["avg_wait_ms"] >= 0
+
+    def test_timeout_is_counted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+        monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+        monkeypatch.setattr(settings, "DB_POOL_TIMEOUT", 0.05)
+        eng = build_engine(f"sqlite:///{tmp_path / 'tiny.db'}")
+        try:
+            with eng.connect():
+                with pytest.raises(PoolTimeoutError):
+                    eng.connect()
+            assert pool_metrics(eng)["timeouts"] == 1
+        finally:
+            eng.dispose()
+
+    def test_metrics_survive_dispose(self, file_engine):
+        with file_engine.connect():
+            pass
+        file_engine.dispose()
+        assert pool_metrics(file_engine)["checkouts"] == 1
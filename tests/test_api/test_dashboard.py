@@ -32,3 +32,116 @@ class TestDashboardAPI:
         data = response.json()
         assert data["plant_id"] == "TEST-PLANT"
         assert "total_active" in data
+
+
+def _generate_alerts(client, plant_id="TEST-PLANT", count=3):
+    response = client.post("/api/v1/reporting/notifications/generate", json={
+        "plant_id": plant_id,
+        "health_scores": [
+            {"equipment_id": f"EQ-{i}", "composite_score": 10} for i in range(count)
+        ],
+    })
+    assert response.status_code == 200
+    return response.json()["total_notifications"]
+
+
+class TestDashboardCounters:
+
+    def test_counts_follow_writes(self, client):
+        before = client.get("/api/v1/dashboard/executive/TEST-PLANT").json()
+        assert before["total_notifications"] == 0
+
+        generated = _generate_alerts(client)
+        client.post("/api/v1/reporting/reports/monthly", json={
+            "plant_id": "TEST-PLANT", "month": 1, "year": 2025,
+        })
+        data = client.get("/api/v1/dashboard/executive/TEST-PLANT").json()
+        assert data["total_notifications"] == generated
+        assert data["active_alerts"] == generated
+        assert data["total_reports"] == 1
+        assert data["reports_by_type"] == {"MONTHLY_KPI": 1}
+        assert len(data["recent_notifications"]) == min(generated, 10)
+
+    def test_acknowledge_moves_alert(self, client):
+        generated = _generate_alerts(client)
+        alerts = client.get("/api/v1/dashboard/alerts/TEST-PLANT").json()
+        assert alerts["total_active"] == generated
+
+        notification_id = alerts["alerts"][0]["notification_id"]
+        client.put(f"/api/v1/reporting/notifications/{notification_id}/ack")
+
+        alerts = client.get("/api/v1/dashboard/alerts/TEST-PLANT").json()
+        assert alerts["total_active"] == generated - 1
+        summary = client.get("/api/v1/dashboard/executive/TEST-PLANT").json()
+        assert summary["total_notifications"] == generated
+
+    def test_counters_match_database(self, client, db_session):
+        from api.services import dashboard_service
+
+        _generate_alerts(client, count=4)
+        client.get("/api/v1/dashboard/executive/TEST-PLANT")
+        _generate_alerts(client, count=2)
+        cached = dashboard_service.get_counters(db_session, "TEST-PLANT")
+        assert cached == dashboard_service._load_counters(db_session, "TEST-PLANT")
+
+    def test_alerts_paginated(self, client):
+        generated = _generate_alerts(client, count=5)
+        response = client.get("/api/v1/dashboard/alerts/TEST-PLANT", params={"limit": 2})
+        data = response.json()
+        assert len(data["alerts"]) == 2
+        assert data["total_active"] == generated
+        assert response.headers.get("X-Next-Cursor")
+
+    def test_plants_counted_separately(self, client):
+        _generate_alerts(client, plant_id="OTHER-PLANT", count=2)
+        data = client.get("/api/v1/dashboard/executive/TEST-PLANT").json()
+        assert data["total_notifications"] == 0
+
+    def test_other_worker_changes_are_seen(self, tmp_path):
+        """Two engines on one database stand in for two worker processes."""
+        from sqlalchemy.orm import Session
+
+        from api.database.connection import Base, build_engine
+        from api.database.models import NotificationModel
+        from api.services import dashboard_service
+
+        url = f"sqlite:///{tmp_path / 'shared.db'}"
+        worker_a, worker_b = build_engine(url), build_engine(url)
+        Base.metadata.create_all(bind=worker_a)
+
+        def active(engine):
+            with Session(engine) as db:
+                return dashboard_service.get_executive_summary(db, "P1")["active_alerts"]
+
+        def notification(i):
+            return NotificationModel(
+                notification_id=f"N-{i}", notification_type="HEALTH", level="CRITICAL",
+                plant_id="P1", title=f"n{i}",
+            )
+
+        try:
+            with Session(worker_a) as db:
+                db.add_all([notification(i) for i in range(3)])
+                db.commit()
+            assert active(worker_a) == active(worker_b) == 3
+
+            with Session(worker_b) as db:
+                db.add(notification(3))
+                db.get(NotificationModel, "N-0").acknowledged = True
+                db.commit()
+            assert active(worker_b) == 3
+            assert active(worker_a) == 3
+            with Session(worker_a) as db:
+                assert dashboard_service.get_counters(db, "P1") == dashboard_service._load_counters(db, "P1")
+
+            # Local commits still update the cache in place
+            with Session(worker_a) as db:
+                db.add(notification(4))
+                db.commit()
+            with Session(worker_a) as db:
+                token = dashboard_service.cache_versions.read(db, "dashboard_counters", "P1")
+            assert dashboard_service._counters[worker_a]["P1"][0] == token
+            assert active(worker_a) == active(worker_b) == 4
+        finally:
+            worker_a.dispose()
+            worker_b.dispose()
@@ -0,0 +1,136 @@
+"""Tests for the per-plant equipment registry cache used by field capture."""
+
+import pytest
+
+from api.database.models import HierarchyNodeModel
+from api.services import equipment_registry
+
+
+def _capture(client, text, **extra):
+    r = client.post("/api/v1/capture/", json={
+        "technician_id": "TECH-001",
+        "capture_type": "TEXT",
+        "language": "en",
+        "raw_text_input": text,
+        **extra,
+    })
+    assert r.status_code == 200
+    return r.json()
+
+
+def _system_id(db_session):
+    return db_session.query(HierarchyNodeModel.node_id).filter(
+        HierarchyNodeModel.node_type == "SYSTEM"
+    ).scalar()
+
+
+def _new_equipment(client, db_session, tag, plant_id="TEST-PLANT"):
+    r = client.post("/api/v1/hierarchy/nodes", json={
+        "node_type": "EQUIPMENT", "name": "Slurry Pump", "code": tag, "tag": tag,
+        "parent_node_id": _system_id(db_session), "level": 4, "plant_id": plant_id,
+    })
+    assert r.status_code == 200
+    return r.json()["node_id"]
+
+
+class TestEquipmentRegistryCache:
+
+    def test_processor_reused_across_captures(self, seeded_client):
+        first = _capture(seeded_client, "Noise on BRY-SAG-ML-001")
+        second = _capture(seeded_client, "Vibration on BRY-SAG-ML-001")
+        assert first["equipment_tag"] == second["equipment_tag"] == "BRY-SAG-ML-001"
+        stats = equipment_registry.stats()
+        assert stats["builds"] == 1
+        assert stats["hits"] == 1
+
+    def test_created_equipment_patched_into_cache(self, seeded_client, db_session):
+        _capture(seeded_client, "Noise on BRY-SAG-ML-001")
+        _new_equipment(seeded_client, db_session, "PMP-SLP-PP-002")
+
+        result = _capture(seeded_client, "Leak on PMP-SLP-PP-002")
+        assert result["equipment_tag"] == "PMP-SLP-PP-002"
+        stats = equipment_registry.stats()
+        assert stats["builds"] == 1
+        assert stats["patched"] == 1
+
+    def test_deleted_equipment_invalidates_cache(self, seeded_client, db_session):
+        node_id = _new_equipment(seeded_client, db_session, "PMP-SLP-PP-002")
+        assert _capture(seeded_client, "PMP-SLP-PP-002")["equipment_tag"] == "PMP-SLP-PP-002"
+
+        assert seeded_client.delete(f"/api/v1/hierarchy/nodes/{node_id}").status_code == 200
+        assert equipment_registry.stats()["cached"] == 0
+        assert _capture(seeded_client, "PMP-SLP-PP-002")["equipment_tag"] != "PMP-SLP-PP-002"
+
+    def test_rolled_back_changes_not_applied(self, seeded_client, db_session):
+        _capture(seeded_client, "Noise on BRY-SAG-ML-001")
+        db_session.add(HierarchyNodeModel(
+            node_type="EQUIPMENT", name="Ghost", code="GHO-STX-EQ-001", tag="GHO-STX-EQ-001",
+            parent_node_id=_system_id(db_session), level=4, plant_id="TEST-PLANT",
+        ))
+        db_session.flush()
+        db_session.rollback()
+
+        assert _capture(seeded_client, "GHO-STX-EQ-001")["equipment_tag"] != "GHO-STX-EQ-001"
+        assert equipment_registry.stats()["patched"] == 0
+
+    def test_plant_scoped_registry(self, seeded_client, db_session):
+        seeded_client.post("/api/v1/hierarchy/plants", json={"plant_id": "OTHER", "name": "Other"})
+        _new_equipment(seeded_client, db_session, "OTH-PMP-PP-001", plant_id="OTHER")
+
+        other = _capture(seeded_client, "OTH-PMP-PP-001", plant_id="TEST-PLANT")
+        assert other["equipment_tag"] != "OTH-PMP-PP-001"
+        own = _capture(seeded_client, "OTH-PMP-PP-001", plant_id="OTHER")
+        assert own["equipment_tag"] == "OTH-PMP-PP-001"
+        assert equipment_registry.stats()["cached"] == 2
+
+    def test_other_worker_changes_are_seen(self, tmp_path):
+        """Two engines on one database stand in for two worker processes."""
+        from sqlalchemy.orm import Session
+
+        from api.database.connection import Base, build_engine
+        from api.database.models import PlantModel
+
+        url = f"sqlite:///{tmp_path / 'shared.db'}"
+        worker_a, worker_b = build_engine(url), build_engine(url)
+        Base.metadata.create_all(bind=worker_a)
+
+        def tags(engine, plant_id="P1"):
+            with Session(engine) as db:
+                return {eq["tag"] for eq in equipment_registry.get_processor(db, plant_id).resolver.registry}
+
+        def equipment(tag):
+            return HierarchyNodeModel(
+                node_id=tag, node_type="EQUIPMENT", name="Pump", code=tag, tag=tag, level=1, plant_id="P1",
+            )
+
+        try:
+            with Session(worker_a) as db:
+                db.add(PlantModel(plant_id="P1", name="P1"))
+                db.add(equipment("PMP-A"))
+                db.commit()
+            assert tags(worker_a) == tags(worker_b) == {"PMP-A"}
+            assert tags(worker_a, None) == {"PMP-A"}
+
+            with Session(worker_b) as db:
+                db.add(equipment("PMP-B"))
+                db.commit()
+            assert tags(worker_a) == {"PMP-A", "PMP-B"}
+            assert tags(worker_a, None) == {"PMP-A", "PMP-B"}
+
+            with Session(worker_b) as db:
+                db.delete(db.get(HierarchyNodeModel, "PMP-A"))
+                db.commit()
+            assert tags(worker_a) == tags(worker_b) == {"PMP-B"}
+
+            # Local creations are still patched into the cached processor
+            before = equipment_registry.stats()
+            with Session(worker_a) as db:
+                db.add(equipment("PMP-C"))
+                db.commit()
+            assert tags(worker_a) == {"PMP-B", "PMP-C"}
+            after = equipment_registry.stats()
+            assert after["patched"] > before["patched"]
+            assert after["builds"] == before["builds"]
+        finally:
+            worker_a.dispose()
+            worker_b.dispose()
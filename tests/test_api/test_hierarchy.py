@@ -73,3 +73,86 @@ class TestHierarchyEndpoints:
         stats = r.json()
         assert stats["EQUIPMENT"] == 1
         assert stats["PLANT"] == 1
+
+    def test_subtree_of_inner_node(self, seeded_client):
+        sys_id = seeded_client._test_ids["system_node_id"]
+        r = seeded_client.get(f"/api/v1/hierarchy/nodes/{sys_id}/tree")
+        assert [n["node_type"] for n in r.json()] == ["SYSTEM", "EQUIPMENT"]
+
+    def test_path_assigned_on_create(self, seeded_client):
+        ids = seeded_client._test_ids
+        r = seeded_client.get(f"/api/v1/hierarchy/nodes/{ids['equipment_node_id']}")
+        assert r.json()["path"] == (
+            f"/{ids['plant_node_id']}/{ids['area_node_id']}/{ids['system_node_id']}/{ids['equipment_node_id']}/"
+        )
+
+    def test_get_ancestors(self, seeded_client):
+        ids = seeded_client._test_ids
+        r = seeded_client.get(f"/api/v1/hierarchy/nodes/{ids['equipment_node_id']}/ancestors")
+        assert r.status_code == 200
+        assert [n["node_id"] for n in r.json()] == [
+            ids["plant_node_id"], ids["area_node_id"], ids["system_node_id"],
+        ]
+
+    def test_subtree_stats(self, seeded_client):
+        area_id = seeded_client._test_ids["area_node_id"]
+        r = seeded_client.get("/api/v1/hierarchy/stats", params={"node_id": area_id})
+        assert r.json() == {"AREA": 1, "SYSTEM": 1, "EQUIPMENT": 1}
+
+    def test_move_node_rewrites_subtree(self, seeded_client):
+        ids = seeded_client._test_ids
+        r = seeded_client.put(
+            f"/api/v1/hierarchy/nodes/{ids['system_node_id']}/move",
+            json={"parent_node_id": ids["plant_node_id"]},
+        )
+        assert r.status_code == 200
+        assert r.json()["level"] == 2
+        eq = seeded_client.get(f"/api/v1/hierarchy/nodes/{ids['equipment_node_id']}").json()
+        assert eq["level"] == 3
+        assert eq["path"] == f"/{ids['plant_node_id']}/{ids['system_node_id']}/{ids['equipment_node_id']}/"
+        area_tree = seeded_client.get(f"/api/v1/hierarchy/nodes/{ids['area_node_id']}/tree").json()
+        assert len(area_tree) == 1
+
+    def test_move_under_descendant_rejected(self, seeded_client):
+        ids = seeded_client._test_ids
+        r = seeded_client.put(
+            f"/api/v1/hierarchy/nodes/{ids['area_node_id']}/move",
+            json={"parent_node_id": ids["equipment_node_id"]},
+        )
+        assert r.status_code == 400
+
+    def test_delete_subtree(self, seeded_client):
+        ids = seeded_client._test_ids
+        r = seeded_client.delete(f"/api/v1/hierarchy/nodes/{ids['system_node_id']}")
+        assert r.status_code == 200
+        assert r.json()["deleted"] == 2
+        stats = seeded_client.get("/api/v1/hierarchy/stats", params={"plant_id": "TEST-PLANT"}).json()
+        assert stats == {"PLANT": 1, "AREA": 1}
+
+    def test_delete_referenced_subtree_conflict(self, seeded_client, db_session):
+        from datetime import datetime
+        from api.database.models import CriticalityAssessmentModel
+        ids = seeded_client._test_ids
+        db_session.add(CriticalityAssessmentModel(
+            node_id=ids["equipment_node_id"], assessed_at=datetime(2025, 1, 1), method="FULL_MATRIX",
+            criteria_scores=[], probability=3, risk_class="II_MEDIUM",
+        ))
+        db_session.commit()
+
+        r = seeded_client.delete(f"/api/v1/hierarchy/nodes/{ids['system_node_id']}")
+        assert r.status_code == 409
+        assert seeded_client.get(f"/api/v1/hierarchy/nodes/{ids['equipment_node_id']}").status_code == 200
+
+    def test_delete_missing_node(self, client):
+        r = client.delete("/api/v1/hierarchy/nodes/nonexistent")
+        assert r.status_code == 404
+
+    def test_rebuild_paths_backfills(self, seeded_client, db_session):
+        from api.database.models import HierarchyNodeModel
+        from api.services import hierarchy_service
+
+        db_session.query(HierarchyNodeModel).update({"path": None})
+        db_session.commit()
+        assert hierarchy_service.rebuild_paths(db_session, "TEST-PLANT") == 4
+        eq_id = seeded_client._test_ids["equipment_node_id"]
+        assert hierarchy_service.get_depth(db_session, eq_id) == 3
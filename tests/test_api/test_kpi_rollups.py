@@ -0,0 +1,193 @@
+"""Tests for the server-side KPI rollups built from work orders."""
+
+import random
+from datetime import date, timedelta
+
+from api.database.models import KPIMetricsModel, WorkOrderModel
+from api.services import kpi_rollup_service
+from tools.engines.kpi_engine import KPIEngine, WorkOrderRecord
+
+EQUIPMENT = "BRY-SAG-ML-001"
+START, END = date(2025, 1, 1), date(2025, 3, 31)
+
+
+def _work_orders(n, seed=7):
+    rng = random.Random(seed)
+    orders = []
+    for i in range(n):
+        order_type = rng.choice(["PM01", "PM02", "PM03", "PM03"])
+        orders.append(WorkOrderModel(
+            work_order_id=f"WO-{i:04d}",
+            order_type=order_type,
+            equipment_id=EQUIPMENT,
+            equipment_tag=EQUIPMENT,
+            priority="2",
+            status=rng.choice(["COMPLETED", "RELEASED"]),
+            created_date=START + timedelta(days=rng.randrange(90)),
+            actual_duration_hours=rng.choice([None, 0.0, 2.5, 6.0]),
+        ))
+    return orders
+
+
+def _engine_kpis(orders):
+    records = [
+        WorkOrderRecord(
+            wo_id=o.work_order_id, equipment_id=o.equipment_id, order_type=o.order_type,
+            created_date=o.created_date, planned_start=o.created_date, planned_end=o.created_date,
+            actual_end=o.created_date if o.status == "COMPLETED" else None,
+            actual_duration_hours=o.actual_duration_hours, is_failure=o.order_type == "PM03",
+        )
+        for o in orders
+    ]
+    return KPIEngine.calculate_from_records(records, "TEST-PLANT", START, END)
+
+
+def _rollups(db_session):
+    return sorted(
+        (r.equipment_id, r.period_start, r.total_work_orders, r.corrective_wo_count, r.downtime_hours)
+        for r in db_session.query(KPIMetricsModel).filter_by(grain=kpi_rollup_service.DAY)
+    )
+
+
+_COMPARED = (
+    "mtbf_days", "mttr_hours", "availability_pct", "oee_pct", "pm_compliance_pct",
+    "total_work_orders", "corrective_wo_count", "preventive_wo_count", "reactive_ratio_pct",
+)
+
+
+class TestKPIRollups:
+
+    def test_rollups_match_engine(self, seeded_client, db_session):
+        orders = _work_orders(300)
+        db_session.add_all(orders)
+        db_session.commit()
+
+        rolled = kpi_rollup_service.calculate_period_kpis(db_session, "TEST-PLANT", START, END)
+        expected = _engine_kpis(orders)
+        for field in _COMPARED:
+            assert getattr(rolled, field) == getattr(expected, field), field
+
+    def test_incremental_updates_match_rebuild(self, seeded_client, db_session):
+        orders = _work_orders(120)
+        db_session.add_all(orders)
+        db_session.commit()
+
+        orders[0].created_date = date(2025, 2, 14)
+        orders[1].order_type = "PM03"
+        orders[2].equipment_id = "UNKNOWN-EQ"
+        db_session.delete(orders[3])
+        db_session.commit()
+        incremental = _rollups(db_session)
+
+        kpi_rollup_service.refresh_rollups(db_session)
+        assert _rollups(db_session) == incremental
+
+    def test_unknown_equipment_not_attributed_to_plant(self, seeded_client, db_session):
+        db_session.add_all(_work_orders(10))
+        db_session.add(WorkOrderModel(
+            work_order_id="WO-X", order_type="PM03", equipment_id="OTHER", equipment_tag="OTHER",
+            priority="1", status="COMPLETED", created_date=START,
+        ))
+        db_session.commit()
+        kpis = kpi_rollup_service.calculate_period_kpis(db_session, "TEST-PLANT", START, END)
+        assert kpis.total_work_orders == 10
+
+    def test_single_day_period_availability(self, seeded_client, db_session):
+        order = WorkOrderModel(
+            work_order_id="WO-DAY", order_type="PM03", equipment_id=EQUIPMENT, equipment_tag=EQUIPMENT,
+            priority="1", status="COMPLETED", created_date=START, actual_duration_hours=6.0,
+        )
+        db_session.add(order)
+        db_session.commit()
+        kpis = kpi_rollup_service.calculate_period_kpis(db_session, "TEST-PLANT", START, START)
+        assert kpis.availability_pct == 75.0
+        expected = KPIEngine.calculate_from_records(
+            [WorkOrderRecord(
+                wo_id="WO-DAY", equipment_id=EQUIPMENT, order_type="PM03", created_date=START,
+                planned_start=START, planned_end=START,
+                actual_end=START, actual_duration_hours=6.0, is_failure=True,
+            )],
+            "TEST-PLANT", START, START,
+        )
+        assert expected.availability_pct == 75.0
+
+    def test_equipment_plant_change_moves_rollups(self, seeded_client, db_session):
+        from api.database.models import HierarchyNodeModel, PlantModel
+        db_session.add_all(_work_orders(20))
+        db_session.add(PlantModel(plant_id="OTHER-PLANT", name="Other", name_fr="Autre"))
+        db_session.commit()
+
+        node = db_session.query(HierarchyNodeModel).filter_by(code=EQUIPMENT).one()
+        node.plant_id = "OTHER-PLANT"
+        db_session.commit()
+        assert kpi_rollup_service.calculate_period_kpis(db_session, "TEST-PLANT", START, END).total_work_orders == 0
+        assert kpi_rollup_service.calculate_period_kpis(db_session, "OTHER-PLANT", START, END).total_work_orders == 20
+
+    def test_get_period_kpis_endpoint(self, seeded_client, db_session):
+        db_session.add_all(_work_orders(50))
+        db_session.commit()
+        response = seeded_client.get("/api/v1/analytics/kpis/TEST-PLANT", params={
+            "period_start": START.isoformat(), "period_end": END.isoformat(),
+            "equipment_id": EQUIPMENT,
+        })
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_work_orders"] == 50
+        assert data["equipment_id"] == EQUIPMENT
+        assert data["schedule_compliance_pct"] is None
+
+    def test_get_period_kpis_rejects_reversed_period(self, client):
+        response = client.get("/api/v1/analytics/kpis/TEST-PLANT", params={
+            "period_start": END.isoformat(), "period_end": START.isoformat(),
+        })
+        assert response.status_code == 400
+
+    def test_refresh_endpoint(self, seeded_client, db_session):
+        db_session.add_all(_work_orders(40))
+        db_session.commit()
+        before = _rollups(db_session)
+        db_session.query(KPIMetricsModel).delete()
+        db_session.commit()
+
+        response = seeded_client.post("/api/v1/analytics/kpis/rollups/refresh", json={})
+        assert response.status_code == 200
+        assert response.json()["rollups"] == len(before)
+        assert _rollups(db_session) == before
+
+    def test_failure_history_import_rolled_up(self, seeded_client):
+        lines = ["Order,Asset_ID,Event_Date,FM,Downtime"]
+        lines += [f"WO-{i},{EQUIPMENT},2025-02-{i + 1:02d},Wear,4" for i in range(5)]
+        response = seeded_client.post(
+            "/api/v1/reporting/import/upload", params={"source": "FAILURE_HISTORY"},
+            files={"file": ("extract.csv", "\n".join(lines).encode(), "text/csv")},
+        )
+        assert response.json()["rows_inserted"] == 5
+
+        data = seeded_client.get("/api/v1/analytics/kpis/TEST-PLANT", params={
+            "period_start": "2025-02-01", "period_end": "2025-02-28",
+        }).json()
+        assert data["corrective_wo_count"] == 5
+        assert data["mtbf_days"] == 1.0
+        assert data["mttr_hours"] == 4.0
+
+    def test_monthly_report_uses_rollups(self, seeded_client, db_session):
+        db_session.add_all(_work_orders(60))
+        db_session.commit()
+        report = seeded_client.post("/api/v1/reporting/reports/monthly", json={
+            "plant_id": "TEST-PLANT", "month": 2, "year": 2025,
+        }).json()
+        summary = report["reliability_kpi_summary"]
+        expected = kpi_rollup_service.calculate_period_kpis(
+            db_session, "TEST-PLANT", date(2025, 2, 1), date(2025, 2, 28),
+        )
+        assert summary["total_work_orders"] == expected.total_work_orders > 0
+        assert "plant_id" not in summary
+
+    def test_quarterly_report_monthly_summaries(self, seeded_client, db_session):
+        db_session.add_all(_work_orders(60))
+        db_session.commit()
+        report = seeded_client.post("/api/v1/reporting/reports/quarterly", json={
+            "plant_id": "TEST-PLANT", "quarter": 1, "year": 2025,
+        }).json()
+        assert [m["month"] for m in report["monthly_summaries"]] == [1, 2, 3]
+        assert sum(m["reliability_kpis"]["total_work_orders"] for m in report["monthly_summaries"]) == 60
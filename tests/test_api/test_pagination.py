@@ -0,0 +1,119 @@
+"""Tests for keyset pagination on list endpoints."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.database.models import NotificationModel, RCAAnalysisModel, WeeklyProgramModel
+from api.services.pagination import decode_cursor, encode_cursor, paginate
+
+
+def _seed_rcas(db_session, n, same_timestamp=False):
+    base = datetime(2025, 1, 1)
+    for i in range(n):
+        db_session.add(RCAAnalysisModel(
+            analysis_id=f"RCA-{i:03d}",
+            event_description=f"Event {i}",
+            plant_id="TEST-PLANT",
+            created_at=base if same_timestamp else base + timedelta(minutes=i),
+            solutions=[{"description": "x" * 1000}],
+        ))
+    db_session.commit()
+
+
+class TestCursor:
+
+    def test_round_trip(self):
+        ts = datetime(2025, 3, 1, 12, 30, 5, 123456)
+        assert decode_cursor(encode_cursor(ts, "ID-1")) == (ts, "ID-1")
+        assert decode_cursor(encode_cursor(None, "ID-2")) == (None, "ID-2")
+
+    @pytest.mark.parametrize("bad", ["not-base64!", "W10", "eyJhIjogMX0"])
+    def test_malformed_cursor(self, bad):
+        with pytest.raises(ValueError):
+            decode_cursor(bad)
+
+
+class TestPaginate:
+
+    @pytest.mark.parametrize("same_timestamp", [False, True])
+    def test_pages_cover_all_rows_once(self, db_session, same_timestamp):
+        _seed_rcas(db_session, 23, same_timestamp)
+        q = db_session.query(RCAAnalysisModel.analysis_id, RCAAnalysisModel.created_at)
+        seen, cursor = [], None
+        while True:
+            page = paginate(q, RCAAnalysisModel.created_at, RCAAnalysisModel.analysis_id, 10, cursor)
+            seen.extend(r.analysis_id for r in page)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        full = paginate(q, RCAAnalysisModel.created_at, RCAAnalysisModel.analysis_id)
+        assert seen == [r.analysis_id for r in full]
+        assert len(set(seen)) == 23
+        if not same_timestamp:
+            assert seen[0] == "RCA-022"
+
+    def test_exact_fit_has_no_next_cursor(self, db_session):
+        _seed_rcas(db_session, 5)
+        q = db_session.query(RCAAnalysisModel)
+        page = paginate(q, RCAAnalysisModel.created_at, RCAAnalysisModel.analysis_id, 5)
+        assert len(page) == 5
+        assert page.next_cursor is None
+
+
+class TestListEndpoints:
+
+    def test_rca_list_pages(self, client, db_session):
+        _seed_rcas(db_session, 5)
+        r = client.get("/api/v1/rca/analyses", params={"limit": 2})
+        assert r.status_code == 200
+        assert [a["analysis_id"] for a in r.json()] == ["RCA-004", "RCA-003"]
+        cursor = r.headers["X-Next-Cursor"]
+        r2 = client.get("/api/v1/rca/analyses", params={"limit": 2, "cursor": cursor})
+        assert [a["analysis_id"] for a in r2.json()] == ["RCA-002", "RCA-001"]
+        r3 = client.get("/api/v1/rca/analyses", params={"limit": 2, "cursor": r2.headers["X-Next-Cursor"]})
+        assert [a["analysis_id"] for a in r3.json()] == ["RCA-000"]
+        assert "X-Next-Cursor" not in r3.headers
+
+    def test_no_limit_returns_every_row(self, client, db_session):
+        _seed_rcas(db_session, 205)
+        r = client.get("/api/v1/rca/analyses")
+        assert len(r.json()) == 205
+        assert "X-Next-Cursor" not in r.headers
+
+    def test_invalid_cursor_is_400(self, client):
+        r = client.get("/api/v1/reporting/notifications", params={"cursor": "garbage!"})
+        assert r.status_code == 400
+
+    def test_notifications_paged(self, client, db_session):
+        for i in range(3):
+            db_session.add(NotificationModel(
+                notification_id=f"N-{i}", notification_type="KPI", plant_id="P1",
+                title=f"n{i}", created_at=datetime(2025, 1, 1) + timedelta(hours=i),
+            ))
+        db_session.commit()
+        r = client.get("/api/v1/reporting/notifications", params={"limit": 2})
+        assert [n["notification_id"] for n in r.json()] == ["N-2", "N-1"]
+        assert "X-Next-Cursor" in r.headers
+
+    def test_program_counts_from_sql(self, client, db_session):
+        db_session.add(WeeklyProgramModel(
+            program_id="WP-1", plant_id="P1", week_number=10, year=2025,
+            work_packages=[{"a": 1}, {"b": 2}], conflicts=None, support_tasks=[{"c": 3}],
+        ))
+        db_session.commit()
+        data = client.get("/api/v1/scheduling/programs").json()
+        assert data[0]["work_packages_count"] == 2
+        assert data[0]["conflicts_count"] == 0
+        assert data[0]["support_tasks_count"] == 1
+
+    def test_capture_list_joins_work_requests(self, client):
+        for i in range(3):
+            client.post("/api/v1/capture/", json={
+                "technician_id": "TECH-001", "capture_type": "TEXT", "language": "en",
+                "raw_text_input": f"Pump {i} leaking " + "x" * 200,
+            })
+        data = client.get("/api/v1/capture/", params={"limit": 2}).json()
+        assert len(data) == 2
+        assert all(c["work_request_id"] for c in data)
+        assert all(len(c["raw_text_preview"]) == 100 for c in data)
@@ -99,6 +99,17 @@ class TestReliabilityAPI:
         assert response.status_code == 200
         data = response.json()
         assert "optimal_interval_days" in data
+        assert "cost_curve" not in data
+
+    def test_calculate_ocr_with_cost_curve(self, client):
+        response = client.post("/api/v1/reliability/ocr/analyze?include_cost_curve=true", json={
+            "equipment_id": "EQ-001", "failure_rate": 2.0,
+            "cost_per_failure": 50000, "cost_per_pm": 5000,
+        })
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["cost_curve"]) == 724
+        assert data["cost_curve"][str(data["optimal_interval_days"])] == data["cost_at_optimal"]
 
     def test_analyze_jackknife(self, client):
         response = client.post("/api/v1/reliability/jackknife/analyze", json={
@@ -104,6 +104,97 @@ class TestReportingAPI:
         data = response.json()
         assert data["valid_rows"] == 1
 
+    def _upload(self, client, source, text, plant_id=None, chunk_size=100):
+        params = {"source": source, "chunk_size": chunk_size}
+        if plant_id:
+            params["plant_id"] = plant_id
+        return client.post(
+            "/api/v1/reporting/import/upload", params=params,
+            files={"file": ("extract.csv", text.encode(), "text/csv")},
+        )
+
+    def test_upload_hierarchy(self, seeded_client, db_session):
+        from api.database.models import HierarchyNodeModel
+        lines = ["Tag,Desc,Type,Parent"]
+        # Children first, and parents spread over later chunks
+        lines += [f"IMP-EQ-{i},Pump {i},ROTATING,IMP-AREA-{i % 3}" for i in range(250)]
+        lines += [f"IMP-AREA-{i},Area {i},AREA,IMP-ROOT" for i in range(3)]
+        lines += ["IMP-ROOT,Imported root,PLANT,", "IMP-EQ-0,Duplicate,ROTATING,"]
+        response = self._upload(seeded_client, "EQUIPMENT_HIERARCHY", "\n".join(lines), plant_id="TEST-PLANT")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["chunks"] == 3
+        assert data["rows_inserted"] == 254
+        assert data["rows_rejected"] == 1
+
+        eq = db_session.get(HierarchyNodeModel, "IMP-EQ-4")
+        assert eq.parent_node_id == "IMP-AREA-1"
+        assert eq.path == "/IMP-ROOT/IMP-AREA-1/IMP-EQ-4/"
+        assert db_session.get(HierarchyNodeModel, "IMP-AREA-0").level == 2
+
+    def test_upload_failure_history(self, client, db_session):
+        from api.database.models import WorkOrderModel
+        lines = ["Order,Asset_ID,Event_Date,FM,Downtime"]
+        lines += [f"WO-{i},EQ-{i % 4},2024-02-{i % 28 + 1:02d},Wear,{i % 6}" for i in range(230)]
+        lines += ["WO-999,EQ-1,bad-date,Wear,1", "WO-5,EQ-1,2024-02-01,Wear,1"]
+        response = self._upload(client, "FAILURE_HISTORY", "\n".join(lines))
+        data = response.json()
+        assert data["rows_read"] == 232
+        assert data["rows_inserted"] == 230
+        assert {e["row"] for e in data["errors"]} == {231, 232}
+        assert db_session.query(WorkOrderModel).count() == 230
+        assert db_session.get(WorkOrderModel, "WO-7").actual_duration_hours == 1.0
+
+    def test_upload_failure_history_rejects_each_column(self, client):
+        text = "Order,Asset_ID,Event_Date,FM,Downtime\nWO-1,EQ-1,2024-02-01,Wear,no date\nWO-2,EQ-1,bad-date,Wear,2\n"
+        data = self._upload(client, "FAILURE_HISTORY", text).json()
+        assert data["rows_inserted"] == 0
+        assert {(e["row"], e["column"]) for e in data["errors"]} == {(1, "downtime_hours"), (2, "failure_date")}
+
+    def test_upload_reports_partial_import(self, client, db_session):
+        from api.database.models import WorkOrderModel
+        lines = ["Order,Asset_ID,Event_Date,FM,Downtime"]
+        lines += [f"WO-{i},EQ-1,2024-02-01,Wear,1" for i in range(600)]
+        body = "\n".join(lines).encode() + b"\nWO-X,EQ-1,2024-02-01,Wear \xff\xfe,1\n"
+        response = client.post(
+            "/api/v1/reporting/import/upload", params={"source": "FAILURE_HISTORY", "chunk_size": 100},
+            files={"file": ("extract.csv", body, "text/csv")},
+        )
+        assert response.status_code == 400
+        detail = response.json()["detail"]
+        assert detail["message"]
+        committed = db_session.query(WorkOrderModel).count()
+        assert 0 < committed < 600
+        assert detail["result"]["rows_inserted"] == committed
+        assert detail["result"]["chunks"] == committed // 100
+
+    def test_upload_maintenance_plan(self, client, db_session):
+        from api.database.models import MaintenanceTaskModel
+        text = "equipment_id,task,interval\nEQ-1,Inspect bearings,30 D\nEQ-1,Lube,weekly\nEQ-2,Bad,sometimes\n"
+        data = self._upload(client, "MAINTENANCE_PLAN", text).json()
+        assert data["rows_inserted"] == 2
+        assert data["errors"][0]["column"] == "frequency"
+        units = {t.frequency_unit for t in db_session.query(MaintenanceTaskModel).all()}
+        assert units == {"DAYS", "WEEKS"}
+
+    def test_upload_unknown_plant(self, client):
+        response = self._upload(client, "EQUIPMENT_HIERARCHY", "equipment_id,description,equipment_type\n", plant_id="NOPE")
+        assert response.status_code == 404
+
+    def test_upload_bad_file_is_400(self, client):
+        response = client.post(
+            "/api/v1/reporting/import/upload", params={"source": "FAILURE_HISTORY"},
+            files={"file": ("extract.pdf", b"%PDF-1.4", "application/pdf")},
+        )
+        assert response.status_code == 400
+        assert "Unsupported file type" in response.json()["detail"]
+
+        response = client.post(
+            "/api/v1/reporting/import/upload", params={"source": "FAILURE_HISTORY"},
+            files={"file": ("extract.csv", "equipment_id,failure_date\nEQ-1,2024-01-01\n".encode("utf-16"), "text/csv")},
+        )
+        assert response.status_code == 400
+
     def test_export_data(self, client):
         response = client.post("/api/v1/reporting/export", json={
             "export_type": "equipment",
@@ -113,6 +204,142 @@ class TestReportingAPI:
         data = response.json()
         assert len(data["sheets"]) >= 1
 
+    def test_stream_payload_export_csv(self, client):
+        response = client.post("/api/v1/reporting/export/stream", params={"format": "csv"}, json={
+            "export_type": "equipment",
+            "hierarchy_data": [{"equipment_id": "EQ-1", "description": "Pump"}],
+        })
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "equipment.csv" in response.headers["content-disposition"]
+        lines = response.text.splitlines()
+        assert lines[0].startswith("Equipment ID,Description")
+        assert lines[1].startswith("EQ-1,Pump")
+
+    def test_stream_unknown_format(self, client):
+        response = client.get("/api/v1/reporting/export/equipment", params={"format": "pdf"})
+        assert response.status_code == 422
+
+    def test_stream_equipment_from_database(self, seeded_client, db_session):
+        import io
+        from openpyxl import load_workbook
+        from api.database.models import HealthScoreModel
+        db_session.add(HealthScoreModel(
+            node_id=seeded_client._test_ids["equipment_node_id"], plant_id="TEST-PLANT",
+            equipment_tag="BRY-SAG-ML-001", composite_score=72.5, health_class="FAIR",
+        ))
+        db_session.commit()
+        response = seeded_client.get("/api/v1/reporting/export/equipment", params={
+            "plant_id": "TEST-PLANT", "format": "xlsx",
+        })
+        assert response.status_code == 200
+        ws = load_workbook(io.BytesIO(response.content))["Equipment"]
+        row = [c.value for c in ws[2]]
+        assert ws.max_row == 2
+        assert row[:5] == ["BRY-SAG-ML-001", "SAG Mill #1", None, "TEST-BRY-SYS", "AA"]
+        assert row[6:] == [72.5, "FAIR"]
+
+    def test_stream_work_orders_ndjson(self, client, db_session):
+        import json
+        from datetime import date
+        from api.database.models import WorkOrderModel
+        for i in range(5):
+            db_session.add(WorkOrderModel(
+                work_order_id=f"WO-{i}", order_type="PM03", equipment_id="EQ-1", equipment_tag="EQ-1",
+                priority="2", status="COMPLETED", created_date=date(2025, 1, i + 1),
+            ))
+        db_session.commit()
+        response = client.get("/api/v1/reporting/export/work-orders", params={
+            "format": "ndjson", "since": "2025-01-02",
+        })
+        assert response.status_code == 200
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["WO ID"] for r in records] == ["WO-1", "WO-2", "WO-3", "WO-4"]
+        assert records[0]["Created"] == "2025-01-02"
+
+    def test_columnar_work_orders_parquet(self, client, db_session):
+        import io
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from datetime import date
+        from api.database.models import WorkOrderModel
+        for i in range(3):
+            db_session.add(WorkOrderModel(
+                work_order_id=f"WO-{i}", order_type="PM03", equipment_id="EQ-1", equipment_tag="EQ-1",
+                priority="2", status="COMPLETED", created_date=date(2025, 1, i + 1),
+                actual_duration_hours=None if i else 4.0,
+            ))
+        db_session.commit()
+        response = client.get("/api/v1/reporting/export/columnar/work_orders", params={"format": "parquet"})
+        assert response.status_code == 200
+        assert "work_orders.parquet" in response.headers["content-disposition"]
+        table = pq.read_table(io.BytesIO(response.content))
+        assert table.column("created_date").type == pa.date32()
+        assert pa.types.is_dictionary(table.column("order_type").type)
+        assert table.column("actual_duration_hours").to_pylist() == [4.0, None, None]
+
+    def test_columnar_hierarchy_arrow_stream(self, seeded_client):
+        import io
+        import pyarrow as pa
+        response = seeded_client.get("/api/v1/reporting/export/columnar/hierarchy_nodes", params={
+            "format": "arrow", "plant_id": "TEST-PLANT",
+        })
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(io.BytesIO(response.content)).read_all()
+        assert table.column("level").to_pylist() == [1, 2, 3, 4]
+        assert table.column("criticality").to_pylist()[-1] == "AA"
+
+    def test_columnar_weibull_predictions(self, seeded_client):
+        import io
+        import pyarrow.parquet as pq
+        seeded_client.post("/api/v1/analytics/weibull-predict", json={
+            "equipment_id": "EQ-1", "equipment_tag": "BRY-SAG-ML-001",
+            "failure_intervals": [100, 150, 200, 250], "current_age_days": 120,
+        })
+        response = seeded_client.get("/api/v1/reporting/export/columnar/weibull_predictions")
+        rows = pq.read_table(io.BytesIO(response.content)).to_pylist()
+        assert len(rows) == 1
+        assert rows[0]["weibull_params"]["sample_size"] == 4
+
+    def test_columnar_kpi_snapshots_filter(self, client):
+        response = client.get("/api/v1/reporting/export/columnar/kpi_snapshots", params={
+            "format": "arrow", "plant_id": "TEST-PLANT",
+        })
+        assert response.status_code == 200
+        response = client.get("/api/v1/reporting/export/columnar/weibull_predictions", params={
+            "plant_id": "TEST-PLANT",
+        })
+        assert response.status_code == 400
+
+    def test_columnar_unknown_dataset_or_format(self, client):
+        assert client.get("/api/v1/reporting/export/columnar/nope").status_code == 404
+        response = client.get("/api/v1/reporting/export/columnar/work_orders", params={"format": "orc"})
+        assert response.status_code == 422
+
+    def test_upload_failure_history_parquet(self, client, db_session):
+        import io
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from datetime import date
+        from api.database.models import WorkOrderModel
+        table = pa.table({
+            "Order": [f"WO-P{i}" for i in range(4)],
+            "Asset_ID": ["EQ-1"] * 4,
+            "Event_Date": [date(2024, 3, i + 1) for i in range(4)],
+            "FM": ["Wear"] * 4,
+            "Downtime": [1.5, 2.0, None, 3.0],
+        })
+        buf = io.BytesIO()
+        pq.write_table(table, buf)
+        response = client.post(
+            "/api/v1/reporting/import/upload", params={"source": "FAILURE_HISTORY"},
+            files={"file": ("history.parquet", buf.getvalue(), "application/vnd.apache.parquet")},
+        )
+        assert response.json()["rows_inserted"] == 4
+        assert db_session.get(WorkOrderModel, "WO-P3").created_date == date(2024, 3, 4)
+        assert db_session.get(WorkOrderModel, "WO-P2").actual_duration_hours is None
+
     def test_cross_module_analysis(self, client):
         response = client.post("/api/v1/reporting/cross-module/analyze", json={
             "plant_id": "TEST-PLANT",
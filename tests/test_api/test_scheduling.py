@@ -109,7 +109,64 @@ class TestSchedulingAPI:
         assert gantt_resp.status_code == 200
         assert isinstance(gantt_resp.json(), list)
 
+    def test_gantt_excel_export_streamed(self, seeded_client):
+        create_resp = seeded_client.post("/api/v1/scheduling/programs", json={
+            "plant_id": "TEST-PLANT", "week_number": 10, "year": 2025,
+        })
+        pid = create_resp.json()["program_id"]
+        resp = seeded_client.get(f"/api/v1/scheduling/programs/{pid}/gantt/export")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/vnd.openxmlformats")
+        assert f"gantt_{pid}.xlsx" in resp.headers["content-disposition"]
+        assert resp.content[:2] == b"PK"
+
+    def test_gantt_excel_export_not_found(self, seeded_client):
+        resp = seeded_client.get("/api/v1/scheduling/programs/NONEXISTENT/gantt/export")
+        assert resp.status_code == 404
+
     def test_404_nonexistent_program(self, seeded_client):
         """Get a nonexistent program returns 404."""
         resp = seeded_client.get("/api/v1/scheduling/programs/NONEXISTENT")
         assert resp.status_code == 404
+
+    def test_create_program_keeps_leveling_result(self, seeded_client, db_session):
+        """Packages beyond workforce capacity are stored unscheduled with their conflicts."""
+        from api.database.models import BacklogItemModel
+        from tools.models.schemas import ConflictResolution, ResourceConflict
+        # Emergency items are small, so only their priority can place them first
+        for i in range(40):
+            emergency = i >= 37
+            db_session.add(BacklogItemModel(
+                backlog_id=f"BL{i:02d}-CAP", equipment_id=f"EQ-CAP-{i}", equipment_tag=f"A{i}X-PMP-{i:03d}",
+                priority="1_EMERGENCY" if emergency else "3_NORMAL", wo_type="PM01",
+                status="AWAITING_APPROVAL", estimated_hours=4.0 if emergency else 8.0,
+                specialties=["MECHANICAL"], materials_ready=True, shutdown_required=False, age_days=5,
+            ))
+        db_session.commit()
+
+        pid = seeded_client.post("/api/v1/scheduling/programs", json={
+            "plant_id": "TEST-PLANT", "week_number": 10, "year": 2025,
+        }).json()["program_id"]
+        program = seeded_client.get(f"/api/v1/scheduling/programs/{pid}").json()
+
+        unscheduled = [p for p in program["work_packages"] if p.get("unscheduled")]
+        placed = [p for p in program["work_packages"] if not p.get("unscheduled")]
+        mechanical = [s for s in program["resource_slots"] if s["specialty"] == "MECHANICAL"]
+        capacity = sum(s["capacity_hours"] for s in mechanical)
+        # 308h of MECHANICAL work against the seeded crew's Thu-Sun capacity
+        assert unscheduled and len(placed) + len(unscheduled) == 40
+        assert sum(p["total_duration_hours"] for p in placed) <= capacity < 308
+        assert all(p["scheduled_date"] is None for p in unscheduled)
+        assert all(s["assigned_hours"] <= s["capacity_hours"] for s in program["resource_slots"])
+        emergency = {f"BL{i:02d}-CAP" for i in range(37, 40)}
+        assert emergency <= {b for p in placed for b in p["grouped_items"]}
+
+        # Both conflict lists read back into their own models
+        conflicts = [ResourceConflict(**c) for c in program["conflicts"]]
+        leveling = [ConflictResolution(**c) for c in program["leveling_conflicts"]]
+        assert [c.model_dump(mode="json") for c in conflicts] == program["conflicts"]
+        not_fitting = [c for c in leveling if "does not fit" in c.conflict_description]
+        assert {c.conflict_description.split()[0] for c in not_fitting} == {p["package_id"] for p in unscheduled}
+
+        gantt = seeded_client.get(f"/api/v1/scheduling/programs/{pid}/gantt").json()
+        assert {row["package_id"] for row in gantt} == {p["package_id"] for p in placed}
@@ -0,0 +1,109 @@
+"""Tests for the in-place schema upgrade of databases created by an earlier version."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import inspect, text
+
+from api.database.connection import Base, build_engine
+from api.database.upgrade import upgrade_schema
+
+
+def _drop_column(conn, table, column, indexes=()):
+    for index in indexes:
+        conn.execute(text(f"DROP INDEX {index}"))
+    conn.execute(text(f"ALTER TABLE {table} DROP COLUMN {column}"))
+
+
+@pytest.fixture
+def old_engine(tmp_path):
+    eng = build_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(bind=eng)
+    with eng.begin() as conn:
+        _drop_column(conn, "hierarchy_nodes", "path", ["ix_hierarchy_nodes_path"])
+    yield eng
+    eng.dispose()
+
+
+class TestSchemaUpgrade:
+
+    def test_adds_hierarchy_path_and_backfills(self, old_engine):
+        with old_engine.begin() as conn:
+            conn.execute(text("INSERT INTO plants (plant_id, name, name_fr, name_ar, location) VALUES ('P1', 'P', '', '', '')"))
+            for node_id, parent, level, node_type in (
+                ("N1", None, 1, "PLANT"), ("N2", "N1", 2, "AREA"), ("N3", "N2", 3, "SYSTEM"),
+            ):
+                conn.execute(text(
+                    "INSERT INTO hierarchy_nodes (node_id, node_type, name, name_fr, code, parent_node_id, "
+                    "level, plant_id, status, \"order\") VALUES (:id, :type, :id, :id, :id, :parent, :level, 'P1', 'ACTIVE', 1)"
+                ), {"id": node_id, "type": node_type, "parent": parent, "level": level})
+
+        assert upgrade_schema(old_engine) == ["hierarchy_nodes.path"]
+
+        inspector = inspect(old_engine)
+        assert "path" in {c["name"] for c in inspector.get_columns("hierarchy_nodes")}
+        assert "ix_hierarchy_nodes_path" in {i["name"] for i in inspector.get_indexes("hierarchy_nodes")}
+        with old_engine.connect() as conn:
+            paths = dict(conn.execute(text("SELECT node_id, path FROM hierarchy_nodes")).all())
+        assert paths == {"N1": "/N1/", "N2": "/N1/N2/", "N3": "/N1/N2/N3/"}
+
+    def test_backfills_backlog_plant_and_updated_at(self, old_engine):
+        with old_engine.begin() as conn:
+            _drop_column(conn, "backlog_items", "plant_id", ["ix_backlog_items_plant_updated"])
+            _drop_column(conn, "backlog_items", "updated_at")
+            conn.execute(text("INSERT INTO plants (plant_id, name, name_fr, name_ar, location) VALUES ('P1', 'P', '', '', '')"))
+            conn.execute(text(
+                "INSERT INTO hierarchy_nodes (node_id, node_type, name, name_fr, code, level, plant_id, status, \"order\") "
+                "VALUES ('EQ1', 'PLANT', 'E', 'E', 'E', 1, 'P1', 'ACTIVE', 1)"
+            ))
+            for backlog_id, equipment_id in (("B1", "EQ1"), ("B2", "UNKNOWN")):
+                conn.execute(text(
+                    "INSERT INTO backlog_items (backlog_id, equipment_id, equipment_tag, priority, wo_type, status, "
+                    "estimated_hours, materials_ready, shutdown_required, age_days, created_at) "
+                    "VALUES (:id, :eq, :eq, '3_NORMAL', 'PM01', 'AWAITING_APPROVAL', 4.0, 1, 0, 0, '2025-01-02 08:00:00')"
+                ), {"id": backlog_id, "eq": equipment_id})
+
+        added = upgrade_schema(old_engine)
+        assert {"backlog_items.plant_id", "backlog_items.updated_at"} <= set(added)
+
+        assert "ix_backlog_items_plant_updated" in {
+            i["name"] for i in inspect(old_engine).get_indexes("backlog_items")
+        }
+        with old_engine.connect() as conn:
+            rows = conn.execute(text("SELECT backlog_id, plant_id, updated_at FROM backlog_items ORDER BY backlog_id")).all()
+        assert [(r[0], r[1]) for r in rows] == [("B1", "P1"), ("B2", None)]
+        assert all(r[2] == "2025-01-02 08:00:00" for r in rows)
+
+    def test_builds_kpi_rollups_for_existing_work_orders(self, old_engine):
+        from sqlalchemy.orm import Session
+
+        from api.services import kpi_rollup_service
+
+        with old_engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_kpi_metrics_rollup"))
+            conn.execute(text("DROP INDEX ix_kpi_metrics_rollup_equipment"))
+            for column in ("grain", "pm_completed_count", "repair_count", "repair_hours", "downtime_hours"):
+                _drop_column(conn, "kpi_metrics", column)
+            conn.execute(text("INSERT INTO plants (plant_id, name, name_fr, name_ar, location) VALUES ('P1', 'P', '', '', '')"))
+            conn.execute(text(
+                "INSERT INTO hierarchy_nodes (node_id, node_type, name, name_fr, code, level, plant_id, status, \"order\") "
+                "VALUES ('EQ1', 'EQUIPMENT', 'E', 'E', 'EQ1', 1, 'P1', 'ACTIVE', 1)"
+            ))
+            for i, day in enumerate(("2025-01-05", "2025-01-15", "2025-01-15")):
+                conn.execute(text(
+                    "INSERT INTO work_orders (work_order_id, order_type, equipment_id, equipment_tag, priority, "
+                    "status, created_date, actual_duration_hours, description) "
+                    "VALUES (:id, 'PM03', 'EQ1', 'EQ1', '2', 'COMPLETED', :day, 4.0, '')"
+                ), {"id": f"WO-{i}", "day": day})
+
+        assert "kpi_metrics.grain" in upgrade_schema(old_engine)
+
+        with Session(old_engine) as db:
+            kpis = kpi_rollup_service.calculate_period_kpis(db, "P1", date(2025, 1, 1), date(2025, 1, 31))
+        assert kpis.total_work_orders == 3
+        assert kpis.corrective_wo_count == 3
+        assert kpis.mttr_hours == 4.0
+
+    def test_idempotent(self, old_engine):
+        upgrade_schema(old_engine)
+        assert upgrade_schema(old_engine) == []
@@ -5,7 +5,9 @@ Validates grouping strategies and stratification.
 
 import pytest
 
-from tools.engines.backlog_grouper import BacklogEntry, BacklogGrouper
+from dataclasses import replace
+
+from tools.engines.backlog_grouper import BacklogEntry, BacklogGrouper, GroupingCache
 
 
 @pytest.fixture
@@ -76,6 +78,35 @@ class TestFindAllGroups:
         assert len(all_item_ids) == len(set(all_item_ids))
 
 
+def _summary(groups):
+    return [(g.group_id, [i.backlog_id for i in g.items], g.total_hours) for g in groups]
+
+
+class TestUpdateGroups:
+    def test_initial_build_matches_full(self, sample_backlog_items):
+        groups = BacklogGrouper.update_groups(GroupingCache(), sample_backlog_items)
+        assert _summary(groups) == _summary(BacklogGrouper.find_all_groups(sample_backlog_items))
+
+    def test_changes_match_full_regroup(self, sample_backlog_items):
+        cache = GroupingCache()
+        BacklogGrouper.update_groups(cache, sample_backlog_items)
+        items = {i.backlog_id: i for i in sample_backlog_items}
+
+        items["BL-5"] = replace(items["BL-5"], equipment_tag="PMP-SLP-003", area_code="PMP-SLP")
+        items["BL-7"] = BacklogEntry("BL-7", "EQ-CVR-001", "CVY-CVR-001", "CVY-CVR", "3_NORMAL", ["ELECTRICAL"], False, True, 3.0)
+        del items["BL-2"]
+        groups = BacklogGrouper.update_groups(cache, [items["BL-5"], items["BL-7"]], {"BL-2"})
+
+        assert _summary(groups) == _summary(BacklogGrouper.find_all_groups(list(items.values())))
+
+    def test_untouched_areas_are_reused(self, sample_backlog_items):
+        cache = GroupingCache()
+        BacklogGrouper.update_groups(cache, sample_backlog_items)
+        sag_groups = cache.area_groups["BRY-SAG"]
+        BacklogGrouper.update_groups(cache, [replace(sample_backlog_items[2], estimated_hours=5.0)])
+        assert cache.area_groups["BRY-SAG"] is sag_groups
+
+
 class TestStratification:
     def test_stratify_totals(self, sample_backlog_items):
         result = BacklogGrouper.stratify(sample_backlog_items)
@@ -4,13 +4,20 @@ Tests REC-003: crash recovery via session state snapshots.
 All tests are offline (no API key needed).
 """
 
+import gzip
 import json
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from agents.orchestration import checkpoint
 from agents.orchestration.checkpoint import (
+    CheckpointLog,
+    autosave_checkpoint,
+    close_checkpoint_log,
+    get_checkpoint_log,
     save_checkpoint,
     load_checkpoint,
     find_latest_checkpoint,
@@ -44,10 +51,11 @@ class TestSaveCheckpoint:
     """Tests for save_checkpoint()."""
 
     def test_creates_file(self, tmp_checkpoint_dir, sample_session):
-        """Checkpoint file should be created on disk."""
+        """Checkpoint log and its index should be created on disk."""
         path = save_checkpoint(sample_session, 1, tmp_checkpoint_dir)
         assert path.exists()
-        assert path.name == "test-session-001_m1.json"
+        assert path.name == "test-session-001.ckpt.jsonl.gz"
+        assert (tmp_checkpoint_dir / "test-session-001.index.json").exists()
 
     def test_creates_directory_if_missing(self, tmp_path, sample_session):
         """Non-existent checkpoint directory should be auto-created."""
@@ -57,11 +65,17 @@ class TestSaveCheckpoint:
         assert deep_dir.exists()
 
     def test_file_contains_valid_json(self, tmp_checkpoint_dir, sample_session):
-        """Checkpoint file should contain valid JSON."""
+        """Checkpoint log should decompress to JSON records."""
         path = save_checkpoint(sample_session, 2, tmp_checkpoint_dir)
-        data = json.loads(path.read_text(encoding="utf-8"))
-        assert data["session_id"] == "test-session-001"
-        assert data["equipment_tag"] == "SAG Mill 001"
+        data = json.loads(gzip.decompress(path.read_bytes()))
+        assert data["fields"]["session_id"] == "test-session-001"
+        assert data["fields"]["equipment_tag"] == "SAG Mill 001"
+
+    def test_appends_to_single_log(self, tmp_checkpoint_dir, sample_session):
+        """Further checkpoints append to the same log instead of new files."""
+        save_checkpoint(sample_session, 1, tmp_checkpoint_dir)
+        save_checkpoint(sample_session, 2, tmp_checkpoint_dir)
+        assert len(list(tmp_checkpoint_dir.iterdir())) == 2
 
 
 class TestLoadCheckpoint:
@@ -85,6 +99,25 @@ class TestLoadCheckpoint:
         result = load_checkpoint("nonexistent-session", 1, tmp_checkpoint_dir)
         assert result is None
 
+    def test_loads_each_milestone_state(self, tmp_checkpoint_dir, sample_session):
+        """Earlier milestones load as they were, not as the latest state."""
+        save_checkpoint(sample_session, 1, tmp_checkpoint_dir)
+        sample_session.failure_modes.append({"mode_id": "fm2"})
+        save_checkpoint(sample_session, 2, tmp_checkpoint_dir)
+
+        assert len(load_checkpoint("test-session-001", 1, tmp_checkpoint_dir).failure_modes) == 1
+        assert len(load_checkpoint("test-session-001", 2, tmp_checkpoint_dir).failure_modes) == 2
+
+    def test_legacy_json_checkpoint(self, tmp_checkpoint_dir, sample_session):
+        """Per-milestone JSON files from earlier versions still load."""
+        tmp_checkpoint_dir.mkdir(parents=True)
+        legacy = tmp_checkpoint_dir / "test-session-001_m3.json"
+        legacy.write_text(sample_session.to_json(), encoding="utf-8")
+
+        loaded = load_checkpoint("test-session-001", 3, tmp_checkpoint_dir)
+        assert loaded.failure_modes == [{"mode_id": "fm1"}]
+        assert find_latest_checkpoint("test-session-001", tmp_checkpoint_dir)[0] == 3
+
 
 class TestFindLatestCheckpoint:
     """Tests for find_latest_checkpoint()."""
@@ -105,6 +138,96 @@ class TestFindLatestCheckpoint:
         assert result is None
 
 
+class TestCheckpointLog:
+    """Tests for delta records, replay and autosave."""
+
+    def test_delta_holds_only_changes(self, tmp_checkpoint_dir, sample_session):
+        log = CheckpointLog("test-session-001", tmp_checkpoint_dir)
+        log.append(sample_session, 1)
+        sample_session.failure_modes[0] = {"mode_id": "fm1", "mechanism": "WEARS"}
+        sample_session.maintenance_tasks.append({"task_id": "t1"})
+        entry = log.append(sample_session, 2)
+
+        with open(log.log_path, "rb") as f:
+            f.seek(entry["offset"])
+            record = json.loads(gzip.decompress(f.read(entry["length"])))
+        assert record["full"] is False
+        assert record["fields"] == {}
+        assert set(record["lists"]) == {"failure_modes", "maintenance_tasks"}
+        assert record["lists"]["failure_modes"]["set"] == {"0": {"mode_id": "fm1", "mechanism": "WEARS"}}
+
+    def test_replay_matches_session(self, tmp_checkpoint_dir, sample_session):
+        log = CheckpointLog("test-session-001", tmp_checkpoint_dir, full_every=3)
+        for i in range(7):
+            sample_session.failure_modes.append({"mode_id": f"fm{i + 2}"})
+            if i == 4:
+                del sample_session.hierarchy_nodes[0]
+                sample_session.sap_upload_package = {"plant": "OCP-JFC"}
+            log.append(sample_session, 1 + i // 2)
+
+        assert log.load().to_json() == sample_session.to_json()
+        assert sum(e["seq"] == e["base"] for e in log.records()) == 3
+
+    def test_reopened_log_continues(self, tmp_checkpoint_dir, sample_session):
+        CheckpointLog("test-session-001", tmp_checkpoint_dir).append(sample_session, 1)
+        sample_session.work_packages.append({"wp_id": "wp1"})
+        reopened = CheckpointLog("test-session-001", tmp_checkpoint_dir)
+        reopened.append(sample_session, 2)
+
+        assert reopened.latest_milestone() == 2
+        assert reopened.load(1).work_packages == []
+        assert reopened.load(2).work_packages == [{"wp_id": "wp1"}]
+
+    def test_autosave_is_not_an_approved_milestone(self, tmp_checkpoint_dir, sample_session):
+        save_checkpoint(sample_session, 1, tmp_checkpoint_dir)
+        sample_session.functions.append({"function_id": "f1"})
+        autosave_checkpoint(sample_session, 2, tmp_checkpoint_dir).result()
+
+        log = get_checkpoint_log("test-session-001", tmp_checkpoint_dir)
+        assert log.latest()["kind"] == "autosave"
+        assert log.load().functions == [{"function_id": "f1"}]
+        assert find_latest_checkpoint("test-session-001", tmp_checkpoint_dir)[0] == 1
+
+    def test_autosaves_coalesce(self, tmp_checkpoint_dir, sample_session):
+        log = CheckpointLog("test-session-001", tmp_checkpoint_dir)
+        with log._lock:  # hold the writer so autosaves queue up
+            futures = [log.autosave(sample_session, 1) for _ in range(5)]
+            sample_session.functions.append({"function_id": "f1"})
+            futures.append(log.autosave(sample_session, 1))
+        log.flush()
+        for future in futures:
+            future.result()
+
+        assert len(log.records()) <= 2
+        assert log.load().functions == [{"function_id": "f1"}]
+
+    def test_autosave_state_frozen_at_call(self, tmp_checkpoint_dir, sample_session):
+        log = CheckpointLog("test-session-001", tmp_checkpoint_dir)
+        log.append(sample_session, 1)
+        with log._lock:  # hold the writer while the workflow keeps editing
+            future = log.autosave(sample_session, 1)
+            sample_session.hierarchy_nodes[0]["name"] = "Renamed"
+            sample_session.hierarchy_nodes[1]["extra"] = {"k": 1}
+        future.result()
+        assert log.load().hierarchy_nodes[0]["name"] == "Plant"
+
+        # The next record sees the in-place edits as changes
+        log.append(sample_session, 1)
+        assert log.load().hierarchy_nodes == sample_session.hierarchy_nodes
+        log.close()
+
+    def test_close_releases_log_and_thread(self, tmp_checkpoint_dir, sample_session):
+        autosave_checkpoint(sample_session, 1, tmp_checkpoint_dir).result()
+        log = get_checkpoint_log("test-session-001", tmp_checkpoint_dir)
+        assert log._executor is not None
+
+        close_checkpoint_log("test-session-001", tmp_checkpoint_dir)
+        assert log._executor is None
+        assert log not in checkpoint._logs.values()
+        # Reopened from the index
+        assert get_checkpoint_log("test-session-001", tmp_checkpoint_dir).load().functions == []
+
+
 class TestWorkflowCheckpointIntegration:
     """Integration test: workflow saves checkpoints on approve."""
 
@@ -128,9 +251,10 @@ class TestWorkflowCheckpointIntegration:
 
         workflow.run("SAG Mill 001", "OCP")
 
-        # All 4 milestones approved → 4 checkpoint files
-        checkpoint_files = list(tmp_checkpoint_dir.glob("*.json"))
-        assert len(checkpoint_files) == 4
+        # All 4 milestones approved → 4 approved checkpoints in one log
+        log = get_checkpoint_log(workflow.session.session_id, tmp_checkpoint_dir)
+        approved = [e for e in log.records() if e["kind"] == "milestone"]
+        assert [e["milestone"] for e in approved] == [1, 2, 3, 4]
 
     @patch("agents.orchestration.workflow._run_validation")
     def test_checkpoint_preserves_all_entities(self, mock_validation, tmp_checkpoint_dir):
@@ -162,3 +286,27 @@ class TestWorkflowCheckpointIntegration:
         assert loaded is not None
         assert len(loaded.hierarchy_nodes) == 1
         assert len(loaded.failure_modes) == 1
+
+    @patch("agents.orchestration.workflow._run_validation")
+    def test_workflow_releases_checkpoint_log(self, mock_validation, tmp_checkpoint_dir):
+        """Finished sessions keep neither a log nor a writer thread."""
+        mock_validation.return_value = ValidationSummary()
+
+        with patch.object(AgentConfig, "load_system_prompt", return_value="Test"):
+            with patch.object(AgentConfig, "get_tools_schema", return_value=[]):
+                workflows = [
+                    StrategyWorkflow(
+                        human_approval_fn=lambda n, s: ("approve", "OK"),
+                        client=MagicMock(),
+                        checkpoint_dir=str(tmp_checkpoint_dir),
+                    )
+                    for _ in range(5)
+                ]
+        threads_before = threading.active_count()
+        for workflow in workflows:
+            workflow.orchestrator.run = MagicMock(return_value="Done.")
+            workflow.run("SAG Mill 001", "OCP")
+
+        session_ids = {w.session.session_id for w in workflows}
+        assert not session_ids & {log.session_id for log in checkpoint._logs.values()}
+        assert threading.active_count() <= threads_before
@@ -0,0 +1,135 @@
+"""Tests for the Arrow/Parquet columnar engine."""
+
+import io
+from datetime import date, datetime
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from tools.engines.columnar_engine import ColumnarEngine, arrow_schema
+from tools.engines.data_import_engine import DataImportEngine
+from tools.engines.weibull_engine import WeibullEngine
+from tools.models.schemas import FailurePrediction, KPIMetrics, PlantHierarchyNode
+
+
+def _predictions(n):
+    for i in range(n):
+        yield FailurePrediction(
+            equipment_id=f"EQ-{i}", equipment_tag=f"EQ-{i}",
+            predicted_at=datetime(2025, 1, 1, 8, 30),
+            weibull_params={"beta": 1.5, "eta": 100.0 + i, "sample_size": 4},
+            current_age_days=10.0, reliability_current=0.9,
+            predicted_failure_window_days=40.0,
+        )
+
+
+class TestArrowSchema:
+
+    def test_scalar_and_optional_fields(self):
+        schema = arrow_schema(KPIMetrics)
+        assert schema.field("plant_id").type == pa.string()
+        assert not schema.field("plant_id").nullable
+        assert schema.field("period_start").type == pa.date32()
+        assert schema.field("calculated_at").type == pa.timestamp("us")
+        assert schema.field("mtbf_days").nullable
+        assert schema.field("total_work_orders").type == pa.int64()
+
+    def test_enums_nested_models_and_subset(self):
+        schema = arrow_schema(PlantHierarchyNode, ["node_id", "node_type", "metadata"], {"plant_id": pa.string()})
+        assert schema.names == ["node_id", "node_type", "metadata", "plant_id"]
+        assert pa.types.is_dictionary(schema.field("node_type").type)
+        assert pa.types.is_struct(schema.field("metadata").type)
+        assert schema.field("metadata").type.field("installation_date").type == pa.date32()
+
+    def test_struct_from_model(self):
+        schema = arrow_schema(FailurePrediction)
+        params = schema.field("weibull_params").type
+        assert [f.name for f in params] == ["beta", "eta", "gamma", "r_squared", "sample_size"]
+
+
+class TestColumnarRoundTrip:
+
+    def test_record_batches_bounded(self):
+        schema = arrow_schema(FailurePrediction)
+        batches = list(ColumnarEngine.record_batches(_predictions(25), schema, batch_rows=10))
+        assert [b.num_rows for b in batches] == [10, 10, 5]
+        assert batches[0].schema == schema
+
+    def test_parquet_round_trip(self):
+        schema = arrow_schema(FailurePrediction)
+        data = b"".join(ColumnarEngine.stream_parquet(ColumnarEngine.record_batches(_predictions(5), schema), schema))
+        assert data[:4] == b"PAR1"
+        table = ColumnarEngine.read_table(io.BytesIO(data))
+        assert table.num_rows == 5
+        row = table.slice(0, 1).to_pylist()[0]
+        assert row["weibull_params"]["eta"] == 100.0
+        assert row["status"] == "DRAFT"
+        assert row["predicted_at"] == datetime(2025, 1, 1, 8, 30)
+
+    def test_ipc_stream_yields_per_batch(self):
+        schema = arrow_schema(FailurePrediction)
+        chunks = list(ColumnarEngine.stream_ipc(
+            ColumnarEngine.record_batches(_predictions(30), schema, batch_rows=10), schema,
+        ))
+        # Schema message, one chunk per batch, end-of-stream marker
+        assert len(chunks) == 5
+        table = ColumnarEngine.read_table(io.BytesIO(b"".join(chunks)))
+        assert table.column("equipment_id").to_pylist()[-1] == "EQ-29"
+
+    def test_ipc_file_read(self):
+        table = pa.table({"equipment_id": ["A", "B"], "failure_date": [date(2025, 1, 1), date(2025, 2, 1)]})
+        sink = io.BytesIO()
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        rows = [r for chunk in ColumnarEngine.iter_rows(io.BytesIO(sink.getvalue())) for r in chunk]
+        assert rows[1] == {"equipment_id": "B", "failure_date": date(2025, 2, 1)}
+
+    def test_read_chunks_accepts_parquet(self):
+        import pyarrow.parquet as pq
+        table = pa.table({
+            "equipment_id": [f"EQ-{i}" for i in range(7)],
+            "failure_date": [date(2025, 1, i + 1) for i in range(7)],
+            "failure_mode": ["Wear"] * 7,
+        })
+        buf = io.BytesIO()
+        pq.write_table(table, buf)
+        buf.seek(0)
+        chunks = list(DataImportEngine.read_chunks(buf, filename="history.parquet", chunk_size=3))
+        assert [len(c) for c in chunks] == [3, 3, 1]
+        assert chunks[0][0]["failure_date"] == date(2025, 1, 1)
+
+
+class TestNumpy:
+
+    def test_zero_copy_column(self):
+        column = pa.chunked_array([pa.array([1.0, 2.0, 3.0])])
+        values = ColumnarEngine.to_numpy(column)
+        assert not values.flags.writeable
+        assert values.ctypes.data == column.chunk(0).buffers()[1].address
+
+    def test_nulls_become_nan(self):
+        values = ColumnarEngine.to_numpy(pa.array([1.0, None]))
+        assert np.isnan(values[1])
+
+    def test_list_column(self):
+        column = pa.array([[1.0, 2.0], [3.0], []]).slice(1)
+        values, lengths = ColumnarEngine.list_to_numpy(column)
+        assert values.tolist() == [3.0]
+        assert lengths.tolist() == [1, 0]
+
+    def test_weibull_fit_from_arrow(self):
+        rng = np.random.default_rng(3)
+        series = [list(rng.weibull(1.8, size=n) * 120) for n in (5, 1, 12, 0, 4)]
+        values, lengths = ColumnarEngine.list_to_numpy(pa.array(series, type=pa.list_(pa.float64())))
+        assert not values.flags.writeable
+        flat = WeibullEngine.fit_batch_flat(values, lengths)
+        ragged = WeibullEngine.fit_batch(series)
+        for name in ("beta", "eta", "r_squared", "sample_size"):
+            np.testing.assert_array_equal(getattr(flat, name), getattr(ragged, name))
+
+    def test_read_table_empty_source(self):
+        schema = arrow_schema(KPIMetrics)
+        data = b"".join(ColumnarEngine.stream_ipc(iter(()), schema))
+        with pytest.raises(ValueError):
+            ColumnarEngine.read_table(io.BytesIO(data))
@@ -0,0 +1,125 @@
+"""Tests for the Critical Path Engine — CPM dates, floats, cycles and what-ifs."""
+
+import random
+
+import pytest
+
+from tools.engines.critical_path import CriticalPathNetwork
+
+
+def _example():
+    #   A(3) → B(2) → D(4)
+    #   A(3) → C(1) → D(4)
+    #        C(1) → E(2)
+    return CriticalPathNetwork(
+        {"A": 3, "B": 2, "C": 1, "D": 4, "E": 2},
+        [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("C", "E")],
+    )
+
+
+def _random_network(n, edges_per_task, seed):
+    rng = random.Random(seed)
+    durations = {f"T{i}": rng.choice([0.5, 1, 2, 4, 8]) for i in range(n)}
+    edges = [
+        (f"T{rng.randrange(i)}", f"T{i}")
+        for i in range(1, n) for _ in range(rng.randint(0, edges_per_task))
+    ]
+    return durations, edges
+
+
+class TestSchedule:
+
+    def test_project_duration(self):
+        assert _example().project_duration == 9.0
+
+    def test_dates_and_floats(self):
+        net = _example()
+        c = net.schedule("C")
+        assert (c.early_start, c.early_finish) == (3.0, 4.0)
+        assert (c.late_start, c.late_finish) == (4.0, 5.0)
+        assert c.total_float == 1.0
+        assert c.free_float == 0.0
+        e = net.schedule("E")
+        assert e.total_float == 3.0
+        assert e.free_float == 3.0
+
+    def test_critical_tasks(self):
+        net = _example()
+        assert net.critical_tasks() == ["A", "B", "D"]
+        assert net.schedule("B").is_critical
+        assert not net.schedule("C").is_critical
+
+    def test_order_is_topological(self):
+        durations, edges = _random_network(300, 3, seed=1)
+        position = {t: i for i, t in enumerate(CriticalPathNetwork(durations, edges).order)}
+        assert all(position[a] < position[b] for a, b in edges)
+
+    def test_unknown_and_duplicate_edges_ignored(self):
+        net = CriticalPathNetwork({"A": 1, "B": 1}, [("A", "B"), ("A", "B"), ("X", "B")])
+        assert net.project_duration == 2.0
+
+    def test_empty_network(self):
+        net = CriticalPathNetwork({}, [])
+        assert net.project_duration == 0.0
+        assert net.critical_tasks() == []
+
+
+class TestCycles:
+
+    def test_cycle_edges_reported(self):
+        net = CriticalPathNetwork(
+            {"A": 1, "B": 1, "C": 1, "D": 1},
+            [("A", "B"), ("B", "C"), ("C", "B"), ("C", "D")],
+        )
+        assert sorted(net.cycle_edges) == [("B", "C"), ("C", "B")]
+        # Scheduled without the cycle: A → B and C → D
+        assert net.order == ["A", "C", "B", "D"]
+        assert net.project_duration == 2.0
+
+    def test_self_loop(self):
+        net = CriticalPathNetwork({"A": 1}, [("A", "A")])
+        assert net.cycle_edges == [("A", "A")]
+        assert net.project_duration == 1.0
+
+    def test_downstream_of_cycle_not_reported(self):
+        net = CriticalPathNetwork(
+            {"A": 1, "B": 1, "C": 1},
+            [("A", "B"), ("B", "A"), ("B", "C")],
+        )
+        assert sorted(net.cycle_edges) == [("A", "B"), ("B", "A")]
+
+    def test_acyclic_has_no_cycle_edges(self):
+        assert _example().cycle_edges == []
+
+
+class TestIncremental:
+
+    def test_set_duration(self):
+        net = _example()
+        net.set_duration("C", 5)
+        assert net.project_duration == 12.0
+        assert net.critical_tasks() == ["A", "C", "D"]
+        assert net.schedule("B").total_float == 3.0
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_rebuild(self, seed):
+        durations, edges = _random_network(500, 3, seed)
+        net = CriticalPathNetwork(durations, edges)
+        rng = random.Random(seed)
+        for _ in range(25):
+            task_id = f"T{rng.randrange(500)}"
+            durations[task_id] = rng.choice([0, 0.5, 3, 16])
+            net.set_duration(task_id, durations[task_id])
+
+        rebuilt = CriticalPathNetwork(durations, edges)
+        assert net.project_duration == rebuilt.project_duration
+        assert net.schedules() == rebuilt.schedules()
+        assert net.critical_tasks() == rebuilt.critical_tasks()
+
+    def test_large_network(self):
+        durations, edges = _random_network(10_000, 2, seed=7)
+        net = CriticalPathNetwork(durations, edges)
+        before = net.project_duration
+        critical = net.critical_tasks()[0]
+        net.set_duration(critical, durations[critical] + 10)
+        assert net.project_duration == before + 10
@@ -112,3 +112,71 @@ class TestPrepareScheduleExport:
     def test_metadata(self):
         result = DataExportEngine.prepare_schedule_export({"program_id": "PROG-1"})
         assert result.metadata["program_id"] == "PROG-1"
+
+
+class TestStreamingExport:
+
+    @staticmethod
+    def _equipment(n):
+        for i in range(n):
+            yield {"equipment_id": f"EQ-{i}", "description": "Pump, slurry", "criticality_class": "A"}
+
+    def test_csv_round_trip(self):
+        import csv
+        import io
+        sheet = DataExportEngine.equipment_sheet(self._equipment(5), include_health=False)
+        text = b"".join(DataExportEngine.stream_csv([sheet], batch_rows=2)).decode()
+        rows = list(csv.reader(io.StringIO(text)))
+        assert rows[0] == ["Equipment ID", "Description", "Type", "Parent ID", "Criticality Class", "Risk Score"]
+        assert rows[1] == ["EQ-0", "Pump, slurry", "", "", "A", ""]
+        assert len(rows) == 6
+
+    def test_rows_generated_lazily(self):
+        consumed = []
+
+        def rows():
+            for i in range(10):
+                consumed.append(i)
+                yield {"equipment_id": f"EQ-{i}"}
+
+        chunks = DataExportEngine.stream_csv([DataExportEngine.equipment_sheet(rows())], batch_rows=3)
+        next(chunks)
+        assert len(consumed) == 3
+
+    def test_ndjson_keys_by_header(self):
+        import json
+        from datetime import date
+        sheet = DataExportEngine.work_order_sheet([
+            {"work_order_id": "WO-1", "created_date": date(2025, 1, 2), "actual_duration_hours": 2.5},
+        ])
+        lines = b"".join(DataExportEngine.stream_ndjson([sheet])).decode().splitlines()
+        record = json.loads(lines[0])
+        assert record["WO ID"] == "WO-1"
+        assert record["Created"] == "2025-01-02"
+        assert "sheet" not in record
+
+    def test_ndjson_multiple_sheets_named(self):
+        import json
+        result = DataExportEngine.prepare_kpi_export(
+            planning_kpis={"kpis": [{"name": "a", "value": 1}]},
+            de_kpis={"kpis": [{"name": "b", "value": 2}]},
+        )
+        lines = b"".join(DataExportEngine.stream_ndjson(DataExportEngine.to_streams(result))).splitlines()
+        assert [json.loads(line)["sheet"] for line in lines] == ["Planning KPIs", "DE KPIs"]
+
+    def test_xlsx_write_only_with_named_styles(self):
+        import io
+        from openpyxl import load_workbook
+        sheet = DataExportEngine.equipment_sheet(self._equipment(3))
+        data = b"".join(DataExportEngine.stream_xlsx([sheet], chunk_bytes=1024))
+        wb = load_workbook(io.BytesIO(data))
+        ws = wb["Equipment"]
+        assert ws.max_row == 4
+        assert ws["A1"].style == "export_header"
+        assert ws["A1"].font.b
+        assert ws["A2"].value == "EQ-0"
+
+    def test_unknown_format(self):
+        import pytest
+        with pytest.raises(ValueError):
+            DataExportEngine.stream([], "pdf")
@@ -1,5 +1,7 @@
 """Tests for Data Import Engine — Phase 6."""
 
+import pytest
+
 from tools.engines.data_import_engine import DataImportEngine
 from tools.models.schemas import ImportSource
 
@@ -124,3 +126,52 @@ class TestSummarizeImport:
         summary = DataImportEngine.summarize_import(result)
         assert summary.valid_pct == 50.0
         assert len(summary.error_summary) > 0
+
+
+class TestStreaming:
+
+    def _csv(self, tmp_path, n):
+        path = tmp_path / "failures.csv"
+        lines = ["Asset_ID,Event_Date,FM,Downtime"]
+        lines += [f"EQ-{i},2024-01-{i % 28 + 1:02d},Wear,{i % 5}" for i in range(n)]
+        lines.append("EQ-X,not-a-date,Wear,1")
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    def test_read_chunks_csv(self, tmp_path):
+        chunks = list(DataImportEngine.read_chunks(self._csv(tmp_path, 24), chunk_size=10))
+        assert [len(c) for c in chunks] == [10, 10, 5]
+        assert chunks[0][0]["Asset_ID"] == "EQ-0"
+
+    def test_read_chunks_xlsx(self, tmp_path):
+        from openpyxl import Workbook
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["equipment_id", "description", "equipment_type"])
+        for i in range(7):
+            ws.append([f"EQ-{i}", "Pump", "ROTATING"])
+        path = tmp_path / "hierarchy.xlsx"
+        wb.save(path)
+        chunks = list(DataImportEngine.read_chunks(path, chunk_size=5))
+        assert [len(c) for c in chunks] == [5, 2]
+        assert chunks[1][1] == {"equipment_id": "EQ-6", "description": "Pump", "equipment_type": "ROTATING"}
+
+    def test_read_chunks_unsupported_type(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            next(DataImportEngine.read_chunks(tmp_path / "extract.pdf"))
+
+    def test_stream_validate_maps_once_and_numbers_rows(self, tmp_path):
+        chunks = DataImportEngine.read_chunks(self._csv(tmp_path, 24), chunk_size=10)
+        results = list(DataImportEngine.stream_validate(chunks, ImportSource.FAILURE_HISTORY))
+        mapping = results[0][0]
+        assert all(m is mapping for m, _ in results)
+        assert mapping.mapping["Downtime"] == "downtime_hours"
+        assert sum(r.valid_rows for _, r in results) == 24
+        assert results[-1][1].errors[0].row == 25
+        assert results[0][1].validated_data[0]["failure_date"] == "2024-01-01"
+
+    def test_optional_columns_do_not_change_confidence(self):
+        headers = ["equipment_id", "description", "equipment_type", "parent"]
+        mapping = DataImportEngine.detect_column_mapping(headers, ImportSource.EQUIPMENT_HIERARCHY, include_optional=True)
+        assert mapping.mapping["parent"] == "parent_id"
+        assert mapping.confidence == 1.0
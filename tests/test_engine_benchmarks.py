@@ -0,0 +1,76 @@
+"""Tests for the engine benchmark harness (run at toy scales)."""
+
+import json
+
+import pytest
+
+from benchmarks.engine_benchmarks import CASES, Fixtures, compare, main, run_benchmarks, run_case
+
+
+@pytest.fixture(scope="module")
+def fixtures():
+    return Fixtures(seed=7)
+
+
+class TestFixtures:
+
+    def test_equipment_count(self, fixtures):
+        assert len(fixtures.equipment(120)) == 120
+
+    def test_hierarchy_parents_first(self, fixtures):
+        nodes = fixtures.hierarchy(500)
+        assert len(nodes) == 500
+        seen = set()
+        for n in nodes:
+            assert n["parent_node_id"] is None or n["parent_node_id"] in seen
+            seen.add(n["node_id"])
+
+
+class TestCases:
+
+    @pytest.mark.parametrize("name", sorted(CASES))
+    def test_case_runs(self, fixtures, name):
+        result = run_case(name, 200, fixtures, repeat=2)
+        assert result.engine == name
+        assert result.scale == 200
+        assert 0 < result.best_s <= result.median_s
+        assert result.unit == CASES[name][0]
+
+    def test_quality_validation_runs_every_rule_family(self, fixtures):
+        results = CASES["quality_validation"][1](fixtures, 500)()
+        families = {r.rule_id.split("-")[0] for r in results}
+        assert {"H", "C", "T", "WP"} <= families
+
+    def test_unknown_case(self):
+        with pytest.raises(ValueError):
+            run_benchmarks(["nope"], scales=(10,))
+
+
+class TestReport:
+
+    def test_report_and_compare(self):
+        report = run_benchmarks(["ocr", "weibull_fit"], scales=(50, 100), repeat=1)
+        assert [(r["engine"], r["scale"]) for r in report["results"]] == [
+            ("ocr", 50), ("weibull_fit", 50), ("ocr", 100), ("weibull_fit", 100),
+        ]
+        json.dumps(report)
+
+        slower = json.loads(json.dumps(report))
+        slower["results"][0]["best_s"] *= 2
+        regressions = compare(report, slower, threshold=0.25)
+        assert [(r["engine"], r["scale"]) for r in regressions] == [("ocr", 50)]
+        assert regressions[0]["change_pct"] == 100.0
+        assert compare(slower, report) == []
+
+    def test_cli_writes_results_and_flags_regressions(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        assert main(["--engines", "ocr", "--scales", "50", "--repeat", "1", "--output", str(baseline)]) == 0
+        data = json.loads(baseline.read_text())
+        assert data["results"][0]["engine"] == "ocr"
+
+        data["results"][0]["best_s"] = 1e-9
+        baseline.write_text(json.dumps(data))
+        assert main([
+            "--engines", "ocr", "--scales", "50", "--repeat", "1",
+            "--output", str(tmp_path / "current.json"), "--compare", str(baseline),
+        ]) == 1
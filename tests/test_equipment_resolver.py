@@ -5,7 +5,7 @@ Validates fuzzy matching, alias lookup, and TAG extraction.
 
 import pytest
 
-from tools.engines.equipment_resolver import EquipmentResolver
+from tools.engines.equipment_resolver import FUZZY_SHORTLIST, EquipmentResolver, TrigramIndex
 
 
 @pytest.fixture
@@ -112,3 +112,68 @@ class TestAlternatives:
                 assert "equipment_id" in alt
                 assert "tag" in alt
                 assert "confidence" in alt
+
+
+class TestTrigramIndex:
+    def test_small_index_returns_every_document(self):
+        index = TrigramIndex()
+        for i, text in enumerate(["alpha", "beta", "gamma"]):
+            index.add(i, text)
+        assert index.candidates("zzz") == [0, 1, 2]
+
+    def test_large_index_shortlists_closest(self):
+        index = TrigramIndex()
+        for i in range(FUZZY_SHORTLIST * 4):
+            index.add(i, f"PMP-SLP-{i:04d}")
+        index.add(999, "BRY-SAG-ML-001")
+        candidates = index.candidates("BRY-SAG-ML-002")
+        assert len(candidates) == FUZZY_SHORTLIST
+        assert index.keys[candidates[-1]] == 999
+
+
+@pytest.fixture
+def large_registry(equipment_registry):
+    filler = [
+        {
+            "equipment_id": f"EQ-FIL-{i:04d}",
+            "tag": f"FIL-XYZ-QR-{i:04d}",
+            "description": f"Filler unit {i}",
+            "description_fr": f"Unite de remplissage {i}",
+            "aliases": [],
+        }
+        for i in range(FUZZY_SHORTLIST * 4)
+    ]
+    return filler + equipment_registry
+
+
+class TestLargeRegistry:
+    def test_fuzzy_tag_found_through_index(self, large_registry):
+        result = EquipmentResolver(large_registry).resolve("BRY-SAG-ML-002")
+        assert result.method == "FUZZY_MATCH"
+        assert result.equipment_id == "EQ-SAG-001"
+
+    def test_description_found_through_index(self, large_registry):
+        result = EquipmentResolver(large_registry).resolve("belt conveyor main ore")
+        assert result.method == "HIERARCHY_SEARCH"
+        assert result.equipment_id == "EQ-CVR-001"
+
+    def test_alternatives_bounded(self, large_registry):
+        result = EquipmentResolver(large_registry).resolve("FIL-XYZ-QR-00")
+        assert 0 < len(result.alternatives) <= 3
+        assert all(alt["tag"] != result.equipment_tag for alt in result.alternatives)
+        confidences = [alt["confidence"] for alt in result.alternatives]
+        assert confidences == sorted(confidences, reverse=True)
+
+
+class TestResolveMany:
+    def test_results_in_input_order(self, resolver):
+        results = resolver.resolve_many(["SAG MILL", "PMP-SLP-001", "SAG MILL", "XYZ"])
+        assert [r.equipment_id if r else None for r in results[:3]] == [
+            "EQ-SAG-001", "EQ-PMP-001", "EQ-SAG-001",
+        ]
+        assert results[0] is results[2]
+
+    def test_matches_single_resolve(self, resolver):
+        inputs = ["BRY-SAG-ML-002", "la pompe à boue Warman"]
+        for single, batch in zip((resolver.resolve(t) for t in inputs), resolver.resolve_many(inputs)):
+            assert single == batch
@@ -109,6 +109,48 @@ class TestBuildExecutionSequence:
             assert t.status == SupportTaskStatus.PENDING
 
 
+class TestCriticalPath:
+
+    def test_schedule_fields(self):
+        result = ExecutionTaskEngine.build_execution_sequence("PKG-1", _basic_tasks())
+        loto = next(t for t in result.tasks if t.task_id == "T-1")
+        guard = next(t for t in result.tasks if t.task_id == "T-2")
+        assert (loto.early_start, loto.early_finish) == (0.0, 0.5)
+        assert guard.early_start == 0.5
+        assert loto.is_critical and guard.is_critical
+        assert result.critical_path_hours == 1.0
+
+    def test_critical_task_ids(self):
+        tasks = [
+            {"task_id": "T-1", "task_type": "LOTO", "estimated_hours": 1.0},
+            {"task_id": "T-2", "task_type": "SCAFFOLDING", "estimated_hours": 4.0},
+            {"task_id": "T-3", "task_type": "GUARD_REMOVAL", "estimated_hours": 0.5},
+        ]
+        result = ExecutionTaskEngine.build_execution_sequence("PKG-CP", tasks)
+        assert result.critical_task_ids == ["T-1", "T-2"]
+        guard = next(t for t in result.tasks if t.task_id == "T-3")
+        assert guard.total_float == 3.5
+
+    def test_explicit_predecessors(self):
+        tasks = [
+            {"task_id": "T-1", "task_type": "CLEANING", "estimated_hours": 1.0, "predecessors": ["T-2"]},
+            {"task_id": "T-2", "task_type": "CRANE", "estimated_hours": 2.0},
+        ]
+        result = ExecutionTaskEngine.build_execution_sequence("PKG-P", tasks)
+        assert [t.task_id for t in result.tasks] == ["T-2", "T-1"]
+        assert result.critical_path_hours == 3.0
+
+    def test_cycle_reported(self):
+        tasks = [
+            {"task_id": "T-1", "task_type": "CRANE", "estimated_hours": 1.0, "predecessors": ["T-2"]},
+            {"task_id": "T-2", "task_type": "MANLIFT", "estimated_hours": 1.0, "predecessors": ["T-1"]},
+        ]
+        result = ExecutionTaskEngine.build_execution_sequence("PKG-C", tasks)
+        assert len(result.tasks) == 2
+        assert {(d.from_task_id, d.to_task_id) for d in result.cycle_dependencies} == {("T-2", "T-1"), ("T-1", "T-2")}
+        assert any("cycle" in w for w in result.warnings)
+
+
 class TestScaffoldingDuration:
 
     def test_low_elevation(self):
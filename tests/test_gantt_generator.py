@@ -102,3 +102,16 @@ class TestExportGanttExcel:
         result = GanttGenerator.export_gantt_excel([], filepath)
         assert os.path.exists(result)
         os.remove(filepath)
+
+    def test_stream_matches_layout(self):
+        import io
+        from openpyxl import load_workbook
+        rows = GanttGenerator.generate_gantt_data(_make_program(2))
+        wb = load_workbook(io.BytesIO(b"".join(GanttGenerator.stream_gantt_excel(rows))))
+        schedule, gantt = wb["Schedule"], wb["Gantt"]
+        assert schedule.max_row == 3
+        assert schedule["A1"].style == "export_header"
+        assert gantt["A1"].value == "Package"
+        assert gantt["A2"].value == rows[0].name
+        bar = [c for c in gantt[2][1:] if c.fill.fill_type == "solid"]
+        assert len(bar) == (rows[0].end_date - rows[0].start_date).days + 1
@@ -66,3 +66,37 @@ class TestBatchAnalyze:
         results = OCREngine.batch_analyze(inputs)
         assert len(results) == 3
         assert all(r.equipment_id.startswith("EQ-") for r in results)
+
+    def test_batch_matches_single(self):
+        inputs = [
+            _make_input(equipment_id=f"EQ-{i}", failure_rate=rate, current_pm_interval_days=days)
+            for i, (rate, days) in enumerate([(0.0, 30), (0.5, 90), (2.0, 365), (8.0, 1000)])
+        ]
+        results = OCREngine.batch_analyze(inputs, beta=2.5)
+        for inp, result in zip(inputs, results):
+            assert result == OCREngine.calculate_optimal_interval(inp, beta=2.5)
+
+    def test_batch_per_item_eta(self):
+        inputs = [_make_input(equipment_id="EQ-A"), _make_input(equipment_id="EQ-B")]
+        results = OCREngine.batch_analyze(inputs, etas=[100.0, None])
+        assert results[0] == OCREngine.calculate_optimal_interval(inputs[0], eta=100.0)
+        assert results[1] == OCREngine.calculate_optimal_interval(inputs[1])
+
+    def test_empty_batch(self):
+        assert OCREngine.batch_analyze([]) == []
+
+
+class TestCostCurve:
+
+    def test_covers_sweep_range(self):
+        curve = OCREngine.cost_curve(_make_input())
+        assert min(curve) == 7
+        assert max(curve) == 730
+        assert len(curve) == 724
+
+    def test_minimum_matches_optimal_interval(self):
+        inp = _make_input()
+        curve = OCREngine.cost_curve(inp)
+        result = OCREngine.calculate_optimal_interval(inp)
+        assert min(curve, key=curve.get) == result.optimal_interval_days
+        assert round(curve[result.optimal_interval_days], 2) == result.cost_at_optimal
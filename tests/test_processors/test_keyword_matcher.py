@@ -0,0 +1,36 @@
+"""Tests for the multi-keyword matcher shared by the field capture detectors."""
+
+import pytest
+from tools.processors.keyword_matcher import KeywordMatcher
+from tools.processors.field_capture_processor import FieldCaptureProcessor, _KEYWORD_MATCHER
+
+
+class TestKeywordMatcher:
+
+    @pytest.mark.parametrize("text", [
+        "bearing overheating due to thermal overload",
+        "corrosive environment near the slurry pump, fuite importante",
+        "hot spot on the shaft, shot blasting nearby",
+        "danger: fire risk, incendie possible",
+        "",
+        "nothing relevant here",
+    ])
+    def test_matches_substring_semantics(self, text):
+        found = _KEYWORD_MATCHER.find(text)
+        assert found == {k for k in _KEYWORD_MATCHER.keywords if k in text}
+
+    def test_contained_keywords(self):
+        matcher = KeywordMatcher(["overload", "thermal overload", "load"])
+        assert matcher.find("thermal overload") == {"overload", "thermal overload", "load"}
+        assert matcher.find("overload") == {"overload", "load"}
+        assert matcher.find("thermal load") == {"load"}
+
+    def test_case_sensitive(self):
+        assert KeywordMatcher(["leak"]).find("LEAK") == set()
+
+    def test_detectors_accept_precomputed_keywords(self):
+        text = "bearing worn, danger near the pump"
+        found = _KEYWORD_MATCHER.find(text)
+        assert FieldCaptureProcessor._detect_component(text, found) == FieldCaptureProcessor._detect_component(text)
+        assert FieldCaptureProcessor._detect_safety_flags(text, found) == FieldCaptureProcessor._detect_safety_flags(text)
+        assert FieldCaptureProcessor._detect_failure_mode(text, found) == FieldCaptureProcessor._detect_failure_mode(text)
@@ -50,3 +50,11 @@ class TestPIIRedactor:
         assert "[REDACTED_EMAIL]" in cleaned
         assert "[REDACTED_ID]" in cleaned
         assert "john@example.com" not in cleaned
+
+    def test_one_item_per_replacement(self):
+        text = "Mail a.b@example.com or c.d@example.org, ask Dr. Martin, badge MAT-4411"
+        cleaned, items = redact(text)
+        placeholders = cleaned.count("[REDACTED_")
+        assert len(items) == placeholders == 4
+        assert items[:2] == ["a.b@example.com", "c.d@example.org"]
+        assert all(item in text for item in items)
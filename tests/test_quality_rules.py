@@ -41,7 +41,12 @@ from tools.models.schemas import (
     AllocatedTask,
     LabourSummary,
 )
-from tools.validators.quality_validator import QualityValidator, ValidationResult
+from tools.validators.quality_validator import (
+    QualityValidator,
+    ValidationCache,
+    ValidationContext,
+    ValidationResult,
+)
 
 
 # ============================================================
@@ -352,3 +357,115 @@ class TestFullValidation:
         # Should have some results (INFO/WARNING level at minimum)
         assert isinstance(results, list)
         # No crashes = pass
+
+
+# ============================================================
+# SHARED INDEXES AND INCREMENTAL RE-VALIDATION
+# ============================================================
+
+def _key(results):
+    return [(r.rule_id, r.severity, r.message, r.entity_id) for r in results]
+
+
+def _task(task_id, name="Inspect motor for vibration", **overrides):
+    fields = dict(
+        task_id=task_id, name=name, name_fr="X", task_type=TaskType.INSPECT,
+        consequences="X", constraint=TaskConstraint.ONLINE, access_time_hours=0,
+        frequency_value=4, frequency_unit=FrequencyUnit.WEEKS,
+    )
+    fields.update(overrides)
+    return MaintenanceTask(**fields)
+
+
+class TestValidationContext:
+    def test_parent_level_checked_through_index(self):
+        """H-01: A child at the same level as its parent is reported."""
+        plant = PlantHierarchyNode(
+            node_id="P", node_type=NodeType.PLANT, name="Plant", name_fr="X", code="P", level=1,
+        )
+        eq1 = PlantHierarchyNode(
+            node_id="E1", node_type=NodeType.EQUIPMENT, name="Pump", name_fr="X", code="E1",
+            parent_node_id="P", level=4,
+        )
+        eq2 = PlantHierarchyNode(
+            node_id="E2", node_type=NodeType.EQUIPMENT, name="Motor", name_fr="X", code="E2",
+            parent_node_id="E1", level=4,
+        )
+        results = QualityValidator.validate_hierarchy([plant, eq1, eq2])
+        h01 = [r for r in results if r.rule_id == "H-01"]
+        assert [r.entity_id for r in h01] == ["E2"]
+        assert "parent 'Pump'" in h01[0].message
+
+    def test_unallocated_tasks_reported_once_in_task_order(self):
+        tasks = [_task("T3"), _task("T1"), _task("T2"), _task("T3")]
+        wp = WorkPackage(
+            name="4W SAG MILL CONMON INSP ON", code="WP", node_id="X",
+            frequency_value=4, frequency_unit=FrequencyUnit.WEEKS,
+            constraint=WPConstraint.ONLINE, access_time_hours=0,
+            work_package_type=WPType.STANDALONE,
+            allocated_tasks=[AllocatedTask(task_id="T1", order=1, operation_number=10)],
+        )
+        results = QualityValidator.validate_work_packages([wp], tasks)
+        assert [r.entity_id for r in results if r.rule_id == "WP-01"] == ["T3", "T2"]
+
+    def test_shared_context_matches_standalone_rules(
+        self, sample_plant_hierarchy_nodes, sample_maintenance_task, sample_work_package,
+    ):
+        tasks = [sample_maintenance_task, _task("T-x", labour_resources=[])]
+        ctx = ValidationContext(
+            nodes=sample_plant_hierarchy_nodes, tasks=tasks, work_packages=[sample_work_package],
+        )
+        assert _key(QualityValidator.validate_hierarchy(sample_plant_hierarchy_nodes, ctx=ctx)) == \
+            _key(QualityValidator.validate_hierarchy(sample_plant_hierarchy_nodes))
+        assert _key(QualityValidator.validate_work_packages([sample_work_package], tasks, ctx=ctx)) == \
+            _key(QualityValidator.validate_work_packages([sample_work_package], tasks))
+
+    def test_validate_tasks_without_failure_modes(self, sample_maintenance_task):
+        assert QualityValidator.validate_tasks([sample_maintenance_task]) == \
+            QualityValidator.validate_tasks([sample_maintenance_task], [])
+
+
+class TestIncrementalValidation:
+    def _data(self):
+        tasks = [_task(f"T{i}", labour_resources=[]) for i in range(3)]
+        wp = WorkPackage(
+            name="4W SAG MILL CONMON INSP ON", code="WP", node_id="X",
+            frequency_value=4, frequency_unit=FrequencyUnit.WEEKS,
+            constraint=WPConstraint.ONLINE, access_time_hours=0,
+            work_package_type=WPType.STANDALONE,
+            allocated_tasks=[AllocatedTask(task_id="T0", order=1, operation_number=10)],
+        )
+        return tasks, [wp]
+
+    def test_unchanged_entities_are_reused(self):
+        tasks, wps = self._data()
+        cache = ValidationCache()
+        first = QualityValidator.run_full_validation(tasks=tasks, work_packages=wps, cache=cache)
+        assert cache.stats() == {"entries": 4, "checked": 4, "reused": 0}
+
+        second = QualityValidator.run_full_validation(tasks=tasks, work_packages=wps, cache=cache)
+        assert _key(second) == _key(first)
+        assert cache.stats()["reused"] == 4
+        assert cache.stats()["checked"] == 4
+
+    def test_only_changed_entities_are_rechecked(self):
+        tasks, wps = self._data()
+        cache = ValidationCache()
+        QualityValidator.run_full_validation(tasks=tasks, work_packages=wps, cache=cache)
+
+        # T0 gains labour: its own check and the WP holding it must re-run
+        tasks[0] = tasks[0].model_copy(update={"labour_resources": [
+            LabourResource(specialty=LabourSpecialty.FITTER, quantity=1, hours_per_person=1),
+        ]})
+        results = QualityValidator.run_full_validation(tasks=tasks, work_packages=wps, cache=cache)
+        assert cache.stats()["checked"] == 4 + 2
+        assert _key(results) == _key(QualityValidator.run_full_validation(tasks=tasks, work_packages=wps))
+        assert not [r for r in results if r.entity_id == "T0" and r.rule_id == "T-11"]
+        assert not [r for r in results if r.rule_id == "WP-11"]
+
+    def test_stale_entries_are_dropped(self):
+        tasks, wps = self._data()
+        cache = ValidationCache()
+        QualityValidator.run_full_validation(tasks=tasks, work_packages=wps, cache=cache)
+        QualityValidator.run_full_validation(tasks=tasks[:1], work_packages=wps, cache=cache)
+        assert cache.stats()["entries"] == 2
@@ -10,6 +10,7 @@ from tools.models.schemas import (
     ResourceConflict,
     EnhancedLevelingResult,
     MultiDayPackage,
+    ScheduleLevelingResult,
 )
 
 
@@ -195,3 +196,65 @@ class TestSplitMultiDayPackage:
         result = SchedulingEngine.split_multi_day_package(package, _make_capacities(), date(2025, 3, 6))
         total_allocated = sum(a["hours"] for a in result.day_allocations)
         assert abs(total_allocated - 50.0) < 0.5
+
+
+class TestLevelSchedule:
+
+    def _pkgs(self, hours_list, team=("MECHANICAL",)):
+        return [
+            {"package_id": f"WP-{i}", "scheduled_shift": "MORNING",
+             "assigned_team": list(team), "total_duration_hours": h}
+            for i, h in enumerate(hours_list)
+        ]
+
+    def test_respects_trade_capacity(self):
+        result = SchedulingEngine.level_schedule(_make_program(self._pkgs([8.0] * 12)), _make_capacities())
+        assert isinstance(result, ScheduleLevelingResult)
+        assert not result.unscheduled_packages
+        assert all(s.assigned_hours <= s.capacity_hours for s in result.resource_slots)
+
+    def test_places_on_thursday_to_sunday(self):
+        program = _make_program(self._pkgs([8.0] * 8))
+        result = SchedulingEngine.level_schedule(program, _make_capacities())
+        dates = {p.scheduled_date for p in result.placements}
+        assert dates <= {date(2025, 3, 6), date(2025, 3, 7), date(2025, 3, 8), date(2025, 3, 9)}
+        assert program.work_packages[0]["scheduled_date"] == result.placements[0].scheduled_date.isoformat()
+
+    def test_balances_load_across_days(self):
+        result = SchedulingEngine.level_schedule(_make_program(self._pkgs([8.0] * 8)), _make_capacities())
+        mech = [s.assigned_hours for s in result.resource_slots if s.specialty == "MECHANICAL"]
+        assert mech == [16.0, 16.0, 16.0, 16.0]
+
+    def test_overflow_reported_unscheduled(self):
+        result = SchedulingEngine.level_schedule(_make_program(self._pkgs([24.0] * 5)), _make_capacities())
+        assert len(result.unscheduled_packages) == 1
+        assert result.conflicts[0].resolution_type == ConflictResolutionType.ADD_SHIFT
+
+    def test_multi_day_split_within_window(self):
+        result = SchedulingEngine.level_schedule(_make_program(self._pkgs([40.0])), _make_capacities())
+        assert len(result.multi_day_packages) == 1
+        md = result.multi_day_packages[0]
+        assert md.total_days == 2
+        assert md.day_allocations[0]["date"] == result.placements[0].scheduled_date.isoformat()
+
+    def test_shutdown_packages_only_in_window(self):
+        program = _make_program(self._pkgs([4.0, 4.0]))
+        attrs = [{"package_id": "WP-0", "shutdown_required": True, "area": "BRY-SAG"},
+                 {"package_id": "WP-1", "shutdown_required": True, "area": "FLT-CEL"}]
+        windows = [{"start_date": "2025-03-08", "end_date": "2025-03-08", "areas": ["BRY-SAG"]}]
+        result = SchedulingEngine.level_schedule(program, _make_capacities(), attrs, windows)
+        assert result.placements[0].scheduled_date == date(2025, 3, 8)
+        assert result.unscheduled_packages == ["WP-1"]
+        assert result.conflicts[0].resolution_type == ConflictResolutionType.EXTEND_WINDOW
+
+    def test_priority_placed_first(self):
+        program = _make_program(self._pkgs([24.0, 24.0, 24.0, 24.0, 24.0]))
+        attrs = [{"package_id": "WP-4", "priority": "1_EMERGENCY"}]
+        result = SchedulingEngine.level_schedule(program, _make_capacities(), attrs)
+        assert "WP-4" not in result.unscheduled_packages
+
+    def test_enhanced_split_starts_at_scheduled_date(self):
+        pkgs = [{"package_id": "WP-BIG", "scheduled_date": "2025-03-06", "scheduled_shift": "MORNING",
+                 "assigned_team": ["MECHANICAL"], "total_duration_hours": 40.0}]
+        result = SchedulingEngine.level_resources_enhanced(_make_program(pkgs), _make_capacities())
+        assert result.multi_day_packages[0].day_allocations[0]["date"] == "2025-03-06"
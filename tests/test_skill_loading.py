@@ -79,3 +79,87 @@ class TestGetAgentSkillsSummary:
         """Non-existent agent should return total_skills=0."""
         summary = get_agent_skills_summary("nonexistent_agent_xyz")
         assert summary["total_skills"] == 0
+
+
+class TestPromptCache:
+    """Tests for the mtime-invalidated skill/prompt cache in agents/_shared/cache.py."""
+
+    @pytest.fixture
+    def agent_dir(self, tmp_path):
+        from agents._shared import cache
+        cache.clear()
+        skill_dir = tmp_path / "skills" / "demo"
+        (skill_dir / "references").mkdir(parents=True)
+        (skill_dir / "CLAUDE.md").write_text("Demo skill body v1", encoding="utf-8")
+        (skill_dir / "references" / "ref.md").write_text("Reference v1", encoding="utf-8")
+        agent = tmp_path / "demo-agent"
+        agent.mkdir()
+        (agent / "CLAUDE.md").write_text("You are a demo agent.", encoding="utf-8")
+        (agent / "skills.yaml").write_text(
+            "skills:\n"
+            f"  - name: demo\n    path: {skill_dir / 'CLAUDE.md'}\n    load_level: 2\n"
+            "    milestone: 1\n    references_to_preload:\n      - references/ref.md\n",
+            encoding="utf-8",
+        )
+        (agent / "config.py").write_text(
+            "from agents._shared.base import AgentConfig, Agent\n\n"
+            "def create_demo_agent_agent():\n"
+            f"    return Agent(AgentConfig(name='Demo', model='m', agent_dir={str(agent)!r}, tools=[]))\n",
+            encoding="utf-8",
+        )
+        yield agent
+        cache.clear()
+
+    @staticmethod
+    def _touch(path, text):
+        import os
+        before = os.stat(path).st_mtime_ns
+        path.write_text(text, encoding="utf-8")
+        os.utime(path, ns=(before + 1_000_000_000, before + 1_000_000_000))
+
+    def _agent(self, agent_dir):
+        from agents._shared.base import Agent, AgentConfig
+        return Agent(AgentConfig(name="Demo", model="m", agent_dir=str(agent_dir), tools=[]))
+
+    def test_second_assembly_is_cached(self, agent_dir):
+        from agents._shared import cache
+        prompt = self._agent(agent_dir).get_system_prompt(1)
+        assert "Demo skill body v1" in prompt and "Reference v1" in prompt
+        misses = cache.stats()["file_misses"]
+        assert self._agent(agent_dir).get_system_prompt(1) == prompt
+        stats = cache.stats()
+        assert stats["file_misses"] == misses
+        assert stats["hits"] == 1
+
+    def test_skill_edit_invalidates_prompt(self, agent_dir):
+        agent = self._agent(agent_dir)
+        agent.get_system_prompt(1)
+        self._touch(agent_dir.parent / "skills" / "demo" / "CLAUDE.md", "Demo skill body v2")
+        assert "Demo skill body v2" in agent.get_system_prompt(1)
+
+    def test_reference_edit_invalidates_skills(self, agent_dir):
+        agent = self._agent(agent_dir)
+        assert agent.config.load_skills_for_milestone(1)[0].references == ["Reference v1"]
+        self._touch(agent_dir.parent / "skills" / "demo" / "references" / "ref.md", "Reference v2")
+        assert agent.config.load_skills_for_milestone(1)[0].references == ["Reference v2"]
+
+    def test_milestones_cached_separately(self, agent_dir):
+        agent = self._agent(agent_dir)
+        assert "<loaded_skills>" in agent.get_system_prompt(1)
+        assert agent.get_system_prompt(2) == "You are a demo agent."
+
+    def test_missing_prompt_raises_and_is_not_cached(self, agent_dir):
+        (agent_dir / "CLAUDE.md").unlink()
+        agent = self._agent(agent_dir)
+        with pytest.raises(FileNotFoundError):
+            agent.get_system_prompt()
+        (agent_dir / "CLAUDE.md").write_text("Restored", encoding="utf-8")
+        assert agent.get_system_prompt() == "Restored"
+
+    def test_warm_up_preloads_every_milestone(self, agent_dir, monkeypatch):
+        from agents._shared import cache, loader
+        monkeypatch.setattr(loader, "AGENTS_ROOT", agent_dir.parent)
+        assert loader.warm_up() == {"demo-agent": 2}  # no milestone + milestone 1
+        before = cache.stats()
+        self._agent(agent_dir).get_system_prompt(1)
+        assert cache.stats()["hits"] == before["hits"] + 1
@@ -131,3 +131,58 @@ class TestReproducibility:
         for n1, n2 in zip(nodes1, nodes2):
             assert n1["name"] == n2["name"]
             assert n1["code"] == n2["code"]
+
+
+class TestFleetGeneration:
+    def test_plants_and_cycled_areas(self, generator):
+        nodes = generator.generate_fleet(num_plants=2, areas_per_plant=10)
+        plants = [n for n in nodes if n["node_type"] == "PLANT"]
+        areas = [n for n in nodes if n["node_type"] == "AREA"]
+        assert [p["code"] for p in plants] == ["OCP-P01", "OCP-P02"]
+        assert len(areas) == 20
+        assert "OCP-P02-BRY2" in {a["code"] for a in areas}
+
+    def test_codes_and_tags_unique_across_plants(self, generator):
+        nodes = generator.generate_fleet(num_plants=3, areas_per_plant=8)
+        codes = [n["code"] for n in nodes]
+        assert len(codes) == len(set(codes))
+        node_ids = {n["node_id"] for n in nodes}
+        assert all(n["parent_node_id"] in node_ids for n in nodes if n["parent_node_id"])
+
+    def test_equipment_density(self, generator):
+        nodes = generator.generate_fleet(num_plants=1, areas_per_plant=8, equipment_per_system=5,
+                                         include_components=False)
+        equipment = [n for n in nodes if n["node_type"] == "EQUIPMENT"]
+        assert len(equipment) == 40
+        assert {n["node_type"] for n in nodes} == {"PLANT", "AREA", "SYSTEM", "EQUIPMENT"}
+        assert {eq["plant_code"] for eq in equipment} == {"OCP-P01"}
+
+
+class TestMultiYearHistory:
+    def test_failure_intervals_within_horizon(self, generator):
+        nodes = generator.generate_fleet(num_plants=1, include_components=False)
+        intervals = generator.generate_failure_intervals(nodes, years=2, failures_per_year=6)
+        assert len(intervals) == sum(n["node_type"] == "EQUIPMENT" for n in nodes)
+        assert all(sum(series) <= 2 * 365 for series in intervals.values())
+        assert sum(len(series) for series in intervals.values()) > 0
+
+    def test_history_spans_years_oldest_first(self, generator):
+        from datetime import date
+        nodes = generator.generate_fleet(num_plants=1, include_components=False)
+        wos = generator.generate_multi_year_history(nodes, years=3, end_date=date(2025, 12, 31))
+        dates = [wo["created_date"] for wo in wos]
+        assert dates == sorted(dates)
+        assert dates[0] < "2023-02-01" and dates[-1] > "2025-11-01"
+        assert len({wo["work_order_id"] for wo in wos}) == len(wos)
+        assert {wo["order_type"] for wo in wos} == {"PM01", "PM02", "PM03"}
+
+    def test_corrective_only(self, generator):
+        nodes = generator.generate_fleet(num_plants=1, include_components=False)
+        wos = generator.generate_multi_year_history(nodes, years=1, pm_interval_days=None)
+        assert {wo["order_type"] for wo in wos} == {"PM03"}
+
+    def test_backlog_items_validate(self, generator):
+        from tools.models.schemas import BacklogItem
+        nodes = generator.generate_fleet(num_plants=1, include_components=False)
+        items = [BacklogItem(**item) for item in generator.generate_backlog(nodes, 50)]
+        assert len({i.backlog_id for i in items}) == 50
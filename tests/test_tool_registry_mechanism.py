@@ -11,6 +11,8 @@ import pytest
 from agents.tool_wrappers.registry import (
     tool, call_tool, call_tool_strict, list_tools,
     is_tool_error, ToolExecutionError, TOOL_REGISTRY,
+    cache_stats, clear_cache, configure_cache,
+    DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL_SECONDS,
 )
 
 
@@ -215,3 +217,80 @@ class TestIsToolError:
 
     def test_false_for_none(self):
         assert is_tool_error(None) is False
+
+
+class TestResultCache:
+    """Tests for the opt-in result cache of cacheable tools."""
+
+    def setup_method(self):
+        clear_cache()
+        self.calls = 0
+
+    def teardown_method(self):
+        to_remove = [k for k in TOOL_REGISTRY if k.startswith(_PREFIX)]
+        for k in to_remove:
+            del TOOL_REGISTRY[k]
+        configure_cache(DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL_SECONDS)
+
+    def _register(self, cacheable=True, fail=False):
+        @tool(f"{_PREFIX}pure", "Pure tool", cacheable=cacheable)
+        def pure(a: int, b: dict | None = None):
+            self.calls += 1
+            if fail:
+                raise RuntimeError("boom")
+            return {"a": a, "b": b}
+
+    def test_repeated_call_served_from_cache(self):
+        self._register()
+        first = call_tool(f"{_PREFIX}pure", {"a": 1, "b": {"x": 1, "y": 2}})
+        second = call_tool(f"{_PREFIX}pure", {"b": {"y": 2, "x": 1}, "a": 1})
+        assert first == second
+        assert self.calls == 1
+        stats = cache_stats()["per_tool"][f"{_PREFIX}pure"]
+        assert stats == {"hits": 1, "misses": 1}
+
+    def test_different_arguments_miss(self):
+        self._register()
+        call_tool(f"{_PREFIX}pure", {"a": 1})
+        call_tool(f"{_PREFIX}pure", {"a": 2})
+        assert self.calls == 2
+
+    def test_not_cacheable_by_default(self):
+        self._register(cacheable=False)
+        call_tool(f"{_PREFIX}pure", {"a": 1})
+        call_tool(f"{_PREFIX}pure", {"a": 1})
+        assert self.calls == 2
+        assert f"{_PREFIX}pure" not in cache_stats()["per_tool"]
+
+    def test_exceptions_not_cached(self):
+        self._register(fail=True)
+        assert is_tool_error(call_tool(f"{_PREFIX}pure", {"a": 1}))
+        with pytest.raises(ToolExecutionError):
+            call_tool_strict(f"{_PREFIX}pure", {"a": 1})
+        assert self.calls == 2
+
+    def test_lru_eviction(self):
+        configure_cache(maxsize=2)
+        self._register()
+        for a in (1, 2, 1, 3):  # 2 is least recently used when 3 arrives
+            call_tool(f"{_PREFIX}pure", {"a": a})
+        assert self.calls == 3
+        call_tool(f"{_PREFIX}pure", {"a": 1})
+        assert self.calls == 3
+        call_tool(f"{_PREFIX}pure", {"a": 2})
+        assert self.calls == 4
+        assert cache_stats()["size"] == 2
+
+    def test_ttl_expiry(self):
+        configure_cache(ttl_seconds=-1)
+        self._register()
+        call_tool(f"{_PREFIX}pure", {"a": 1})
+        call_tool(f"{_PREFIX}pure", {"a": 1})
+        assert self.calls == 2
+
+    def test_list_tools_reports_flag(self):
+        self._register()
+        entry = next(t for t in list_tools() if t["name"] == f"{_PREFIX}pure")
+        assert entry["cacheable"] is True
+        import agents.tool_wrappers.fm_lookup_tools  # noqa: F401
+        assert next(t for t in list_tools() if t["name"] == "validate_fm_combination")["cacheable"] is True
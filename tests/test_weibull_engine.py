@@ -2,6 +2,7 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from tools.engines.weibull_engine import WeibullEngine
@@ -194,3 +195,130 @@ class TestPredict:
             current_age_days=50,
         )
         assert result.weibull_params.r_squared == 0.0
+
+
+class TestBatch:
+    SERIES = [
+        [120, 150, 130, 140, 135],
+        [100],
+        [],
+        [500, 480, 450, 420, 400, 380, 350],
+        [5, 5, 5, 5],
+    ]
+
+    def test_fit_batch_matches_single_fits(self):
+        fit = WeibullEngine.fit_batch(self.SERIES)
+        assert len(fit) == len(self.SERIES)
+        for i, series in enumerate(self.SERIES):
+            assert fit.params(i) == WeibullEngine.fit_parameters(series)
+
+    def test_fit_batch_empty_input(self):
+        fit = WeibullEngine.fit_batch([])
+        assert len(fit) == 0
+
+    def test_predict_batch_arrays(self):
+        ages = [100, 50, 10, 300, 2]
+        batch = WeibullEngine.predict_batch(self.SERIES, ages)
+        assert batch.reliability_current.shape == (5,)
+        assert np.all((batch.reliability_current >= 0) & (batch.reliability_current <= 1))
+        assert np.all(batch.predicted_failure_window_days >= 0)
+        assert np.all(batch.risk_score <= 100)
+        assert batch.failure_pattern[0] == WeibullEngine.classify_failure_pattern(batch.fit.beta[0]).value
+
+    def test_predict_is_thin_wrapper(self):
+        batch = WeibullEngine.predict_batch(self.SERIES, [100] * 5, confidence_level=0.8)
+        for i, series in enumerate(self.SERIES):
+            single = WeibullEngine.predict("EQ", "TAG", series, 100, confidence_level=0.8)
+            row = WeibullEngine.prediction_from_batch(batch, i, "EQ", "TAG")
+            assert row.model_dump(exclude={"prediction_id", "predicted_at"}) == \
+                single.model_dump(exclude={"prediction_id", "predicted_at"})
+
+    def test_mismatched_ages(self):
+        with pytest.raises(ValueError):
+            WeibullEngine.predict_batch(self.SERIES, [100])
+
+    def test_classify_failure_patterns_vectorised(self):
+        betas = np.array([0.5, 1.0, 1.3, 1.7, 2.5, 4.0])
+        patterns = WeibullEngine.classify_failure_patterns(betas)
+        assert list(patterns) == [
+            WeibullEngine.classify_failure_pattern(b).value for b in betas
+        ]
+
+
+class TestMaximumLikelihood:
+    @staticmethod
+    def _sample(beta, eta, size, gamma=0.0, seed=0):
+        rng = np.random.default_rng(seed)
+        return list(gamma + eta * rng.weibull(beta, size=size))
+
+    def test_recovers_parameters_complete_data(self):
+        data = self._sample(2.5, 200.0, 2000)
+        fit = WeibullEngine.fit_mle_batch([data])
+        assert fit.converged[0]
+        assert abs(fit.beta[0] - 2.5) < 0.15
+        assert abs(fit.eta[0] - 200.0) < 5.0
+        assert fit.iterations <= 10
+
+    def test_bounds_bracket_estimate(self):
+        fit = WeibullEngine.fit_mle_batch([self._sample(2.0, 100.0, 50)], confidence_level=0.95)
+        bounds = fit.bounds(0)
+        assert bounds["beta_lower"] < fit.beta[0] < bounds["beta_upper"]
+        assert bounds["eta_lower"] < fit.eta[0] < bounds["eta_upper"]
+
+    def test_suspensions_raise_characteristic_life(self):
+        failures = [100, 120, 140, 160, 180]
+        without = WeibullEngine.fit_mle(failures)
+        with_suspensions = WeibullEngine.fit_mle(failures, suspensions=[200, 220, 240])
+        assert with_suspensions.eta > without.eta
+        assert with_suspensions.sample_size == 8
+
+    def test_censored_data_recovers_parameters(self):
+        rng = np.random.default_rng(1)
+        times = 150.0 * rng.weibull(1.8, size=3000)
+        censor = rng.uniform(0, 300, size=3000)
+        fit = WeibullEngine.fit_mle_batch(
+            [list(times[times <= censor])], [list(censor[times > censor])],
+        )
+        assert abs(fit.beta[0] - 1.8) < 0.15
+        assert abs(fit.eta[0] - 150.0) < 8.0
+
+    def test_three_parameter_location(self):
+        # Small sample: the first failure sits well above the true location
+        data = self._sample(2.0, 100.0, 60, gamma=50.0, seed=2)
+        fit = WeibullEngine.fit_mle_batch([data], three_parameter=True)
+        assert fit.gamma[0] < min(data) - 3.0
+        assert fit.params(0).gamma == fit.gamma[0]
+
+        # Brute-force profile likelihood over gamma in [0, first failure)
+        grid = np.linspace(0.0, min(data) * (1 - 1e-6), 2001)
+        profile = WeibullEngine.fit_mle_batch([[x - g for x in data] for g in grid])
+        loglik = np.where(profile.beta >= 1.0, profile.log_likelihood, -np.inf)
+        best = int(np.argmax(loglik))
+        assert abs(fit.gamma[0] - grid[best]) < 0.5
+        assert fit.log_likelihood[0] >= loglik[best] - 1e-3
+        two_param = WeibullEngine.fit_mle_batch([data])
+        assert fit.log_likelihood[0] > two_param.log_likelihood[0]
+
+    def test_fallbacks(self):
+        fit = WeibullEngine.fit_mle_batch([[], [5], [5, 5]], [[], [10], []])
+        assert not fit.converged.any()
+        assert list(fit.beta) == [1.0, 1.0, 1.0]
+        assert list(fit.eta) == [365.0, 15.0, 5.0]
+        assert np.isnan(fit.beta_lower).all()
+
+    def test_batch_matches_single(self):
+        series = [self._sample(1.5, 300.0, 20, seed=s) for s in range(5)]
+        fit = WeibullEngine.fit_mle_batch(series)
+        for i, data in enumerate(series):
+            assert fit.params(i) == WeibullEngine.fit_mle(data)
+
+    def test_mismatched_suspensions(self):
+        with pytest.raises(ValueError):
+            WeibullEngine.fit_mle_batch([[1, 2, 3]], [[], []])
+
+    def test_predict_from_mle_fit(self):
+        fit = WeibullEngine.fit_mle_batch([[120, 150, 130, 140, 135]], [[160, 170]])
+        batch = WeibullEngine.predict_from_fit(fit, [100])
+        prediction = WeibullEngine.prediction_from_batch(batch, 0, "EQ", "TAG")
+        assert prediction.weibull_params.sample_size == 7
+        assert prediction.status == ApprovalStatus.DRAFT
@@ -34,6 +34,23 @@ class WorkPackageGroup:
     requires_shutdown: bool = False
 
 
+@dataclass
+class GroupingCache:
+    """find_all_groups results kept per area between optimisation runs.
+
+    Every grouping strategy keys on the equipment tag or the area, and a tag
+    always belongs to one area, so groups (and their de-duplication) never
+    cross areas. An area only has to be regrouped when one of its entries
+    changes.
+    """
+    entries: dict[str, BacklogEntry] = field(default_factory=dict)
+    area_groups: dict[str, list[WorkPackageGroup]] = field(default_factory=dict)
+
+
+# Tie-break order of find_all_groups for groups with equal total hours
+_GROUP_KIND_ORDER = {"GRP-EQ-": 0, "GRP-AREA-": 1, "GRP-SD-": 2}
+
+
 class BacklogGrouper:
     """Groups backlog items into executable work packages."""
 
@@ -131,6 +148,62 @@ class BacklogGrouper:
 
         return unique_groups
 
+    @classmethod
+    def update_groups(
+        cls,
+        cache: GroupingCache,
+        upserts: list[BacklogEntry],
+        removed_ids: set[str] | None = None,
+    ) -> list[WorkPackageGroup]:
+        """Incremental find_all_groups: regroup only areas touched by changes.
+
+        Entries are kept ordered by backlog_id. The result equals
+        find_all_groups over all cached entries in that order.
+
+        Args:
+            cache: Grouping state from the previous run (mutated in place).
+            upserts: New or modified entries.
+            removed_ids: Backlog ids no longer in the backlog (applied after upserts).
+        """
+        dirty_areas: set[str] = set()
+        inserted = False
+        for entry in upserts:
+            old = cache.entries.get(entry.backlog_id)
+            if old == entry:
+                continue
+            if old is None:
+                inserted = True
+            else:
+                dirty_areas.add(old.area_code)
+            cache.entries[entry.backlog_id] = entry
+            dirty_areas.add(entry.area_code)
+        for backlog_id in removed_ids or ():
+            old = cache.entries.pop(backlog_id, None)
+            if old is not None:
+                dirty_areas.add(old.area_code)
+        if inserted:
+            cache.entries = dict(sorted(cache.entries.items()))
+
+        if dirty_areas:
+            by_area: dict[str, list[BacklogEntry]] = defaultdict(list)
+            for entry in cache.entries.values():
+                if entry.area_code in dirty_areas:
+                    by_area[entry.area_code].append(entry)
+            for area in dirty_areas:
+                if by_area.get(area):
+                    cache.area_groups[area] = cls.find_all_groups(by_area[area])
+                else:
+                    cache.area_groups.pop(area, None)
+
+        # Reproduce find_all_groups ordering: hours desc, then strategy, then first appearance
+        position = {backlog_id: i for i, backlog_id in enumerate(cache.entries)}
+
+        def sort_key(group: WorkPackageGroup) -> tuple:
+            kind = next(rank for prefix, rank in _GROUP_KIND_ORDER.items() if group.group_id.startswith(prefix))
+            return (-group.total_hours, kind, min(position[e.backlog_id] for e in group.items))
+
+        return sorted((g for groups in cache.area_groups.values() for g in groups), key=sort_key)
+
     @staticmethod
     def stratify(items: list[BacklogEntry]) -> dict:
         """Stratify backlog by reason, priority, and readiness."""
@@ -0,0 +1,287 @@
+"""Columnar Engine — Arrow/Parquet exchange of analytics datasets.
+
+Arrow schemas are derived from the Pydantic models, so a Parquet file or an
+Arrow IPC stream of work orders, hierarchy nodes, KPI snapshots or Weibull
+predictions carries the same typed columns the API validates:
+
+- str → string, int → int64, float → float64, bool → bool,
+  date → date32, datetime → timestamp[us]
+- str enums → dictionary-encoded string (categoricals in pandas)
+- nested models → struct, lists → list, other dicts → JSON string
+- Optional[...] fields are nullable; the others are not
+
+Rows are converted in record batches and written incrementally, and files
+are read back batch by batch, so neither direction holds a whole dataset as
+Python objects. Numeric columns load into NumPy without copying when they
+have a single chunk and no nulls (see ``to_numpy`` / ``list_to_numpy``).
+
+Deterministic — no LLM required.
+"""
+
+from __future__ import annotations
+
+import json
+import types
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Union, get_args, get_origin
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet as pq
+from pydantic import BaseModel
+
+from tools.engines.data_export_engine import spooled_chunks
+
+# Rows converted per record batch
+DEFAULT_BATCH_ROWS = 10_000
+
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+_PARQUET_MAGIC = b"PAR1"
+_ARROW_FILE_MAGIC = b"ARROW1"
+
+_SCALAR_TYPES = {
+    str: pa.string(),
+    int: pa.int64(),
+    float: pa.float64(),
+    bool: pa.bool_(),
+    date: pa.date32(),
+    datetime: pa.timestamp("us"),
+}
+
+
+def _unwrap_optional(annotation) -> tuple[Any, bool]:
+    """(inner annotation, nullable) for X | None / Optional[X]."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0], len(args) < len(get_args(annotation))
+    return annotation, False
+
+
+def arrow_type(annotation) -> tuple[pa.DataType, bool]:
+    """Arrow type of a Pydantic field annotation and whether it is nullable."""
+    annotation, nullable = _unwrap_optional(annotation)
+    if annotation in _SCALAR_TYPES:
+        return _SCALAR_TYPES[annotation], nullable
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return pa.dictionary(pa.int32(), pa.string()), nullable
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return pa.struct(list(arrow_schema(annotation))), nullable
+    if get_origin(annotation) in (list, tuple, set, frozenset):
+        args = get_args(annotation)
+        item_type, _ = arrow_type(args[0]) if args else (pa.string(), True)
+        return pa.list_(item_type), nullable
+    # dict, Any and anything else travel as JSON text
+    return pa.string(), nullable
+
+
+def arrow_schema(
+    model: type[BaseModel],
+    fields: Iterable[str] | None = None,
+    extra: dict[str, pa.DataType] | None = None,
+) -> pa.Schema:
+    """Arrow schema of a Pydantic model.
+
+    Args:
+        model: Source model.
+        fields: Model fields to include, in this order (default: all).
+        extra: Additional nullable columns (e.g. database-only columns).
+    """
+    model_fields = model.model_fields
+    names = list(fields) if fields is not None else list(model_fields)
+    columns = []
+    for name in names:
+        data_type, nullable = arrow_type(model_fields[name].annotation)
+        columns.append(pa.field(name, data_type, nullable=nullable))
+    for name, data_type in (extra or {}).items():
+        columns.append(pa.field(name, data_type, nullable=True))
+    return pa.schema(columns)
+
+
+def _convert(value, data_type: pa.DataType):
+    """Python value as Arrow expects it for a column of ``data_type``."""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    if pa.types.is_struct(data_type) and isinstance(value, dict):
+        return {f.name: _convert(value.get(f.name), f.type) for f in data_type}
+    if pa.types.is_list(data_type) and isinstance(value, (list, tuple, set, frozenset)):
+        return [_convert(v, data_type.value_type) for v in value]
+    if pa.types.is_string(data_type) and not isinstance(value, str):
+        return json.dumps(value, default=str)
+    if pa.types.is_timestamp(data_type) and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if pa.types.is_date(data_type) and isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+
+class _ChunkSink:
+    """Write-only file object collecting what Arrow writes between reads."""
+
+    closed = False
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ColumnarEngine:
+    """Converts model-shaped rows to and from Arrow, Parquet and NumPy."""
+
+    # ── Writing ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def record_batches(
+        rows: Iterable[dict | BaseModel],
+        schema: pa.Schema,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+    ) -> Iterator[pa.RecordBatch]:
+        """Typed record batches of at most ``batch_rows`` rows.
+
+        Rows may be dicts or models; keys outside the schema are ignored and
+        missing ones are null.
+        """
+        columns: list[list] = [[] for _ in schema]
+        count = 0
+
+        def batch() -> pa.RecordBatch:
+            arrays = [pa.array(values, type=f.type) for values, f in zip(columns, schema)]
+            return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+        for row in rows:
+            if isinstance(row, BaseModel):
+                row = row.model_dump()
+            for values, f in zip(columns, schema):
+                values.append(_convert(row.get(f.name), f.type))
+            count += 1
+            if count >= batch_rows:
+                yield batch()
+                columns = [[] for _ in schema]
+                count = 0
+        if count:
+            yield batch()
+
+    @staticmethod
+    def to_table(rows: Iterable[dict | BaseModel], schema: pa.Schema) -> pa.Table:
+        return pa.Table.from_batches(list(ColumnarEngine.record_batches(rows, schema)), schema=schema)
+
+    @staticmethod
+    def write_parquet(
+        batches: Iterable[pa.RecordBatch],
+        schema: pa.Schema,
+        target: str | Path | IO[bytes],
+        compression: str = "zstd",
+    ) -> None:
+        """Write batches to a Parquet file, one row group per batch."""
+        with pq.ParquetWriter(target, schema, compression=compression) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+
+    @staticmethod
+    def stream_parquet(batches: Iterable[pa.RecordBatch], schema: pa.Schema) -> Iterator[bytes]:
+        """Parquet bytes in chunks (the footer is written last, so the file is spooled)."""
+        return spooled_chunks(lambda f: ColumnarEngine.write_parquet(batches, schema, f))
+
+    @staticmethod
+    def stream_ipc(batches: Iterable[pa.RecordBatch], schema: pa.Schema) -> Iterator[bytes]:
+        """Arrow IPC stream bytes, yielded as each batch is written."""
+        sink = _ChunkSink()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            yield sink.take()
+            for batch in batches:
+                writer.write_batch(batch)
+                yield sink.take()
+        tail = sink.take()
+        if tail:
+            yield tail
+
+    # ── Reading ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def read_batches(
+        source: str | Path | IO[bytes],
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+    ) -> Iterator[pa.RecordBatch]:
+        """Record batches of a Parquet file, Arrow IPC file or Arrow IPC stream.
+
+        The format is recognised from the leading magic bytes.
+        """
+        f = open(source, "rb") if isinstance(source, (str, Path)) else source
+        try:
+            start = f.tell()
+            magic = f.read(6)
+            f.seek(start)
+            if magic[:4] == _PARQUET_MAGIC:
+                yield from pq.ParquetFile(f).iter_batches(batch_size=batch_rows)
+            elif magic == _ARROW_FILE_MAGIC:
+                reader = pa.ipc.open_file(f)
+                for i in range(reader.num_record_batches):
+                    yield reader.get_batch(i)
+            else:
+                yield from pa.ipc.open_stream(f)
+        finally:
+            if f is not source:
+                f.close()
+
+    @staticmethod
+    def read_table(source: str | Path | IO[bytes]) -> pa.Table:
+        batches = list(ColumnarEngine.read_batches(source))
+        if not batches:
+            raise ValueError("No record batches in columnar source")
+        return pa.Table.from_batches(batches)
+
+    @staticmethod
+    def iter_rows(source: str | Path | IO[bytes], batch_rows: int = DEFAULT_BATCH_ROWS) -> Iterator[list[dict]]:
+        """Rows as lists of dicts, one list per record batch (for list[dict] importers)."""
+        for batch in ColumnarEngine.read_batches(source, batch_rows):
+            yield batch.to_pylist()
+
+    # ── NumPy ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def to_numpy(column: pa.Array | pa.ChunkedArray) -> np.ndarray:
+        """A numeric column as a NumPy array.
+
+        Zero-copy (a read-only view of the Arrow buffer) for a single chunk
+        without nulls; otherwise chunks are concatenated and nulls become NaN.
+        """
+        if isinstance(column, pa.ChunkedArray):
+            column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        if column.null_count:
+            return column.to_numpy(zero_copy_only=False).astype(float)
+        return column.to_numpy(zero_copy_only=True)
+
+    @staticmethod
+    def list_to_numpy(column: pa.Array | pa.ChunkedArray) -> tuple[np.ndarray, np.ndarray]:
+        """A list<number> column as (flat values, length per row).
+
+        The ragged layout of fleet data (e.g. failure intervals per
+        equipment) without building Python lists; the values are a view of
+        the Arrow buffer when the column has one chunk and no null items.
+        """
+        if isinstance(column, pa.ChunkedArray):
+            column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        offsets = column.offsets.to_numpy()
+        lengths = np.diff(offsets).astype(np.int64)
+        values = ColumnarEngine.to_numpy(column.values.slice(offsets[0], offsets[-1] - offsets[0]))
+        return values, lengths
@@ -0,0 +1,261 @@
+"""Critical Path Engine — CPM scheduling for execution and shutdown networks.
+
+Forward and backward pass over a finish-to-start task network in
+O(V+E): early/late start and finish, total and free float, and the
+critical task list. Dependency cycles are detected (Tarjan SCC) and the
+edges that form them are reported and left out of the schedule.
+
+The network keeps, per task, its early start (longest path from the
+start) and its tail (longest path after it to the end). Late dates are
+derived from the tail and the project duration, so changing one task's
+duration only revisits its descendants (early starts) and ancestors
+(tails) — which makes what-if analysis on large shutdown networks
+interactive.
+
+Deterministic — no LLM required.
+"""
+
+import heapq
+import operator
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable
+
+# Tasks whose total float is within this tolerance are critical
+FLOAT_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class TaskSchedule:
+    """CPM dates (hours from the network start) and floats of one task."""
+    early_start: float
+    early_finish: float
+    late_start: float
+    late_finish: float
+    total_float: float
+    free_float: float
+    is_critical: bool
+
+
+def _topological_order(succs: list[list[int]]) -> list[int]:
+    """Kahn's algorithm; roots and successors are taken in input order."""
+    in_degree = [0] * len(succs)
+    for targets in succs:
+        for j in targets:
+            in_degree[j] += 1
+    queue = deque(i for i, d in enumerate(in_degree) if d == 0)
+    order: list[int] = []
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        for j in succs[i]:
+            in_degree[j] -= 1
+            if in_degree[j] == 0:
+                queue.append(j)
+    return order
+
+
+def _cycle_edges(succs: list[list[int]], nodes: list[int]) -> set[tuple[int, int]]:
+    """Edges lying on a cycle: both ends in the same strongly connected component.
+
+    Iterative Tarjan restricted to `nodes` (the tasks Kahn could not order).
+    """
+    members = set(nodes)
+    index: dict[int, int] = {}
+    low: dict[int, int] = {}
+    component: dict[int, int] = {}
+    stack: list[int] = []
+    on_stack: set[int] = set()
+    components = 0
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, 0)]
+        while work:
+            v, i = work[-1]
+            targets = succs[v]
+            if i < len(targets):
+                work[-1] = (v, i + 1)
+                w = targets[i]
+                if w not in members:
+                    continue
+                if w not in index:
+                    index[w] = low[w] = len(index)
+                    stack.append(w)
+                    on_stack.add(w)
+                    work.append((w, 0))
+                elif w in on_stack:
+                    low[v] = min(low[v], index[w])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack.discard(w)
+                    component[w] = components
+                    if w == v:
+                        break
+                components += 1
+
+    return {
+        (v, w) for v in nodes for w in succs[v]
+        if w in component and component[w] == component[v]
+    }
+
+
+class CriticalPathNetwork:
+    """Finish-to-start task network with incrementally maintained CPM dates."""
+
+    def __init__(self, durations: dict[str, float], edges: Iterable[tuple[str, str]]):
+        """
+        Args:
+            durations: task_id → duration in hours, in the preferred order
+                for tasks that are not constrained relative to each other.
+            edges: (predecessor_id, successor_id) pairs. Unknown ids and
+                duplicates are ignored.
+        """
+        self.ids = list(durations)
+        self._index = {task_id: i for i, task_id in enumerate(self.ids)}
+        self._duration = [float(durations[task_id]) for task_id in self.ids]
+        n = len(self.ids)
+
+        succs: list[list[int]] = [[] for _ in range(n)]
+        seen: set[tuple[int, int]] = set()
+        for from_id, to_id in edges:
+            i, j = self._index.get(from_id), self._index.get(to_id)
+            if i is None or j is None or (i, j) in seen:
+                continue
+            seen.add((i, j))
+            succs[i].append(j)
+
+        # Edges on a dependency cycle, reported and left out of the schedule
+        self.cycle_edges: list[tuple[str, str]] = []
+        order = _topological_order(succs)
+        if len(order) < n:
+            placed = set(order)
+            cyclic = _cycle_edges(succs, [i for i in range(n) if i not in placed])
+            self.cycle_edges = [
+                (self.ids[i], self.ids[j]) for i in range(n) for j in succs[i] if (i, j) in cyclic
+            ]
+            succs = [[j for j in targets if (i, j) not in cyclic] for i, targets in enumerate(succs)]
+            order = _topological_order(succs)
+
+        preds: list[list[int]] = [[] for _ in range(n)]
+        for i, targets in enumerate(succs):
+            for j in targets:
+                preds[j].append(i)
+        self._succs = succs
+        self._preds = preds
+        self._order = order
+        self._rank = [0] * n
+        for rank, i in enumerate(order):
+            self._rank[i] = rank
+
+        d = self._duration
+        self._early_start = es = [0.0] * n
+        for i in order:
+            if preds[i]:
+                es[i] = max(es[p] + d[p] for p in preds[i])
+        self._tail = tail = [0.0] * n
+        for i in reversed(order):
+            if succs[i]:
+                tail[i] = max(d[s] + tail[s] for s in succs[i])
+        self._update_project_duration()
+
+    @classmethod
+    def from_sequence(cls, sequence) -> "CriticalPathNetwork":
+        """Network of an ExecutionSequence (tasks and their dependencies)."""
+        return cls(
+            {t.task_id: t.estimated_hours for t in sequence.tasks},
+            [(dep.from_task_id, dep.to_task_id) for dep in sequence.dependencies],
+        )
+
+    def _update_project_duration(self):
+        self.project_duration = max(map(operator.add, self._early_start, self._duration), default=0.0)
+
+    @property
+    def order(self) -> list[str]:
+        """Task ids in topological order (cycle edges ignored)."""
+        return [self.ids[i] for i in self._order]
+
+    def duration(self, task_id: str) -> float:
+        return self._duration[self._index[task_id]]
+
+    def schedule(self, task_id: str) -> TaskSchedule:
+        i = self._index[task_id]
+        d = self._duration[i]
+        early_start = self._early_start[i]
+        early_finish = early_start + d
+        late_finish = self.project_duration - self._tail[i]
+        late_start = late_finish - d
+        total_float = late_start - early_start
+        next_start = min((self._early_start[s] for s in self._succs[i]), default=self.project_duration)
+        return TaskSchedule(
+            early_start=early_start,
+            early_finish=early_finish,
+            late_start=late_start,
+            late_finish=late_finish,
+            total_float=total_float,
+            free_float=next_start - early_finish,
+            is_critical=total_float <= FLOAT_TOLERANCE,
+        )
+
+    def schedules(self) -> dict[str, TaskSchedule]:
+        """Schedule of every task, in topological order."""
+        return {task_id: self.schedule(task_id) for task_id in self.order}
+
+    def critical_tasks(self) -> list[str]:
+        """Tasks with zero total float, in topological order."""
+        end, es, d, tail = self.project_duration, self._early_start, self._duration, self._tail
+        return [
+            self.ids[i] for i in self._order
+            if end - tail[i] - d[i] - es[i] <= FLOAT_TOLERANCE
+        ]
+
+    def set_duration(self, task_id: str, hours: float) -> None:
+        """Change one task's duration, revisiting only the affected tasks."""
+        i = self._index[task_id]
+        hours = float(hours)
+        if hours == self._duration[i]:
+            return
+        self._duration[i] = hours
+        self._propagate_early_starts(self._succs[i])
+        self._propagate_tails(self._preds[i])
+        self._update_project_duration()
+
+    def _propagate_early_starts(self, start: list[int]):
+        es, d, preds, succs, rank = self._early_start, self._duration, self._preds, self._succs, self._rank
+        heap = [(rank[i], i) for i in start]
+        heapq.heapify(heap)
+        queued = set(start)
+        while heap:
+            _, i = heapq.heappop(heap)
+            value = max(es[p] + d[p] for p in preds[i])
+            if value != es[i]:
+                es[i] = value
+                for s in succs[i]:
+                    if s not in queued:
+                        queued.add(s)
+                        heapq.heappush(heap, (rank[s], s))
+
+    def _propagate_tails(self, start: list[int]):
+        tail, d, preds, succs, rank = self._tail, self._duration, self._preds, self._succs, self._rank
+        heap = [(-rank[i], i) for i in start]
+        heapq.heapify(heap)
+        queued = set(start)
+        while heap:
+            _, i = heapq.heappop(heap)
+            value = max(d[s] + tail[s] for s in succs[i])
+            if value != tail[i]:
+                tail[i] = value
+                for p in preds[i]:
+                    if p not in queued:
+                        queued.add(p)
+                        heapq.heappush(heap, (-rank[p], p))
@@ -1,14 +1,34 @@
 """Data Export Engine — Phase 6.
 
 Generates structured data for export as Excel/CSV/PDF.
-This engine produces the DATA structures; actual file generation
-happens in the API/service layer.
+The prepare_* methods produce the DATA structures (ExportResult);
+file generation happens in the API/service layer.
+
+Large exports are streamed instead: the *_sheet methods return
+SheetStream objects whose rows are generated lazily, and the stream_*
+writers turn them into CSV, NDJSON or XLSX bytes chunk by chunk. XLSX is
+written with an openpyxl write-only workbook and shared named styles, so
+memory stays bounded whatever the number of rows (e.g. a 500k-row work
+order history).
 
 Deterministic — no LLM required.
 """
 
 from __future__ import annotations
 
+import csv
+import io
+import json
+import tempfile
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import IO, Callable, Iterable, Iterator
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
 from tools.models.schemas import (
     ExportFormat,
     ExportResult,
@@ -16,6 +36,98 @@ from tools.models.schemas import (
     ExportSheet,
 )
 
+# Rows encoded per chunk by the CSV/NDJSON writers
+STREAM_BATCH_ROWS = 1000
+# Bytes per chunk when streaming a finished XLSX file
+STREAM_CHUNK_BYTES = 64 * 1024
+# XLSX output is kept in memory up to this size, then spooled to disk
+_XLSX_SPOOL_BYTES = 8 * 1024 * 1024
+
+# Streaming format → (media type, file extension)
+STREAM_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+}
+
+HEADER_STYLE = "export_header"
+CELL_STYLE = "export_cell"
+
+THIN_BORDER = Border(
+    left=Side(style="thin"), right=Side(style="thin"),
+    top=Side(style="thin"), bottom=Side(style="thin"),
+)
+
+
+@dataclass
+class SheetStream:
+    """A sheet whose rows are generated lazily; it can be written once."""
+    name: str
+    headers: list[str]
+    rows: Iterable[list]
+
+
+def add_named_styles(wb: Workbook) -> None:
+    """Register the shared header and cell styles on a workbook.
+
+    Cells refer to a named style by name, so a write-only workbook stores
+    one style record however many cells use it.
+    """
+    wb.add_named_style(NamedStyle(
+        name=HEADER_STYLE,
+        font=Font(bold=True, color="FFFFFF", name="Arial", size=10),
+        fill=PatternFill("solid", fgColor="4472C4"),
+        alignment=Alignment(horizontal="center"),
+        border=THIN_BORDER,
+    ))
+    wb.add_named_style(NamedStyle(
+        name=CELL_STYLE,
+        font=Font(name="Arial", size=10),
+        border=THIN_BORDER,
+    ))
+
+
+def styled_cell(ws, value, style: str) -> WriteOnlyCell:
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _xlsx_value(value):
+    if isinstance(value, (dict, list, tuple, set)):
+        return json.dumps(value, default=_json_default)
+    return value
+
+
+def spooled_chunks(write: Callable[[IO[bytes]], None], chunk_bytes: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+    """Run ``write`` into a spooled temporary file and yield its bytes in chunks.
+
+    For container formats such as XLSX (a ZIP archive), which are only
+    complete once every row is written: the file stays in memory up to a
+    few MB and then moves to disk.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=_XLSX_SPOOL_BYTES) as f:
+        write(f)
+        f.seek(0)
+        yield from iter(lambda: f.read(chunk_bytes), b"")
+
+
+def _batches(rows: Iterable[list], size: int) -> Iterator[list[list]]:
+    batch: list[list] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 
 class DataExportEngine:
     """Generates structured data for export."""
@@ -27,33 +139,10 @@ class DataExportEngine:
         include_health: bool = True,
     ) -> ExportResult:
         """Prepare equipment hierarchy data for export."""
-        headers = ["Equipment ID", "Description", "Type", "Parent ID"]
-        if include_criticality:
-            headers.extend(["Criticality Class", "Risk Score"])
-        if include_health:
-            headers.extend(["Health Score", "Health Class"])
+        stream = DataExportEngine.equipment_sheet(hierarchy_data, include_criticality, include_health)
+        rows = list(stream.rows)
 
-        rows: list[list] = []
-        for eq in hierarchy_data:
-            row = [
-                eq.get("equipment_id", ""),
-                eq.get("description", ""),
-                eq.get("equipment_type", ""),
-                eq.get("parent_id", ""),
-            ]
-            if include_criticality:
-                row.extend([
-                    eq.get("criticality_class", ""),
-                    eq.get("risk_score", ""),
-                ])
-            if include_health:
-                row.extend([
-                    eq.get("health_score", eq.get("composite_score", "")),
-                    eq.get("health_class", ""),
-                ])
-            rows.append(row)
-
-        sheet = ExportSheet(name="Equipment", headers=headers, rows=rows)
+        sheet = ExportSheet(name=stream.name, headers=stream.headers, rows=rows)
         return ExportResult(
             format=ExportFormat.EXCEL,
             sheets=[sheet],
@@ -188,28 +277,166 @@ class DataExportEngine:
 
         # Gantt/schedule rows
         if gantt_rows:
-            gantt_headers = ["WO ID", "Description", "Start", "End",
-                             "Duration (hrs)", "Resource Group", "Status"]
-            rows = [
-                [
-                    g.get("work_order_id", g.get("wo_id", "")),
-                    g.get("description", ""),
-                    g.get("planned_start", g.get("start", "")),
-                    g.get("planned_end", g.get("end", "")),
-                    g.get("duration_hours", g.get("duration", "")),
-                    g.get("resource_group", g.get("work_center", "")),
-                    g.get("status", ""),
-                ]
-                for g in gantt_rows
-            ]
-            sheets.append(ExportSheet(
-                name="Schedule",
-                headers=gantt_headers,
-                rows=rows,
-            ))
+            stream = DataExportEngine.schedule_sheet(gantt_rows)
+            sheets.append(ExportSheet(name=stream.name, headers=stream.headers, rows=list(stream.rows)))
 
         return ExportResult(
             format=ExportFormat.EXCEL,
             sheets=sheets,
             metadata={"export_type": "schedule", "program_id": program.get("program_id", "")},
         )
+
+    # ── Streaming sections ──────────────────────────────────────────
+
+    @staticmethod
+    def equipment_sheet(
+        hierarchy_data: Iterable[dict],
+        include_criticality: bool = True,
+        include_health: bool = True,
+    ) -> SheetStream:
+        """Equipment rows generated one at a time from any iterable of dicts."""
+        headers = ["Equipment ID", "Description", "Type", "Parent ID"]
+        if include_criticality:
+            headers.extend(["Criticality Class", "Risk Score"])
+        if include_health:
+            headers.extend(["Health Score", "Health Class"])
+
+        def rows() -> Iterator[list]:
+            for eq in hierarchy_data:
+                row = [
+                    eq.get("equipment_id", ""),
+                    eq.get("description", ""),
+                    eq.get("equipment_type", ""),
+                    eq.get("parent_id", ""),
+                ]
+                if include_criticality:
+                    row.extend([
+                        eq.get("criticality_class", ""),
+                        eq.get("risk_score", ""),
+                    ])
+                if include_health:
+                    row.extend([
+                        eq.get("health_score", eq.get("composite_score", "")),
+                        eq.get("health_class", ""),
+                    ])
+                yield row
+
+        return SheetStream(name="Equipment", headers=headers, rows=rows())
+
+    @staticmethod
+    def work_order_sheet(work_orders: Iterable[dict]) -> SheetStream:
+        """Work order history rows generated one at a time."""
+        headers = ["WO ID", "Order Type", "Equipment ID", "Equipment Tag", "Priority",
+                   "Status", "Created", "Duration (hrs)", "Description"]
+        rows = (
+            [
+                wo.get("work_order_id", ""),
+                wo.get("order_type", ""),
+                wo.get("equipment_id", ""),
+                wo.get("equipment_tag", ""),
+                wo.get("priority", ""),
+                wo.get("status", ""),
+                wo.get("created_date", ""),
+                wo.get("actual_duration_hours", ""),
+                wo.get("description", ""),
+            ]
+            for wo in work_orders
+        )
+        return SheetStream(name="Work Orders", headers=headers, rows=rows)
+
+    @staticmethod
+    def schedule_sheet(gantt_rows: Iterable[dict]) -> SheetStream:
+        """Gantt/schedule rows generated one at a time."""
+        headers = ["WO ID", "Description", "Start", "End",
+                   "Duration (hrs)", "Resource Group", "Status"]
+        rows = (
+            [
+                g.get("work_order_id", g.get("wo_id", "")),
+                g.get("description", ""),
+                g.get("planned_start", g.get("start", "")),
+                g.get("planned_end", g.get("end", "")),
+                g.get("duration_hours", g.get("duration", "")),
+                g.get("resource_group", g.get("work_center", "")),
+                g.get("status", ""),
+            ]
+            for g in gantt_rows
+        )
+        return SheetStream(name="Schedule", headers=headers, rows=rows)
+
+    @staticmethod
+    def to_streams(result: ExportResult) -> list[SheetStream]:
+        """Sheets of a prepared export, for the streaming writers."""
+        return [SheetStream(name=s.name, headers=s.headers, rows=s.rows) for s in result.sheets]
+
+    # ── Streaming writers ───────────────────────────────────────────
+
+    @staticmethod
+    def stream_csv(sheets: list[SheetStream], batch_rows: int = STREAM_BATCH_ROWS) -> Iterator[bytes]:
+        """UTF-8 CSV, one chunk per batch of rows.
+
+        Several sheets are written one after another, each with its own
+        header row, separated by an empty line.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def take() -> bytes:
+            data = buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            return data
+
+        for i, sheet in enumerate(sheets):
+            if i:
+                writer.writerow([])
+            writer.writerow(sheet.headers)
+            for batch in _batches(sheet.rows, batch_rows):
+                writer.writerows(batch)
+                yield take()
+        tail = take()
+        if tail:
+            yield tail
+
+    @staticmethod
+    def stream_ndjson(sheets: list[SheetStream], batch_rows: int = STREAM_BATCH_ROWS) -> Iterator[bytes]:
+        """One JSON object per row keyed by header, one chunk per batch of rows.
+
+        With several sheets, each object also carries its sheet name in
+        ``"sheet"``.
+        """
+        for sheet in sheets:
+            extra = {"sheet": sheet.name} if len(sheets) > 1 else {}
+            for batch in _batches(sheet.rows, batch_rows):
+                yield "".join(
+                    json.dumps({**extra, **dict(zip(sheet.headers, row))}, default=_json_default) + "\n"
+                    for row in batch
+                ).encode("utf-8")
+
+    @staticmethod
+    def write_xlsx(sheets: list[SheetStream], target: str | Path | IO[bytes]) -> None:
+        """Write the sheets to an XLSX file with a write-only workbook."""
+        wb = Workbook(write_only=True)
+        add_named_styles(wb)
+        for sheet in sheets:
+            ws = wb.create_sheet(sheet.name[:31])
+            ws.append([styled_cell(ws, h, HEADER_STYLE) for h in sheet.headers])
+            for row in sheet.rows:
+                ws.append([_xlsx_value(v) for v in row])
+        wb.save(target)
+
+    @staticmethod
+    def stream_xlsx(sheets: list[SheetStream], chunk_bytes: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+        """XLSX bytes in chunks, built through a spooled temporary file."""
+        return spooled_chunks(lambda f: DataExportEngine.write_xlsx(sheets, f), chunk_bytes)
+
+    @staticmethod
+    def stream(sheets: list[SheetStream], fmt: str) -> Iterator[bytes]:
+        """Stream the sheets in one of STREAM_FORMATS."""
+        writers = {
+            "csv": DataExportEngine.stream_csv,
+            "ndjson": DataExportEngine.stream_ndjson,
+            "xlsx": DataExportEngine.stream_xlsx,
+        }
+        if fmt not in writers:
+            raise ValueError(f"Unknown export format: {fmt}")
+        return writers[fmt](sheets)
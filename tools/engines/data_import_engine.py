@@ -6,11 +6,19 @@ Parses and validates pre-parsed row data (list[dict]) for:
 - Maintenance plan imports
 
 Validates data structure, maps columns, and returns validated results.
+Large CSV/XLSX/Parquet/Arrow extracts are read in fixed-size chunks (read_chunks) and
+validated chunk by chunk (stream_validate) so memory stays constant.
 Deterministic — no LLM required.
 """
 
 from __future__ import annotations
 
+import csv
+import io
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO
+
 from tools.models.schemas import (
     ImportMapping,
     ImportResult,
@@ -19,6 +27,10 @@ from tools.models.schemas import (
     ImportValidationError,
 )
 
+# Parquet files and Arrow IPC files/streams
+_COLUMNAR_SUFFIXES = (".parquet", ".arrow", ".arrows", ".feather")
+_CSV_SUFFIXES = ("", ".csv", ".txt")
+
 # Required columns per import source
 _REQUIRED_COLUMNS: dict[ImportSource, list[str]] = {
     ImportSource.EQUIPMENT_HIERARCHY: [
@@ -32,6 +44,21 @@ _REQUIRED_COLUMNS: dict[ImportSource, list[str]] = {
     ],
 }
 
+# Optional columns picked up by detect_column_mapping(include_optional=True)
+_OPTIONAL_COLUMNS: dict[ImportSource, list[str]] = {
+    ImportSource.EQUIPMENT_HIERARCHY: [
+        "parent_id", "criticality", "node_type",
+    ],
+    ImportSource.FAILURE_HISTORY: [
+        "work_order_id", "downtime_hours", "cost", "priority", "order_type", "description",
+    ],
+    ImportSource.MAINTENANCE_PLAN: [
+        "task_id", "task_type", "constraint",
+    ],
+}
+
+DEFAULT_CHUNK_SIZE = 5000
+
 # Known column aliases for auto-mapping
 _COLUMN_ALIASES: dict[str, list[str]] = {
     "equipment_id": ["equipment_id", "equip_id", "eq_id", "asset_id", "tag", "functional_location"],
@@ -45,6 +72,13 @@ _COLUMN_ALIASES: dict[str, list[str]] = {
     "criticality": ["criticality", "crit", "risk_class", "criticality_class"],
     "downtime_hours": ["downtime_hours", "downtime", "duration_hours", "repair_hours"],
     "cost": ["cost", "repair_cost", "total_cost", "amount"],
+    "node_type": ["node_type", "level_type", "hierarchy_level"],
+    "work_order_id": ["work_order_id", "order", "order_number", "wo_number", "aufnr"],
+    "priority": ["priority", "prio", "priority_code"],
+    "order_type": ["order_type", "wo_type", "auart"],
+    "task_id": ["task_id", "task_number", "operation_id"],
+    "task_type": ["task_type", "action", "activity_type"],
+    "constraint": ["constraint", "plant_condition", "operating_condition"],
 }
 
 
@@ -85,22 +119,29 @@ class DataImportEngine:
     def detect_column_mapping(
         headers: list[str],
         target_type: ImportSource,
+        include_optional: bool = False,
     ) -> ImportMapping:
-        """Auto-detect column mapping from source headers to target schema."""
+        """Auto-detect column mapping from source headers to target schema.
+
+        Confidence only counts required columns; include_optional also maps
+        the optional columns the bulk import understands.
+        """
         required = _REQUIRED_COLUMNS.get(target_type, [])
+        targets = required + (_OPTIONAL_COLUMNS.get(target_type, []) if include_optional else [])
         mapping: dict[str, str] = {}
         headers_lower = [h.lower().strip() for h in headers]
 
-        for target_col in required:
+        for target_col in targets:
             aliases = _COLUMN_ALIASES.get(target_col, [target_col])
             for alias in aliases:
                 alias_lower = alias.lower()
                 if alias_lower in headers_lower:
                     idx = headers_lower.index(alias_lower)
-                    mapping[headers[idx]] = target_col
-                    break
+                    if headers[idx] not in mapping:
+                        mapping[headers[idx]] = target_col
+                        break
 
-        mapped_targets = set(mapping.values())
+        mapped_targets = set(mapping.values()) & set(required)
         confidence = len(mapped_targets) / max(len(required), 1)
 
         return ImportMapping(
@@ -110,6 +151,77 @@ class DataImportEngine:
             confidence=round(confidence, 2),
         )
 
+    @staticmethod
+    def read_chunks(
+        source: str | Path | IO[bytes],
+        filename: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[list[dict]]:
+        """Read a CSV, XLSX, Parquet or Arrow extract as successive lists of at most chunk_size rows.
+
+        The first row holds the headers. XLSX files are read from the first
+        worksheet in openpyxl read-only mode and Parquet/Arrow files one
+        record batch at a time (column names as headers, values already
+        typed), so no format is loaded whole into memory.
+
+        Args:
+            source: File path or binary file object.
+            filename: Name used to pick the format when source is a file object.
+
+        Raises:
+            ValueError: the file extension is not a supported format.
+        """
+        name = str(filename or (source if isinstance(source, (str, Path)) else ""))
+        suffix = Path(name).suffix.lower()
+        if suffix in (".xlsx", ".xlsm"):
+            rows = _iter_xlsx_rows(source)
+        elif suffix in _COLUMNAR_SUFFIXES:
+            rows = _iter_columnar_rows(source)
+        elif suffix in _CSV_SUFFIXES:
+            rows = _iter_csv_rows(source)
+        else:
+            raise ValueError(f"Unsupported file type: '{suffix}'")
+
+        chunk: list[dict] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def stream_validate(
+        chunks: Iterable[list[dict]],
+        source: ImportSource,
+        column_mapping: dict[str, str] | None = None,
+    ) -> Iterator[tuple[ImportMapping, ImportResult]]:
+        """Validate an import chunk by chunk.
+
+        The column mapping is detected once, from the headers of the first
+        chunk (optional columns included), unless one is given. Each result
+        covers one chunk, with row numbers counted from the start of the file;
+        validated_data holds the mapped rows.
+        """
+        mapping: ImportMapping | None = None
+        offset = 0
+        for chunk in chunks:
+            if mapping is None:
+                headers = list(chunk[0].keys()) if chunk else []
+                if column_mapping is None:
+                    mapping = DataImportEngine.detect_column_mapping(headers, source, include_optional=True)
+                else:
+                    mapping = ImportMapping(
+                        source_columns=headers,
+                        target_columns=_REQUIRED_COLUMNS.get(source, []),
+                        mapping=column_mapping,
+                        confidence=1.0,
+                    )
+            result = DataImportEngine._validate(chunk, source, mapping.mapping, row_offset=offset)
+            offset += len(chunk)
+            yield mapping, result
+
     @staticmethod
     def summarize_import(result: ImportResult) -> ImportSummary:
         """Generate summary statistics from an import result."""
@@ -134,6 +246,7 @@ class DataImportEngine:
         rows: list[dict],
         source: ImportSource,
         column_mapping: dict[str, str] | None,
+        row_offset: int = 0,
     ) -> ImportResult:
         """Core validation logic for all import types."""
         if not rows:
@@ -167,7 +280,7 @@ class DataImportEngine:
                 val = row.get(col)
                 if val is None or (isinstance(val, str) and not val.strip()):
                     errors.append(ImportValidationError(
-                        row=i + 1,
+                        row=row_offset + i + 1,
                         column=col,
                         message=f"Required column '{col}' is missing or empty",
                     ))
@@ -182,7 +295,7 @@ class DataImportEngine:
                         _date.fromisoformat(fd[:10])
                     except (ValueError, TypeError):
                         errors.append(ImportValidationError(
-                            row=i + 1,
+                            row=row_offset + i + 1,
                             column="failure_date",
                             message=f"Invalid date format: '{fd}'",
                         ))
@@ -201,3 +314,40 @@ class DataImportEngine:
             errors=errors,
             validated_data=valid_data,
         )
+
+
+def _iter_csv_rows(source: str | Path | IO[bytes]) -> Iterator[dict]:
+    if isinstance(source, (str, Path)):
+        with open(source, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+        return
+    text = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+    try:
+        yield from csv.DictReader(text)
+    finally:
+        text.detach()
+
+
+def _iter_columnar_rows(source: str | Path | IO[bytes]) -> Iterator[dict]:
+    from tools.engines.columnar_engine import ColumnarEngine
+
+    for rows in ColumnarEngine.iter_rows(source):
+        yield from rows
+
+
+def _iter_xlsx_rows(source: str | Path | IO[bytes]) -> Iterator[dict]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        headers = [str(h).strip() if h is not None else f"column_{i + 1}" for i, h in enumerate(header)]
+        for values in rows:
+            if values is None or all(v is None for v in values):
+                continue
+            yield dict(zip(headers, values))
+    finally:
+        wb.close()
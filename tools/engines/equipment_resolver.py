@@ -4,10 +4,22 @@ Resolves equipment TAG from voice/text/image input.
 Uses fuzzy matching, alias lookup, and hierarchy search.
 """
 
+import heapq
 import re
+from collections import Counter
 from difflib import SequenceMatcher
 from dataclasses import dataclass
 
+# Candidates kept by the trigram index before exact SequenceMatcher scoring
+FUZZY_SHORTLIST = 50
+
+_TAG_PATTERN = re.compile(r"[A-Z]{2,5}-[A-Z]{2,5}-[A-Z]{2,5}-\d{2,4}")
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
 
 @dataclass
 class ResolutionResult:
@@ -19,6 +31,55 @@ class ResolutionResult:
     alternatives: list[dict]  # Other possible matches
 
 
+class TrigramIndex:
+    """Inverted index of character trigrams used to shortlist fuzzy candidates.
+
+    Each document is a (key, text) pair; several documents may share a key
+    (e.g. the description, French description and aliases of one equipment).
+    """
+
+    def __init__(self):
+        self.keys: list[int] = []
+        self.texts: list[str] = []
+        self._sizes: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def add(self, key: int, text: str):
+        doc = len(self.texts)
+        grams = _trigrams(text)
+        self.keys.append(key)
+        self.texts.append(text)
+        self._sizes.append(len(grams))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(doc)
+
+    def candidates(self, text: str, limit: int = FUZZY_SHORTLIST) -> list[int]:
+        """Documents most similar to `text` by trigram overlap, in index order.
+
+        Small indexes return every document so scoring stays exhaustive.
+        """
+        if len(self.texts) <= limit:
+            return list(range(len(self.texts)))
+        grams = _trigrams(text)
+        shared: Counter = Counter()
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings:
+                shared.update(postings)
+        if not shared:
+            return []
+        size = len(grams)
+        sizes = self._sizes
+        # Jaccard overlap of trigram sets
+        best = heapq.nlargest(
+            limit, shared.items(), key=lambda item: item[1] / (size + sizes[item[0]] - item[1]),
+        )
+        return sorted(doc for doc, _ in best)
+
+
 class EquipmentResolver:
     """Resolves equipment identification from field input."""
 
@@ -28,7 +89,7 @@ class EquipmentResolver:
             equipment_registry: List of dicts with keys:
                 equipment_id, tag, description, description_fr, aliases
         """
-        self.registry = equipment_registry
+        self.registry = list(equipment_registry)
         self._tag_index = {eq["tag"].upper(): eq for eq in equipment_registry}
         self._id_index = {eq["equipment_id"]: eq for eq in equipment_registry}
         self._alias_index: dict[str, dict] = {}
@@ -36,6 +97,38 @@ class EquipmentResolver:
             for alias in eq.get("aliases", []):
                 self._alias_index[alias.upper()] = eq
 
+        # Trigram indexes: tags (upper case) and descriptions/aliases (lower case)
+        tag_positions = {eq["tag"].upper(): i for i, eq in enumerate(equipment_registry)}
+        self._tag_trigrams = TrigramIndex()
+        for tag, i in tag_positions.items():
+            self._tag_trigrams.add(i, tag)
+        self._text_trigrams = TrigramIndex()
+        for i, eq in enumerate(equipment_registry):
+            texts = [eq.get("description", ""), eq.get("description_fr", ""), *eq.get("aliases", [])]
+            for text in dict.fromkeys(t.lower() for t in texts if t):
+                self._text_trigrams.add(i, text)
+
+    def add_equipment(self, eq: dict):
+        """Add one registry entry to every index without rebuilding them."""
+        i = len(self.registry)
+        self.registry.append(eq)
+        self._tag_index[eq["tag"].upper()] = eq
+        self._id_index[eq["equipment_id"]] = eq
+        for alias in eq.get("aliases", []):
+            self._alias_index[alias.upper()] = eq
+        self._tag_trigrams.add(i, eq["tag"].upper())
+        texts = [eq.get("description", ""), eq.get("description_fr", ""), *eq.get("aliases", [])]
+        for text in dict.fromkeys(t.lower() for t in texts if t):
+            self._text_trigrams.add(i, text)
+
+    def resolve_many(self, inputs: list[str]) -> list[ResolutionResult | None]:
+        """Resolve a batch of inputs; repeated inputs are resolved once."""
+        resolved: dict[str, ResolutionResult | None] = {}
+        for text in inputs:
+            if text not in resolved:
+                resolved[text] = self.resolve(text)
+        return [resolved[text] for text in inputs]
+
     def resolve(self, input_text: str) -> ResolutionResult | None:
         """
         Resolve equipment from free-text input.
@@ -55,8 +148,7 @@ class EquipmentResolver:
             )
 
         # 2. Extract TAG pattern from text (e.g., "BRY-SAG-ML-001")
-        tag_pattern = re.compile(r"[A-Z]{2,5}-[A-Z]{2,5}-[A-Z]{2,5}-\d{2,4}")
-        tags_found = tag_pattern.findall(cleaned)
+        tags_found = _TAG_PATTERN.findall(cleaned)
         for tag in tags_found:
             if tag in self._tag_index:
                 eq = self._tag_index[tag]
@@ -109,36 +201,43 @@ class EquipmentResolver:
 
     def _fuzzy_match_tags(self, text: str) -> dict | None:
         best = None
-        for tag, eq in self._tag_index.items():
+        for doc in self._tag_trigrams.candidates(text):
+            tag = self._tag_trigrams.texts[doc]
             score = SequenceMatcher(None, text, tag).ratio()
             if best is None or score > best["score"]:
-                best = {"equipment": eq, "score": score}
+                best = {"equipment": self.registry[self._tag_trigrams.keys[doc]], "score": score}
         return best
 
     def _fuzzy_match_descriptions(self, text: str) -> dict | None:
         text_lower = text.lower()
         best = None
-        for eq in self.registry:
-            for field in ["description", "description_fr"]:
-                desc = eq.get(field, "").lower()
-                score = SequenceMatcher(None, text_lower, desc).ratio()
-                if best is None or score > best["score"]:
-                    best = {"equipment": eq, "score": score}
+        for doc in self._text_trigrams.candidates(text_lower):
+            desc = self._text_trigrams.texts[doc]
+            score = SequenceMatcher(None, text_lower, desc).ratio()
+            if best is None or score > best["score"]:
+                best = {"equipment": self.registry[self._text_trigrams.keys[doc]], "score": score}
         return best
 
     def _get_alternatives(self, text: str, exclude: str, max_count: int = 3) -> list[dict]:
+        text_lower, text_upper = text.lower(), text.upper()
+        scores: dict[int, float] = {}
+        for doc in self._text_trigrams.candidates(text_lower):
+            i = self._text_trigrams.keys[doc]
+            score = SequenceMatcher(None, text_lower, self._text_trigrams.texts[doc]).ratio()
+            scores[i] = max(scores.get(i, 0.0), score)
+        for doc in self._tag_trigrams.candidates(text_upper):
+            i = self._tag_trigrams.keys[doc]
+            score = SequenceMatcher(None, text_upper, self.registry[i]["tag"]).ratio()
+            scores[i] = max(scores.get(i, 0.0), score)
+
         results = []
-        for eq in self.registry:
-            if eq["tag"] == exclude:
+        for i in sorted(scores):
+            eq = self.registry[i]
+            if eq["tag"] == exclude or scores[i] <= 0.3:
                 continue
-            desc_score = SequenceMatcher(None, text.lower(), eq.get("description", "").lower()).ratio()
-            tag_score = SequenceMatcher(None, text.upper(), eq["tag"]).ratio()
-            score = max(desc_score, tag_score)
-            if score > 0.3:
-                results.append({
-                    "equipment_id": eq["equipment_id"],
-                    "tag": eq["tag"],
-                    "confidence": round(score, 2),
-                })
-        results.sort(key=lambda x: x["confidence"], reverse=True)
-        return results[:max_count]
+            results.append({
+                "equipment_id": eq["equipment_id"],
+                "tag": eq["tag"],
+                "confidence": round(scores[i], 2),
+            })
+        return heapq.nlargest(max_count, results, key=lambda x: x["confidence"])
@@ -3,13 +3,13 @@
 Builds ordered execution sequences with dependency resolution,
 smart duration estimation, and safety checklists for support tasks.
 
-Uses Kahn's algorithm for topological sorting.
+Orders tasks and computes the CPM schedule (early/late dates, float,
+critical tasks, dependency cycles) with the critical path engine.
 
 Deterministic — no LLM required.
 """
 
-from collections import defaultdict, deque
-
+from tools.engines.critical_path import CriticalPathNetwork
 from tools.models.schemas import (
     SupportTaskType,
     SupportTaskStatus,
@@ -125,7 +125,8 @@ class ExecutionTaskEngine:
             package_id: Work package identifier.
             support_tasks: List of dicts with keys:
                 task_id, task_type (SupportTaskType value), description,
-                estimated_hours, is_pre_execution (optional)
+                estimated_hours, is_pre_execution (optional),
+                predecessors (optional list of task_ids that must finish first)
             package_attributes: Optional dict with keys:
                 elevation_meters, shutdown_required
 
@@ -188,16 +189,34 @@ class ExecutionTaskEngine:
                             if pred_id not in t.predecessors:
                                 t.predecessors.append(pred_id)
 
-        # Topological sort
-        tasks = ExecutionTaskEngine._topological_sort(tasks, dependencies)
+        # Explicit predecessors from the input
+        for st, t in zip(support_tasks, tasks):
+            for pred_id in st.get("predecessors", []):
+                if pred_id not in t.predecessors:
+                    t.predecessors.append(pred_id)
+                    dependencies.append(TaskDependency(from_task_id=pred_id, to_task_id=t.task_id))
+
+        # Topological sort and CPM schedule
+        network = CriticalPathNetwork(
+            {t.task_id: t.estimated_hours for t in tasks},
+            [(dep.from_task_id, dep.to_task_id) for dep in dependencies],
+        )
+        tasks = ExecutionTaskEngine._topological_sort(tasks, network)
+        ExecutionTaskEngine._apply_schedule(tasks, network)
 
         # Calculate hours
         pre_hours = sum(t.estimated_hours for t in tasks if t.is_pre_execution)
         post_hours = sum(t.estimated_hours for t in tasks if not t.is_pre_execution)
-        critical_path = ExecutionTaskEngine._calculate_critical_path(tasks, dependencies)
 
         # Warnings
         warnings: list[str] = []
+        cycle_dependencies = [
+            TaskDependency(from_task_id=from_id, to_task_id=to_id)
+            for from_id, to_id in network.cycle_edges
+        ]
+        if cycle_dependencies:
+            edges = ", ".join(f"{d.from_task_id} -> {d.to_task_id}" for d in cycle_dependencies)
+            warnings.append(f"Dependency cycle ignored for scheduling: {edges}")
         shutdown_required = package_attributes.get("shutdown_required", False)
         has_loto = SupportTaskType.LOTO in task_type_map
         if shutdown_required and not has_loto:
@@ -209,7 +228,9 @@ class ExecutionTaskEngine:
             dependencies=dependencies,
             total_pre_hours=round(pre_hours, 2),
             total_post_hours=round(post_hours, 2),
-            critical_path_hours=round(critical_path, 2),
+            critical_path_hours=round(network.project_duration, 2),
+            critical_task_ids=network.critical_tasks(),
+            cycle_dependencies=cycle_dependencies,
             warnings=warnings,
         )
 
@@ -228,74 +249,26 @@ class ExecutionTaskEngine:
     @staticmethod
     def _topological_sort(
         tasks: list[ExecutionTask],
-        dependencies: list[TaskDependency],
+        network: CriticalPathNetwork,
     ) -> list[ExecutionTask]:
-        """Kahn's algorithm for topological ordering."""
-        if not tasks:
-            return tasks
-
+        """Order tasks topologically (Kahn's algorithm, cycle edges ignored)."""
         task_map = {t.task_id: t for t in tasks}
-        in_degree: dict[str, int] = defaultdict(int)
-        adj: dict[str, list[str]] = defaultdict(list)
-
-        for t in tasks:
-            in_degree.setdefault(t.task_id, 0)
-
-        for dep in dependencies:
-            adj[dep.from_task_id].append(dep.to_task_id)
-            in_degree[dep.to_task_id] += 1
-
-        queue: deque[str] = deque()
-        for tid in in_degree:
-            if in_degree[tid] == 0 and tid in task_map:
-                queue.append(tid)
-
         ordered: list[ExecutionTask] = []
-        order_idx = 1
-        while queue:
-            tid = queue.popleft()
-            if tid in task_map:
-                task_map[tid].sequence_order = order_idx
-                ordered.append(task_map[tid])
-                order_idx += 1
-            for neighbor in adj.get(tid, []):
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-
-        # Add any remaining tasks not in the dependency graph
-        ordered_ids = {t.task_id for t in ordered}
-        for t in tasks:
-            if t.task_id not in ordered_ids:
-                t.sequence_order = order_idx
-                ordered.append(t)
-                order_idx += 1
-
+        for order_idx, task_id in enumerate(network.order, start=1):
+            task = task_map[task_id]
+            task.sequence_order = order_idx
+            ordered.append(task)
         return ordered
 
     @staticmethod
-    def _calculate_critical_path(
-        tasks: list[ExecutionTask],
-        dependencies: list[TaskDependency],
-    ) -> float:
-        """Forward pass: calculate longest path duration."""
-        if not tasks:
-            return 0.0
-
-        task_map = {t.task_id: t for t in tasks}
-        earliest_finish: dict[str, float] = {}
-
-        adj: dict[str, list[str]] = defaultdict(list)
-        for dep in dependencies:
-            adj[dep.from_task_id].append(dep.to_task_id)
-
-        # Process in sequence order
-        sorted_tasks = sorted(tasks, key=lambda t: t.sequence_order)
-        for t in sorted_tasks:
-            pred_max = 0.0
-            for pred_id in t.predecessors:
-                if pred_id in earliest_finish:
-                    pred_max = max(pred_max, earliest_finish[pred_id])
-            earliest_finish[t.task_id] = pred_max + t.estimated_hours
-
-        return max(earliest_finish.values()) if earliest_finish else 0.0
+    def _apply_schedule(tasks: list[ExecutionTask], network: CriticalPathNetwork) -> None:
+        """Copy the CPM dates and floats of the network onto the tasks."""
+        for t in tasks:
+            schedule = network.schedule(t.task_id)
+            t.early_start = round(schedule.early_start, 2)
+            t.early_finish = round(schedule.early_finish, 2)
+            t.late_start = round(schedule.late_start, 2)
+            t.late_finish = round(schedule.late_finish, 2)
+            t.total_float = round(schedule.total_float, 2)
+            t.free_float = round(schedule.free_float, 2)
+            t.is_critical = schedule.is_critical
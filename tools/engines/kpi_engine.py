@@ -121,59 +121,48 @@ class KPIEngine:
         equipment_id: str | None = None,
         total_period_hours: float | None = None,
     ) -> KPIMetrics:
-        """Calculate all KPIs from a list of work order records."""
-        # Filter by equipment if specified
-        filtered = records
-        if equipment_id:
-            filtered = [r for r in records if r.equipment_id == equipment_id]
-
-        # Failure dates for MTBF
-        failure_dates = [r.actual_start or r.created_date for r in filtered if r.is_failure]
-        mtbf = cls.calculate_mtbf(failure_dates)
+        """Calculate all KPIs from a list of work order records (one pass)."""
+        failure_dates: list[date] = []
+        repair_durations: list[float] = []
+        total_downtime = 0.0
+        total = corrective = preventive = pm_executed = 0
+        planned = on_time = 0
+        for r in records:
+            # Filter by equipment if specified
+            if equipment_id and r.equipment_id != equipment_id:
+                continue
+            total += 1
+            if r.is_failure:
+                # Failure dates for MTBF, repair durations for MTTR and downtime
+                failure_dates.append(r.actual_start or r.created_date)
+                if r.actual_duration_hours is not None:
+                    repair_durations.append(r.actual_duration_hours)
+                    total_downtime += r.actual_duration_hours
+            if r.order_type == "PM03":
+                corrective += 1
+            elif r.order_type == "PM02":
+                preventive += 1
+                if r.actual_end is not None:
+                    pm_executed += 1
+            if r.planned_start is not None:
+                planned += 1
+                if r.actual_start is not None and r.actual_start <= r.planned_end:
+                    on_time += 1
 
-        # Repair durations for MTTR
-        repair_durations = [
-            r.actual_duration_hours
-            for r in filtered
-            if r.is_failure and r.actual_duration_hours is not None
-        ]
+        mtbf = cls.calculate_mtbf(failure_dates)
         mttr = cls.calculate_mttr(repair_durations)
 
         # Availability
         if total_period_hours is None:
-            total_period_hours = (period_end - period_start).days * 24.0
-        total_downtime = sum(
-            r.actual_duration_hours
-            for r in filtered
-            if r.is_failure and r.actual_duration_hours is not None
-        )
+            # Both period_start and period_end are included
+            total_period_hours = ((period_end - period_start).days + 1) * 24.0
         availability = cls.calculate_availability(total_period_hours, total_downtime)
 
         # OEE (simplified for maintenance MVP)
         oee = cls.calculate_oee(availability) if availability is not None else None
 
-        # Count by type
-        total = len(filtered)
-        corrective = len([r for r in filtered if r.order_type == "PM03"])
-        preventive = len([r for r in filtered if r.order_type == "PM02"])
-
-        # Schedule compliance
-        planned = [r for r in filtered if r.planned_start is not None]
-        on_time = [
-            r for r in planned
-            if r.actual_start is not None and r.actual_start <= r.planned_end
-        ]
-        schedule_compliance = cls.calculate_schedule_compliance(len(planned), len(on_time))
-
-        # PM compliance
-        pm_planned = len([r for r in filtered if r.order_type == "PM02"])
-        pm_executed = len([
-            r for r in filtered
-            if r.order_type == "PM02" and r.actual_end is not None
-        ])
-        pm_compliance = cls.calculate_pm_compliance(pm_planned, pm_executed)
-
-        # Reactive ratio
+        schedule_compliance = cls.calculate_schedule_compliance(planned, on_time)
+        pm_compliance = cls.calculate_pm_compliance(preventive, pm_executed)
         reactive_ratio = cls.calculate_reactive_ratio(corrective, total)
 
         return KPIMetrics(
@@ -6,10 +6,18 @@ vs risk of failure. Uses Weibull reliability for failure probability.
 Deterministic — no LLM required.
 """
 
-import math
+import numpy as np
 
 from tools.models.schemas import OCRAnalysisInput, OCRAnalysisResult
 
+# Candidate PM intervals (days) evaluated for every equipment item
+MIN_INTERVAL_DAYS = 7
+MAX_INTERVAL_DAYS = 730
+_INTERVALS = np.arange(MIN_INTERVAL_DAYS, MAX_INTERVAL_DAYS + 1, dtype=float)
+
+# Rows per vectorised sweep, keeps the cost matrix at ~6 MB
+_CHUNK_ROWS = 1024
+
 
 class OCREngine:
     """Optimum Cost-Risk analysis for maintenance interval selection."""
@@ -29,51 +37,21 @@ class OCREngine:
 
         Sweeps intervals from 7 to 730 days to find minimum.
         """
-        if eta is None:
-            eta = (365.0 / inp.failure_rate) if inp.failure_rate > 0 else 365.0
-
-        best_interval = inp.current_pm_interval_days
-        best_cost = float("inf")
-        costs_by_interval: dict[int, float] = {}
-
-        for interval in range(7, 731):
-            pm_cost = inp.cost_per_pm * (365.0 / interval)
-            reliability = math.exp(-((interval / eta) ** beta))
-            failure_cost = inp.failure_rate * inp.cost_per_failure * (1 - reliability)
-            total = pm_cost + failure_cost
-            costs_by_interval[interval] = total
-            if total < best_cost:
-                best_cost = total
-                best_interval = interval
-
-        current_cost = costs_by_interval.get(
-            inp.current_pm_interval_days,
-            _total_cost(inp, inp.current_pm_interval_days, beta, eta),
-        )
-
-        savings_pct = ((current_cost - best_cost) / current_cost * 100) if current_cost > 0 else 0.0
-
-        r_optimal = math.exp(-((best_interval / eta) ** beta))
-        r_current = math.exp(-((inp.current_pm_interval_days / eta) ** beta))
-
-        if best_interval < inp.current_pm_interval_days:
-            recommendation = f"Reduce PM interval from {inp.current_pm_interval_days}d to {best_interval}d (saves {savings_pct:.1f}%)"
-        elif best_interval > inp.current_pm_interval_days:
-            recommendation = f"Extend PM interval from {inp.current_pm_interval_days}d to {best_interval}d (saves {savings_pct:.1f}%)"
-        else:
-            recommendation = f"Current interval of {inp.current_pm_interval_days}d is near optimal"
-
-        return OCRAnalysisResult(
-            equipment_id=inp.equipment_id,
-            optimal_interval_days=best_interval,
-            current_interval_days=inp.current_pm_interval_days,
-            cost_at_optimal=round(best_cost, 2),
-            cost_at_current=round(current_cost, 2),
-            savings_pct=round(max(0.0, savings_pct), 1),
-            risk_at_optimal=round(1 - r_optimal, 4),
-            risk_at_current=round(1 - r_current, 4),
-            recommendation=recommendation,
-        )
+        return OCREngine.batch_analyze([inp], beta, [eta])[0]
+
+    @staticmethod
+    def cost_curve(
+        inp: OCRAnalysisInput,
+        beta: float = 2.0,
+        eta: float | None = None,
+    ) -> dict[int, float]:
+        """Total cost at every candidate interval, for plotting on request."""
+        eta = _default_eta(inp) if eta is None else eta
+        totals = _cost_matrix(
+            np.array([inp.failure_rate]), np.array([inp.cost_per_failure]),
+            np.array([inp.cost_per_pm]), beta, np.array([eta]),
+        )[0]
+        return dict(zip(range(MIN_INTERVAL_DAYS, MAX_INTERVAL_DAYS + 1), totals.tolist()))
 
     @staticmethod
     def sensitivity_analysis(
@@ -88,26 +66,126 @@ class OCREngine:
         if base_value is None or base_value <= 0:
             return [OCREngine.calculate_optimal_interval(inp, beta)]
 
-        results = []
+        variants = []
         for i in range(steps):
             factor = 1.0 - range_pct / 100 + (2 * range_pct / 100) * (i / max(1, steps - 1))
             modified = inp.model_copy()
             setattr(modified, parameter, base_value * factor)
-            results.append(OCREngine.calculate_optimal_interval(modified, beta))
-        return results
+            variants.append(modified)
+        return OCREngine.batch_analyze(variants, beta)
 
     @staticmethod
     def batch_analyze(
         inputs: list[OCRAnalysisInput],
         beta: float = 2.0,
+        etas: list[float | None] | None = None,
     ) -> list[OCRAnalysisResult]:
-        """Analyze multiple equipment items."""
-        return [OCREngine.calculate_optimal_interval(inp, beta) for inp in inputs]
+        """Analyze multiple equipment items.
+
+        All items are swept together as one NumPy cost matrix (items ×
+        intervals), processed in fixed-size row chunks. An exhaustive sweep is
+        used rather than a bracketing search because the total-cost curve is
+        not unimodal in general: once R(t) flattens out, the PM term keeps
+        falling and the minimum can move to the 730-day boundary.
+
+        Args:
+            inputs: One OCRAnalysisInput per equipment item.
+            beta: Weibull shape parameter shared by all items.
+            etas: Optional per-item Weibull scale; None entries default to
+                365 / failure_rate.
+        """
+        if not inputs:
+            return []
+        if etas is None:
+            etas = [None] * len(inputs)
+
+        failure_rate = np.array([inp.failure_rate for inp in inputs], dtype=float)
+        cost_per_failure = np.array([inp.cost_per_failure for inp in inputs], dtype=float)
+        cost_per_pm = np.array([inp.cost_per_pm for inp in inputs], dtype=float)
+        current = np.array([inp.current_pm_interval_days for inp in inputs], dtype=float)
+        eta = np.array([
+            _default_eta(inp) if e is None else e for inp, e in zip(inputs, etas)
+        ], dtype=float)
+
+        best_idx = np.empty(len(inputs), dtype=np.int64)
+        best_cost = np.empty(len(inputs))
+        for start in range(0, len(inputs), _CHUNK_ROWS):
+            rows = slice(start, start + _CHUNK_ROWS)
+            totals = _cost_matrix(
+                failure_rate[rows], cost_per_failure[rows], cost_per_pm[rows], beta, eta[rows],
+            )
+            # argmin keeps the first (shortest) interval on ties, like the loop did
+            best_idx[rows] = np.argmin(totals, axis=1)
+            best_cost[rows] = totals[np.arange(totals.shape[0]), best_idx[rows]]
+
+        best_interval = best_idx + MIN_INTERVAL_DAYS
+        current_cost = _total_cost_array(failure_rate, cost_per_failure, cost_per_pm, current, beta, eta)
+        r_optimal = np.exp(-((best_interval / eta) ** beta))
+        r_current = np.exp(-((current / eta) ** beta))
+
+        return [
+            _build_result(
+                inp, int(best_interval[i]), float(best_cost[i]), float(current_cost[i]),
+                float(r_optimal[i]), float(r_current[i]),
+            )
+            for i, inp in enumerate(inputs)
+        ]
+
+
+def _default_eta(inp: OCRAnalysisInput) -> float:
+    """Characteristic life implied by the failure rate (failures/year)."""
+    return (365.0 / inp.failure_rate) if inp.failure_rate > 0 else 365.0
+
+
+def _cost_matrix(
+    failure_rate: np.ndarray,
+    cost_per_failure: np.ndarray,
+    cost_per_pm: np.ndarray,
+    beta: float,
+    eta: np.ndarray,
+) -> np.ndarray:
+    """Total cost for each item (rows) at each candidate interval (columns)."""
+    return _total_cost_array(
+        failure_rate[:, None], cost_per_failure[:, None], cost_per_pm[:, None],
+        _INTERVALS[None, :], beta, eta[:, None],
+    )
+
+
+def _total_cost_array(failure_rate, cost_per_failure, cost_per_pm, interval, beta, eta):
+    """Vectorised _total_cost; broadcasts over any argument."""
+    pm_cost = cost_per_pm * (365.0 / interval)
+    reliability = np.exp(-((interval / eta) ** beta))
+    failure_cost = failure_rate * cost_per_failure * (1 - reliability)
+    return pm_cost + failure_cost
 
 
-def _total_cost(inp: OCRAnalysisInput, interval: int, beta: float, eta: float) -> float:
-    """Helper: calculate total cost at a given interval."""
-    pm_cost = inp.cost_per_pm * (365.0 / interval)
-    reliability = math.exp(-((interval / eta) ** beta))
-    failure_cost = inp.failure_rate * inp.cost_per_failure * (1 - reliability)
-    return pm_cost + failure_cost
+def _build_result(
+    inp: OCRAnalysisInput,
+    best_interval: int,
+    best_cost: float,
+    current_cost: float,
+    r_optimal: float,
+    r_current: float,
+) -> OCRAnalysisResult:
+    """Assemble the OCRAnalysisResult and recommendation for one item."""
+    savings_pct = ((current_cost - best_cost) / current_cost * 100) if current_cost > 0 else 0.0
+
+    if best_interval < inp.current_pm_interval_days:
+        recommendation = f"Reduce PM interval from {inp.current_pm_interval_days}d to {best_interval}d (saves {savings_pct:.1f}%)"
+    elif best_interval > inp.current_pm_interval_days:
+        recommendation = f"Extend PM interval from {inp.current_pm_interval_days}d to {best_interval}d (saves {savings_pct:.1f}%)"
+    else:
+        recommendation = f"Current interval of {inp.current_pm_interval_days}d is near optimal"
+
+    return OCRAnalysisResult(
+        equipment_id=inp.equipment_id,
+        optimal_interval_days=best_interval,
+        current_interval_days=inp.current_pm_interval_days,
+        cost_at_optimal=round(best_cost, 2),
+        cost_at_current=round(current_cost, 2),
+        savings_pct=round(max(0.0, savings_pct), 1),
+        risk_at_optimal=round(1 - r_optimal, 4),
+        risk_at_current=round(1 - r_current, 4),
+        recommendation=recommendation,
+    )
+
@@ -7,6 +7,8 @@ the DRAFT→FINAL→ACTIVE→COMPLETED lifecycle.
 Deterministic — no LLM required.
 """
 
+import heapq
+import math
 from datetime import date, datetime, timedelta
 from collections import defaultdict
 
@@ -19,11 +21,23 @@ from tools.models.schemas import (
     BacklogWorkPackage, ShiftType,
     TradeCapacity, ConflictResolution, ConflictResolutionType,
     MultiDayPackage, EnhancedLevelingResult,
+    PackagePlacement, ScheduleLevelingResult,
 )
 
 
 SHIFT_HOURS = 8.0
 EXECUTION_DAYS = 4  # Thursday through Sunday
+DEFAULT_SHIFTS = [ShiftType.MORNING.value, ShiftType.AFTERNOON.value]
+_SHIFT_ORDER = {s.value: i for i, s in enumerate(ShiftType)}
+_EPS = 1e-9
+
+
+def _execution_start(year: int, week_number: int) -> date:
+    """Thursday of the given ISO week (first day of the execution window)."""
+    jan4 = date(year, 1, 4)
+    start_of_week1 = jan4 - timedelta(days=jan4.isoweekday() - 1)
+    week_start = start_of_week1 + timedelta(weeks=week_number - 1)
+    return week_start + timedelta(days=3)
 
 
 class SchedulingEngine:
@@ -38,16 +52,13 @@ class SchedulingEngine:
     ) -> WeeklyProgram:
         """Create a DRAFT weekly program from backlog work packages.
 
-        Distributes packages across the Thu-Sun execution window.
+        Distributes packages across the Thu-Sun execution window; use
+        level_schedule to place them against trade capacity.
         """
         pkg_dicts = []
         total_hours = 0.0
 
-        # Calculate the Thursday of the given ISO week
-        jan4 = date(year, 1, 4)
-        start_of_week1 = jan4 - timedelta(days=jan4.isoweekday() - 1)
-        week_start = start_of_week1 + timedelta(weeks=week_number - 1)
-        exec_start = week_start + timedelta(days=3)  # Thursday
+        exec_start = _execution_start(year, week_number)
 
         for i, pkg in enumerate(work_packages):
             day_offset = i % EXECUTION_DAYS
@@ -417,9 +428,11 @@ class SchedulingEngine:
                 spec_hours = hours / len(team) if team else hours
                 cap = cap_map.get((shift, spec), SHIFT_HOURS)
                 if spec_hours > cap and cap > 0:
-                    md = SchedulingEngine.split_multi_day_package(
-                        pkg, trade_capacities, date.today(),
-                    )
+                    try:
+                        start = date.fromisoformat(str(pkg.get("scheduled_date", "")))
+                    except ValueError:
+                        start = date.today()
+                    md = SchedulingEngine.split_multi_day_package(pkg, trade_capacities, start)
                     multi_day.append(md)
                     break
 
@@ -431,6 +444,257 @@ class SchedulingEngine:
             max_utilization_pct=round(max_util, 1),
         )
 
+    @staticmethod
+    def level_schedule(
+        program: WeeklyProgram,
+        trade_capacities: list[TradeCapacity],
+        package_attributes: list[dict] | None = None,
+        shutdown_windows: list[dict] | None = None,
+        max_passes: int = 3,
+    ) -> ScheduleLevelingResult:
+        """Place packages on the Thu-Sun window against per-trade shift capacity.
+
+        Packages are taken from a priority queue (priority, then largest
+        first) and placed greedily on the (day, shift) start slot with the
+        lowest resulting peak utilization. Packages whose per-trade hours
+        exceed one shift's capacity span consecutive days on the same shift.
+        A local search then moves packages between feasible slots while the
+        sum of squared utilizations decreases, and retries packages that did
+        not fit. Placed packages get their scheduled_date/scheduled_shift
+        rewritten in program.work_packages; the others keep theirs and are
+        reported as unscheduled.
+
+        Args:
+            program: Weekly program with work packages.
+            trade_capacities: Per-specialty/shift capacity per day. Trades
+                missing from a shift default to SHIFT_HOURS.
+            package_attributes: Optional dicts with package_id and any of
+                shutdown_required, area, priority (e.g. "1_EMERGENCY").
+            shutdown_windows: [{start_date, end_date, areas}]. When given,
+                shutdown_required packages are only placed on days inside a
+                window covering their area (empty areas = whole plant).
+            max_passes: Local search passes over all placed packages.
+        """
+        exec_start = _execution_start(program.year, program.week_number)
+        days = [exec_start + timedelta(days=d) for d in range(EXECUTION_DAYS)]
+
+        cap_map: dict[tuple[str, str], float] = defaultdict(float)
+        for tc in trade_capacities:
+            cap_map[(tc.shift, tc.specialty)] += tc.total_hours
+        shifts = sorted({tc.shift for tc in trade_capacities}, key=lambda s: (_SHIFT_ORDER.get(s, 99), s)) or DEFAULT_SHIFTS
+        n_shifts = len(shifts)
+        n_slots = EXECUTION_DAYS * n_shifts
+
+        def cap(slot: int, spec: str) -> float:
+            return cap_map.get((shifts[slot % n_shifts], spec), SHIFT_HOURS)
+
+        attrs = {a.get("package_id", ""): a for a in (package_attributes or [])}
+        windows = []
+        for w in shutdown_windows or []:
+            windows.append((
+                date.fromisoformat(str(w["start_date"])[:10]),
+                date.fromisoformat(str(w["end_date"])[:10]),
+                set(w.get("areas") or []),
+            ))
+
+        # Per package: demand per trade and candidate (start slot, span) options.
+        # Loads live in one flat list indexed by trade * n_slots + slot.
+        packages = program.work_packages
+        spec_index: dict[str, int] = {}
+        demand: list[dict[str, float]] = []
+        options: list[list[tuple[tuple[int, int], tuple[tuple[int, float], ...]]]] = []
+        blocked_by_shutdown: set[int] = set()
+        for idx, pkg in enumerate(packages):
+            team = pkg.get("assigned_team", []) or ["GENERAL"]
+            hours = pkg.get("total_duration_hours", 0.0)
+            demand.append({spec: hours / len(team) for spec in team})
+            for spec in team:
+                spec_index.setdefault(spec, len(spec_index))
+
+            a = attrs.get(pkg.get("package_id", ""), {})
+            allowed = [True] * EXECUTION_DAYS
+            if shutdown_windows is not None and a.get("shutdown_required"):
+                area = a.get("area", "")
+                allowed = [
+                    any(start <= d <= end and (not areas or area in areas) for start, end, areas in windows)
+                    for d in days
+                ]
+                if not any(allowed):
+                    blocked_by_shutdown.add(idx)
+
+            pkg_options = []
+            for k, shift in enumerate(shifts):
+                caps = [cap_map.get((shift, spec), SHIFT_HOURS) for spec in demand[idx]]
+                if min(caps) <= 0:
+                    continue
+                span = max(1, max(math.ceil(h / c - _EPS) for h, c in zip(demand[idx].values(), caps)))
+                for day in range(EXECUTION_DAYS - span + 1):
+                    if all(allowed[day:day + span]):
+                        start = day * n_shifts + k
+                        cells = tuple(
+                            (spec_index[spec] * n_slots + start + d * n_shifts, h / span)
+                            for spec, h in demand[idx].items() for d in range(span)
+                        )
+                        pkg_options.append(((start, span), cells))
+            pkg_options.sort(key=lambda o: o[0])
+            options.append(pkg_options)
+
+        specs = list(spec_index)
+        capacity = [cap(slot, spec) for spec in specs for slot in range(n_slots)]
+        inv_cap = [1.0 / c if c > 0 else 0.0 for c in capacity]
+        load = [0.0] * len(capacity)
+
+        def fits(cells) -> bool:
+            return all(load[i] + h <= capacity[i] + _EPS for i, h in cells)
+
+        def apply(cells, sign: float) -> None:
+            for i, h in cells:
+                load[i] += sign * h
+
+        def added_cost(cells) -> float:
+            return sum((2 * load[i] * h + h * h) * inv_cap[i] * inv_cap[i] for i, h in cells)
+
+        def place(idx: int):
+            best, best_peak = None, 0.0
+            for option in options[idx]:
+                cells = option[1]
+                if fits(cells):
+                    option_peak = max((load[i] + h) * inv_cap[i] for i, h in cells)
+                    if best is None or option_peak < best_peak - _EPS:
+                        best, best_peak = option, option_peak
+            if best is not None:
+                apply(best[1], 1.0)
+            return best
+
+        # Greedy construction from a priority queue
+        queue = []
+        for idx, pkg in enumerate(packages):
+            a = attrs.get(pkg.get("package_id", ""), {})
+            heapq.heappush(queue, (str(a.get("priority", "9")), -pkg.get("total_duration_hours", 0.0), idx))
+        placement: dict[int, tuple] = {}
+        unplaced: list[int] = []
+        while queue:
+            _, _, idx = heapq.heappop(queue)
+            option = place(idx)
+            if option is None:
+                unplaced.append(idx)
+            else:
+                placement[idx] = option
+
+        # Local search: relocate packages while the squared-utilization cost drops
+        moves = 0
+        for _ in range(max_passes):
+            improved = False
+            for idx, current in list(placement.items()):
+                if len(options[idx]) < 2:
+                    continue
+                apply(current[1], -1.0)
+                best, best_cost = current, added_cost(current[1])
+                for option in options[idx]:
+                    if option is not current and fits(option[1]):
+                        cost = added_cost(option[1])
+                        if cost < best_cost - _EPS:
+                            best, best_cost = option, cost
+                apply(best[1], 1.0)
+                if best is not current:
+                    placement[idx] = best
+                    moves += 1
+                    improved = True
+            still_unplaced = []
+            for idx in unplaced:
+                option = place(idx)
+                if option is None:
+                    still_unplaced.append(idx)
+                else:
+                    placement[idx] = option
+                    improved = True
+            unplaced = still_unplaced
+            if not improved:
+                break
+
+        # Write back placements
+        placements: list[PackagePlacement] = []
+        multi_day: list[MultiDayPackage] = []
+        for idx in sorted(placement):
+            start, span = placement[idx][0]
+            pkg = packages[idx]
+            first_day, shift = days[start // n_shifts], shifts[start % n_shifts]
+            pkg["scheduled_date"] = first_day.isoformat()
+            pkg["scheduled_shift"] = shift
+            placements.append(PackagePlacement(
+                package_id=pkg.get("package_id", ""),
+                scheduled_date=first_day,
+                scheduled_shift=shift,
+                total_days=span,
+            ))
+            if span > 1:
+                hours = pkg.get("total_duration_hours", 0.0)
+                bottleneck = max(demand[idx], key=lambda spec: demand[idx][spec] / cap(start, spec))
+                multi_day.append(MultiDayPackage(
+                    package_id=pkg.get("package_id", ""),
+                    total_hours=hours,
+                    bottleneck_specialty=bottleneck,
+                    day_allocations=[
+                        {"day": d + 1, "date": (first_day + timedelta(days=d)).isoformat(), "hours": round(hours / span, 1)}
+                        for d in range(span)
+                    ],
+                    total_days=span,
+                ))
+
+        # Utilization per slot and trade
+        report_specs = sorted(set(specs) | {spec for _, spec in cap_map})
+        slots: list[ResourceSlot] = []
+        max_util, bottleneck = 0.0, ""
+        for slot in range(n_slots):
+            shift = shifts[slot % n_shifts]
+            for spec in report_specs:
+                hrs = max(load[spec_index[spec] * n_slots + slot], 0.0) if spec in spec_index else 0.0
+                c = cap(slot, spec)
+                if hrs <= _EPS and (shift, spec) not in cap_map:
+                    continue
+                util = hrs / c * 100.0 if c > 0 else 0.0
+                if util > max_util:
+                    max_util, bottleneck = util, spec
+                slots.append(ResourceSlot(
+                    slot_date=days[slot // n_shifts],
+                    shift=shift,
+                    specialty=spec,
+                    assigned_hours=round(hrs, 1),
+                    capacity_hours=c,
+                    utilization_pct=round(util, 1),
+                ))
+        program.resource_slots = slots
+
+        conflicts: list[ConflictResolution] = []
+        for idx in sorted(unplaced):
+            pkg_id = packages[idx].get("package_id", "")
+            if idx in blocked_by_shutdown:
+                conflicts.append(ConflictResolution(
+                    conflict_description=f"{pkg_id} requires shutdown but no window covers its area this week",
+                    resolution_type=ConflictResolutionType.EXTEND_WINDOW,
+                    suggestion=f"Defer {pkg_id} to the next shutdown window or extend the current one",
+                    estimated_impact="Package stays in backlog until a shutdown window is available",
+                ))
+            else:
+                trades = ", ".join(sorted(demand[idx]))
+                conflicts.append(ConflictResolution(
+                    conflict_description=f"{pkg_id} does not fit remaining {trades} capacity in the Thu-Sun window",
+                    resolution_type=ConflictResolutionType.ADD_SHIFT,
+                    suggestion=f"Add {trades} capacity or defer {pkg_id} to next week",
+                    estimated_impact=f"Schedules {packages[idx].get('total_duration_hours', 0.0):.1f}h of deferred work",
+                ))
+
+        return ScheduleLevelingResult(
+            placements=placements,
+            resource_slots=slots,
+            multi_day_packages=multi_day,
+            unscheduled_packages=[packages[idx].get("package_id", "") for idx in sorted(unplaced)],
+            conflicts=conflicts,
+            bottleneck_specialty=bottleneck,
+            max_utilization_pct=round(max_util, 1),
+            local_search_moves=moves,
+        )
+
     @staticmethod
     def suggest_conflict_resolutions(
         conflicts: list[ResourceConflict],
@@ -8,12 +8,19 @@ Validated by GECAMIN MAPLA 2024:
 
 Phase 1: Pure statistical methods (no ML dependency).
 Uses standard 2-parameter Weibull: R(t) = exp(-(t/eta)^beta)
+Maximum-likelihood fits also support right-censored (suspended) units and
+the 3-parameter form R(t) = exp(-((t - gamma)/eta)^beta).
 
 NOTE: All outputs enter as DRAFT — safety-first principle applies.
 Human always validates prediction results.
 """
 
 import math
+from dataclasses import dataclass
+from itertools import chain
+from statistics import NormalDist
+
+import numpy as np
 
 from tools.models.schemas import (
     ApprovalStatus,
@@ -22,6 +29,99 @@ from tools.models.schemas import (
     WeibullParameters,
 )
 
+# Lanczos coefficients (g=7) shared by the scalar and vectorised Gamma function
+_LANCZOS_G = 7
+_LANCZOS_COEFFICIENTS = [
+    0.99999999999980993, 676.5203681218851, -1259.1392167224028,
+    771.32342877765313, -176.61502916214059, 12.507343278686905,
+    -0.13857109526572012, 9.9843695780195716e-6, 1.5056327351493116e-7,
+]
+
+# Bracket for the MLE shape parameter; a root outside it means degenerate data
+_MLE_BETA_MIN = 1e-3
+_MLE_BETA_MAX = 100.0
+
+# Upper beta bounds for each Nowlan & Heap pattern (see classify_failure_pattern)
+_PATTERN_BETA_BOUNDS = np.array([0.8, 1.2, 1.5, 2.0, 3.5])
+_PATTERN_ORDER = np.array([
+    FailurePattern.F_EARLY_LIFE.value,
+    FailurePattern.E_RANDOM.value,
+    FailurePattern.D_STRESS.value,
+    FailurePattern.C_FATIGUE.value,
+    FailurePattern.B_AGE.value,
+    FailurePattern.A_BATHTUB.value,
+])
+
+
+@dataclass
+class WeibullBatchFit:
+    """Weibull parameters for many equipment items, one array slot per series."""
+    beta: np.ndarray
+    eta: np.ndarray
+    gamma: np.ndarray
+    r_squared: np.ndarray
+    sample_size: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.beta)
+
+    def params(self, i: int) -> WeibullParameters:
+        """Materialise series ``i`` as a WeibullParameters model."""
+        return WeibullParameters(
+            beta=float(self.beta[i]),
+            eta=float(self.eta[i]),
+            gamma=float(self.gamma[i]),
+            r_squared=float(self.r_squared[i]),
+            sample_size=int(self.sample_size[i]),
+        )
+
+
+@dataclass
+class WeibullMLEBatchFit(WeibullBatchFit):
+    """Maximum-likelihood fits with Fisher-matrix confidence bounds.
+
+    Bounds are two-sided at ``confidence_level`` and, for 3-parameter fits,
+    conditional on the fitted location ``gamma``. Items that fell back to the
+    exponential estimate (fewer than 2 failures, or no converged solution)
+    have ``converged == False`` and NaN bounds. ``r_squared`` is not defined
+    for MLE and is left at 0.
+    """
+    failures: np.ndarray
+    log_likelihood: np.ndarray
+    beta_lower: np.ndarray
+    beta_upper: np.ndarray
+    eta_lower: np.ndarray
+    eta_upper: np.ndarray
+    converged: np.ndarray
+    iterations: int
+    confidence_level: float
+
+    def bounds(self, i: int) -> dict:
+        """Confidence bounds of series ``i`` as a plain dict."""
+        return {
+            "confidence_level": self.confidence_level,
+            "beta_lower": float(self.beta_lower[i]),
+            "beta_upper": float(self.beta_upper[i]),
+            "eta_lower": float(self.eta_lower[i]),
+            "eta_upper": float(self.eta_upper[i]),
+        }
+
+
+@dataclass
+class WeibullBatchPrediction:
+    """Fleet-wide prediction arrays aligned with the input series."""
+    fit: WeibullBatchFit
+    current_age_days: np.ndarray
+    reliability_current: np.ndarray
+    predicted_failure_window_days: np.ndarray
+    mean_life: np.ndarray
+    risk_score: np.ndarray
+    failure_pattern: np.ndarray
+    confidence_level: float
+
+    def __len__(self) -> int:
+        return len(self.fit)
+
 
 class WeibullEngine:
     """Statistical failure prediction using Weibull distribution analysis."""
@@ -41,70 +141,325 @@ class WeibullEngine:
         Returns:
             WeibullParameters with estimated beta, eta, and fit quality.
         """
-        n = len(failure_intervals)
-        if n < 3:
-            return WeibullParameters(
-                beta=1.0, eta=max(failure_intervals) if failure_intervals else 365.0,
-                r_squared=0.0, sample_size=n,
-            )
+        return WeibullEngine.fit_batch([failure_intervals]).params(0)
 
-        # Sort failures
-        sorted_failures = sorted(failure_intervals)
-
-        # Median rank approximation: F(i) = (i - 0.3) / (n + 0.4) (Bernard's approx.)
-        x = []  # ln(t)
-        y = []  # ln(ln(1/(1-F)))
-        for i, t in enumerate(sorted_failures, 1):
-            if t <= 0:
-                continue
-            f = (i - 0.3) / (n + 0.4)
-            if f <= 0 or f >= 1:
-                continue
-            x.append(math.log(t))
-            y.append(math.log(math.log(1 / (1 - f))))
-
-        if len(x) < 2:
-            return WeibullParameters(
-                beta=1.0, eta=sum(sorted_failures) / n if n > 0 else 365.0,
-                r_squared=0.0, sample_size=n,
-            )
+    @staticmethod
+    def fit_batch(series: list[list[float]]) -> WeibullBatchFit:
+        """Rank-regression fit of many failure-interval series at once.
 
-        # Linear regression: y = beta * x - beta * ln(eta)
-        n_pts = len(x)
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(xi * yi for xi, yi in zip(x, y))
-        sum_x2 = sum(xi * xi for xi in x)
-
-        denom = n_pts * sum_x2 - sum_x * sum_x
-        if abs(denom) < 1e-10:
-            return WeibullParameters(
-                beta=1.0, eta=sum(sorted_failures) / n,
-                r_squared=0.0, sample_size=n,
-            )
+        Same method and fallbacks as fit_parameters, but the ragged input is
+        flattened into one array so median ranks and the regression sums for
+        every series are computed with a handful of NumPy passes.
 
-        beta = (n_pts * sum_xy - sum_x * sum_y) / denom
-        intercept = (sum_y - beta * sum_x) / n_pts
-        eta = math.exp(-intercept / beta) if beta != 0 else sum(sorted_failures) / n
+        Args:
+            series: One list of time-to-failure values (days) per equipment.
+
+        Returns:
+            WeibullBatchFit whose arrays are indexed like ``series``.
+        """
+        values, _owner, lengths = WeibullEngine._flatten(series)
+        return WeibullEngine.fit_batch_flat(values, lengths)
 
-        # R-squared (coefficient of determination)
-        mean_y = sum_y / n_pts
-        ss_tot = sum((yi - mean_y) ** 2 for yi in y)
-        ss_res = sum((yi - (beta * xi + intercept)) ** 2 for xi, yi in zip(x, y))
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
+    @staticmethod
+    def fit_batch_flat(values: np.ndarray, lengths: np.ndarray) -> WeibullBatchFit:
+        """fit_batch on already flattened series.
+
+        Args:
+            values: Time-to-failure values (days) of every series, back to back.
+                Not modified, so a read-only view (e.g. of an Arrow list
+                column, see ColumnarEngine.list_to_numpy) is used as is.
+            lengths: Number of values of each series.
+        """
+        values = np.asarray(values, dtype=float)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        m = len(lengths)
+        owner = np.repeat(np.arange(m), lengths)
+
+        # Sort within each series, then rank = position inside its own block
+        order = np.lexsort((values, owner))
+        values = values[order]
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])) if m else lengths
+        rank = np.arange(len(values)) - offsets[owner] + 1
+
+        n = lengths.astype(float)
+        totals = np.bincount(owner, weights=values, minlength=m)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_all = totals / np.maximum(n, 1)
+            max_all = np.full(m, 365.0)
+            if len(values):
+                last = offsets + lengths - 1
+                has = lengths > 0
+                max_all[has] = values[last[has]]
+
+            # Median rank approximation: F(i) = (i - 0.3) / (n + 0.4) (Bernard's approx.)
+            valid = values > 0
+            f = (rank - 0.3) / (n[owner] + 0.4)
+            x = np.log(np.where(valid, values, 1.0))
+            y = np.log(np.log(1 / (1 - f)))
+            w = valid.astype(float)
+
+            n_pts = np.bincount(owner, weights=w, minlength=m)
+            sum_x = np.bincount(owner, weights=x * w, minlength=m)
+            sum_y = np.bincount(owner, weights=y * w, minlength=m)
+            sum_xy = np.bincount(owner, weights=x * y * w, minlength=m)
+            sum_x2 = np.bincount(owner, weights=x * x * w, minlength=m)
+
+            # Linear regression: y = beta * x - beta * ln(eta)
+            denom = n_pts * sum_x2 - sum_x * sum_x
+            beta = (n_pts * sum_xy - sum_x * sum_y) / denom
+            intercept = (sum_y - beta * sum_x) / n_pts
+            eta = np.where(beta != 0, np.exp(-intercept / beta), mean_all)
+
+            # R-squared (coefficient of determination)
+            mean_y = sum_y / n_pts
+            ss_tot = np.bincount(owner, weights=w * (y - mean_y[owner]) ** 2, minlength=m)
+            resid = y - (beta[owner] * x + intercept[owner])
+            ss_res = np.bincount(owner, weights=w * resid ** 2, minlength=m)
+            r_squared = np.where(ss_tot > 0, 1 - ss_res / ss_tot, 0.0)
 
         # Ensure valid parameters
-        beta = max(0.1, beta)
-        eta = max(1.0, eta)
-        r_squared = max(0.0, min(1.0, r_squared))
+        beta = np.round(np.maximum(0.1, beta), 3)
+        eta = np.round(np.maximum(1.0, eta), 1)
+        r_squared = np.round(np.clip(r_squared, 0.0, 1.0), 4)
+
+        # Fallbacks: fewer than 3 failures, fewer than 2 usable points,
+        # or all points at the same time (denom ~ 0)
+        too_small = lengths < 3
+        degenerate = too_small | (n_pts < 2) | (np.abs(denom) < 1e-10)
+        beta = np.where(degenerate, 1.0, beta)
+        eta = np.where(too_small, max_all, np.where(degenerate, mean_all, eta))
+        r_squared = np.where(degenerate, 0.0, r_squared)
+
+        return WeibullBatchFit(
+            beta=beta,
+            eta=eta,
+            gamma=np.zeros(m),
+            r_squared=r_squared,
+            sample_size=lengths,
+        )
 
-        return WeibullParameters(
-            beta=round(beta, 3),
-            eta=round(eta, 1),
-            r_squared=round(r_squared, 4),
-            sample_size=n,
+    @staticmethod
+    def _flatten(series: list[list[float]]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Flatten a ragged list into (values, owning series index, lengths)."""
+        lengths = np.fromiter((len(s) for s in series), dtype=np.int64, count=len(series))
+        values = np.fromiter(chain.from_iterable(series), dtype=float, count=int(lengths.sum()))
+        owner = np.repeat(np.arange(len(series)), lengths)
+        return values, owner, lengths
+
+    @classmethod
+    def fit_mle(
+        cls,
+        failure_intervals: list[float],
+        suspensions: list[float] | None = None,
+        three_parameter: bool = False,
+    ) -> WeibullParameters:
+        """Maximum-likelihood Weibull fit for a single equipment item.
+
+        Args:
+            failure_intervals: Time-to-failure values (days).
+            suspensions: Running times (days) of units that have not failed
+                (right-censored). Optional.
+            three_parameter: Also estimate the location parameter gamma.
+
+        Returns:
+            WeibullParameters; use fit_mle_batch for confidence bounds.
+        """
+        return cls.fit_mle_batch(
+            [failure_intervals],
+            [suspensions or []],
+            three_parameter=three_parameter,
+        ).params(0)
+
+    @classmethod
+    def fit_mle_batch(
+        cls,
+        failure_series: list[list[float]],
+        suspension_series: list[list[float]] | None = None,
+        three_parameter: bool = False,
+        confidence_level: float = 0.9,
+    ) -> WeibullMLEBatchFit:
+        """Maximum-likelihood fit of many (possibly censored) series at once.
+
+        Beta solves the profile-likelihood equation
+
+            sum(t^b ln t) / sum(t^b) - 1/b - mean(ln t_failures) = 0
+
+        with a bracketed Newton iteration run on all series simultaneously
+        (typically 5-8 iterations); eta then follows in closed form. For the
+        3-parameter form, gamma maximises the profile log-likelihood by
+        golden-section search on [0, first failure). Fits whose gamma would
+        push beta below 1 (unbounded likelihood) revert to gamma = 0.
+
+        Args:
+            failure_series: Time-to-failure values (days), one list per item.
+            suspension_series: Running times (days) of unfailed units, one
+                list per item. Optional.
+            three_parameter: Also estimate the location parameter gamma.
+            confidence_level: Two-sided level of the Fisher-matrix bounds.
+
+        Returns:
+            WeibullMLEBatchFit whose arrays are indexed like ``failure_series``.
+        """
+        m = len(failure_series)
+        if suspension_series is None:
+            suspension_series = [[] for _ in range(m)]
+        if len(suspension_series) != m:
+            raise ValueError(
+                f"suspension_series has {len(suspension_series)} entries for {m} failure series"
+            )
+
+        f_values, f_owner, f_lengths = cls._flatten(failure_series)
+        s_values, s_owner, s_lengths = cls._flatten(suspension_series)
+        t = np.concatenate((f_values, s_values))
+        owner = np.concatenate((f_owner, s_owner))
+        failed = np.concatenate((np.ones(len(f_values)), np.zeros(len(s_values))))
+
+        # Non-positive times carry no information
+        keep = t > 0
+        t, owner, failed = t[keep], owner[keep], failed[keep]
+        r = np.bincount(owner, weights=failed, minlength=m)
+        total_time = np.bincount(owner, weights=t, minlength=m)
+
+        beta, eta, loglik, solved, iterations = cls._mle_profile(t, failed, owner, m, r)
+        gamma = np.zeros(m)
+
+        if three_parameter and len(t):
+            first_failure = np.full(m, np.inf)
+            np.minimum.at(first_failure, owner[failed == 1], t[failed == 1])
+            search = (r >= 2) & np.isfinite(first_failure)
+            gamma_hi = np.where(search, first_failure * (1 - 1e-6), 0.0)
+
+            def profile(g: np.ndarray, beta0: np.ndarray):
+                return cls._mle_profile(t - g[owner], failed, owner, m, r, beta0)
+
+            # Golden-section maximisation of the profile log-likelihood in gamma
+            inv_phi = (math.sqrt(5) - 1) / 2
+            a, b = np.zeros(m), gamma_hi
+            c, d = b - inv_phi * (b - a), a + inv_phi * (b - a)
+            fc = profile(c, beta)[2]
+            fd = profile(d, beta)[2]
+            for _ in range(40):
+                left = fc > fd
+                b = np.where(left, d, b)
+                a = np.where(left, a, c)
+                c_new = np.where(left, b - inv_phi * (b - a), d)
+                d_new = np.where(left, c, a + inv_phi * (b - a))
+                probe = np.where(left, c_new, d_new)
+                f_probe = profile(probe, beta)[2]
+                fc, fd = np.where(left, f_probe, fd), np.where(left, fc, f_probe)
+                c, d = c_new, d_new
+            g_star = np.where(search, (a + b) / 2, 0.0)
+            b3, e3, ll3, ok3, it3 = profile(g_star, beta)
+            iterations += it3
+
+            better = search & ok3 & (ll3 > loglik) & (b3 >= 1.0)
+            beta = np.where(better, b3, beta)
+            eta = np.where(better, e3, eta)
+            loglik = np.where(better, ll3, loglik)
+            gamma = np.where(better, g_star, 0.0)
+
+        # Fisher information at the MLE (observed), on the shifted times
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            shifted = t - gamma[owner]
+            w = (shifted > 0).astype(float)
+            u = np.log(np.where(w > 0, shifted, 1.0) / eta[owner])
+            zb = w * np.exp(beta[owner] * u)
+            s1 = np.bincount(owner, weights=zb * u, minlength=m)
+            s2 = np.bincount(owner, weights=zb * u * u, minlength=m)
+            info_bb = r / beta ** 2 + s2
+            info_ee = r * beta ** 2 / eta ** 2
+            info_be = -beta * s1 / eta
+            det = info_bb * info_ee - info_be ** 2
+            se_beta = np.sqrt(info_ee / det)
+            se_eta = np.sqrt(info_bb / det)
+
+        z = NormalDist().inv_cdf((1 + confidence_level) / 2)
+        converged = solved & np.isfinite(loglik) & (det > 0)
+
+        # Exponential fallback: beta = 1, eta = total time on test / failures
+        fallback_eta = np.where(r >= 1, total_time / np.maximum(r, 1), np.maximum(total_time, 365.0))
+        beta = np.where(converged, beta, 1.0)
+        eta = np.where(converged, eta, fallback_eta)
+        gamma = np.where(converged, gamma, 0.0)
+        nan = np.full(m, np.nan)
+
+        return WeibullMLEBatchFit(
+            beta=np.round(np.maximum(0.1, beta), 3),
+            eta=np.round(np.maximum(1.0, eta), 1),
+            gamma=np.round(gamma, 1),
+            r_squared=np.zeros(m),
+            sample_size=f_lengths + s_lengths,
+            failures=r.astype(np.int64),
+            log_likelihood=np.where(converged, loglik, nan),
+            beta_lower=np.where(converged, beta * np.exp(-z * se_beta / beta), nan),
+            beta_upper=np.where(converged, beta * np.exp(z * se_beta / beta), nan),
+            eta_lower=np.where(converged, eta * np.exp(-z * se_eta / eta), nan),
+            eta_upper=np.where(converged, eta * np.exp(z * se_eta / eta), nan),
+            converged=converged,
+            iterations=iterations,
+            confidence_level=confidence_level,
         )
 
+    @staticmethod
+    def _mle_profile(
+        t: np.ndarray,
+        failed: np.ndarray,
+        owner: np.ndarray,
+        m: int,
+        r: np.ndarray,
+        beta0: np.ndarray | None = None,
+        tol: float = 1e-8,
+        max_iter: int = 50,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+        """Solve the 2-parameter profile equation for every series at once.
+
+        Times <= 0 (suspensions inside a 3-parameter failure-free period) are
+        ignored. Returns (beta, eta, log-likelihood, solved mask, iterations).
+        A series is unsolved when it has fewer than 2 failures or no root
+        inside the beta bracket (e.g. all failures at the same time).
+        """
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            w = (t > 0).astype(float)
+            t = np.where(w > 0, t, 1.0)
+            # Scale by the longest time per series so t^beta stays in (0, 1]
+            scale = np.ones(m)
+            np.maximum.at(scale, owner, t)
+            u = np.log(t / scale[owner])
+            mean_fu = np.bincount(owner, weights=u * failed, minlength=m) / r
+
+            beta = np.ones(m) if beta0 is None else beta0.copy()
+            lo, hi = np.full(m, _MLE_BETA_MIN), np.full(m, _MLE_BETA_MAX)
+            active = r >= 2
+            iterations = 0
+            for iterations in range(1, max_iter + 1):
+                zb = w * np.exp(beta[owner] * u)
+                s0 = np.bincount(owner, weights=zb, minlength=m)
+                s1 = np.bincount(owner, weights=zb * u, minlength=m)
+                s2 = np.bincount(owner, weights=zb * u * u, minlength=m)
+                g = s1 / s0 - 1 / beta - mean_fu
+                dg = (s2 * s0 - s1 * s1) / s0 ** 2 + 1 / beta ** 2
+
+                # g is increasing in beta: keep a bracket and bisect on bad steps
+                lo = np.where(g < 0, beta, lo)
+                hi = np.where(g > 0, beta, hi)
+                step = beta - g / dg
+                new = np.where((step > lo) & (step < hi), step, np.sqrt(lo * hi))
+                new = np.where(active, new, beta)
+                done = np.abs(new - beta) <= tol * beta
+                beta = new
+                active &= ~done
+                if not active.any():
+                    break
+
+            s0 = np.bincount(owner, weights=w * np.exp(beta[owner] * u), minlength=m)
+            eta = scale * (s0 / r) ** (1 / beta)
+            sum_f_log_t = np.bincount(owner, weights=failed * w * np.log(t), minlength=m)
+            # At the MLE sum((t/eta)^beta) == r, so the last term collapses to -r
+            loglik = r * np.log(beta) - r * beta * np.log(eta) + (beta - 1) * sum_f_log_t - r
+            solved = (r >= 2) & ~active & (beta > _MLE_BETA_MIN * 1.01) & (beta < _MLE_BETA_MAX * 0.99)
+            loglik = np.where(solved, loglik, -np.inf)
+        return beta, eta, loglik, solved, iterations
+
     @staticmethod
     def reliability(t: float, params: WeibullParameters) -> float:
         """Calculate reliability R(t) = exp(-(t/eta)^beta).
@@ -145,18 +500,22 @@ class WeibullEngine:
             return math.pi / (math.sin(math.pi * x) * WeibullEngine._gamma_function(1 - x))
 
         x -= 1
-        g = 7
-        coefficients = [
-            0.99999999999980993, 676.5203681218851, -1259.1392167224028,
-            771.32342877765313, -176.61502916214059, 12.507343278686905,
-            -0.13857109526572012, 9.9843695780195716e-6, 1.5056327351493116e-7,
-        ]
-        t = x + g + 0.5
-        s = coefficients[0]
-        for i in range(1, len(coefficients)):
-            s += coefficients[i] / (x + i)
+        t = x + _LANCZOS_G + 0.5
+        s = _LANCZOS_COEFFICIENTS[0]
+        for i in range(1, len(_LANCZOS_COEFFICIENTS)):
+            s += _LANCZOS_COEFFICIENTS[i] / (x + i)
         return math.sqrt(2 * math.pi) * (t ** (x + 0.5)) * math.exp(-t) * s
 
+    @staticmethod
+    def _gamma_array(x: np.ndarray) -> np.ndarray:
+        """Vectorised Lanczos Gamma for x >= 0.5 (always true for 1 + 1/beta)."""
+        x = np.asarray(x, dtype=float) - 1
+        t = x + _LANCZOS_G + 0.5
+        s = np.full_like(x, _LANCZOS_COEFFICIENTS[0])
+        for i in range(1, len(_LANCZOS_COEFFICIENTS)):
+            s += _LANCZOS_COEFFICIENTS[i] / (x + i)
+        return math.sqrt(2 * math.pi) * (t ** (x + 0.5)) * np.exp(-t) * s
+
     @staticmethod
     def classify_failure_pattern(beta: float) -> FailurePattern:
         """Map Weibull beta to Nowlan & Heap failure pattern.
@@ -179,47 +538,89 @@ class WeibullEngine:
         else:
             return FailurePattern.A_BATHTUB
 
+    @staticmethod
+    def classify_failure_patterns(beta: np.ndarray) -> np.ndarray:
+        """Vectorised classify_failure_pattern; returns FailurePattern values."""
+        return _PATTERN_ORDER[np.searchsorted(_PATTERN_BETA_BOUNDS, beta, side="right")]
+
     @classmethod
-    def predict(
+    def predict_batch(
         cls,
-        equipment_id: str,
-        equipment_tag: str,
-        failure_intervals: list[float],
-        current_age_days: float,
+        series: list[list[float]],
+        current_age_days: list[float],
         confidence_level: float = 0.9,
-    ) -> FailurePrediction:
-        """Generate failure prediction for an equipment item.
+    ) -> WeibullBatchPrediction:
+        """Fit and predict for a whole fleet in one vectorised pass.
 
         Args:
-            equipment_id: SAP EQUNR
-            equipment_tag: Technical TAG
-            failure_intervals: Historical time-to-failure data (days)
-            current_age_days: Current age since last overhaul (days)
+            series: Historical time-to-failure data (days), one list per item.
+            current_age_days: Current age since last overhaul (days), per item.
             confidence_level: Desired confidence level (0.5-0.99)
 
         Returns:
-            FailurePrediction with DRAFT status (safety-first: human must validate).
+            WeibullBatchPrediction with unrounded per-item arrays.
         """
-        params = cls.fit_parameters(failure_intervals)
-        reliability_now = cls.reliability(current_age_days, params)
-        failure_pattern = cls.classify_failure_pattern(params.beta)
+        return cls.predict_from_fit(cls.fit_batch(series), current_age_days, confidence_level)
+
+    @classmethod
+    def predict_from_fit(
+        cls,
+        fit: WeibullBatchFit,
+        current_age_days: list[float],
+        confidence_level: float = 0.9,
+    ) -> WeibullBatchPrediction:
+        """Vectorised prediction from already fitted parameters (e.g. fit_mle_batch)."""
+        age = np.asarray(current_age_days, dtype=float)
+        if age.shape != fit.beta.shape:
+            raise ValueError(
+                f"current_age_days has {age.size} entries for {len(fit)} failure series"
+            )
+
+        # R(t) = exp(-((t - gamma)/eta)^beta), 1.0 before the failure-free period
+        adjusted = np.maximum(age - fit.gamma, 0.0)
+        reliability_now = np.where(
+            age <= fit.gamma, 1.0, np.exp(-((adjusted / fit.eta) ** fit.beta)),
+        )
 
         # Predicted failure window: time until R(t) drops to (1 - confidence_level)
-        # Solve: R(t_pred) = 1 - confidence_level
         target_reliability = 1 - confidence_level
         if target_reliability <= 0 or target_reliability >= 1:
-            predicted_days = params.eta  # Fallback to characteristic life
+            predicted_days = fit.eta.copy()  # Fallback to characteristic life
         else:
             # t = eta * (-ln(R))^(1/beta) + gamma
-            predicted_t = params.eta * ((-math.log(target_reliability)) ** (1 / params.beta)) + params.gamma
-            predicted_days = max(0, predicted_t - current_age_days)
+            predicted_t = fit.eta * ((-math.log(target_reliability)) ** (1 / fit.beta)) + fit.gamma
+            predicted_days = np.maximum(0.0, predicted_t - age)
 
         # Risk score: 0-100 based on proximity to predicted failure
-        mean_life_val = cls.mean_life(params)
-        if mean_life_val > 0:
-            risk_score = min(100.0, (current_age_days / mean_life_val) * 100)
-        else:
-            risk_score = 50.0
+        mean_life = fit.eta * cls._gamma_array(1 + 1 / fit.beta) + fit.gamma
+        with np.errstate(divide="ignore", invalid="ignore"):
+            risk_score = np.where(
+                mean_life > 0, np.minimum(100.0, age / mean_life * 100), 50.0,
+            )
+
+        return WeibullBatchPrediction(
+            fit=fit,
+            current_age_days=age,
+            reliability_current=reliability_now,
+            predicted_failure_window_days=predicted_days,
+            mean_life=mean_life,
+            risk_score=risk_score,
+            failure_pattern=cls.classify_failure_patterns(fit.beta),
+            confidence_level=confidence_level,
+        )
+
+    @classmethod
+    def prediction_from_batch(
+        cls,
+        batch: WeibullBatchPrediction,
+        i: int,
+        equipment_id: str,
+        equipment_tag: str,
+    ) -> FailurePrediction:
+        """Materialise row ``i`` of a batch as a DRAFT FailurePrediction."""
+        failure_pattern = FailurePattern(str(batch.failure_pattern[i]))
+        risk_score = float(batch.risk_score[i])
+        predicted_days = float(batch.predicted_failure_window_days[i])
 
         # Generate recommendation based on pattern and risk
         recommendation = cls._generate_recommendation(failure_pattern, risk_score, predicted_days)
@@ -227,17 +628,41 @@ class WeibullEngine:
         return FailurePrediction(
             equipment_id=equipment_id,
             equipment_tag=equipment_tag,
-            weibull_params=params,
-            current_age_days=current_age_days,
-            reliability_current=round(reliability_now, 4),
+            weibull_params=batch.fit.params(i),
+            current_age_days=float(batch.current_age_days[i]),
+            reliability_current=round(float(batch.reliability_current[i]), 4),
             predicted_failure_window_days=round(predicted_days, 1),
-            confidence_level=confidence_level,
+            confidence_level=batch.confidence_level,
             risk_score=round(risk_score, 1),
             failure_pattern=failure_pattern,
             recommendation=recommendation,
             status=ApprovalStatus.DRAFT,
         )
 
+    @classmethod
+    def predict(
+        cls,
+        equipment_id: str,
+        equipment_tag: str,
+        failure_intervals: list[float],
+        current_age_days: float,
+        confidence_level: float = 0.9,
+    ) -> FailurePrediction:
+        """Generate failure prediction for an equipment item.
+
+        Args:
+            equipment_id: SAP EQUNR
+            equipment_tag: Technical TAG
+            failure_intervals: Historical time-to-failure data (days)
+            current_age_days: Current age since last overhaul (days)
+            confidence_level: Desired confidence level (0.5-0.99)
+
+        Returns:
+            FailurePrediction with DRAFT status (safety-first: human must validate).
+        """
+        batch = cls.predict_batch([failure_intervals], [current_age_days], confidence_level)
+        return cls.prediction_from_batch(batch, 0, equipment_id, equipment_tag)
+
     @staticmethod
     def _generate_recommendation(
         pattern: FailurePattern,
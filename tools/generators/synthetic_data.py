@@ -128,6 +128,12 @@ FAILURE_MODES_BY_MI = {
 }
 
 
+# Weibull shapes drawn per equipment: infant mortality, random, wear-out
+FAILURE_SHAPES = [0.8, 1.0, 1.5, 2.2, 3.0]
+
+SPECIALTIES = ["MECHANICAL", "ELECTRICAL", "INSTRUMENTATION", "WELDING", "LUBRICATION"]
+
+
 class SyntheticDataGenerator:
     """Generates phosphate-realistic synthetic maintenance data."""
 
@@ -141,29 +147,84 @@ class SyntheticDataGenerator:
         num_areas: int | None = None,
     ) -> list[dict]:
         """Generate a complete plant hierarchy."""
+        areas = PHOSPHATE_AREAS[:num_areas] if num_areas else PHOSPHATE_AREAS
+        return self._plant_nodes(
+            plant_code, plant_name, "Complexe d'engrais de Jorf 1",
+            [(area_code, area_code, area_fr, area_en) for area_code, area_fr, area_en in areas],
+            equipment_per_system=None, tag_numbers={}, include_components=True,
+        )
+
+    def generate_fleet(
+        self,
+        num_plants: int = 3,
+        areas_per_plant: int = 8,
+        equipment_per_system: int | None = None,
+        include_components: bool = True,
+    ) -> list[dict]:
+        """Generate several plants at once, for scale and benchmark data.
+
+        Args:
+            num_plants: Plants OCP-P01, OCP-P02, ...
+            areas_per_plant: Areas cycle through PHOSPHATE_AREAS; repeats get
+                a numeric suffix in their code (e.g. OCP-P01-BRY2).
+            equipment_per_system: Equipment per area system, cycling through
+                the area's equipment types (default: one of each type).
+            include_components: Also generate sub-assemblies and
+                maintainable items below each equipment.
+
+        Equipment tags are numbered fleet-wide per area type
+        (BRY-SAG-ML-001, BRY-BAL-ML-002, ...), so they stay unique across plants.
+        """
+        nodes = []
+        tag_numbers: dict[str, int] = {}
+        for p in range(1, num_plants + 1):
+            areas = []
+            for a in range(areas_per_plant):
+                area_code, area_fr, area_en = PHOSPHATE_AREAS[a % len(PHOSPHATE_AREAS)]
+                repeat = a // len(PHOSPHATE_AREAS)
+                suffix = str(repeat + 1) if repeat else ""
+                areas.append((f"{area_code}{suffix}", area_code, area_fr, area_en))
+            nodes.extend(self._plant_nodes(
+                f"OCP-P{p:02d}", f"Phosphate Plant {p}", f"Usine de phosphate {p}", areas,
+                equipment_per_system, tag_numbers, include_components,
+            ))
+        return nodes
+
+    def _plant_nodes(
+        self,
+        plant_code: str,
+        plant_name: str,
+        plant_name_fr: str,
+        areas: list[tuple[str, str, str, str]],
+        equipment_per_system: int | None,
+        tag_numbers: dict[str, int],
+        include_components: bool,
+    ) -> list[dict]:
+        """Nodes of one plant; areas are (code suffix, area type, French, English)."""
         nodes = []
         plant_id = str(uuid.uuid4())
         nodes.append({
             "node_id": plant_id,
             "node_type": "PLANT",
             "name": plant_name,
-            "name_fr": "Complexe d'engrais de Jorf 1",
+            "name_fr": plant_name_fr,
             "code": plant_code,
             "level": 1,
             "parent_node_id": None,
+            "plant_code": plant_code,
         })
 
-        areas = PHOSPHATE_AREAS[:num_areas] if num_areas else PHOSPHATE_AREAS
-        for area_code, area_fr, area_en in areas:
+        for area_suffix, area_code, area_fr, area_en in areas:
             area_id = str(uuid.uuid4())
             nodes.append({
                 "node_id": area_id,
                 "node_type": "AREA",
                 "name": area_en,
                 "name_fr": area_fr,
-                "code": f"{plant_code}-{area_code}",
+                "code": f"{plant_code}-{area_suffix}",
                 "level": 2,
                 "parent_node_id": plant_id,
+                "plant_code": plant_code,
             })
 
             system_id = str(uuid.uuid4())
@@ -172,15 +233,21 @@ class SyntheticDataGenerator:
                 "node_type": "SYSTEM",
                 "name": f"{area_en} System",
                 "name_fr": f"Système {area_fr}",
-                "code": f"{plant_code}-{area_code}-SYS",
+                "code": f"{plant_code}-{area_suffix}-SYS",
                 "level": 3,
                 "parent_node_id": area_id,
+                "plant_code": plant_code,
             })
 
-            equipment_defs = EQUIPMENT_TYPES.get(area_code, [])
+            type_defs = EQUIPMENT_TYPES.get(area_code, [])
+            if equipment_per_system is None or not type_defs:
+                equipment_defs = type_defs
+            else:
+                equipment_defs = [type_defs[i % len(type_defs)] for i in range(equipment_per_system)]
             for eq_idx, eq_def in enumerate(equipment_defs, 1):
                 eq_id = str(uuid.uuid4())
-                tag = f"{area_code}-{eq_def['code']}-{eq_idx:03d}"
+                tag_numbers[area_code] = tag_numbers.get(area_code, 0) + 1
+                tag = f"{area_code}-{eq_def['code']}-{tag_numbers[area_code]:03d}"
                 mfr = self.rng.choice(MANUFACTURERS.get(eq_def["type"], MANUFACTURERS["DEFAULT"]))
                 nodes.append({
                     "node_id": eq_id,
@@ -190,12 +257,15 @@ class SyntheticDataGenerator:
                     "code": tag,
                     "level": 4,
                     "parent_node_id": system_id,
+                    "plant_code": plant_code,
                     "tag": tag,
                     "criticality": eq_def["criticality"],
                     "manufacturer": mfr,
                     "power_kw": eq_def["power_kw"],
                     "weight_kg": eq_def["weight_kg"],
                 })
+                if not include_components:
+                    continue
 
                 sub_assy_list = SUB_ASSEMBLIES.get(eq_def["type"], SUB_ASSEMBLIES["DEFAULT"])
                 for sa_idx, sa_name in enumerate(sub_assy_list, 1):
@@ -208,6 +278,7 @@ class SyntheticDataGenerator:
                         "code": f"{tag}-SA{sa_idx:02d}",
                         "level": 5,
                         "parent_node_id": eq_id,
+                        "plant_code": plant_code,
                     })
 
                     mi_list = MAINTAINABLE_ITEMS.get(sa_name, MAINTAINABLE_ITEMS["DEFAULT"])
@@ -222,6 +293,7 @@ class SyntheticDataGenerator:
                             "level": 6,
                             "parent_node_id": sa_id,
                             "mi_type": mi_name,
+                            "plant_code": plant_code,
                         })
 
         return nodes
@@ -285,6 +357,119 @@ class SyntheticDataGenerator:
 
         return work_orders
 
+    def generate_failure_intervals(
+        self,
+        equipment_nodes: list[dict],
+        years: int = 3,
+        failures_per_year: float = 4.0,
+    ) -> dict[str, list[float]]:
+        """Days between successive failures of each equipment over ``years``.
+
+        Each equipment gets its own Weibull shape (infant mortality to
+        wear-out) and a scale around 365 / failures_per_year; intervals are
+        drawn until the horizon is exhausted. Keyed by equipment code.
+        """
+        horizon = years * 365
+        intervals = {}
+        for eq in equipment_nodes:
+            if eq["node_type"] != "EQUIPMENT":
+                continue
+            beta = self.rng.choice(FAILURE_SHAPES)
+            eta = 365 / failures_per_year * self.rng.uniform(0.5, 1.5)
+            series, elapsed = [], 0.0
+            while True:
+                interval = round(max(self.rng.weibullvariate(eta, beta), 0.5), 1)
+                elapsed += interval
+                if elapsed > horizon:
+                    break
+                series.append(interval)
+            intervals[eq["code"]] = series
+        return intervals
+
+    def generate_multi_year_history(
+        self,
+        equipment_nodes: list[dict],
+        years: int = 3,
+        failures_per_year: float = 4.0,
+        pm_interval_days: int | None = 30,
+        end_date: date | None = None,
+    ) -> list[dict]:
+        """Multi-year work order history, oldest first.
+
+        Corrective orders (PM03) follow generate_failure_intervals; preventive
+        orders (PM01/PM02) every ``pm_interval_days`` with a few days of
+        jitter (None = corrective only). Order numbers are sequential, so
+        they stay unique at any volume.
+        """
+        end_date = end_date or date.today()
+        start_date = end_date - timedelta(days=years * 365)
+        intervals = self.generate_failure_intervals(equipment_nodes, years, failures_per_year)
+        work_orders = []
+        for eq in equipment_nodes:
+            if eq["node_type"] != "EQUIPMENT":
+                continue
+            dates = []
+            day = 0.0
+            for interval in intervals[eq["code"]]:
+                day += interval
+                dates.append((start_date + timedelta(days=int(day)), "PM03"))
+            if pm_interval_days:
+                for day in range(pm_interval_days, years * 365, pm_interval_days):
+                    jitter = self.rng.randint(-3, 3)
+                    dates.append((start_date + timedelta(days=day + jitter), self.rng.choice(["PM01", "PM02"])))
+
+            for wo_date, wo_type in dates:
+                corrective = wo_type == "PM03"
+                work_orders.append({
+                    "order_type": wo_type,
+                    "equipment_id": eq.get("code", ""),
+                    "equipment_tag": eq.get("tag", eq.get("code", "")),
+                    "priority": self.rng.choice(["1", "2", "2"] if corrective else ["3", "4", "4"]),
+                    "status": "COMPLETED",
+                    "created_date": wo_date.isoformat(),
+                    "actual_duration_hours": self.rng.choice([4, 8, 12, 16, 24] if corrective else [2, 4, 8]),
+                    "description": f"{'Repair' if corrective else 'Maintenance'} on {eq['name']}",
+                })
+
+        work_orders.sort(key=lambda wo: (wo["created_date"], wo["equipment_id"]))
+        for n, wo in enumerate(work_orders, 1):
+            wo["work_order_id"] = f"WO-{n:08d}"
+        return work_orders
+
+    def generate_backlog(self, equipment_nodes: list[dict], count: int) -> list[dict]:
+        """Open backlog items spread over the given equipment (BacklogItem fields)."""
+        eq_nodes = [n for n in equipment_nodes if n["node_type"] == "EQUIPMENT"]
+        today = date.today()
+        items = []
+        for i in range(count):
+            eq = eq_nodes[i % len(eq_nodes)]
+            age = self.rng.randint(0, 120)
+            materials_ready = self.rng.random() < 0.8
+            shutdown_required = self.rng.random() < 0.1
+            if not materials_ready:
+                status = "AWAITING_MATERIALS"
+            elif shutdown_required:
+                status = "AWAITING_SHUTDOWN"
+            else:
+                status = self.rng.choice(["AWAITING_RESOURCES", "AWAITING_APPROVAL", "SCHEDULED"])
+            items.append({
+                "backlog_id": f"BL-{i + 1:07d}",
+                "work_request_id": f"WR-{i + 1:07d}",
+                "equipment_id": eq.get("code", ""),
+                "equipment_tag": eq.get("tag", eq.get("code", "")),
+                "priority": self.rng.choice(["1_EMERGENCY", "2_URGENT", "3_NORMAL", "3_NORMAL", "4_PLANNED"]),
+                "work_order_type": self.rng.choice(["PM01", "PM02", "PM03"]),
+                "created_date": (today - timedelta(days=age)).isoformat(),
+                "age_days": age,
+                "status": status,
+                "estimated_duration_hours": self.rng.choice([2.0, 4.0, 8.0, 12.0, 16.0]),
+                "required_specialties": self.rng.sample(SPECIALTIES, self.rng.randint(1, 2)),
+                "materials_ready": materials_ready,
+                "shutdown_required": shutdown_required,
+                "groupable": self.rng.random() < 0.5,
+            })
+        return items
+
     def get_statistics(self, nodes: list[dict]) -> dict:
         """Return statistics about the generated data."""
         stats = {
@@ -2380,6 +2380,8 @@ class ExportFormat(str, Enum):
     EXCEL = "EXCEL"
     CSV = "CSV"
     PDF = "PDF"
+    PARQUET = "PARQUET"
+    ARROW = "ARROW"  # Arrow IPC stream
 
 
 class ImportSource(str, Enum):
@@ -2556,6 +2558,21 @@ class ImportSummary(BaseModel):
     error_summary: dict = Field(default_factory=dict)
 
 
+class ImportProgress(BaseModel):
+    source: ImportSource
+    chunks: int = 0
+    rows_read: int = 0
+    rows_inserted: int = 0
+    rows_rejected: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class BulkImportResult(ImportProgress):
+    mapping: Optional[ImportMapping] = None
+    errors: list[ImportValidationError] = Field(default_factory=list)
+    errors_truncated: bool = False
+
+
 # --- Phase 6 Models: Export ---
 
 
@@ -2729,6 +2746,14 @@ class ExecutionTask(BaseModel):
     predecessors: list[str] = Field(default_factory=list)
     safety_checklist: list[str] = Field(default_factory=list)
     is_pre_execution: bool = True
+    # CPM schedule, hours from the start of the sequence
+    early_start: float = 0.0
+    early_finish: float = 0.0
+    late_start: float = 0.0
+    late_finish: float = 0.0
+    total_float: float = 0.0
+    free_float: float = 0.0
+    is_critical: bool = False
 
 
 class ExecutionSequence(BaseModel):
@@ -2738,6 +2763,8 @@ class ExecutionSequence(BaseModel):
     total_pre_hours: float = 0.0
     total_post_hours: float = 0.0
     critical_path_hours: float = 0.0
+    critical_task_ids: list[str] = Field(default_factory=list)
+    cycle_dependencies: list[TaskDependency] = Field(default_factory=list)
     warnings: list[str] = Field(default_factory=list)
 
 
@@ -2775,6 +2802,24 @@ class EnhancedLevelingResult(BaseModel):
     max_utilization_pct: float = 0.0
 
 
+class PackagePlacement(BaseModel):
+    package_id: str
+    scheduled_date: date
+    scheduled_shift: str
+    total_days: int = 1
+
+
+class ScheduleLevelingResult(BaseModel):
+    placements: list[PackagePlacement] = Field(default_factory=list)
+    resource_slots: list[ResourceSlot] = Field(default_factory=list)
+    multi_day_packages: list[MultiDayPackage] = Field(default_factory=list)
+    unscheduled_packages: list[str] = Field(default_factory=list)
+    conflicts: list[ConflictResolution] = Field(default_factory=list)
+    bottleneck_specialty: str = ""
+    max_utilization_pct: float = 0.0
+    local_search_moves: int = 0
+
+
 # --- Phase 7 Models: G18 — FMECA Workflow ---
 
 
@@ -31,6 +31,7 @@ class BacklogOptimizer:
         workforce: list[dict],
         shutdowns: list[dict],
         period_days: int = 30,
+        groups: list[WorkPackageGroup] | None = None,
     ) -> OptimizedBacklog:
         """
         Optimise a backlog into a schedule.
@@ -40,6 +41,8 @@ class BacklogOptimizer:
             workforce: [{worker_id, specialty, shift, available}]
             shutdowns: [{shutdown_id, start_date, end_date, type, areas}]
             period_days: Scheduling horizon in days.
+            groups: Precomputed work package groups for items (e.g. from
+                BacklogGrouper.update_groups); computed here when omitted.
         """
         if not items:
             return _empty_backlog(period_days)
@@ -47,9 +50,6 @@ class BacklogOptimizer:
         period_start = date.today()
         period_end = period_start + timedelta(days=period_days)
 
-        # Convert to BacklogEntry for grouper
-        entries = _to_backlog_entries(items)
-
         # Stratify
         stratification = _stratify(items)
 
@@ -59,7 +59,8 @@ class BacklogOptimizer:
         shutdown_items = [i for i in items if i.shutdown_required and i.materials_ready]
 
         # Group using BacklogGrouper
-        groups = BacklogGrouper.find_all_groups(entries)
+        if groups is None:
+            groups = BacklogGrouper.find_all_groups(_to_backlog_entries(items))
 
         # Build work packages from groups
         work_packages = _build_work_packages(groups, period_start)
@@ -9,6 +9,7 @@ Deterministic — no LLM required.
 
 from datetime import datetime
 
+from tools.processors.keyword_matcher import KeywordMatcher
 from tools.processors.pii_redactor import redact
 from tools.engines.equipment_resolver import EquipmentResolver, ResolutionResult
 from tools.engines.priority_engine import PriorityEngine, PriorityInput
@@ -116,6 +117,11 @@ _SAFETY_KEYWORDS = [
     "sécurité", "danger", "fuite", "incendie",
 ]
 
+# Every detection keyword, scanned once per capture and shared by the detectors
+_KEYWORD_MATCHER = KeywordMatcher([
+    *MECHANISM_KEYWORDS, *CAUSE_KEYWORDS, *_COMPONENT_KEYWORDS, *_SAFETY_KEYWORDS,
+])
+
 
 class FieldCaptureProcessor:
     """Processes raw field captures into structured work requests."""
@@ -134,13 +140,14 @@ class FieldCaptureProcessor:
         equipment = self._resolve_equipment(capture, cleaned_text)
 
         # 3. Detect failure mode (mechanism + cause) against VALID_FM_COMBINATIONS
-        mechanism, cause, fm_code = self._detect_failure_mode(cleaned_text)
+        keywords = _KEYWORD_MATCHER.find(cleaned_text.lower())
+        mechanism, cause, fm_code = self._detect_failure_mode(cleaned_text, keywords)
 
         # 4. Detect component type
-        component = self._detect_component(cleaned_text)
+        component = self._detect_component(cleaned_text, keywords)
 
         # 5. Detect safety flags
-        safety_flags = self._detect_safety_flags(cleaned_text)
+        safety_flags = self._detect_safety_flags(cleaned_text, keywords)
 
         # 6. Determine work order type
         wo_type = self._determine_wo_type(mechanism)
@@ -230,19 +237,25 @@ class FieldCaptureProcessor:
         return self.resolver.resolve(text) if text else None
 
     @staticmethod
-    def _detect_failure_mode(text: str) -> tuple[Mechanism | None, Cause | None, str | None]:
-        """Detect mechanism + cause from text, validated against VALID_FM_COMBINATIONS."""
-        text_lower = text.lower()
+    def _detect_failure_mode(
+        text: str, keywords: set[str] | None = None,
+    ) -> tuple[Mechanism | None, Cause | None, str | None]:
+        """Detect mechanism + cause from text, validated against VALID_FM_COMBINATIONS.
+
+        `keywords` is the result of the shared keyword scan; computed here if omitted.
+        """
+        if keywords is None:
+            keywords = _KEYWORD_MATCHER.find(text.lower())
 
         detected_mechanisms: list[Mechanism] = []
         for keyword, mech in MECHANISM_KEYWORDS.items():
-            if keyword in text_lower:
+            if keyword in keywords:
                 if mech not in detected_mechanisms:
                     detected_mechanisms.append(mech)
 
         detected_causes: list[Cause] = []
         for keyword, cause in CAUSE_KEYWORDS.items():
-            if keyword in text_lower:
+            if keyword in keywords:
                 if cause not in detected_causes:
                     detected_causes.append(cause)
 
@@ -266,19 +279,21 @@ class FieldCaptureProcessor:
         return None, None, None
 
     @staticmethod
-    def _detect_component(text: str) -> str | None:
-        text_lower = text.lower()
+    def _detect_component(text: str, keywords: set[str] | None = None) -> str | None:
+        if keywords is None:
+            keywords = _KEYWORD_MATCHER.find(text.lower())
         for keyword, component in _COMPONENT_KEYWORDS.items():
-            if keyword in text_lower:
+            if keyword in keywords:
                 return component
         return None
 
     @staticmethod
-    def _detect_safety_flags(text: str) -> list[str]:
-        text_lower = text.lower()
+    def _detect_safety_flags(text: str, keywords: set[str] | None = None) -> list[str]:
+        if keywords is None:
+            keywords = _KEYWORD_MATCHER.find(text.lower())
         flags = []
         for kw in _SAFETY_KEYWORDS:
-            if kw in text_lower:
+            if kw in keywords:
                 flags.append(kw.upper())
         return flags
 
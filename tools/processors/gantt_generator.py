@@ -1,16 +1,22 @@
 """Gantt Generator — produces Gantt data and Excel exports.
 
 Converts WeeklyProgram work packages into structured GanttRow data
-and can export to Excel with visual timeline using openpyxl.
+and can export to Excel with visual timeline using an openpyxl
+write-only workbook with named styles.
 
 Deterministic — no LLM required.
 """
 
 from datetime import date, timedelta
+from typing import IO, Iterator
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
+from openpyxl.utils import get_column_letter
 
+from tools.engines.data_export_engine import (
+    CELL_STYLE, HEADER_STYLE, THIN_BORDER, add_named_styles, spooled_chunks, styled_cell,
+)
 from tools.models.schemas import WeeklyProgram, GanttRow
 
 
@@ -25,6 +31,10 @@ SPECIALTY_COLORS = {
 
 DEFAULT_COLOR = "BDD7EE"
 
+_TITLE_STYLE = "gantt_title"
+_DATE_STYLE = "gantt_date"
+_NAME_STYLE = "gantt_name"
+
 
 class GanttGenerator:
     """Generates Gantt chart data and Excel exports."""
@@ -35,6 +45,9 @@ class GanttGenerator:
         rows: list[GanttRow] = []
 
         for pkg in program.work_packages:
+            # Left out by schedule leveling: no date this week
+            if pkg.get("unscheduled"):
+                continue
             pkg_id = pkg.get("package_id", "")
             name = pkg.get("name", "")
             hours = pkg.get("total_duration_hours", 0.0)
@@ -84,90 +97,84 @@ class GanttGenerator:
         Returns:
             The filepath written.
         """
-        wb = Workbook()
+        GanttGenerator.write_gantt_excel(gantt_rows, filepath)
+        return filepath
 
-        # ── Sheet 1: Schedule Table ──
-        ws_schedule = wb.active
-        ws_schedule.title = "Schedule"
+    @staticmethod
+    def stream_gantt_excel(gantt_rows: list[GanttRow]) -> Iterator[bytes]:
+        """The Gantt workbook as XLSX bytes in chunks."""
+        return spooled_chunks(lambda f: GanttGenerator.write_gantt_excel(gantt_rows, f))
 
-        headers = ["Package ID", "Name", "Start", "End", "Shift", "Area", "Specialty", "Hours"]
-        header_fill = PatternFill("solid", fgColor="4472C4")
-        header_font = Font(bold=True, color="FFFFFF", name="Arial", size=10)
-        thin_border = Border(
-            left=Side(style="thin"), right=Side(style="thin"),
-            top=Side(style="thin"), bottom=Side(style="thin"),
-        )
+    @staticmethod
+    def write_gantt_excel(gantt_rows: list[GanttRow], target: str | IO[bytes]) -> None:
+        """Write the schedule table and timeline with a write-only workbook.
+
+        Cells use named styles (one per specialty colour for the bars)
+        instead of per-cell Font/Border objects.
+        """
+        wb = Workbook(write_only=True)
+        add_named_styles(wb)
+        wb.add_named_style(NamedStyle(name=_TITLE_STYLE, font=Font(bold=True, name="Arial", size=10)))
+        wb.add_named_style(NamedStyle(
+            name=_DATE_STYLE, font=Font(bold=True, name="Arial", size=9),
+            alignment=Alignment(horizontal="center"),
+        ))
+        wb.add_named_style(NamedStyle(name=_NAME_STYLE, font=Font(name="Arial", size=10)))
 
-        for col, header in enumerate(headers, 1):
-            cell = ws_schedule.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = thin_border
+        # ── Sheet 1: Schedule Table ──
+        ws_schedule = wb.create_sheet("Schedule")
+        headers = ["Package ID", "Name", "Start", "End", "Shift", "Area", "Specialty", "Hours"]
+        for col in range(1, len(headers) + 1):
+            ws_schedule.column_dimensions[get_column_letter(col)].width = 18
+        ws_schedule.append([styled_cell(ws_schedule, h, HEADER_STYLE) for h in headers])
 
-        for row_idx, gr in enumerate(gantt_rows, 2):
+        for gr in gantt_rows:
             values = [
                 gr.package_id, gr.name,
                 gr.start_date.isoformat(), gr.end_date.isoformat(),
                 gr.shift, gr.area, gr.specialty, gr.duration_hours,
             ]
-            for col, val in enumerate(values, 1):
-                cell = ws_schedule.cell(row=row_idx, column=col, value=val)
-                cell.font = Font(name="Arial", size=10)
-                cell.border = thin_border
-
-        # Auto-fit column widths
-        for col in range(1, len(headers) + 1):
-            ws_schedule.column_dimensions[chr(64 + col) if col <= 26 else "A"].width = 18
+            ws_schedule.append([styled_cell(ws_schedule, v, CELL_STYLE) for v in values])
 
         # ── Sheet 2: Gantt Visual ──
         ws_gantt = wb.create_sheet("Gantt")
 
         if not gantt_rows:
-            ws_gantt.cell(row=1, column=1, value="No work packages scheduled")
-            wb.save(filepath)
-            return filepath
+            ws_gantt.append(["No work packages scheduled"])
+            wb.save(target)
+            return
 
-        # Determine date range
-        all_dates = []
-        for gr in gantt_rows:
-            d = gr.start_date
-            while d <= gr.end_date:
-                all_dates.append(d)
-                d += timedelta(days=1)
-
-        if not all_dates:
-            wb.save(filepath)
-            return filepath
-
-        min_date = min(all_dates)
-        max_date = max(all_dates)
-        date_range = []
-        d = min_date
-        while d <= max_date:
-            date_range.append(d)
-            d += timedelta(days=1)
+        min_date = min(gr.start_date for gr in gantt_rows)
+        max_date = max(gr.end_date for gr in gantt_rows)
+        date_range = [min_date + timedelta(days=i) for i in range((max_date - min_date).days + 1)]
 
         # Headers: column 1 = Package Name, columns 2+ = dates
-        ws_gantt.cell(row=1, column=1, value="Package").font = Font(bold=True, name="Arial", size=10)
         ws_gantt.column_dimensions["A"].width = 30
-        for col_idx, dt in enumerate(date_range, 2):
-            cell = ws_gantt.cell(row=1, column=col_idx, value=dt.strftime("%m/%d"))
-            cell.font = Font(bold=True, name="Arial", size=9)
-            cell.alignment = Alignment(horizontal="center")
-            ws_gantt.column_dimensions[cell.column_letter].width = 8
-
-        # Rows: one per package
-        for row_idx, gr in enumerate(gantt_rows, 2):
-            ws_gantt.cell(row=row_idx, column=1, value=gr.name).font = Font(name="Arial", size=10)
-            color = SPECIALTY_COLORS.get(gr.specialty, DEFAULT_COLOR)
-            fill = PatternFill("solid", fgColor=color)
-
-            for col_idx, dt in enumerate(date_range, 2):
-                if gr.start_date <= dt <= gr.end_date:
-                    cell = ws_gantt.cell(row=row_idx, column=col_idx)
-                    cell.fill = fill
-                    cell.border = thin_border
+        for col_idx in range(2, len(date_range) + 2):
+            ws_gantt.column_dimensions[get_column_letter(col_idx)].width = 8
+        ws_gantt.append(
+            [styled_cell(ws_gantt, "Package", _TITLE_STYLE)]
+            + [styled_cell(ws_gantt, dt.strftime("%m/%d"), _DATE_STYLE) for dt in date_range]
+        )
 
-        wb.save(filepath)
-        return filepath
+        # Rows: one per package, bars styled by specialty colour
+        bar_styles: set[str] = set()
+        for gr in gantt_rows:
+            color = SPECIALTY_COLORS.get(gr.specialty, DEFAULT_COLOR)
+            bar_style = f"gantt_bar_{color}"
+            if bar_style not in bar_styles:
+                wb.add_named_style(NamedStyle(
+                    name=bar_style, fill=PatternFill("solid", fgColor=color), border=THIN_BORDER,
+                ))
+                bar_styles.add(bar_style)
+            first = (gr.start_date - min_date).days
+            last = (gr.end_date - min_date).days
+            ws_gantt.append(
+                [styled_cell(ws_gantt, gr.name, _NAME_STYLE)]
+                + [
+                    styled_cell(ws_gantt, None, bar_style) if first <= i <= last else None
+                    for i in range(len(date_range))
+                ]
+            )
+
+        wb.save(target)
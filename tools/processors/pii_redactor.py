@@ -45,10 +45,14 @@ def redact(text: str) -> tuple[str, list[str]]:
     redacted_items: list[str] = []
     cleaned = text
 
+    # One sub() per pattern records what it replaces (no separate finditer pass).
+    # Patterns stay sequential: each later one only sees text the earlier ones
+    # left, which keeps e.g. a phone number inside an ID from half-matching.
     for pattern, replacement in _PATTERNS:
-        for match in pattern.finditer(cleaned):
+        def _replace(match: re.Match, replacement: str = replacement) -> str:
             redacted_items.append(match.group())
-        cleaned = pattern.sub(replacement, cleaned)
+            return replacement
+        cleaned = pattern.sub(_replace, cleaned)
 
     # Deduplicate while preserving order
     seen: set[str] = set()
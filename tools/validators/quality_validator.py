@@ -4,7 +4,11 @@ Implements 40+ validation rules from REF-04.
 Validates strategy development data at all stages.
 """
 
+import hashlib
 import math
+import threading
+from functools import cached_property
+from typing import Callable
 
 from tools.models.schemas import (
     ApprovalStatus,
@@ -42,43 +46,199 @@ class ValidationResult:
         return f"[{self.severity}] {self.rule_id}: {self.message}"
 
 
+class ValidationCache:
+    """Results of previous runs, for incremental re-validation.
+
+    Each per-entity check is keyed by its rule group, a hash of the entity's
+    content and the facts it reads from other entities (parent level, whether
+    a function has failures, the tasks allocated to a WP...). An entity whose
+    key is unchanged since the last run is not re-checked. After every run
+    only the keys used by that run are kept, so the cache tracks the latest
+    state of the session instead of growing with each edit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: dict[tuple, list[ValidationResult]] = {}
+        self.checked = 0
+        self.reused = 0
+
+    def snapshot(self) -> dict[tuple, list[ValidationResult]]:
+        # commit() swaps the dict instead of mutating it, so readers need no lock
+        with self._lock:
+            return self._results
+
+    def commit(self, used: dict[tuple, list[ValidationResult]], checked: int, reused: int):
+        with self._lock:
+            self._results = used
+            self.checked += checked
+            self.reused += reused
+
+    def clear(self):
+        with self._lock:
+            self._results = {}
+            self.checked = 0
+            self.reused = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._results), "checked": self.checked, "reused": self.reused}
+
+
+class ValidationContext:
+    """Indexes over one set of strategy data, built once and shared by every rule.
+
+    Pass the same lists given to the ``validate_*`` methods. With a
+    ``ValidationCache`` per-entity checks are skipped when the entity and
+    its related entities are unchanged since the previous run; call
+    ``commit()`` once all rules have run.
+    """
+
+    def __init__(
+        self,
+        nodes: list[PlantHierarchyNode] | None = None,
+        functions: list[Function] | None = None,
+        functional_failures: list[FunctionalFailure] | None = None,
+        criticality_assessments: list[CriticalityAssessment] | None = None,
+        failure_modes: list[FailureMode] | None = None,
+        tasks: list[MaintenanceTask] | None = None,
+        work_packages: list[WorkPackage] | None = None,
+        cache: ValidationCache | None = None,
+    ):
+        self.nodes = nodes or []
+        self.functions = functions or []
+        self.functional_failures = functional_failures or []
+        self.criticality_assessments = criticality_assessments or []
+        self.failure_modes = failure_modes or []
+        self.tasks = tasks or []
+        self.work_packages = work_packages or []
+        self.cache = cache
+        self._previous = cache.snapshot() if cache is not None else {}
+        self._fingerprints: dict[int, bytes] = {}
+        self._used: dict[tuple, list[ValidationResult]] = {}
+        self._checked = 0
+        self._reused = 0
+
+    @cached_property
+    def node_by_id(self) -> dict[str, PlantHierarchyNode]:
+        # First node wins on duplicate ids, like the previous linear search
+        index: dict[str, PlantHierarchyNode] = {}
+        for node in self.nodes:
+            index.setdefault(node.node_id, node)
+        return index
+
+    @cached_property
+    def nodes_with_functions(self) -> set[str]:
+        return {f.node_id for f in self.functions}
+
+    @cached_property
+    def functions_with_failures(self) -> set[str]:
+        return {ff.function_id for ff in self.functional_failures}
+
+    @cached_property
+    def assessed_nodes(self) -> set[str]:
+        return {a.node_id for a in self.criticality_assessments}
+
+    @cached_property
+    def task_by_id(self) -> dict[str, MaintenanceTask]:
+        return {t.task_id: t for t in self.tasks}
+
+    @cached_property
+    def task_positions(self) -> dict[str, list[int]]:
+        positions: dict[str, list[int]] = {}
+        for i, task in enumerate(self.tasks):
+            positions.setdefault(task.task_id, []).append(i)
+        return positions
+
+    @cached_property
+    def allocated_task_ids(self) -> set[str]:
+        return {at.task_id for wp in self.work_packages for at in wp.allocated_tasks}
+
+    def tasks_of(self, wp: WorkPackage) -> list[MaintenanceTask]:
+        """Tasks allocated to ``wp``, in task-list order."""
+        ids = {at.task_id for at in wp.allocated_tasks}
+        positions = sorted(i for tid in ids for i in self.task_positions.get(tid, ()))
+        return [self.tasks[i] for i in positions]
+
+    def fingerprint(self, entity) -> bytes:
+        key = id(entity)
+        fp = self._fingerprints.get(key)
+        if fp is None:
+            fp = hashlib.blake2b(entity.model_dump_json().encode(), digest_size=16).digest()
+            self._fingerprints[key] = fp
+        return fp
+
+    def check(self, kind: str, entity, extra, run: Callable[[], list[ValidationResult]]) -> list[ValidationResult]:
+        """Run one per-entity check, or reuse its cached result.
+
+        ``extra`` must capture everything the check reads besides ``entity``.
+        """
+        if self.cache is None:
+            return run()
+        key = (kind, self.fingerprint(entity), extra)
+        results = self._used.get(key)
+        if results is None:
+            results = self._previous.get(key)
+            if results is None:
+                results = run()
+                self._checked += 1
+            else:
+                self._reused += 1
+            self._used[key] = results
+        return results
+
+    def commit(self):
+        """Store this run's results in the cache, dropping stale entries."""
+        if self.cache is not None:
+            self.cache.commit(self._used, self._checked, self._reused)
+
+
 class QualityValidator:
     """Runs 40+ quality validation rules on strategy development data."""
 
     @staticmethod
     def validate_hierarchy(
         nodes: list[PlantHierarchyNode],
+        ctx: ValidationContext | None = None,
     ) -> list[ValidationResult]:
         """Validate hierarchy rules (H-01 to H-04)."""
+        ctx = ctx or ValidationContext(nodes=nodes)
         results = []
 
         for node in nodes:
-            # H-01: Maximum depth check (6 levels in our model)
-            if node.level > 6:
-                results.append(ValidationResult(
-                    "H-01", "ERROR",
-                    f"Node '{node.name}' exceeds maximum hierarchy depth (level {node.level})",
-                    node.node_id,
-                ))
+            parent = ctx.node_by_id.get(node.parent_node_id) if node.parent_node_id else None
+            results.extend(QualityValidator._check_node(node, parent))
 
-            # H-02: MI nodes must have a component code
-            if node.node_type == NodeType.MAINTAINABLE_ITEM and not node.component_lib_ref:
-                results.append(ValidationResult(
-                    "H-02", "ERROR",
-                    f"Maintainable item '{node.name}' has no component library reference",
-                    node.node_id,
-                ))
+        return results
 
-            # Check parent-child consistency
-            if node.parent_node_id:
-                parent = next((n for n in nodes if n.node_id == node.parent_node_id), None)
-                if parent and parent.level >= node.level:
-                    results.append(ValidationResult(
-                        "H-01", "ERROR",
-                        f"Node '{node.name}' (level {node.level}) has parent '{parent.name}' "
-                        f"at same or deeper level ({parent.level})",
-                        node.node_id,
-                    ))
+    @staticmethod
+    def _check_node(node: PlantHierarchyNode, parent: PlantHierarchyNode | None) -> list[ValidationResult]:
+        results = []
+
+        # H-01: Maximum depth check (6 levels in our model)
+        if node.level > 6:
+            results.append(ValidationResult(
+                "H-01", "ERROR",
+                f"Node '{node.name}' exceeds maximum hierarchy depth (level {node.level})",
+                node.node_id,
+            ))
+
+        # H-02: MI nodes must have a component code
+        if node.node_type == NodeType.MAINTAINABLE_ITEM and not node.component_lib_ref:
+            results.append(ValidationResult(
+                "H-02", "ERROR",
+                f"Maintainable item '{node.name}' has no component library reference",
+                node.node_id,
+            ))
+
+        # Check parent-child consistency
+        if parent and parent.level >= node.level:
+            results.append(ValidationResult(
+                "H-01", "ERROR",
+                f"Node '{node.name}' (level {node.level}) has parent '{parent.name}' "
+                f"at same or deeper level ({parent.level})",
+                node.node_id,
+            ))
 
         return results
 
@@ -87,18 +247,16 @@ class QualityValidator:
         nodes: list[PlantHierarchyNode],
         functions: list[Function],
         functional_failures: list[FunctionalFailure],
+        ctx: ValidationContext | None = None,
     ) -> list[ValidationResult]:
         """Validate function rules (F-01 to F-05)."""
+        ctx = ctx or ValidationContext(nodes=nodes, functions=functions, functional_failures=functional_failures)
         results = []
 
-        # Get sets of node IDs that have functions/failures
-        nodes_with_functions = {f.node_id for f in functions}
-        functions_with_failures = {ff.function_id for ff in functional_failures}
-
         for node in nodes:
             # F-01/F-03: Systems and MIs must have functions
             if node.node_type in (NodeType.SYSTEM, NodeType.MAINTAINABLE_ITEM):
-                if node.node_id not in nodes_with_functions:
+                if node.node_id not in ctx.nodes_with_functions:
                     rule = "F-01" if node.node_type == NodeType.SYSTEM else "F-03"
                     results.append(ValidationResult(
                         rule, "ERROR",
@@ -108,7 +266,7 @@ class QualityValidator:
 
         # F-02/F-04: Functions must have functional failures
         for func in functions:
-            if func.function_id not in functions_with_failures:
+            if func.function_id not in ctx.functions_with_failures:
                 results.append(ValidationResult(
                     "F-02", "ERROR",
                     f"Function '{func.description}' has no functional failures defined",
@@ -131,10 +289,12 @@ class QualityValidator:
     def validate_criticality(
         nodes: list[PlantHierarchyNode],
         assessments: list[CriticalityAssessment],
+        ctx: ValidationContext | None = None,
     ) -> list[ValidationResult]:
         """Validate criticality rules (C-01 to C-04)."""
+        ctx = ctx or ValidationContext(nodes=nodes, criticality_assessments=assessments)
         results = []
-        assessed_nodes = {a.node_id for a in assessments}
+        assessed_nodes = ctx.assessed_nodes
 
         for node in nodes:
             # C-01: Equipment must have criticality
@@ -166,101 +326,112 @@ class QualityValidator:
     @staticmethod
     def validate_failure_modes(
         failure_modes: list[FailureMode],
+        ctx: ValidationContext | None = None,
     ) -> list[ValidationResult]:
         """Validate failure mode rules (FM-01 to FM-07)."""
+        ctx = ctx or ValidationContext(failure_modes=failure_modes)
         results = []
 
         for fm in failure_modes:
-            # FM-01 & FM-02: Validate 'what' field
-            what_issues = NamingValidator.validate_fm_what(fm.what)
-            for issue in what_issues:
-                results.append(ValidationResult(
-                    issue["rule"], issue["severity"], issue["message"], fm.failure_mode_id,
-                ))
-
-            # FM-04: Mechanism must be from predefined list (enforced by enum, but check)
-            # FM-05: Cause must be from predefined list (enforced by enum)
-            # FM-06: Status must be Recommended or Redundant (enforced by enum)
+            results.extend(ctx.check("fm", fm, None, lambda: QualityValidator._check_fm(fm)))
 
         return results
 
+    @staticmethod
+    def _check_fm(fm: FailureMode) -> list[ValidationResult]:
+        # FM-01 & FM-02: Validate 'what' field
+        # FM-04: Mechanism must be from predefined list (enforced by enum, but check)
+        # FM-05: Cause must be from predefined list (enforced by enum)
+        # FM-06: Status must be Recommended or Redundant (enforced by enum)
+        return [
+            ValidationResult(issue["rule"], issue["severity"], issue["message"], fm.failure_mode_id)
+            for issue in NamingValidator.validate_fm_what(fm.what)
+        ]
+
     @staticmethod
     def validate_tasks(
         tasks: list[MaintenanceTask],
-        failure_modes: list[FailureMode],
+        failure_modes: list[FailureMode] | None = None,
+        ctx: ValidationContext | None = None,
     ) -> list[ValidationResult]:
         """Validate task rules (T-01 to T-19)."""
+        ctx = ctx or ValidationContext(tasks=tasks, failure_modes=failure_modes)
         results = []
 
-        # Build FM→strategy lookup
-        fm_strategy = {fm.failure_mode_id: fm.strategy_type for fm in failure_modes}
-
         for task in tasks:
-            # T-01/T-03: CB and FFI tasks MUST have acceptable limits
-            # (We check all tasks, but only ERROR for CB/FFI)
-            if not task.acceptable_limits:
-                # Try to find the associated FM strategy
-                # For now, check based on task type
-                if task.task_type in (TaskType.INSPECT, TaskType.CHECK, TaskType.TEST):
-                    results.append(ValidationResult(
-                        "T-01", "WARNING",
-                        f"Task '{task.name}' has no acceptable limits defined",
-                        task.task_id,
-                    ))
+            results.extend(ctx.check("task", task, None, lambda: QualityValidator._check_task(task)))
 
-            # T-02/T-04: CB and FFI tasks MUST have conditional comments
-            if not task.conditional_comments:
-                if task.task_type in (TaskType.INSPECT, TaskType.CHECK, TaskType.TEST):
-                    results.append(ValidationResult(
-                        "T-02", "WARNING",
-                        f"Task '{task.name}' has no conditional comments defined",
-                        task.task_id,
-                    ))
+        return results
 
-            # Validate task naming
-            name_issues = NamingValidator.validate_task_name(task.name, task.task_type.value)
-            for issue in name_issues:
-                results.append(ValidationResult(
-                    issue["rule"], issue["severity"], issue["message"], task.task_id,
-                ))
+    @staticmethod
+    def _check_task(task: MaintenanceTask) -> list[ValidationResult]:
+        results = []
 
-            # T-11: Required fields
-            if not task.labour_resources:
+        # T-01/T-03: CB and FFI tasks MUST have acceptable limits
+        # (We check all tasks, but only ERROR for CB/FFI)
+        if not task.acceptable_limits:
+            # Try to find the associated FM strategy
+            # For now, check based on task type
+            if task.task_type in (TaskType.INSPECT, TaskType.CHECK, TaskType.TEST):
                 results.append(ValidationResult(
-                    "T-11", "ERROR",
-                    f"Task '{task.name}' has no labour resources assigned",
+                    "T-01", "WARNING",
+                    f"Task '{task.name}' has no acceptable limits defined",
                     task.task_id,
                 ))
 
-            # T-16: Replacement tasks must have materials
-            if task.task_type == TaskType.REPLACE and not task.material_resources:
+        # T-02/T-04: CB and FFI tasks MUST have conditional comments
+        if not task.conditional_comments:
+            if task.task_type in (TaskType.INSPECT, TaskType.CHECK, TaskType.TEST):
                 results.append(ValidationResult(
-                    "T-16", "ERROR",
-                    f"Replacement task '{task.name}' has no materials in costing",
+                    "T-02", "WARNING",
+                    f"Task '{task.name}' has no conditional comments defined",
                     task.task_id,
                 ))
 
-            # T-17: Constraint alignment (enforced by model, but double-check)
-            if task.constraint == TaskConstraint.ONLINE and task.access_time_hours != 0:
-                results.append(ValidationResult(
-                    "T-17", "ERROR",
-                    f"Online task '{task.name}' has non-zero access time ({task.access_time_hours}h)",
-                    task.task_id,
-                ))
-            if task.constraint == TaskConstraint.OFFLINE and task.access_time_hours == 0:
-                results.append(ValidationResult(
-                    "T-17", "ERROR",
-                    f"Offline task '{task.name}' has zero access time",
-                    task.task_id,
-                ))
+        # Validate task naming
+        name_issues = NamingValidator.validate_task_name(task.name, task.task_type.value)
+        for issue in name_issues:
+            results.append(ValidationResult(
+                issue["rule"], issue["severity"], issue["message"], task.task_id,
+            ))
 
-            # T-18: SAP name length (enforced by model max_length=72)
-            if len(task.name) > 72:
-                results.append(ValidationResult(
-                    "T-18", "ERROR",
-                    f"Task name exceeds 72 chars ({len(task.name)})",
-                    task.task_id,
-                ))
+        # T-11: Required fields
+        if not task.labour_resources:
+            results.append(ValidationResult(
+                "T-11", "ERROR",
+                f"Task '{task.name}' has no labour resources assigned",
+                task.task_id,
+            ))
+
+        # T-16: Replacement tasks must have materials
+        if task.task_type == TaskType.REPLACE and not task.material_resources:
+            results.append(ValidationResult(
+                "T-16", "ERROR",
+                f"Replacement task '{task.name}' has no materials in costing",
+                task.task_id,
+            ))
+
+        # T-17: Constraint alignment (enforced by model, but double-check)
+        if task.constraint == TaskConstraint.ONLINE and task.access_time_hours != 0:
+            results.append(ValidationResult(
+                "T-17", "ERROR",
+                f"Online task '{task.name}' has non-zero access time ({task.access_time_hours}h)",
+                task.task_id,
+            ))
+        if task.constraint == TaskConstraint.OFFLINE and task.access_time_hours == 0:
+            results.append(ValidationResult(
+                "T-17", "ERROR",
+                f"Offline task '{task.name}' has zero access time",
+                task.task_id,
+            ))
+
+        # T-18: SAP name length (enforced by model max_length=72)
+        if len(task.name) > 72:
+            results.append(ValidationResult(
+                "T-18", "ERROR",
+                f"Task name exceeds 72 chars ({len(task.name)})",
+                task.task_id,
+            ))
 
         return results
 
@@ -268,55 +439,62 @@ class QualityValidator:
     def validate_work_packages(
         work_packages: list[WorkPackage],
         tasks: list[MaintenanceTask],
+        ctx: ValidationContext | None = None,
     ) -> list[ValidationResult]:
         """Validate work package rules (WP-01 to WP-13)."""
+        ctx = ctx or ValidationContext(work_packages=work_packages, tasks=tasks)
         results = []
 
         # WP-01: Every task must be in a work package
-        allocated_task_ids = set()
-        for wp in work_packages:
-            for at in wp.allocated_tasks:
-                allocated_task_ids.add(at.task_id)
-
-        task_ids = {t.task_id for t in tasks}
-        unallocated = task_ids - allocated_task_ids
-        for tid in unallocated:
-            task = next((t for t in tasks if t.task_id == tid), None)
-            name = task.name if task else tid
+        seen = set()
+        for task in tasks:
+            if task.task_id in ctx.allocated_task_ids or task.task_id in seen:
+                continue
+            seen.add(task.task_id)
             results.append(ValidationResult(
                 "WP-01", "ERROR",
-                f"Task '{name}' is not allocated to any work package",
-                tid,
+                f"Task '{task.name}' is not allocated to any work package",
+                task.task_id,
             ))
 
         for wp in work_packages:
-            # Validate WP naming
-            name_issues = NamingValidator.validate_wp_name(wp.name)
-            for issue in name_issues:
-                results.append(ValidationResult(
-                    issue["rule"], issue["severity"], issue["message"], wp.work_package_id,
-                ))
+            wp_tasks = ctx.tasks_of(wp)
+            extra = tuple(ctx.fingerprint(t) for t in wp_tasks) if ctx.cache else None
+            results.extend(ctx.check(
+                "wp", wp, extra, lambda: QualityValidator._check_wp(wp, wp_tasks),
+            ))
+
+        return results
 
-            # WP-03: Online and offline tasks must not be mixed
-            wp_task_ids = {at.task_id for at in wp.allocated_tasks}
-            wp_tasks = [t for t in tasks if t.task_id in wp_task_ids]
-            constraints = {t.constraint for t in wp_tasks}
-            if TaskConstraint.ONLINE in constraints and TaskConstraint.OFFLINE in constraints:
+    @staticmethod
+    def _check_wp(wp: WorkPackage, wp_tasks: list[MaintenanceTask]) -> list[ValidationResult]:
+        results = []
+
+        # Validate WP naming
+        name_issues = NamingValidator.validate_wp_name(wp.name)
+        for issue in name_issues:
+            results.append(ValidationResult(
+                issue["rule"], issue["severity"], issue["message"], wp.work_package_id,
+            ))
+
+        # WP-03: Online and offline tasks must not be mixed
+        constraints = {t.constraint for t in wp_tasks}
+        if TaskConstraint.ONLINE in constraints and TaskConstraint.OFFLINE in constraints:
+            results.append(ValidationResult(
+                "WP-03", "ERROR",
+                f"Work package '{wp.name}' mixes ONLINE and OFFLINE tasks",
+                wp.work_package_id,
+            ))
+
+        # WP-11: All tasks must have labour
+        for task in wp_tasks:
+            if not task.labour_resources:
                 results.append(ValidationResult(
-                    "WP-03", "ERROR",
-                    f"Work package '{wp.name}' mixes ONLINE and OFFLINE tasks",
+                    "WP-11", "ERROR",
+                    f"Task '{task.name}' in WP '{wp.name}' has no labour assigned",
                     wp.work_package_id,
                 ))
 
-            # WP-11: All tasks must have labour
-            for task in wp_tasks:
-                if not task.labour_resources:
-                    results.append(ValidationResult(
-                        "WP-11", "ERROR",
-                        f"Task '{task.name}' in WP '{wp.name}' has no labour assigned",
-                        wp.work_package_id,
-                    ))
-
         return results
 
     @staticmethod
@@ -346,10 +524,11 @@ class QualityValidator:
         failure_modes: list[FailureMode],
         tasks: list[MaintenanceTask],
         fm_to_task: dict[str, str] | None = None,
+        ctx: ValidationContext | None = None,
     ) -> list[ValidationResult]:
         """GAP-2 + T-12: Validate cause → frequency unit alignment."""
         results = []
-        task_by_id = {t.task_id: t for t in tasks}
+        task_by_id = (ctx or ValidationContext(tasks=tasks)).task_by_id
 
         for fm in failure_modes:
             if not fm_to_task:
@@ -479,6 +658,7 @@ class QualityValidator:
         nodes: list[PlantHierarchyNode],
         tasks: list[MaintenanceTask],
         mi_to_tasks: dict[str, list[str]] | None = None,
+        ctx: ValidationContext | None = None,
     ) -> list[ValidationResult]:
         """T-13: Every MI must have a replacement task."""
         results = []
@@ -486,7 +666,7 @@ class QualityValidator:
             return results
 
         mi_nodes = [n for n in nodes if n.node_type == NodeType.MAINTAINABLE_ITEM]
-        task_by_id = {t.task_id: t for t in tasks}
+        task_by_id = (ctx or ValidationContext(tasks=tasks)).task_by_id
 
         for mi in mi_nodes:
             task_ids = mi_to_tasks.get(mi.node_id, [])
@@ -529,14 +709,15 @@ class QualityValidator:
     def validate_wp_frequency_alignment(
         work_packages: list[WorkPackage],
         tasks: list[MaintenanceTask],
+        ctx: ValidationContext | None = None,
     ) -> list[ValidationResult]:
         """WP-04: All tasks in a WP must match the WP frequency."""
+        ctx = ctx or ValidationContext(work_packages=work_packages, tasks=tasks)
         results = []
-        task_by_id = {t.task_id: t for t in tasks}
 
         for wp in work_packages:
             for at in wp.allocated_tasks:
-                task = task_by_id.get(at.task_id)
+                task = ctx.task_by_id.get(at.task_id)
                 if not task:
                     continue
                 if task.frequency_value != wp.frequency_value or task.frequency_unit != wp.frequency_unit:
@@ -559,31 +740,43 @@ class QualityValidator:
         failure_modes: list[FailureMode] | None = None,
         tasks: list[MaintenanceTask] | None = None,
         work_packages: list[WorkPackage] | None = None,
+        cache: ValidationCache | None = None,
     ) -> list[ValidationResult]:
-        """Run all validation rules and return combined results."""
+        """Run all validation rules and return combined results.
+
+        The indexes are built once and shared by every rule. Pass the same
+        ``cache`` on each call to re-check only entities that changed since
+        the previous run.
+        """
+        ctx = ValidationContext(
+            nodes=nodes, functions=functions, functional_failures=functional_failures,
+            criticality_assessments=criticality_assessments, failure_modes=failure_modes,
+            tasks=tasks, work_packages=work_packages, cache=cache,
+        )
         all_results = []
 
         if nodes:
-            all_results.extend(cls.validate_hierarchy(nodes))
+            all_results.extend(cls.validate_hierarchy(nodes, ctx=ctx))
 
         if nodes and functions and functional_failures:
-            all_results.extend(cls.validate_functions(nodes, functions, functional_failures))
+            all_results.extend(cls.validate_functions(nodes, functions, functional_failures, ctx=ctx))
 
         if nodes and criticality_assessments:
-            all_results.extend(cls.validate_criticality(nodes, criticality_assessments))
+            all_results.extend(cls.validate_criticality(nodes, criticality_assessments, ctx=ctx))
 
         if failure_modes:
-            all_results.extend(cls.validate_failure_modes(failure_modes))
+            all_results.extend(cls.validate_failure_modes(failure_modes, ctx=ctx))
 
         if tasks:
-            all_results.extend(cls.validate_tasks(tasks, failure_modes or []))
+            all_results.extend(cls.validate_tasks(tasks, failure_modes or [], ctx=ctx))
 
         if work_packages and tasks:
-            all_results.extend(cls.validate_work_packages(work_packages, tasks))
-            all_results.extend(cls.validate_wp_frequency_alignment(work_packages, tasks))
+            all_results.extend(cls.validate_work_packages(work_packages, tasks, ctx=ctx))
+            all_results.extend(cls.validate_wp_frequency_alignment(work_packages, tasks, ctx=ctx))
 
         if work_packages:
             all_results.extend(cls.validate_suppressive_wp(work_packages))
             all_results.extend(cls.validate_sequential_wp(work_packages))
 
+        ctx.commit()
         return all_results